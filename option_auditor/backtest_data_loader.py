@@ -1,18 +1,18 @@
 import os
 import numpy as np
-import yfinance as yf
 import pandas as pd
 import logging
 from typing import Optional
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from option_auditor.config import BACKTEST_BENCHMARK_SYMBOLS
+from option_auditor.common.market_data_provider import get_provider
 
 logger = logging.getLogger("BacktestDataLoader")
 
 class BacktestDataLoader:
     @retry(stop=stop_after_attempt(4), wait=wait_exponential(multiplier=1, min=1, max=10), retry=retry_if_exception_type(Exception), reraise=True)
     def _download_with_retry(self, symbols, period="10y"):
-        return yf.download(symbols, period=period, auto_adjust=True, progress=False)
+        return get_provider().download(symbols, period=period, auto_adjust=True, progress=False)
 
     def _get_mock_data(self, ticker: str) -> pd.DataFrame:
         """Generates mock data for CI environments."""
@@ -5,6 +5,7 @@ import logging
 from typing import Dict, Any, List, Tuple
 from option_auditor.backtesting_strategies import get_strategy, AbstractBacktestStrategy
 from option_auditor.config import BACKTEST_DAYS
+from option_auditor.strategies.patterns import swing_highs, swing_lows
 
 logger = logging.getLogger("BacktestEngine")
 
@@ -133,6 +134,13 @@ class BacktestEngine:
         target_price = 0.0
         current_stop_reason = "STOP"
 
+        # Fractals for the whole window in one pass; each is recorded once the bar after it closes
+        highs = sim_data['High'].values
+        lows = sim_data['Low'].values
+        rsi_values = sim_data['rsi'].values if 'rsi' in sim_data.columns else None
+        is_swing_high = swing_highs(highs)
+        is_swing_low = swing_lows(lows)
+
         # 4. Loop
         for i in range(len(sim_data)):
             if i < 20: continue # Warmup
@@ -141,27 +149,21 @@ class BacktestEngine:
             row = sim_data.iloc[i]
 
             # --- FRACTAL IDENTIFICATION (Shared Logic) ---
-            if i >= 2:
-                row_minus_1 = sim_data.iloc[i-1]
-                row_minus_2 = sim_data.iloc[i-2]
-
-                # Swing High
-                if row_minus_1['High'] > row_minus_2['High'] and row_minus_1['High'] > row['High']:
-                    recent_swing_highs.append({
-                        'price': row_minus_1['High'],
-                        'rsi': row_minus_1['rsi'] if 'rsi' in row_minus_1 else 50,
-                        'idx': i-1
-                    })
-                    if len(recent_swing_highs) > 10: recent_swing_highs.pop(0)
-
-                # Swing Low
-                if row_minus_1['Low'] < row_minus_2['Low'] and row_minus_1['Low'] < row['Low']:
-                    recent_swing_lows.append({
-                        'price': row_minus_1['Low'],
-                        'rsi': row_minus_1['rsi'] if 'rsi' in row_minus_1 else 50,
-                        'idx': i-1
-                    })
-                    if len(recent_swing_lows) > 10: recent_swing_lows.pop(0)
+            if is_swing_high[i-1]:
+                recent_swing_highs.append({
+                    'price': highs[i-1],
+                    'rsi': rsi_values[i-1] if rsi_values is not None else 50,
+                    'idx': i-1
+                })
+                if len(recent_swing_highs) > 10: recent_swing_highs.pop(0)
+
+            if is_swing_low[i-1]:
+                recent_swing_lows.append({
+                    'price': lows[i-1],
+                    'rsi': rsi_values[i-1] if rsi_values is not None else 50,
+                    'idx': i-1
+                })
+                if len(recent_swing_lows) > 10: recent_swing_lows.pop(0)
 
             price = row['Close']
             buy_signal = False
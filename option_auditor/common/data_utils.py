@@ -2,17 +2,29 @@ import os
 import csv
 import pandas as pd
 import yfinance as yf
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta, date, time as dt_time
+from functools import lru_cache
 import logging
 import time
 import random
 import numpy as np
 from option_auditor.common.resilience import data_api_breaker, ResiliencyGuru
+from option_auditor.common.market_store import PartitionedMarketStore, PARTITION_READ_MAX_TICKERS
+from option_auditor.common.market_panel import MarketPanel
+from option_auditor.common import shared_panel
+from option_auditor.common.frame_cache import loaded_frame_cache, file_version, shared_copy
+from option_auditor.common.timeframes import resample_frame
+from option_auditor.common.downloader import default_downloader
+from option_auditor.common.single_flight import SingleFlight
+from option_auditor.common.market_data_provider import get_provider
 
 logger = logging.getLogger(__name__)
 
 CACHE_DIR = "cache_data"
 
+# Coalesces concurrent identical downloads (same cache/tickers/period/interval) into one request.
+market_data_flight = SingleFlight("market_data", share=lambda df: shared_copy(df) if isinstance(df, pd.DataFrame) else df)
+
 # Ensure cache directory exists
 os.makedirs(CACHE_DIR, exist_ok=True)
 
@@ -63,41 +75,42 @@ def save_atomic(df: pd.DataFrame, file_path: str):
         if os.path.exists(tmp_path):
             os.remove(tmp_path)
 
-def get_cached_market_data(ticker_list: list = None, period="2y", cache_name="sp500", force_refresh: bool = False, lookup_only: bool = False):
+def get_cached_market_data(ticker_list: list = None, period="2y", cache_name="sp500", force_refresh: bool = False, lookup_only: bool = False, incremental: bool = False, columns: list = None, tickers: list = None):
     """
-    Retrieves data from disk cache if valid (<24 hours for market scans).
+    Retrieves data from disk cache while it is current for the exchange calendar.
     Uses atomic writes and memory optimization.
+
+    A cache is current until a new trading session closes (per get_market_holidays) after
+    the last bar it stores. If the last bar cannot be determined, age-based windows apply
+    (<24 hours for market scans, 4h otherwise, stale-but-usable up to 48h).
+
+    incremental: When a refresh is needed and a cache file already exists, only the bars
+    after each ticker's last cached bar are downloaded and merged into the existing file.
+
+    Small ticker_list lookups are served from the per-ticker partitions when they are in sync
+    with the region file, so a watchlist check does not deserialize the whole universe.
+
+    columns: Only return these fields (e.g. ["Close", "Volume"]).
+    tickers: Only return these tickers (ticker_list remains the download universe).
+    Both are pushed down into the parquet reader, so unused columns are never decoded.
     """
     file_path = os.path.join(CACHE_DIR, f"{cache_name}.parquet")
 
-    # Determine Validity Duration
-    validity_hours = 24 if "market_scan" in cache_name else 4
-
     # Check if Cache Exists and Age
     file_exists = os.path.exists(file_path)
     file_age = None
     is_valid = False
     is_stale_but_usable = False
+    calendar_fresh = None
 
     if file_exists and not force_refresh:
-        try:
-            mtime = datetime.fromtimestamp(os.path.getmtime(file_path))
-            file_age = datetime.now() - mtime
-            age_hours = file_age.total_seconds() / 3600
-
-            if age_hours < validity_hours:
-                is_valid = True
-            elif age_hours < 48:
-                # Stale but usable fallback
-                is_stale_but_usable = True
-        except Exception as e:
-            logger.warning(f"Error checking cache validity: {e}")
+        is_valid, is_stale_but_usable, calendar_fresh, file_age = _cache_validity(file_path, cache_name, ticker_list, lookup_only)
 
     # 1. Return Valid Cache
     if is_valid:
         try:
-            logger.info(f"🚀 Loading {cache_name} from cache (Age: {file_age})...")
-            return pd.read_parquet(file_path)
+            logger.info(f"🚀 Loading {cache_name} from cache ({'current for the trading calendar' if calendar_fresh else f'Age: {file_age}'})...")
+            return _read_cache(file_path, cache_name, ticker_list, columns=columns, tickers=tickers)
         except Exception:
             logger.warning("Cache corrupted, will re-download.")
 
@@ -105,7 +118,7 @@ def get_cached_market_data(ticker_list: list = None, period="2y", cache_name="sp
     if is_stale_but_usable and not force_refresh:
         try:
             logger.warning(f"⚠️  Cache {cache_name} is stale ({file_age}). Returning to prevent timeout.")
-            return pd.read_parquet(file_path)
+            return _read_cache(file_path, cache_name, ticker_list, columns=columns, tickers=tickers)
         except Exception as e:
              logger.warning(f"Failed to read stale cache {cache_name}: {e}")
 
@@ -119,6 +132,52 @@ def get_cached_market_data(ticker_list: list = None, period="2y", cache_name="sp
         logger.warning("No ticker list provided for download.")
         return pd.DataFrame()
 
+    # Concurrent callers for the same universe share one download (see market_data_flight)
+    flight_key = ("cache", cache_name, tuple(sorted(set(ticker_list))), period, "1d")
+    all_data = market_data_flight.do(flight_key, _download_and_store, ticker_list, period, cache_name, file_path, incremental and file_exists)
+
+    # A session has closed since the cached bars but the download failed: yesterday's data beats none
+    if all_data.empty and calendar_fresh is False:
+        try:
+            logger.warning(f"⚠️  Refresh of {cache_name} returned no data. Serving the previous session's cache.")
+            return _read_cache(file_path, cache_name, ticker_list, columns=columns, tickers=tickers)
+        except Exception as e:
+            logger.warning(f"Failed to read previous cache {cache_name}: {e}")
+
+    return _project_frame(all_data, columns=columns, tickers=tickers)
+
+def _cache_validity(file_path: str, cache_name: str, ticker_list: list = None, lookup_only: bool = False):
+    """
+    (is_valid, is_stale_but_usable, calendar_fresh, file_age) of an existing cache file under
+    the rules get_cached_market_data serves it by.
+    """
+    # Determine Validity Duration (fallback when the calendar check is inconclusive)
+    validity_hours = 24 if "market_scan" in cache_name else 4
+    file_age = None
+    is_valid = False
+    is_stale_but_usable = False
+
+    calendar_fresh = _calendar_cache_freshness(file_path, cache_name, ticker_list)
+    if calendar_fresh is not None:
+        is_valid = calendar_fresh
+    try:
+        mtime = datetime.fromtimestamp(os.path.getmtime(file_path))
+        file_age = datetime.now() - mtime
+        age_hours = file_age.total_seconds() / 3600
+
+        if calendar_fresh is None and age_hours < validity_hours:
+            is_valid = True
+        elif not is_valid and age_hours < 48:
+            # Stale but usable fallback (a session has closed since the cache: only lookups
+            # take it, regular callers refresh and fall back to it if the download fails)
+            is_stale_but_usable = calendar_fresh is None or lookup_only
+    except Exception as e:
+        logger.warning(f"Error checking cache validity: {e}")
+
+    return is_valid, is_stale_but_usable, calendar_fresh, file_age
+
+def _download_and_store(ticker_list: list, period: str, cache_name: str, file_path: str, incremental: bool) -> pd.DataFrame:
+    """Downloads (or incrementally refreshes) a cache and saves it with its partitions/panel."""
     logger.info(f"⏳ Downloading fresh data for {len(ticker_list)} tickers (Chunked)...")
 
     # Detect Indian tickers for logging/tuning
@@ -126,20 +185,340 @@ def get_cached_market_data(ticker_list: list = None, period="2y", cache_name="sp
     if ticker_list and len(ticker_list) > 0 and isinstance(ticker_list[0], str):
         first = ticker_list[0]
         if first.endswith('.NS') or first.endswith('.BO'):
-             logger.info("🇮🇳 Indian tickers detected. Using chunking with sleep for safety.")
+             logger.info("🇮🇳 Indian tickers detected. Using rate-limited adaptive chunking.")
         elif any(first.endswith(s) for s in ['.L', '.AS', '.DE', '.PA', '.MC', '.MI', '.HE']):
-             logger.info("🇬🇧/🇪🇺 UK/Euro tickers detected. Disabling threads to prevent connection drop.")
+             logger.info("🇬🇧/🇪🇺 UK/Euro tickers detected. Disabling per-chunk threads to prevent connection drop (chunks still run concurrently).")
              use_threads = False
              
+    all_data = None
+    if incremental:
+        all_data = _refresh_incremental(ticker_list, period, file_path, use_threads)
+
     # Use safe batch fetch
-    all_data = fetch_batch_data_safe(ticker_list, period=period, interval="1d", chunk_size=30, threads=use_threads)
+    if all_data is None:
+        all_data = fetch_batch_data_safe(ticker_list, period=period, interval="1d", chunk_size=30, threads=use_threads)
 
     # 5. Save Cache Atomically
     if not all_data.empty:
         save_atomic(all_data, file_path)
+        _write_partitions(cache_name, all_data, file_path)
+        if shared_panel.SHARED_PANEL_ENABLED:
+            _publish_shared_panel(cache_name, all_data, file_path)
 
     return all_data
 
+def _project_frame(df: pd.DataFrame, columns: list = None, tickers: list = None) -> pd.DataFrame:
+    """In-memory equivalent of the reader projection for frames that are already decoded."""
+    if df is None or df.empty or (columns is None and tickers is None):
+        return df
+    if isinstance(df.columns, pd.MultiIndex):
+        mask = np.ones(len(df.columns), dtype=bool)
+        if tickers is not None:
+            mask &= df.columns.get_level_values(0).isin(tickers)
+        if columns is not None:
+            mask &= df.columns.get_level_values(1).isin(columns)
+        return df.loc[:, mask]
+    if columns is not None:
+        return df.loc[:, df.columns.isin(columns)]
+    return df
+
+def _read_parquet_projected(file_path: str, columns: list = None, tickers: list = None) -> pd.DataFrame:
+    """
+    Reads only the requested (ticker, field) columns of a cache parquet.
+    MultiIndex columns are stored by pyarrow under their stringified tuple, e.g. "('AAPL', 'Close')".
+    """
+    import ast
+    import pyarrow.parquet as pq
+
+    wanted_tickers = set(tickers) if tickers is not None else None
+    wanted_fields = set(columns) if columns is not None else None
+
+    selected = []
+    for name in pq.read_schema(file_path).names:
+        if name.startswith("__index_level_"):
+            continue
+        try:
+            key = ast.literal_eval(name) if name.startswith("(") else name
+        except (ValueError, SyntaxError):
+            key = name
+        if isinstance(key, tuple) and len(key) >= 2:
+            ticker, field = key[0], key[1]
+        else:
+            ticker, field = None, key
+        if wanted_tickers is not None and ticker is not None and ticker not in wanted_tickers:
+            continue
+        if wanted_fields is not None and field not in wanted_fields:
+            continue
+        selected.append(name)
+
+    return pd.read_parquet(file_path, columns=selected)
+
+def _read_cache(file_path: str, cache_name: str, ticker_list: list = None, columns: list = None, tickers: list = None) -> pd.DataFrame:
+    """
+    Reads a region cache through the in-process frame cache, keyed by the file's (mtime, size),
+    so repeated scans within the validity window do not touch disk.
+    On a miss, a few requested tickers are read from the partitions if the manifest was built
+    from this exact file and covers all of them; a columns/tickers projection reads only those
+    parquet columns; otherwise the full file is decoded and cached.
+    Callers get shared_copy()s, so their edits never leak into the cached frame.
+    """
+    version = file_version(file_path)
+    path_key = os.path.abspath(file_path)
+    projection = (tuple(columns) if columns is not None else None, tuple(tickers) if tickers is not None else None)
+
+    if version is not None:
+        cached = loaded_frame_cache.get(("frame", path_key, version))
+        if cached is not None:
+            return shared_copy(_project_frame(cached, columns=columns, tickers=tickers))
+
+    selection = tickers if tickers is not None else ticker_list
+    if selection and len(selection) <= PARTITION_READ_MAX_TICKERS and version is not None:
+        parts_key = ("parts", path_key, version, tuple(selection), projection[0])
+        cached = loaded_frame_cache.get(parts_key)
+        if cached is not None:
+            return shared_copy(cached)
+        try:
+            store = PartitionedMarketStore(cache_name, CACHE_DIR)
+            manifest = store.load_manifest()
+            if store.is_in_sync(manifest, version[0]) and \
+                    all(t in manifest["tickers"] for t in selection):
+                logger.info(f"🗂️  Reading {len(selection)} partitions from {cache_name}")
+                df = store.read(selection, manifest, columns=columns)
+                loaded_frame_cache.put(parts_key, df)
+                return shared_copy(df)
+        except Exception as e:
+            logger.debug(f"Partition read failed for {cache_name}, using full file: {e}")
+
+    if columns is not None or tickers is not None:
+        proj_key = ("proj", path_key, version, projection)
+        cached = loaded_frame_cache.get(proj_key) if version is not None else None
+        if cached is not None:
+            return shared_copy(cached)
+        try:
+            df = _read_parquet_projected(file_path, columns=columns, tickers=tickers)
+            if version is not None:
+                loaded_frame_cache.put(proj_key, df)
+                return shared_copy(df)
+            return df
+        except Exception as e:
+            logger.debug(f"Projected read failed for {cache_name}, using full file: {e}")
+
+    df = pd.read_parquet(file_path)
+    if version is not None and isinstance(df, pd.DataFrame):
+        loaded_frame_cache.put(("frame", path_key, version), df)
+        return shared_copy(_project_frame(df, columns=columns, tickers=tickers))
+    return _project_frame(df, columns=columns, tickers=tickers)
+
+def _write_partitions(cache_name: str, df: pd.DataFrame, file_path: str):
+    """Rebuilds the per-ticker partitions for a freshly saved region cache. Best effort."""
+    try:
+        source_mtime_ns = os.stat(file_path).st_mtime_ns
+        PartitionedMarketStore(cache_name, CACHE_DIR).write(df, source_mtime_ns)
+    except Exception as e:
+        logger.warning(f"Failed to partition cache {cache_name}: {e}")
+
+def _publish_shared_panel(cache_name: str, df: pd.DataFrame, file_path: str):
+    """Publishes the saved cache as a memory-mapped panel stamped with the file's version. Best effort."""
+    try:
+        version = shared_panel.cache_version(file_path)
+        if version:
+            panel = MarketPanel.from_frame(df, version=version)
+            shared_panel.publish_panel(panel, cache_name, CACHE_DIR, version)
+    except Exception as e:
+        logger.warning(f"Failed to publish shared panel {cache_name}: {e}")
+
+def load_shared_panel(cache_name: str, ticker_list: list = None, lookup_only: bool = False):
+    """
+    Returns the read-only shared MarketPanel for cache_name if sharing is enabled, the
+    published panel matches the current cache file and get_cached_market_data would serve
+    that file (same ticker_list / lookup_only rules), else None (callers read the parquet
+    or download).
+    """
+    if not shared_panel.SHARED_PANEL_ENABLED:
+        return None
+    file_path = os.path.join(CACHE_DIR, f"{cache_name}.parquet")
+    if not os.path.exists(file_path):
+        return None
+    is_valid, is_stale_but_usable, _, _ = _cache_validity(file_path, cache_name, ticker_list, lookup_only)
+    if not (is_valid or is_stale_but_usable):
+        return None
+    return shared_panel.attach_panel(cache_name, CACHE_DIR, expected_version=shared_panel.cache_version(file_path))
+
+def _period_to_timedelta(period: str):
+    """
+    Converts a yfinance period string ('2y', '6mo', '60d', '1wk') to a timedelta.
+    Returns None for open-ended periods such as 'max' or 'ytd'.
+    """
+    units = {"d": 1, "wk": 7, "mo": 31, "y": 366}
+    try:
+        for suffix, days in units.items():
+            if period.endswith(suffix):
+                return timedelta(days=int(period[:-len(suffix)]) * days)
+    except (ValueError, AttributeError):
+        pass
+    return None
+
+def _last_bar_dates(df: pd.DataFrame) -> dict:
+    """
+    Returns {ticker: last timestamp with a valid Close} for a (Ticker, Field) MultiIndex frame.
+    Tickers without any valid bar are omitted.
+    """
+    if not isinstance(df.columns, pd.MultiIndex) or df.empty:
+        return {}
+
+    fields = df.columns.get_level_values(1)
+    closes = df.loc[:, fields == 'Close'] if 'Close' in fields else df
+    mask = closes.notna().to_numpy()
+    if mask.size == 0:
+        return {}
+
+    # Index of the last True per column (argmax on the reversed rows)
+    last_pos = len(mask) - 1 - mask[::-1].argmax(axis=0)
+    has_bar = mask.any(axis=0)
+
+    last_dates = {}
+    for col, pos, ok in zip(closes.columns, last_pos, has_bar):
+        if ok:
+            ticker = col[0]
+            ts = df.index[pos]
+            if ticker not in last_dates or ts > last_dates[ticker]:
+                last_dates[ticker] = ts
+    return last_dates
+
+def _settled_bar_dates(df: pd.DataFrame) -> dict:
+    """
+    {ticker: timestamp of the second-to-last valid Close} for a (Ticker, Field) frame: the
+    latest bar that was certainly a full session. Tickers with a single bar map to that bar.
+    """
+    if not isinstance(df.columns, pd.MultiIndex) or df.empty:
+        return {}
+
+    fields = df.columns.get_level_values(1)
+    if 'Close' not in fields:
+        return _last_bar_dates(df)
+    closes = df.loc[:, fields == 'Close']
+    mask = closes.notna().to_numpy()
+    # Position of the second-to-last True per column (the last one where only one exists)
+    counts = mask.cumsum(axis=0)
+    totals = counts[-1] if len(counts) else np.zeros(mask.shape[1], dtype=int)
+    target = np.maximum(totals - 1, 1)
+
+    settled = {}
+    for j, col in enumerate(closes.columns):
+        if totals[j] == 0:
+            continue
+        pos = int(np.argmax(counts[:, j] >= target[j]))
+        ts = df.index[pos]
+        ticker = col[0]
+        if ticker not in settled or ts > settled[ticker]:
+            settled[ticker] = ts
+    return settled
+
+# Relative change of a re-fetched settled Close that means the provider re-adjusted the history
+ADJUSTMENT_TOLERANCE = 1e-4
+
+def _readjusted_tickers(existing: pd.DataFrame, delta: pd.DataFrame, tickers: list, anchors: dict) -> list:
+    """Tickers whose re-fetched settled bar no longer matches the cached one (beyond ADJUSTMENT_TOLERANCE)."""
+    changed = []
+    for ticker in tickers:
+        anchor = anchors.get(ticker)
+        try:
+            cached = existing[(ticker, 'Close')].get(anchor)
+            fetched = delta[(ticker, 'Close')].get(anchor)
+        except (KeyError, TypeError, ValueError):
+            continue
+        if not np.isscalar(cached) or not np.isscalar(fetched):
+            continue
+        if cached is None or fetched is None or pd.isna(cached) or pd.isna(fetched) or cached == 0:
+            # The provider did not return the bar: nothing to compare
+            continue
+        if abs(fetched / cached - 1) > ADJUSTMENT_TOLERANCE:
+            changed.append(ticker)
+    return changed
+
+def _refresh_incremental(ticker_list: list, period: str, file_path: str, use_threads: bool = True):
+    """
+    Delta refresh for an existing (Ticker, Field) parquet cache.
+    Downloads only the bars since each ticker's last settled cached bar (the bar before the
+    last one, which may have been a partial session), downloads the full period for tickers
+    that are not cached yet, merges everything and trims to the requested period.
+
+    The re-fetched settled bar checks the cached history is still on the provider's price
+    basis: if its Close moved beyond ADJUSTMENT_TOLERANCE (a split or dividend re-adjusted
+    the history) the ticker is downloaded in full instead of merged.
+
+    Returns the merged DataFrame, or None if the existing cache cannot be used incrementally
+    (the caller then falls back to a full download).
+    """
+    try:
+        existing = pd.read_parquet(file_path)
+    except Exception as e:
+        logger.warning(f"Incremental refresh: cannot read existing cache ({e}). Falling back to full download.")
+        return None
+
+    if existing.empty or not isinstance(existing.columns, pd.MultiIndex):
+        return None
+
+    # Tickers no longer in the universe leave the cache, as they would with a full download
+    existing = existing.loc[:, existing.columns.get_level_values(0).isin(ticker_list)]
+
+    anchors = _settled_bar_dates(existing)
+
+    # Group tickers sharing the same settled bar so each group is a single chunked download
+    groups = {}
+    missing = []
+    for ticker in dict.fromkeys(ticker_list):
+        anchor = anchors.get(ticker)
+        if anchor is None:
+            missing.append(ticker)
+        else:
+            groups.setdefault(pd.Timestamp(anchor).normalize(), []).append(ticker)
+
+    logger.info(f"⏩ Incremental refresh: {sum(len(v) for v in groups.values())} cached tickers "
+                f"in {len(groups)} date groups, {len(missing)} new tickers.")
+
+    updates = []
+    readjusted = []
+    for start, tickers in groups.items():
+        delta = fetch_batch_data_safe(tickers, interval="1d", chunk_size=30, threads=use_threads, start=start)
+        if delta.empty:
+            continue
+        changed = _readjusted_tickers(existing, delta, tickers, anchors) if isinstance(delta.columns, pd.MultiIndex) else []
+        if changed:
+            delta = delta.drop(columns=changed, level=0, errors='ignore')
+            readjusted.extend(changed)
+        if not delta.empty:
+            updates.append(delta)
+
+    if readjusted:
+        # Their cached bars are on the old price basis: replace them entirely
+        logger.info(f"🔁 Incremental refresh: {len(readjusted)} tickers re-adjusted (split/dividend), downloading in full.")
+        existing = existing.drop(columns=readjusted, level=0, errors='ignore')
+        missing.extend(readjusted)
+
+    if missing:
+        fresh = fetch_batch_data_safe(missing, period=period, interval="1d", chunk_size=30, threads=use_threads)
+        if not fresh.empty:
+            updates.append(fresh)
+
+    if not updates:
+        return existing
+
+    update = updates[0] if len(updates) == 1 else pd.concat(updates, axis=1, sort=True)
+    if not isinstance(update.columns, pd.MultiIndex):
+        logger.warning("Incremental refresh: unexpected flat delta frame. Falling back to full download.")
+        return None
+
+    # Downloaded bars win over cached ones (the last cached bar may have been intraday)
+    merged = update.combine_first(existing)
+    merged = merged.dropna(how='all')
+
+    window = _period_to_timedelta(period)
+    if window is not None and not merged.empty:
+        merged = merged[merged.index >= merged.index.max() - window]
+
+    return merged
+
 def fetch_data_with_retry(ticker, period="1y", interval="1d", auto_adjust=True, retries=3):
     """
     Fetches data from yfinance with exponential backoff retry logic.
@@ -147,7 +526,7 @@ def fetch_data_with_retry(ticker, period="1y", interval="1d", auto_adjust=True,
     for attempt in range(retries):
         try:
             # Wrap the actual network call with the breaker
-            df = data_api_breaker.call(yf.download, ticker, period=period, interval=interval, progress=False, auto_adjust=auto_adjust)
+            df = data_api_breaker.call(get_provider().download, ticker, period=period, interval=interval, progress=False, auto_adjust=auto_adjust)
             if not df.empty:
                 return df
         except Exception as e:
@@ -161,49 +540,48 @@ def fetch_data_with_retry(ticker, period="1y", interval="1d", auto_adjust=True,
 
     return pd.DataFrame()
 
-def fetch_batch_data_safe(tickers: list, period="1y", interval="1d", chunk_size=30, threads=True, raise_on_error=False) -> pd.DataFrame:
+def fetch_batch_data_safe(tickers: list, period="1y", interval="1d", chunk_size=30, threads=True, raise_on_error=False, start=None) -> pd.DataFrame:
     """
     Downloads data for a list of tickers in chunks to avoid Rate Limiting.
     Returns a combined DataFrame or Empty DataFrame on total failure.
+    If `start` is given, bars from that date onwards are requested instead of `period`.
+
+    Chunks are downloaded concurrently by the adaptive downloader: requests are paced by a
+    token bucket, and chunk_size is the upper bound for each exchange group's adaptive size.
     """
     if not tickers:
         return pd.DataFrame()
 
     # Deduplicate
     unique_tickers = sorted(list(set(tickers)))
-    chunks = [unique_tickers[i:i + chunk_size] for i in range(0, len(unique_tickers), chunk_size)]
-
-    data_frames = []
-    logger.info(f"Fetching {len(unique_tickers)} tickers in {len(chunks)} batches...")
-
-    for i, chunk in enumerate(chunks):
-        try:
-            if i > 0:
-                time.sleep(1.0 + random.random() * 0.5)
-
-            batch = data_api_breaker.call(
-                yf.download,
-                chunk,
-                period=period,
-                interval=interval,
-                group_by='ticker',
-                progress=False,
-                auto_adjust=True,
-                threads=threads
-            )
-
-            if not batch.empty:
-                data_frames.append(batch)
-
-        except Exception as e:
-            if raise_on_error:
-                # If specifically requested, bubble up the error (e.g. for Auth/Rate Limit detection)
-                raise e
-
-            logger.error(f"Batch {i} download failed or Circuit Open: {e}")
-            if data_api_breaker.current_state == 'open':
-                logger.warning("Circuit breaker open during batch fetch. Aborting remaining batches.")
-                break
+    window = {"start": start} if start is not None else {"period": period}
+
+    flight_key = ("batch", tuple(unique_tickers), interval, start if start is not None else period, raise_on_error)
+    return market_data_flight.do(flight_key, _fetch_batch, unique_tickers, interval, chunk_size, threads, raise_on_error, window)
+
+def _fetch_batch(unique_tickers: list, interval: str, chunk_size: int, threads: bool, raise_on_error: bool, window: dict) -> pd.DataFrame:
+    """Runs the chunked download for fetch_batch_data_safe and combines the chunks."""
+
+    def _fetch_chunk(chunk):
+        return data_api_breaker.call(
+            get_provider().download,
+            chunk,
+            interval=interval,
+            group_by='ticker',
+            progress=False,
+            auto_adjust=True,
+            threads=threads,
+            **window
+        )
+
+    logger.info(f"Fetching {len(unique_tickers)} tickers (chunks of up to {chunk_size})...")
+    data_frames = default_downloader.download(
+        unique_tickers,
+        _fetch_chunk,
+        chunk_size=chunk_size,
+        raise_on_error=raise_on_error,
+        should_abort=lambda: data_api_breaker.current_state == 'open',
+    )
 
     if not data_frames:
         return pd.DataFrame()
@@ -217,12 +595,21 @@ def fetch_batch_data_safe(tickers: list, period="1y", interval="1d", chunk_size=
         logger.error(f"Failed to concat batches: {e}")
         return pd.DataFrame()
 
-def prepare_data_for_ticker(ticker, data_source, time_frame, period, yf_interval, resample_rule, is_intraday):
-    """Helper to prepare DataFrame for a single ticker."""
+def prepare_data_for_ticker(ticker, data_source, time_frame, period, yf_interval, resample_rule, is_intraday,
+                            source_resampled=False):
+    """
+    Helper to prepare DataFrame for a single ticker. data_source may be a batch frame or a MarketPanel.
+    source_resampled: data_source already holds resample_rule bars (a derived panel), so only a
+    per-ticker fallback download is resampled.
+    """
     df = pd.DataFrame()
+    fetched = False
 
     # Extract from batch if available
-    if data_source is not None:
+    if isinstance(data_source, MarketPanel):
+        if ticker in data_source:
+            df = data_source.frame(ticker)
+    elif data_source is not None:
         if isinstance(data_source.columns, pd.MultiIndex):
             try:
                  # Check Level 1 (standard) or Level 0 (group_by='ticker')
@@ -238,6 +625,7 @@ def prepare_data_for_ticker(ticker, data_source, time_frame, period, yf_interval
     # If empty, sequential fetch with retry
     if df.empty:
          df = fetch_data_with_retry(ticker, period=period, interval=yf_interval, auto_adjust=not is_intraday)
+         fetched = True
 
     # Clean NaNs
     df = df.dropna(how='all')
@@ -252,110 +640,344 @@ def prepare_data_for_ticker(ticker, data_source, time_frame, period, yf_interval
             logger.debug(f"Error flattening cols for {ticker}: {e}")
 
     # Resample if needed
-    if resample_rule:
-        agg_dict = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
-        agg_dict = {k: v for k, v in agg_dict.items() if k in df.columns}
+    if resample_rule and (fetched or not source_resampled):
         try:
-            df = df.resample(resample_rule).agg(agg_dict)
-            df = df.dropna()
+            df = resample_frame(df, resample_rule)
         except Exception as e:
             logger.error(f"Error resampling {ticker}: {e}")
 
     return df
 
-def _calculate_trend_breakout_date(df: pd.DataFrame) -> str:
+# The trend start is searched for in the last 400 bars; the first of them needs the 51 bars before it
+TREND_BREAKOUT_SEARCH = 400
+TREND_BREAKOUT_BARS = TREND_BREAKOUT_SEARCH + 51
+TREND_BREAKOUT_FEATURE = ("trend_breakout", ())
+
+
+def _bars_since_breakout(close: np.ndarray, high_50: np.ndarray, low_20: np.ndarray) -> np.ndarray:
+    """
+    Per column of (bars x tickers) blocks: bars from the last bar back to the first close at or
+    above High_50 after the last close at or below Low_20, within the last 400 bars. -1 if the
+    last close is not above Low_20 or there is no such breakout.
+    """
+    bars_ago = np.full(close.shape[1], -1.0)
+    window = min(len(close), TREND_BREAKOUT_SEARCH)
+    close, high_50, low_20 = close[-window:], high_50[-window:], low_20[-window:]
+
+    in_trend = close[-1] > low_20[-1]
+    is_breakout = close >= high_50
+    is_broken = close <= low_20
+    last_break = np.where(is_broken.any(axis=0), window - 1 - np.argmax(is_broken[::-1], axis=0), -1)
+    is_breakout &= np.arange(window)[:, None] > last_break
+
+    found = in_trend & is_breakout.any(axis=0)
+    bars_ago[found] = (window - 1 - np.argmax(is_breakout, axis=0))[found]
+    return bars_ago
+
+
+def batch_trend_breakout(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> tuple:
+    """
+    _calculate_trend_breakout_date for a series or (bars x tickers) blocks, with the channels
+    computed as High_50 = prior 50-bar high and Low_20 = prior 20-bar low: a 1-tuple of bars
+    since the breakout (-1 if not in a trend). Only the last TREND_BREAKOUT_BARS are read.
+    """
+    from option_auditor.common.indicator_engine import rolling_max, rolling_min, shift
+
+    single = np.ndim(close) == 1
+    high, low, close = (np.asarray(x, dtype=np.float64).reshape(len(x), -1)[-TREND_BREAKOUT_BARS:] for x in (high, low, close))
+    if len(close) < 50:
+        bars_ago = np.full(close.shape[1], -1.0)
+    else:
+        bars_ago = _bars_since_breakout(close, shift(rolling_max(high, 50), 1), shift(rolling_min(low, 20), 1))
+    return (float(bars_ago[0]),) if single else (bars_ago,)
+
+
+def _calculate_trend_breakout_date(df: pd.DataFrame, ticker: str = None) -> str:
     """
     Calculates the start date of the current trend (ISA Logic: Breakout > 50d High, Exit < 20d Low).
     Returns "N/A" if not in a trend.
+    With a ticker the result is memoized per data version in the feature store (and batch-computed
+    for large scans by the indicator engine). High_50/Low_20 columns already on the frame are used as is.
     """
     try:
         # Ensure we have enough data
         if df.empty or len(df) < 50: return "N/A"
 
-        # Calculate indicators if missing
-        # Work on a copy/slice to avoid modifying original if needed, but adding columns is fine
-        subset = df.copy()
-
-        if 'High_50' not in subset.columns:
-            subset['High_50'] = subset['High'].rolling(50).max().shift(1)
-        if 'Low_20' not in subset.columns:
-            subset['Low_20'] = subset['Low'].rolling(20).min().shift(1)
-
-        curr_close = subset['Close'].iloc[-1]
-        low_20 = subset['Low_20'].iloc[-1]
+        if 'High_50' in df.columns or 'Low_20' in df.columns:
+            close = df['Close'].to_numpy(dtype=np.float64).reshape(-1, 1)
+            if 'High_50' in df.columns:
+                high_50 = df['High_50'].to_numpy(dtype=np.float64).reshape(-1, 1)
+            else:
+                high_50 = df['High'].rolling(50).max().shift(1).to_numpy(dtype=np.float64).reshape(-1, 1)
+            if 'Low_20' in df.columns:
+                low_20 = df['Low_20'].to_numpy(dtype=np.float64).reshape(-1, 1)
+            else:
+                low_20 = df['Low'].rolling(20).min().shift(1).to_numpy(dtype=np.float64).reshape(-1, 1)
+            bars_ago = _bars_since_breakout(close, high_50, low_20)[0]
+        else:
+            from option_auditor.common.feature_store import TickerFeatures
+            bars_ago = TickerFeatures(ticker, df).trend_breakout()[0]
 
-        # Check if currently in a trend state
-        # The ISA logic defines a trend as "Safe" if Close > Low_20.
-        # If currently stopped out (Close <= Low_20), then no active trend.
-        if pd.isna(curr_close) or pd.isna(low_20) or curr_close <= low_20:
+        if bars_ago < 0:
             return "N/A"
+        return df.index[-1 - int(bars_ago)].strftime("%Y-%m-%d")
+    except Exception:
+        return "N/A"
+
+# Listed holidays per exchange (includes one-off closures the rules below cannot know about)
+LISTED_HOLIDAYS = {
+    'NYSE': [
+        date(2024, 1, 1), date(2024, 1, 15), date(2024, 2, 19), date(2024, 3, 29),
+        date(2024, 5, 27), date(2024, 6, 19), date(2024, 7, 4), date(2024, 9, 2),
+        date(2024, 11, 28), date(2024, 12, 25),
+        date(2025, 1, 1), date(2025, 1, 9), date(2025, 1, 20), date(2025, 2, 17), date(2025, 4, 18),
+        date(2025, 5, 26), date(2025, 6, 19), date(2025, 7, 4), date(2025, 9, 1),
+        date(2025, 11, 27), date(2025, 12, 25)
+    ],
+    'LSE': [
+        date(2024, 1, 1), date(2024, 3, 29), date(2024, 4, 1), date(2024, 5, 6),
+        date(2024, 5, 27), date(2024, 8, 26), date(2024, 12, 25), date(2024, 12, 26),
+        date(2025, 1, 1), date(2025, 4, 18), date(2025, 4, 21), date(2025, 5, 5),
+        date(2025, 5, 26), date(2025, 8, 25), date(2025, 12, 25), date(2025, 12, 26)
+    ],
+    # NSE Holidays are plentiful and follow the lunar calendar, adding major ones
+    'NSE': [
+        date(2024, 1, 22), date(2024, 1, 26), date(2024, 3, 8), date(2024, 3, 25),
+        date(2024, 3, 29), date(2024, 4, 11), date(2024, 4, 17), date(2024, 5, 1),
+        date(2024, 6, 17), date(2024, 7, 17), date(2024, 8, 15), date(2024, 10, 2),
+        date(2024, 11, 1), date(2024, 11, 15), date(2024, 12, 25),
+        date(2025, 1, 26), date(2025, 2, 26), date(2025, 3, 14), date(2025, 3, 31),
+        date(2025, 4, 10), date(2025, 4, 14), date(2025, 4, 18), date(2025, 5, 1),
+        date(2025, 8, 15), date(2025, 8, 27), date(2025, 10, 2), date(2025, 10, 21),
+        date(2025, 12, 25)
+    ],
+}
 
-        # Search backwards
-        limit = min(len(subset), 400)
-        subset = subset.iloc[-limit:]
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th (1-based, -1 for the last) given weekday of a month."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = (date(year, month + 1, 1) if month < 12 else date(year + 1, 1, 1)) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+def _us_observed(day: date) -> date:
+    """Saturday holidays are observed on Friday, Sunday ones on Monday."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+def _rule_holidays(exchange: str, year: int) -> set:
+    """Regular holidays of an exchange in a year, from the rules that set them."""
+    from dateutil.easter import easter
+
+    good_friday = easter(year) - timedelta(days=2)
+    easter_monday = easter(year) + timedelta(days=1)
 
-        is_breakout = subset['Close'] >= subset['High_50']
-        is_broken = subset['Close'] <= subset['Low_20']
+    if exchange == 'NYSE':
+        days = {
+            _nth_weekday(year, 1, 0, 3),   # Martin Luther King Jr. Day
+            _nth_weekday(year, 2, 0, 3),   # Washington's Birthday
+            good_friday,
+            _nth_weekday(year, 5, 0, -1),  # Memorial Day
+            _us_observed(date(year, 7, 4)),
+            _nth_weekday(year, 9, 0, 1),   # Labor Day
+            _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+            _us_observed(date(year, 12, 25)),
+        }
+        if year >= 2022:
+            days.add(_us_observed(date(year, 6, 19)))
+        # A Saturday New Year's Day is not observed on the Friday before
+        if date(year, 1, 1).weekday() != 5:
+            days.add(_us_observed(date(year, 1, 1)))
+        return days
+
+    if exchange == 'LSE':
+        days = {
+            good_friday, easter_monday,
+            _nth_weekday(year, 5, 0, 1),   # Early May bank holiday
+            _nth_weekday(year, 5, 0, -1),  # Spring bank holiday
+            _nth_weekday(year, 8, 0, -1),  # Summer bank holiday
+        }
+        new_year = date(year, 1, 1)
+        days.add(new_year if new_year.weekday() < 5 else new_year + timedelta(days=7 - new_year.weekday()))
+        # Christmas and Boxing Day falling on a weekend move to the next free weekdays
+        day = date(year, 12, 25)
+        for holiday in (date(year, 12, 25), date(year, 12, 26)):
+            day = max(day, holiday)
+            while day.weekday() >= 5 or day in days:
+                day += timedelta(days=1)
+            days.add(day)
+        return days
+
+    if exchange == 'XETRA':
+        return {
+            date(year, 1, 1), good_friday, easter_monday, date(year, 5, 1),
+            date(year, 12, 24), date(year, 12, 25), date(year, 12, 26), date(year, 12, 31),
+        }
+
+    if exchange == 'NSE':
+        # Fixed-date national holidays that fall on a weekday; the lunar ones come from the
+        # holidays package's NSE calendar
+        days = {d for d in (date(year, 1, 26), date(year, 5, 1), date(year, 8, 15),
+                            date(year, 10, 2), date(year, 12, 25)) if d.weekday() < 5}
+        try:
+            import holidays as holidays_lib
+        except ImportError:
+            if not any(d.year == year for d in LISTED_HOLIDAYS['NSE']):
+                _warn_no_nse_calendar()
+            return days
+        return days | set(holidays_lib.financial_holidays("XNSE", years=year))
+
+    return set()
+
+@lru_cache(maxsize=1)
+def _warn_no_nse_calendar():
+    """Logged once per process."""
+    logger.warning("The holidays package is not installed: NSE lunar holidays beyond the listed "
+                   "years are unknown and will be treated as trading days")
+
+@lru_cache(maxsize=256)
+def _exchange_holidays(exchange: str, year: int) -> frozenset:
+    listed = {d for d in LISTED_HOLIDAYS.get(exchange, []) if d.year == year}
+    return frozenset(listed | _rule_holidays(exchange, year))
+
+def get_market_holidays(exchange: str, years: list = None) -> list[date]:
+    """
+    Returns a list of market holidays for the given exchange.
+    Supports: 'LSE', 'NSE', 'NYSE', 'XETRA'.
 
-        break_indices = subset.index[is_broken]
-        last_break_idx = break_indices[-1] if not break_indices.empty else None
+    Holidays come from the exchange's rules (any year) merged with the listed ones; NSE's
+    lunar holidays beyond the listed years need the `holidays` package. `years` defaults to
+    the listed years through next year.
+    """
+    exchange = exchange.upper()
+    if years is None:
+        first = min((d.year for d in LISTED_HOLIDAYS.get(exchange, [])), default=date.today().year)
+        years = range(first, date.today().year + 2)
 
-        breakout_indices = subset.index[is_breakout]
+    holidays = []
+    for year in years:
+        holidays.extend(sorted(_exchange_holidays(exchange, year)))
+    return holidays
 
-        if last_break_idx is not None:
-             valid_breakouts = breakout_indices[breakout_indices > last_break_idx]
-        else:
-             valid_breakouts = breakout_indices
+# Regular session close per exchange (local time) and the downloader's exchange groups that trade there
+EXCHANGE_SESSIONS = {
+    "NYSE": ("America/New_York", dt_time(16, 0)),
+    "LSE": ("Europe/London", dt_time(16, 30)),
+    "NSE": ("Asia/Kolkata", dt_time(15, 30)),
+    "XETRA": ("Europe/Berlin", dt_time(17, 30)),
+}
+GROUP_EXCHANGES = {"us": "NYSE", "uk": "LSE", "india": "NSE", "eu": "XETRA"}
 
-        if not valid_breakouts.empty:
-             return valid_breakouts[0].strftime("%Y-%m-%d")
+# Time after the close for the provider's daily bar to settle
+SESSION_SETTLE_MINUTES = 30
 
-        return "N/A"
-    except Exception:
-        return "N/A"
+def is_trading_day(exchange: str, day: date) -> bool:
+    """Weekdays that are not holidays of the exchange (see get_market_holidays)."""
+    return day.weekday() < 5 and day not in _exchange_holidays(exchange.upper(), day.year)
 
-def get_market_holidays(exchange: str) -> list[date]:
+def last_closed_session(exchange: str, now: datetime = None) -> pd.Timestamp:
     """
-    Returns a list of market holidays for the given exchange.
-    Supports: 'LSE', 'NSE', 'NYSE'.
+    Close time (tz-aware) of the most recent session of `exchange` that has closed and settled.
+    `now` defaults to the current time; a naive value is taken as UTC.
     """
-    exchange = exchange.upper()
+    tz, close = EXCHANGE_SESSIONS.get(exchange, EXCHANGE_SESSIONS["NYSE"])
+    now = pd.Timestamp.now(tz="UTC") if now is None else pd.Timestamp(now)
+    if now.tzinfo is None:
+        now = now.tz_localize("UTC")
+    now_local = now.tz_convert(tz)
+
+    day = now_local.date()
+    settle = timedelta(minutes=SESSION_SETTLE_MINUTES)
+    while True:
+        if is_trading_day(exchange, day):
+            session_close = pd.Timestamp(datetime.combine(day, close)).tz_localize(tz)
+            if session_close + settle <= now_local:
+                return session_close
+        day -= timedelta(days=1)
+
+def cache_exchanges(cache_name: str, ticker_list: list = None) -> set:
+    """Exchanges whose sessions feed a cache, from its tickers (or its name if none are given)."""
+    from option_auditor.common.downloader import exchange_group
+
+    if ticker_list:
+        return {GROUP_EXCHANGES[exchange_group(t)] for t in ticker_list if isinstance(t, str)} or {"NYSE"}
+
+    name = cache_name.lower()
+    if "india" in name:
+        return {"NSE"}
+    if "europe" in name or "euro" in name:
+        return {"LSE", "XETRA"}
+    if "uk" in name:
+        return {"LSE"}
+    return {"NYSE"}
+
+def _stored_last_bar(file_path: str):
+    """
+    Last bar date stored in a cache file, from the parquet footer statistics of its date index
+    (nothing is decoded). None if the file has no datetime index or cannot be read.
+    """
+    import pyarrow.parquet as pq
 
-    # 2024-2025 Basic Holiday List (Approximate)
-    # Ideally should use pandas_market_calendars, but using static list for simplicity/portability.
+    version = file_version(file_path)
+    if version is None:
+        return None
+    key = ("last_bar", os.path.abspath(file_path), version)
+    cached = loaded_frame_cache.get(key)
+    if cached is not None:
+        return cached
 
-    holidays = []
+    try:
+        parquet = pq.ParquetFile(file_path)
+        index_columns = (parquet.schema_arrow.pandas_metadata or {}).get("index_columns", [])
+        if len(index_columns) != 1 or not isinstance(index_columns[0], str):
+            return None
+        metadata = parquet.metadata
+        last_bar = None
+        for rg in range(metadata.num_row_groups):
+            row_group = metadata.row_group(rg)
+            for c in range(row_group.num_columns):
+                column = row_group.column(c)
+                if column.path_in_schema != index_columns[0] or column.statistics is None or not column.statistics.has_min_max:
+                    continue
+                value = pd.Timestamp(column.statistics.max)
+                last_bar = value if last_bar is None or value > last_bar else last_bar
+    except Exception as e:
+        logger.debug(f"Could not read last bar of {file_path}: {e}")
+        return None
 
-    if exchange == 'NYSE':
-        holidays = [
-            date(2024, 1, 1), date(2024, 1, 15), date(2024, 2, 19), date(2024, 3, 29),
-            date(2024, 5, 27), date(2024, 6, 19), date(2024, 7, 4), date(2024, 9, 2),
-            date(2024, 11, 28), date(2024, 12, 25),
-            date(2025, 1, 1), date(2025, 1, 20), date(2025, 2, 17), date(2025, 4, 18),
-            date(2025, 5, 26), date(2025, 6, 19), date(2025, 7, 4), date(2025, 9, 1),
-            date(2025, 11, 27), date(2025, 12, 25)
-        ]
-    elif exchange == 'LSE':
-        holidays = [
-            date(2024, 1, 1), date(2024, 3, 29), date(2024, 4, 1), date(2024, 5, 6),
-            date(2024, 5, 27), date(2024, 8, 26), date(2024, 12, 25), date(2024, 12, 26),
-            date(2025, 1, 1), date(2025, 4, 18), date(2025, 4, 21), date(2025, 5, 5),
-            date(2025, 5, 26), date(2025, 8, 25), date(2025, 12, 25), date(2025, 12, 26)
-        ]
-    elif exchange == 'NSE':
-        # NSE Holidays are plentiful, adding major ones
-        holidays = [
-            date(2024, 1, 22), date(2024, 1, 26), date(2024, 3, 8), date(2024, 3, 25),
-            date(2024, 3, 29), date(2024, 4, 11), date(2024, 4, 17), date(2024, 5, 1),
-            date(2024, 6, 17), date(2024, 7, 17), date(2024, 8, 15), date(2024, 10, 2),
-            date(2024, 11, 1), date(2024, 11, 15), date(2024, 12, 25),
-            date(2025, 1, 26), date(2025, 2, 26), date(2025, 3, 14), date(2025, 3, 31),
-            date(2025, 4, 10), date(2025, 4, 14), date(2025, 4, 18), date(2025, 5, 1),
-            date(2025, 8, 15), date(2025, 8, 27), date(2025, 10, 2), date(2025, 10, 21),
-            date(2025, 12, 25)
-        ]
+    if last_bar is not None:
+        loaded_frame_cache.put(key, last_bar, nbytes=64)
+    return last_bar
 
-    return holidays
+def _calendar_cache_freshness(file_path: str, cache_name: str, ticker_list: list = None, now: datetime = None):
+    """
+    True if no session has closed since the cache's last bar, False if a refresh is due,
+    None if the last bar or file time is unknown (callers fall back to age windows).
+
+    A session only counts if it settled after the file was written: the download that wrote
+    the file already saw every earlier session, so weekends, holidays (listed or not) and
+    tickers whose history simply ends do not trigger re-downloads. A last bar dated on the
+    latest closed session but written before it settled is a partial bar and is refreshed.
+    """
+    last_bar = _stored_last_bar(file_path)
+    version = file_version(file_path)
+    if last_bar is None or version is None:
+        return None
+
+    written = pd.Timestamp(version[0], unit="ns", tz="UTC")
+    settle = timedelta(minutes=SESSION_SETTLE_MINUTES)
+
+    for exchange in cache_exchanges(cache_name, ticker_list):
+        session_close = last_closed_session(exchange, now)
+        session_day = session_close.date()
+        if written < session_close + settle and last_bar.date() <= session_day:
+            return False
+
+    return True
 
 def get_currency_symbol(ticker: str) -> str:
     """
@@ -412,7 +1034,7 @@ def fetch_exchange_rate(from_curr: str, to_curr: str) -> float:
             # Actually USDINR=X is standard.
             yf_ticker = "USDINR=X"
 
-        data = yf.Ticker(yf_ticker)
+        data = get_provider().ticker(yf_ticker)
         hist = data.history(period="1d")
         if not hist.empty:
             rate = hist['Close'].iloc[-1]
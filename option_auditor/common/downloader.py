@@ -0,0 +1,207 @@
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Global request budget against Yahoo (chunks per second) and max concurrent chunk downloads.
+DOWNLOAD_RATE_PER_SEC = float(os.environ.get("DOWNLOAD_RATE_PER_SEC", 2.0))
+DOWNLOAD_MAX_IN_FLIGHT = int(os.environ.get("DOWNLOAD_MAX_IN_FLIGHT", 4))
+
+EU_SUFFIXES = ('.AS', '.DE', '.PA', '.MC', '.MI', '.HE', '.BR', '.LS', '.SW', '.ST', '.CO', '.OL', '.VI', '.IR')
+
+# Per exchange group: concurrent chunks allowed and the latency (s) above which a chunk counts as slow.
+EXCHANGE_PROFILES = {
+    "us": {"max_in_flight": 4, "slow_seconds": 20.0},
+    "uk": {"max_in_flight": 2, "slow_seconds": 20.0},
+    "eu": {"max_in_flight": 2, "slow_seconds": 20.0},
+    "india": {"max_in_flight": 2, "slow_seconds": 25.0},
+}
+
+
+def exchange_group(ticker: str) -> str:
+    """Maps a ticker to the exchange group whose rate behaviour it shares."""
+    t = str(ticker).upper()
+    if t.endswith('.L'):
+        return "uk"
+    if t.endswith('.NS') or t.endswith('.BO'):
+        return "india"
+    if t.endswith(EU_SUFFIXES):
+        return "eu"
+    return "us"
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. acquire() reserves a token and sleeps for any deficit,
+    so callers are paced at `rate` per second after an initial burst of `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Takes one token, sleeping until it is available. Returns the time slept."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1.0
+            wait_for = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait_for > 0:
+            time.sleep(wait_for)
+        return wait_for
+
+    def reset(self):
+        with self._lock:
+            self._tokens = self.capacity
+            self._last = time.monotonic()
+
+
+class ChunkTuner:
+    """
+    AIMD chunk sizing for one exchange group: the scale applied to the caller's chunk_size
+    halves on errors or slow chunks and recovers additively on fast successes.
+    """
+    MIN_SCALE = 0.2
+    STEP_UP = 0.1
+
+    def __init__(self, slow_seconds: float):
+        self.slow_seconds = slow_seconds
+        self.scale = 1.0
+        self._lock = threading.Lock()
+
+    def chunk_size(self, requested: int) -> int:
+        return max(1, int(round(requested * self.scale)))
+
+    def record(self, seconds: float, ok: bool):
+        with self._lock:
+            if not ok or seconds > self.slow_seconds:
+                self.scale = max(self.MIN_SCALE, self.scale / 2)
+            else:
+                self.scale = min(1.0, self.scale + self.STEP_UP)
+
+
+class AdaptiveDownloader:
+    """
+    Downloads ticker chunks concurrently: a global token bucket paces requests, the number
+    of in-flight chunks is bounded (overall and per exchange group), and each group's chunk
+    size adapts to the latency and error rate it observes. Tuning state persists across calls.
+    """
+
+    def __init__(self, rate_per_sec: float = DOWNLOAD_RATE_PER_SEC, max_in_flight: int = DOWNLOAD_MAX_IN_FLIGHT):
+        self.max_in_flight = max(1, max_in_flight)
+        self.bucket = TokenBucket(rate_per_sec)
+        self.tuners: Dict[str, ChunkTuner] = {}
+        self._lock = threading.Lock()
+
+    def tuner(self, group: str) -> ChunkTuner:
+        with self._lock:
+            if group not in self.tuners:
+                self.tuners[group] = ChunkTuner(EXCHANGE_PROFILES.get(group, EXCHANGE_PROFILES["us"])["slow_seconds"])
+            return self.tuners[group]
+
+    def reset(self):
+        with self._lock:
+            self.tuners.clear()
+        self.bucket.reset()
+
+    def download(
+        self,
+        tickers: List[str],
+        fetch_chunk: Callable[[List[str]], pd.DataFrame],
+        chunk_size: int = 30,
+        raise_on_error: bool = False,
+        should_abort: Optional[Callable[[], bool]] = None,
+    ) -> List[pd.DataFrame]:
+        """
+        Runs fetch_chunk over adaptive chunks of `tickers` and returns the non-empty frames
+        in dispatch order. Failed chunks are logged and skipped (or re-raised with raise_on_error).
+        should_abort is checked after each failure; if it returns True no further chunks are sent.
+        """
+        queues: Dict[str, List[str]] = {}
+        for t in tickers:
+            queues.setdefault(exchange_group(t), []).append(t)
+
+        results: Dict[int, pd.DataFrame] = {}
+        in_flight = {}
+        group_in_flight = {g: 0 for g in queues}
+        dispatched = 0
+        aborted = False
+        first_error = None
+
+        def _timed_fetch(chunk):
+            started = time.monotonic()
+            try:
+                return fetch_chunk(chunk), None, time.monotonic() - started
+            except Exception as e:
+                return None, e, time.monotonic() - started
+
+        def _next_group():
+            for g, remaining in queues.items():
+                limit = EXCHANGE_PROFILES.get(g, EXCHANGE_PROFILES["us"])["max_in_flight"]
+                if remaining and group_in_flight[g] < limit:
+                    return g
+            return None
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            while True:
+                while not aborted and len(in_flight) < self.max_in_flight:
+                    group = _next_group()
+                    if group is None:
+                        break
+                    size = self.tuner(group).chunk_size(chunk_size)
+                    chunk, queues[group] = queues[group][:size], queues[group][size:]
+                    self.bucket.acquire()
+                    future = executor.submit(_timed_fetch, chunk)
+                    in_flight[future] = (dispatched, group, chunk)
+                    group_in_flight[group] += 1
+                    dispatched += 1
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, group, chunk = in_flight.pop(future)
+                    group_in_flight[group] -= 1
+                    batch, error, seconds = future.result()
+                    self.tuner(group).record(seconds, ok=error is None)
+
+                    if error is not None:
+                        if raise_on_error:
+                            first_error = first_error or error
+                            aborted = True
+                            continue
+                        logger.error(f"Batch {index} ({group}, {len(chunk)} tickers) download failed or Circuit Open: {error}")
+                        if should_abort and should_abort():
+                            logger.warning("Circuit breaker open during batch fetch. Aborting remaining batches.")
+                            aborted = True
+                        continue
+
+                    if batch is not None and not batch.empty:
+                        results[index] = batch
+
+        if first_error is not None:
+            raise first_error
+
+        return [results[i] for i in sorted(results)]
+
+
+default_downloader = AdaptiveDownloader()
+
+
+def reset_download_state():
+    """Clears adaptive chunk sizes and refills the rate limiter."""
+    default_downloader.reset()
@@ -0,0 +1,328 @@
+import os
+import hashlib
+import logging
+import threading
+from typing import Callable, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+
+from option_auditor.common.frame_cache import FrameCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FEATURE_STORE_MB = int(os.environ.get("FEATURE_STORE_MAX_MB", 256))
+
+# Opt-in on-disk tier: indicator series survive restarts and are shared by workers on one host.
+FEATURE_STORE_DIR = os.environ.get("FEATURE_STORE_DIR") or None
+
+_FINGERPRINT_FIELDS = ("Open", "High", "Low", "Close", "Volume")
+
+# Nominal footprint of a stored latest value (key and float) for the memory budget
+_LAST_VALUE_NBYTES = 256
+
+
+def data_version(df: pd.DataFrame) -> Optional[tuple]:
+    """
+    Identity of a price frame: (first bar, last bar, bar count, last bar's OHLCV, digest).
+    The last bar's values are included so an intraday update of today's bar is a new version;
+    the digest of every bar's OHLCV and date makes a revised interior bar one too (the disk
+    tier would otherwise serve indicators of the old bars indefinitely).
+    None if the frame is empty.
+    """
+    if df is None or df.empty:
+        return None
+    fields = [f for f in df.columns if f in _FINGERPRINT_FIELDS]
+    bars = df if len(fields) == len(df.columns) else df[fields]
+    bars = np.ascontiguousarray(bars.to_numpy(dtype=np.float64, na_value=np.nan))
+    last = dict(zip(fields, bars[-1].tolist()))
+    values = tuple(
+        last[f] if f in last and last[f] == last[f] else None
+        for f in _FINGERPRINT_FIELDS
+    )
+    index = df.index
+    h = hashlib.blake2b(bars, digest_size=16)
+    h.update(",".join(map(str, fields)).encode())
+    h.update(index.asi8 if isinstance(index, pd.DatetimeIndex) else pd.util.hash_pandas_object(index, index=False).to_numpy())
+    return (str(index[0]), str(index[-1]), len(df), values, h.hexdigest())
+
+
+def bar_version(df: pd.DataFrame) -> Optional[tuple]:
+    """
+    Cheap identity of a price frame from its ends: (first bar, last bar, bar count, first
+    and last bars' OHLCV). Keys latest values streamed by indicator_stream, which checks
+    the bars in between itself. None if the frame is empty.
+    """
+    if df is None or df.empty:
+        return None
+    fields = [f for f in _FINGERPRINT_FIELDS if f in df.columns]
+    ends = df[fields].iloc[[0, -1]].to_numpy(dtype=np.float64, na_value=np.nan).tolist()
+    values = tuple(
+        tuple(bar[f] if f in bar and bar[f] == bar[f] else None for f in _FINGERPRINT_FIELDS)
+        for bar in (dict(zip(fields, row)) for row in ends)
+    )
+    return (str(df.index[0]), str(df.index[-1]), len(df), values)
+
+
+class FeatureStore:
+    """
+    Indicator series keyed by (ticker, data version, indicator, params), computed once and
+    served to every strategy that asks for them during a scan. Large scans pre-fill it in
+    one batch through the indicator engine (prime_panel_features).
+
+    The in-memory tier is a FrameCache (LRU under a byte budget). When `disk_dir` is set,
+    float series are also written as .npy files and re-attached to the caller's index on a
+    memory miss. Cached series are shared between callers and must not be modified in place.
+    """
+
+    def __init__(self, max_bytes: int, disk_dir: Optional[str] = None):
+        self.memory = FrameCache(max_bytes)
+        self.disk_dir = disk_dir
+        self._lock = threading.Lock()
+
+    def get(self, ticker: str, df: pd.DataFrame, name: str, params: tuple, compute: Callable[[], Optional[pd.Series]],
+            version: Optional[tuple] = None) -> Optional[pd.Series]:
+        version = version or data_version(df)
+        if not ticker or version is None:
+            return compute()
+
+        key = (ticker, version, name, params)
+        cached = self.memory.get(key)
+        if cached is not None:
+            return cached
+
+        series = self._load(key, df) if self.disk_dir else None
+        if series is None:
+            series = compute()
+            if series is None:
+                return None
+            if self.disk_dir and len(series) == len(df):
+                self._save(key, series)
+
+        self.memory.put(key, series)
+        return series
+
+    def lookup(self, ticker: str, version: Optional[tuple], name: str, params: tuple):
+        """The cached value if the memory tier has it, without computing anything."""
+        if not ticker or version is None:
+            return None
+        return self.memory.get((ticker, version, name, params))
+
+    def put(self, ticker: str, version: tuple, name: str, params: tuple, value):
+        """Stores a precomputed feature (see indicator_engine) for a frame with `version`."""
+        self.memory.put((ticker, version, name, params), value)
+
+    def lookup_last(self, ticker: str, version: Optional[tuple], name: str, params: tuple) -> Optional[float]:
+        """The latest value of a feature stored by put_last, if any."""
+        if not ticker or version is None:
+            return None
+        return self.memory.get((ticker, version, "last", (name, params)))
+
+    def put_last(self, ticker: str, version: tuple, name: str, params: tuple, value: float):
+        """Stores only a feature's latest value (see indicator_stream) for a frame with bar_version `version`."""
+        self.memory.put((ticker, version, "last", (name, params)), value, nbytes=_LAST_VALUE_NBYTES)
+
+    def clear(self):
+        self.memory.clear()
+
+    def _disk_path(self, key: Hashable) -> str:
+        ticker, version, name, params = key
+        safe_ticker = "".join(c if c.isalnum() or c in "-_." else "_" for c in ticker)
+        digest = hashlib.sha1(repr(version).encode()).hexdigest()[:16]
+        return os.path.join(self.disk_dir, safe_ticker, f"{name}-{'_'.join(map(str, params))}-{digest}.npy")
+
+    def _load(self, key: Hashable, df: pd.DataFrame) -> Optional[pd.Series]:
+        path = self._disk_path(key)
+        try:
+            values = np.load(path)
+        except (OSError, ValueError):
+            return None
+        if len(values) != len(df):
+            return None
+        return pd.Series(values, index=df.index)
+
+    def _save(self, key: Hashable, series: pd.Series):
+        """Best effort; replaces older versions of the same indicator for the ticker."""
+        if not isinstance(series, pd.Series) or not pd.api.types.is_numeric_dtype(series.dtype):
+            return
+        path = self._disk_path(key)
+        folder, filename = os.path.split(path)
+        prefix = filename.rsplit("-", 1)[0] + "-"
+        try:
+            with self._lock:
+                os.makedirs(folder, exist_ok=True)
+                for old in os.listdir(folder):
+                    if old.startswith(prefix) and old != filename:
+                        os.remove(os.path.join(folder, old))
+                tmp = f"{path}.tmp.npy"
+                np.save(tmp, series.to_numpy(dtype=np.float64, na_value=np.nan))
+                os.replace(tmp, path)
+        except OSError as e:
+            logger.debug(f"Feature store write failed for {path}: {e}")
+
+
+feature_store = FeatureStore(DEFAULT_FEATURE_STORE_MB * 1024 * 1024, disk_dir=FEATURE_STORE_DIR)
+
+_WINDOW_FEATURES = {"sma", "rolling_max", "rolling_min", "donchian_high", "donchian_low"}
+
+
+def _last_window_value(df: pd.DataFrame, name: str, params: tuple) -> float:
+    """Last value of a rolling-window feature from its window alone (pandas min_periods=n rules)."""
+    if name == "sma":
+        length, column = params
+        window = df[column].iloc[-length:]
+    elif name in ("rolling_max", "rolling_min"):
+        column, length = params
+        window = df[column].iloc[-length:]
+    else:
+        # Donchian: the `length` bars before the last one
+        length = params[0]
+        window = df["High" if name == "donchian_high" else "Low"].iloc[-length - 1:-1]
+
+    values = window.to_numpy(dtype=np.float64, na_value=np.nan)
+    if len(values) < length or np.isnan(values).any():
+        return float("nan")
+    if name == "sma":
+        # A constant window is returned exactly, as pandas does
+        return float(values[0]) if (values == values[0]).all() else float(values.mean())
+    if name in ("rolling_max", "donchian_high"):
+        return float(values.max())
+    return float(values.min())
+
+
+class TickerFeatures:
+    """
+    Indicator accessors for one ticker's frame, served from the feature store.
+
+    Each method computes exactly what the strategies computed inline before
+    (pandas rolling windows, pandas_ta ATR/RSI/EMA/bands), so signals are unchanged.
+    Store keys are (method name, positional args), which is also how the indicator
+    engine publishes batch results. Without a ticker nothing is cached.
+    """
+
+    def __init__(self, ticker: Optional[str], df: pd.DataFrame, store: Optional[FeatureStore] = None):
+        self.ticker = ticker
+        self.df = df
+        self.store = store or feature_store
+        self._version = None
+        self._bar_version = None
+
+    @property
+    def version(self) -> Optional[tuple]:
+        if self._version is None and self.ticker:
+            self._version = data_version(self.df)
+        return self._version
+
+    @property
+    def bar_version(self) -> Optional[tuple]:
+        if self._bar_version is None and self.ticker:
+            self._bar_version = bar_version(self.df)
+        return self._bar_version
+
+    def _get(self, name: str, params: tuple, compute: Callable[[], Optional[pd.Series]]) -> Optional[pd.Series]:
+        return self.store.get(self.ticker, self.df, name, params, compute, version=self.version)
+
+    def feature(self, name: str, params: tuple):
+        """Generic accessor: feature("atr", (14,)) == atr(14)."""
+        return getattr(self, name)(*params)
+
+    def cached(self, name: str, params: tuple):
+        """The stored value of a feature (e.g. published by the indicator engine) or None; never computes."""
+        return self.store.lookup(self.ticker, self.version, name, params)
+
+    def last(self, name: str, params: tuple) -> float:
+        """
+        Latest value of a single-series feature (last-bar evaluation). Served from the store
+        when the value was streamed or the full series is cached; otherwise window features
+        read only their window and the others fall back to the full series. NaN when it
+        cannot be computed.
+        """
+        streamed = self.store.lookup_last(self.ticker, self.bar_version, name, params)
+        if streamed is not None:
+            return streamed
+        cached = self.cached(name, params)
+        if cached is None and name in _WINDOW_FEATURES:
+            return _last_window_value(self.df, name, params)
+        series = cached if cached is not None else self.feature(name, params)
+        if series is None or len(series) == 0:
+            return float("nan")
+        return float(series.iloc[-1])
+
+    def sma(self, length: int, column: str = "Close") -> pd.Series:
+        return self._get("sma", (length, column), lambda: self.df[column].rolling(length).mean())
+
+    def ema(self, length: int, column: str = "Close") -> Optional[pd.Series]:
+        return self._get("ema", (length, column), lambda: ta.ema(self.df[column], length=length))
+
+    def rolling_max(self, column: str, length: int) -> pd.Series:
+        return self._get("rolling_max", (column, length), lambda: self.df[column].rolling(length).max())
+
+    def rolling_min(self, column: str, length: int) -> pd.Series:
+        return self._get("rolling_min", (column, length), lambda: self.df[column].rolling(length).min())
+
+    def donchian_high(self, length: int = 20) -> pd.Series:
+        """Highest high of the previous `length` bars (excludes the current bar)."""
+        return self._get("donchian_high", (length,), lambda: self.rolling_max("High", length).shift(1))
+
+    def donchian_low(self, length: int = 20) -> pd.Series:
+        """Lowest low of the previous `length` bars (excludes the current bar)."""
+        return self._get("donchian_low", (length,), lambda: self.rolling_min("Low", length).shift(1))
+
+    def volume_avg(self, length: int = 20) -> pd.Series:
+        return self.sma(length, column="Volume")
+
+    def atr(self, length: int = 14) -> Optional[pd.Series]:
+        return self._get("atr", (length,), lambda: ta.atr(self.df["High"], self.df["Low"], self.df["Close"], length=length))
+
+    def rsi(self, length: int = 14, column: str = "Close") -> Optional[pd.Series]:
+        return self._get("rsi", (length, column), lambda: ta.rsi(self.df[column], length=length))
+
+    def bollinger_bands(self, length: int = 20, std: float = 2.0) -> Optional[pd.DataFrame]:
+        """lower/mid/upper columns of pandas_ta bbands."""
+        def compute():
+            bb = ta.bbands(self.df["Close"], length=length, std=std)
+            if bb is None:
+                return None
+            bands = bb.iloc[:, :3].copy()
+            bands.columns = ["lower", "mid", "upper"]
+            return bands
+        return self._get("bollinger_bands", (length, std), compute)
+
+    def keltner_channels(self, length: int = 20, scalar: float = 1.5) -> Optional[pd.DataFrame]:
+        """lower/basis/upper columns of pandas_ta kc."""
+        def compute():
+            kc = ta.kc(self.df["High"], self.df["Low"], self.df["Close"], length=length, scalar=scalar)
+            if kc is None:
+                return None
+            bands = kc.iloc[:, :3].copy()
+            bands.columns = ["lower", "basis", "upper"]
+            return bands
+        return self._get("keltner_channels", (length, scalar), compute)
+
+    # Cycle, pattern and trend features: one value per frame rather than a series
+
+    def hilbert_phase(self) -> tuple:
+        """(phase, amplitude) at the last bar, as calculate_hilbert_phase on the closes."""
+        from option_auditor.strategies.math_utils import calculate_hilbert_phase
+        return self._get("hilbert_phase", (), lambda: calculate_hilbert_phase(self.df["Close"].values))
+
+    def dominant_cycle(self) -> Optional[tuple]:
+        """(period, rel_pos) as calculate_dominant_cycle on the closes; None under 64 bars."""
+        from option_auditor.strategies.math_utils import calculate_dominant_cycle
+        return self._get("dominant_cycle", (), lambda: calculate_dominant_cycle(self.df["Close"].tolist()))
+
+    def darvas_box(self) -> Optional[tuple]:
+        """(ceiling, floor, state) of the latest Darvas box, as patterns.darvas_boxes; None without a ceiling."""
+        from option_auditor.strategies.patterns import darvas_boxes
+
+        def compute():
+            box = darvas_boxes(self.df["High"].values, self.df["Low"].values, self.df["Close"].values)
+            return None if np.isnan(box[0]) else box
+        return self._get("darvas_box", (), compute)
+
+    def trend_breakout(self) -> tuple:
+        """(bars since the current trend's breakout,) as data_utils.batch_trend_breakout; -1 outside a trend."""
+        from option_auditor.common.data_utils import batch_trend_breakout
+        return self._get("trend_breakout", (), lambda: batch_trend_breakout(
+            self.df["High"].values, self.df["Low"].values, self.df["Close"].values))
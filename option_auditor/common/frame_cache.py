@@ -0,0 +1,99 @@
+import os
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FRAME_CACHE_MB = int(os.environ.get("FRAME_CACHE_MAX_MB", 1024))
+
+
+def estimate_nbytes(obj: Any) -> int:
+    """Approximate in-memory size of a cached DataFrame, MarketPanel or ndarray."""
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=False).sum())
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    return int(getattr(obj, "nbytes", 0))
+
+
+def file_version(file_path: str) -> Optional[tuple]:
+    """(mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(file_path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+# Copy-on-write is always on from pandas 3; before that only if the application enabled it
+_ALWAYS_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3
+
+
+def shared_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy of a shared (cached) frame to hand to a caller: shallow under copy-on-write, deep
+    otherwise, so in-place edits never reach the shared data.
+    """
+    copy_on_write = _ALWAYS_COPY_ON_WRITE or pd.get_option("mode.copy_on_write") is True
+    return df.copy(deep=not copy_on_write)
+
+
+class FrameCache:
+    """
+    Thread-safe, process-level LRU for decoded cache files with a memory budget.
+
+    Keys carry the source file's (mtime_ns, size), so a rewritten file is simply a miss and
+    its stale entries age out. Objects larger than the whole budget are not cached.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: Optional[int] = None):
+        nbytes = estimate_nbytes(value) if nbytes is None else nbytes
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[1]
+            self._entries[key] = (value, nbytes)
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes and self._entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._nbytes -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+loaded_frame_cache = FrameCache(DEFAULT_FRAME_CACHE_MB * 1024 * 1024)
@@ -0,0 +1,441 @@
+import time
+import importlib
+import logging
+import warnings
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from option_auditor.common.market_panel import MarketPanel
+
+logger = logging.getLogger(__name__)
+
+# Below this many tickers the per-ticker path is as fast as building the (date x ticker) blocks
+ENGINE_MIN_TICKERS = 50
+
+FeatureSpec = Tuple[str, tuple]
+
+# ---------------------------------------------------------------------------
+# Array kernels. All take (date x ticker) float64 arrays and work down axis 0;
+# a NaN anywhere in a window gives NaN, like pandas rolling(n) with min_periods=n.
+# ---------------------------------------------------------------------------
+
+def shift(x: np.ndarray, periods: int = 1) -> np.ndarray:
+    out = np.full_like(x, np.nan)
+    if periods < len(x):
+        out[periods:] = x[:len(x) - periods]
+    return out
+
+
+def _rolling_extreme(x: np.ndarray, n: int, ufunc) -> np.ndarray:
+    """van Herk/Gil-Werman: block prefix/suffix accumulations give every window in O(T)."""
+    t = x.shape[0]
+    out = np.full_like(x, np.nan)
+    if n <= 0 or t < n:
+        return out
+    blocks = -(-t // n)
+    pad = blocks * n - t
+    padded = np.concatenate([x, np.full((pad,) + x.shape[1:], np.nan)]) if pad else x
+    shaped = padded.reshape((blocks, n) + x.shape[1:])
+    prefix = ufunc.accumulate(shaped, axis=1).reshape(padded.shape)
+    suffix = ufunc.accumulate(shaped[:, ::-1], axis=1)[:, ::-1].reshape(padded.shape)
+    # Window [i-n+1, i] = suffix from its first element's block + prefix of i's block
+    out[n - 1:] = ufunc(suffix[:t - n + 1], prefix[n - 1:t])
+    return out
+
+
+def rolling_max(x: np.ndarray, n: int) -> np.ndarray:
+    return _rolling_extreme(x, n, np.maximum)
+
+
+def rolling_min(x: np.ndarray, n: int) -> np.ndarray:
+    return _rolling_extreme(x, n, np.minimum)
+
+
+def _window_sums(x: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(sum, valid count) of each trailing n-window, NaNs counted as missing."""
+    valid = ~np.isnan(x)
+    zero = np.zeros((1,) + x.shape[1:])
+    csum = np.concatenate([zero, np.cumsum(np.where(valid, x, 0.0), axis=0)])
+    ccount = np.concatenate([zero, np.cumsum(valid, axis=0)])
+    return csum[n:] - csum[:-n], ccount[n:] - ccount[:-n]
+
+
+def rolling_mean(x: np.ndarray, n: int) -> np.ndarray:
+    out = np.full_like(x, np.nan)
+    if n <= 0 or len(x) < n:
+        return out
+    sums, counts = _window_sums(x, n)
+    out[n - 1:] = np.where(counts == n, sums / n, np.nan)
+    # Constant windows return the value itself, as pandas does (no summation residue)
+    hi, lo = rolling_max(x, n), rolling_min(x, n)
+    return np.where(hi == lo, hi, out)
+
+
+def rolling_std(x: np.ndarray, n: int, ddof: int = 0) -> np.ndarray:
+    out = np.full_like(x, np.nan)
+    if n <= ddof or len(x) < n:
+        return out
+    # Centre each column on its first value to keep the sum-of-squares well conditioned
+    first = x[np.argmax(~np.isnan(x), axis=0), np.arange(x.shape[1])]
+    centred = x - np.nan_to_num(first)
+    sums, counts = _window_sums(centred, n)
+    sq_sums, _ = _window_sums(centred * centred, n)
+    var = np.maximum(sq_sums - sums * sums / n, 0.0) / (n - ddof)
+    out[n - 1:] = np.where(counts == n, np.sqrt(var), np.nan)
+    hi, lo = rolling_max(x, n), rolling_min(x, n)
+    return np.where(hi == lo, 0.0, out)
+
+
+def ewm_mean(x: np.ndarray, alpha: float, adjust: bool = True, min_periods: int = 0) -> np.ndarray:
+    """
+    pandas `Series.ewm(alpha=..., adjust=..., min_periods=...).mean()` (ignore_na=False) for
+    every column at once: one vectorised update per date instead of one pandas call per ticker.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    out = np.empty_like(x)
+    old_wt_factor = 1.0 - alpha
+    new_wt = 1.0 if adjust else alpha
+
+    weighted = x[0].copy()
+    nobs = (~np.isnan(weighted)).astype(np.int64)
+    old_wt = np.ones_like(weighted)
+    out[0] = np.where(nobs >= max(min_periods, 1), weighted, np.nan)
+
+    for i in range(1, len(x)):
+        cur = x[i]
+        obs = ~np.isnan(cur)
+        nobs += obs
+        has = ~np.isnan(weighted)
+        old_wt = np.where(has, old_wt * old_wt_factor, old_wt)
+        update = has & obs & (weighted != cur)
+        blended = (old_wt * weighted + new_wt * cur) / (old_wt + new_wt)
+        weighted = np.where(update, blended, weighted)
+        if adjust:
+            old_wt = np.where(has & obs, old_wt + new_wt, old_wt)
+        else:
+            old_wt = np.where(has & obs, 1.0, old_wt)
+        weighted = np.where(~has & obs, cur, weighted)
+        out[i] = np.where(nobs >= max(min_periods, 1), weighted, np.nan)
+    return out
+
+
+def _starts(x: np.ndarray) -> np.ndarray:
+    """Row of each column's first non-NaN value (len(x) if none)."""
+    valid = ~np.isnan(x)
+    return np.where(valid.any(axis=0), np.argmax(valid, axis=0), len(x))
+
+
+def ema(x: np.ndarray, n: int, starts: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    pandas_ta `ema` (presma): seeded with the mean of each column's first n bars, then
+    ewm(span=n, adjust=False). `starts` marks where each ticker's history begins.
+    """
+    starts = _starts(x) if starts is None else starts
+    seeded = np.full_like(x, np.nan)
+    cols = np.arange(x.shape[1])
+    seed_rows = starts + n - 1
+    ok = seed_rows < len(x)
+    if ok.any():
+        window = np.arange(n)[:, None] + starts[ok][None, :]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN seed windows stay NaN
+            seeded[seed_rows[ok], cols[ok]] = np.nanmean(x[window, cols[ok]], axis=0)
+    after = np.arange(len(x))[:, None] > seed_rows[None, :]
+    seeded = np.where(after, x, seeded)
+    return ewm_mean(seeded, 2.0 / (n + 1), adjust=False)
+
+
+def wilder(x: np.ndarray, n: int) -> np.ndarray:
+    """Wilder smoothing as pandas_ta `rma`: ewm(alpha=1/n, min_periods=n)."""
+    return ewm_mean(x, 1.0 / n, adjust=True, min_periods=n)
+
+
+@lru_cache(maxsize=1)
+def true_range_prenan() -> bool:
+    """
+    Whether the installed pandas_ta leaves each history's first true range NaN (0.3.x) or
+    takes it as that bar's high-low range (0.4.x). Checked once on a two-bar series.
+    """
+    try:
+        import pandas_ta as ta
+        tr = ta.true_range(pd.Series([2.0, 2.0]), pd.Series([1.0, 1.0]), pd.Series([1.5, 1.5]))
+        return bool(pd.isna(tr.iloc[0]))
+    except Exception:
+        return False
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray, starts: Optional[np.ndarray] = None) -> np.ndarray:
+    """pandas_ta `true_range`; the first bar has no previous close (see true_range_prenan)."""
+    prev_close = shift(close, 1)
+    tr = np.fmax(np.fmax(np.abs(high - low), np.abs(high - prev_close)), np.abs(low - prev_close))
+    if true_range_prenan():
+        starts = _starts(close) if starts is None else starts
+        ok = starts < len(tr)
+        tr[starts[ok], np.arange(tr.shape[1])[ok]] = np.nan
+    return tr
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int = 14, starts: Optional[np.ndarray] = None) -> np.ndarray:
+    return wilder(true_range(high, low, close, starts), n)
+
+
+def rsi(x: np.ndarray, n: int = 14) -> np.ndarray:
+    diff = x - shift(x, 1)
+    gains = np.where(diff < 0, 0.0, diff)
+    losses = np.where(diff > 0, 0.0, diff)
+    avg_gain = wilder(gains, n)
+    avg_loss = np.abs(wilder(losses, n))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100.0 * avg_gain / (avg_gain + avg_loss)
+
+
+def bollinger_bands(x: np.ndarray, n: int = 20, num_std: float = 2.0, ddof: int = 0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    mid = rolling_mean(x, n)
+    width = num_std * rolling_std(x, n, ddof=ddof)
+    return mid - width, mid, mid + width
+
+
+def keltner_channels(high: np.ndarray, low: np.ndarray, close: np.ndarray, n: int = 20, scalar: float = 1.5,
+                     starts: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """pandas_ta `kc` defaults: EMA basis, EMA of the true range as the band."""
+    starts = _starts(close) if starts is None else starts
+    basis = ema(close, n, starts)
+    band = ema(true_range(high, low, close, starts), n, starts)
+    return basis - scalar * band, basis, basis + scalar * band
+
+
+# ---------------------------------------------------------------------------
+# Engine over a MarketPanel
+# ---------------------------------------------------------------------------
+
+_BAND_COLUMNS = {"bollinger_bands": ["lower", "mid", "upper"], "keltner_channels": ["lower", "basis", "upper"]}
+
+_INPUT_COLUMNS = {
+    "donchian_high": ("High",), "donchian_low": ("Low",), "bollinger_bands": ("Close",),
+    "atr": ("High", "Low", "Close"), "keltner_channels": ("High", "Low", "Close"),
+    "hilbert_phase": ("Close",), "dominant_cycle": ("Close",), "darvas_box": ("High", "Low", "Close"),
+    "trend_breakout": ("High", "Low", "Close"),
+}
+
+# Features with one value per ticker (a tuple), computed by batch functions over the input
+# columns: name -> (module, function, trailing bars used or None for all)
+_TICKER_FEATURES = {
+    "hilbert_phase": ("option_auditor.strategies.math_utils", "batch_hilbert_phase", None),
+    "dominant_cycle": ("option_auditor.strategies.math_utils", "batch_dominant_cycle", 64),
+    "darvas_box": ("option_auditor.strategies.patterns", "darvas_boxes", 62),  # DARVAS_LOOKBACK + 2
+    "trend_breakout": ("option_auditor.common.data_utils", "batch_trend_breakout", 451),  # TREND_BREAKOUT_BARS
+}
+
+
+def _input_columns(name: str, params: tuple) -> tuple:
+    return _INPUT_COLUMNS.get(name) or tuple(p for p in params if isinstance(p, str))
+
+
+class IndicatorEngine:
+    """
+    Computes indicators for every ticker of a MarketPanel in one NumPy pass each, on
+    (date x ticker) blocks, and publishes them to the feature store under the same
+    (name, params) keys TickerFeatures uses, so strategies read them without changes.
+
+    Only tickers with a contiguous listed range are served: a ticker with gaps in the
+    panel grid (mixed exchange calendars) sees different windows per-ticker.
+    """
+
+    def __init__(self, panel: MarketPanel):
+        self.panel = panel
+        self._fields: Dict[str, np.ndarray] = {}
+        self._results: Dict[FeatureSpec, object] = {}
+        self._starts = None
+
+    def field(self, name: str) -> np.ndarray:
+        block = self._fields.get(name)
+        if block is None:
+            block = np.ascontiguousarray(self.panel.field(name).T, dtype=np.float64)
+            self._fields[name] = block
+        return block
+
+    @property
+    def starts(self) -> np.ndarray:
+        if self._starts is None:
+            starts = np.full(len(self.panel), len(self.panel.dates))
+            for i, ticker in enumerate(self.panel.tickers):
+                rows = self.panel.listed_rows(ticker)
+                if isinstance(rows, slice) and rows.stop > rows.start:
+                    starts[i] = rows.start
+            self._starts = starts
+        return self._starts
+
+    def compute(self, name: str, params: tuple):
+        """
+        (date x ticker) array for a feature, a tuple of them for the band features, or a
+        tuple of per-ticker arrays for the cycle features.
+        """
+        key = (name, tuple(params))
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if name == "sma":
+            length, column = params
+            result = rolling_mean(self.field(column), length)
+        elif name == "ema":
+            length, column = params
+            result = ema(self.field(column), length, self.starts)
+        elif name == "rolling_max":
+            column, length = params
+            result = rolling_max(self.field(column), length)
+        elif name == "rolling_min":
+            column, length = params
+            result = rolling_min(self.field(column), length)
+        elif name == "donchian_high":
+            result = shift(self.compute("rolling_max", ("High", params[0])), 1)
+        elif name == "donchian_low":
+            result = shift(self.compute("rolling_min", ("Low", params[0])), 1)
+        elif name == "atr":
+            result = atr(self.field("High"), self.field("Low"), self.field("Close"), params[0], self.starts)
+        elif name == "rsi":
+            length, column = params
+            result = rsi(self.field(column), length)
+        elif name == "bollinger_bands":
+            length, num_std = params
+            result = bollinger_bands(self.field("Close"), length, num_std)
+        elif name == "keltner_channels":
+            length, scalar = params
+            result = keltner_channels(self.field("High"), self.field("Low"), self.field("Close"), length, scalar, self.starts)
+        elif name in _TICKER_FEATURES:
+            module, func, tail = _TICKER_FEATURES[name]
+            batch_func = getattr(importlib.import_module(module), func)
+            result = self._per_ticker(batch_func, _INPUT_COLUMNS[name], tail)
+        else:
+            raise KeyError(f"Unknown feature {name!r}")
+
+        self._results[key] = result
+        return result
+
+    def _per_ticker(self, batch_func, columns: tuple = ("Close",), tail: Optional[int] = None) -> Tuple[np.ndarray, ...]:
+        """
+        Runs a batch function over the `columns` blocks of each contiguous ticker. Tickers
+        whose input rows coincide (same listed range, or same last `tail` rows) share one
+        (date x ticker) matrix per column and one call. Returns one array per output, NaN if
+        not computed.
+        """
+        blocks = [self.field(column) for column in columns]
+        groups = {}
+        for i, ticker in enumerate(self.panel.tickers):
+            rows = self.panel.listed_rows(ticker)
+            if not isinstance(rows, slice) or rows.stop <= rows.start:
+                continue
+            start = rows.start if tail is None else max(rows.start, rows.stop - tail)
+            groups.setdefault((start, rows.stop), []).append(i)
+
+        outputs = None
+        for (start, stop), cols in groups.items():
+            values = batch_func(*(block[start:stop, cols] for block in blocks))
+            if outputs is None:
+                outputs = tuple(np.full(len(self.panel), np.nan) for _ in values)
+            for out, arr in zip(outputs, values):
+                out[cols] = arr
+        return outputs or ()
+
+    def value(self, ticker: str, name: str, params: tuple):
+        """The feature for one ticker over its listed rows, as TickerFeatures would return it."""
+        rows = self.panel.listed_rows(ticker)
+        index = self.panel.dates[rows]
+        i = self.panel.ticker_index[ticker]
+        result = self.compute(name, params)
+        if name in _TICKER_FEATURES:
+            # A NaN first output means the batch function could not compute it; later ones may be NaN by design
+            values = tuple(float(arr[i]) for arr in result)
+            return None if not values or np.isnan(values[0]) else values
+        if isinstance(result, tuple):
+            return pd.DataFrame({col: arr[rows, i] for col, arr in zip(_BAND_COLUMNS[name], result)}, index=index)
+        return pd.Series(result[rows, i], index=index)
+
+    def prime(self, store, features: Iterable[FeatureSpec], tickers: Optional[List[str]] = None) -> int:
+        """
+        Publishes the features for the given tickers (default: all) into `store`.
+        A feature is only published if it matches the per-ticker computation on one
+        probe ticker (guards against pandas_ta version differences). Returns the
+        number of series stored.
+        """
+        from option_auditor.common.feature_store import TickerFeatures, data_version
+
+        candidates = []
+        for ticker in (self.panel.tickers if tickers is None else dict.fromkeys(tickers)):
+            if ticker not in self.panel:
+                continue
+            rows = self.panel.listed_rows(ticker)
+            if isinstance(rows, slice) and rows.stop > rows.start:
+                candidates.append((ticker, rows.stop - rows.start))
+        if not candidates:
+            return 0
+
+        frames = {}
+        versions = {}
+        stored = 0
+        for name, params in dict.fromkeys((n, tuple(p)) for n, p in features):
+            window = max([p for p in params if isinstance(p, int)], default=1)
+            columns = _input_columns(name, params)
+            eligible = []
+            for ticker, length in candidates:
+                if length < window:
+                    continue
+                frame = frames.setdefault(ticker, self.panel.frame(ticker))
+                # A ticker without the input column raises per-ticker; don't hand it NaNs instead
+                if all(c in frame.columns for c in columns):
+                    eligible.append(ticker)
+            if name in _TICKER_FEATURES:
+                # Tickers the batch function could not compute are left to the per-ticker path
+                eligible = [t for t in eligible if self.value(t, name, params) is not None]
+            if not eligible:
+                continue
+            try:
+                # Probe one ticker against the per-ticker path (pandas / pandas_ta) first
+                probe = eligible[0]
+                expected = TickerFeatures(None, frames[probe]).feature(name, params)
+                if not _matches(self.value(probe, name, params), expected):
+                    logger.debug(f"Indicator engine {name}{params} differs from per-ticker result; not published")
+                    continue
+                for ticker in eligible:
+                    if ticker not in versions:
+                        versions[ticker] = data_version(frames[ticker])
+                    store.put(ticker, versions[ticker], name, params, self.value(ticker, name, params))
+                    stored += 1
+            except Exception as e:
+                logger.warning(f"Indicator engine failed for {name}{params}: {e}")
+        return stored
+
+
+def _matches(actual, expected) -> bool:
+    if actual is None or not isinstance(expected, (pd.Series, pd.DataFrame, tuple)):
+        return False
+    a = np.asarray(actual, dtype=np.float64)
+    try:
+        b = np.asarray(expected, dtype=np.float64)
+    except (TypeError, ValueError):
+        return False
+    if a.shape != b.shape:
+        return False
+    return bool(np.allclose(a, b, rtol=1e-6, atol=1e-9, equal_nan=True))
+
+
+def prime_panel_features(panel: Optional[MarketPanel], features: Optional[Iterable[FeatureSpec]], tickers: Optional[List[str]] = None, store=None) -> int:
+    """
+    Batch-computes `features` for a scan's panel into the feature store when the universe
+    is large enough to benefit. Best effort: strategies compute anything missing themselves.
+    """
+    if panel is None or not features or len(panel) < ENGINE_MIN_TICKERS:
+        return 0
+    from option_auditor.common.feature_store import feature_store
+
+    started = time.perf_counter()
+    try:
+        stored = IndicatorEngine(panel).prime(store or feature_store, features, tickers)
+    except Exception as e:
+        logger.warning(f"Indicator engine priming failed: {e}")
+        return 0
+    logger.info(f"🧮 Indicator engine: {stored} series for {len(panel)} tickers in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return stored
@@ -0,0 +1,708 @@
+import os
+import math
+import pickle
+import logging
+import threading
+from array import array
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from option_auditor.common.indicator_engine import true_range_prenan
+
+logger = logging.getLogger(__name__)
+
+# Incremental indicator state for repeated scans of the same universe (the headless scheduler).
+# Opt-in via STREAMING_INDICATORS=1; start_scheduler enables it for its process.
+STREAMING_ENABLED = os.environ.get("STREAMING_INDICATORS", "0").lower() in ("1", "true")
+# Per-ticker checkpoints survive restarts when set
+STREAMING_STATE_DIR = os.environ.get("STREAMING_STATE_DIR") or None
+# Deltas appended to a checkpoint before it is rewritten as one snapshot
+STREAMING_JOURNAL_MAX = 64
+# Recursive features (EMA, Wilder) streamed over the full history serve a strategy's trimmed
+# frame only while the bars before it carry less than this weight (well inside the engine's rtol)
+STREAMING_TRIM_RESIDUAL = 1e-8
+
+NAN = float("nan")
+_BAR_FIELDS = ("Open", "High", "Low", "Close", "Volume")
+
+FeatureSpec = Tuple[str, tuple]
+
+
+# ---------------------------------------------------------------------------
+# Incremental indicators. update(bar) commits a bar and returns the indicator value for
+# it; peek(bar) returns the value the bar would get without committing it (used for the
+# last, possibly partial, bar). Both are O(1) amortised. `bar` maps field -> float.
+# ---------------------------------------------------------------------------
+
+class RollingMean:
+    """pandas rolling(n).mean(): same compensated add/remove sums and constant-window rule."""
+    recursive = False
+
+    def __init__(self, length: int, column: str = "Close"):
+        self.length = length
+        self.column = column
+        self.inputs = (column,)
+        self.warmup = length - 1
+        self.window = deque()
+        # nobs, negatives, sum, add compensation, remove compensation, run of equal values, last value
+        self._sums = (0, 0, 0.0, 0.0, 0.0, 0, NAN)
+
+    def _advance(self, x: float):
+        nobs, neg_ct, sum_x, comp_add, comp_remove, same, prev = self._sums
+        if len(self.window) == self.length:
+            old = self.window[0]
+            if old == old:
+                nobs -= 1
+                y = -old - comp_remove
+                t = sum_x + y
+                comp_remove = t - sum_x - y
+                sum_x = t
+                if math.copysign(1.0, old) < 0:
+                    neg_ct -= 1
+        if x == x:
+            nobs += 1
+            y = x - comp_add
+            t = sum_x + y
+            comp_add = t - sum_x - y
+            sum_x = t
+            if math.copysign(1.0, x) < 0:
+                neg_ct += 1
+            same = same + 1 if x == prev else 1
+            prev = x
+        sums = (nobs, neg_ct, sum_x, comp_add, comp_remove, same, prev)
+
+        if nobs < self.length:
+            return sums, NAN
+        result = sum_x / nobs
+        if same >= nobs:
+            result = prev
+        elif neg_ct == 0 and result < 0:
+            result = 0.0
+        elif neg_ct == nobs and result > 0:
+            result = 0.0
+        return sums, result
+
+    def update(self, bar) -> float:
+        x = bar[self.column]
+        self._sums, value = self._advance(x)
+        if len(self.window) == self.length:
+            self.window.popleft()
+        self.window.append(x)
+        return value
+
+    def peek(self, bar) -> float:
+        return self._advance(bar[self.column])[1]
+
+
+class RollingExtreme:
+    """rolling(n).max() / .min() with a monotonic deque of (position, value) candidates."""
+    recursive = False
+
+    def __init__(self, column: str, length: int, highest: bool = True):
+        self.column = column
+        self.length = length
+        self.highest = highest
+        self.inputs = (column,)
+        self.warmup = length - 1
+        self.window = deque()       # raw values, to count NaNs leaving the window
+        self.candidates = deque()
+        self.nobs = 0
+        self.position = 0
+
+    def update(self, bar) -> float:
+        x = bar[self.column]
+        if len(self.window) == self.length:
+            old = self.window.popleft()
+            if old == old:
+                self.nobs -= 1
+        oldest = self.position - self.length
+        while self.candidates and self.candidates[0][0] <= oldest:
+            self.candidates.popleft()
+        if x == x:
+            self.nobs += 1
+            while self.candidates and (self.candidates[-1][1] <= x if self.highest else self.candidates[-1][1] >= x):
+                self.candidates.pop()
+            self.candidates.append((self.position, x))
+        self.window.append(x)
+        self.position += 1
+        return self.candidates[0][1] if self.nobs >= self.length else NAN
+
+    def peek(self, bar) -> float:
+        x = bar[self.column]
+        nobs = self.nobs + (x == x)
+        if len(self.window) == self.length:
+            old = self.window[0]
+            nobs -= (old == old)
+        if nobs < self.length:
+            return NAN
+        # At most one candidate (the bar leaving the window) is skipped
+        oldest = self.position - self.length
+        for pos, value in self.candidates:
+            if pos > oldest:
+                return max(value, x) if self.highest else min(value, x)
+        return x
+
+
+class Shifted:
+    """Previous bar's value of another indicator (Donchian channels exclude the current bar)."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.inputs = inner.inputs
+        self.recursive = inner.recursive
+        self.warmup = inner.warmup + 1
+        self.last = NAN
+
+    def update(self, bar) -> float:
+        value = self.last
+        self.last = self.inner.update(bar)
+        return value
+
+    def peek(self, bar) -> float:
+        return self.last
+
+
+class _Ewm:
+    """One step of pandas ewm(...).mean() (ignore_na=False)."""
+
+    def __init__(self, alpha: float, adjust: bool = True, min_periods: int = 0):
+        self.factor = 1.0 - alpha
+        self.new_wt = 1.0 if adjust else alpha
+        self.adjust = adjust
+        self.min_periods = max(min_periods, 1)
+        self.state = (NAN, 1.0, 0)  # weighted mean, old weight, observations
+
+    def advance(self, x: float):
+        weighted, old_wt, nobs = self.state
+        observed = x == x
+        nobs += observed
+        if weighted == weighted:
+            old_wt *= self.factor
+            if observed:
+                if weighted != x:
+                    weighted = (old_wt * weighted + self.new_wt * x) / (old_wt + self.new_wt)
+                old_wt = old_wt + self.new_wt if self.adjust else 1.0
+        elif observed:
+            weighted = x
+        return (weighted, old_wt, nobs), (weighted if nobs >= self.min_periods else NAN)
+
+    def update(self, x: float) -> float:
+        self.state, value = self.advance(x)
+        return value
+
+    def peek(self, x: float) -> float:
+        return self.advance(x)[1]
+
+
+def _wilder(length: int) -> _Ewm:
+    # pandas_ta rma
+    return _Ewm(1.0 / length, adjust=True, min_periods=length)
+
+
+def _residual(factor: float, length: int, bars: int) -> float:
+    """Weight a recursive value over the last `bars` bars leaves on the bars before them."""
+    return factor ** (bars - length) if bars >= length else 1.0
+
+
+class Ema:
+    """pandas_ta ema (presma): seeded with the mean of the first n bars, then ewm(span=n, adjust=False)."""
+    recursive = True
+    warmup = 0
+
+    def __init__(self, length: int, column: str = "Close"):
+        self.length = length
+        self.column = column
+        self.inputs = (column,)
+        self.seed = []
+        self.count = 0
+        self.ewm = _Ewm(2.0 / (length + 1), adjust=False)
+
+    def _input(self, x: float) -> float:
+        if self.count < self.length - 1:
+            return NAN
+        if self.count == self.length - 1:
+            values = np.array(self.seed + [x])
+            valid = int(np.count_nonzero(~np.isnan(values)))
+            return float(np.nansum(values)) / valid if valid else NAN
+        return x
+
+    def update(self, bar) -> float:
+        x = bar[self.column]
+        value = self.ewm.update(self._input(x))
+        if self.count < self.length - 1:
+            self.seed.append(x)
+        else:
+            self.seed = []
+        self.count += 1
+        return value
+
+    def peek(self, bar) -> float:
+        return self.ewm.peek(self._input(bar[self.column]))
+
+    def residual(self, bars: int) -> float:
+        return _residual(self.ewm.factor, self.length, bars)
+
+
+class Atr:
+    """pandas_ta atr: Wilder smoothing of the true range (the first bar's as pandas_ta takes it)."""
+    recursive = True
+    warmup = 0
+    inputs = ("High", "Low", "Close")
+
+    def __init__(self, length: int = 14):
+        self.length = length
+        self.started = False
+        self.prev_close = NAN
+        self.ewm = _wilder(length)
+
+    def _true_range(self, bar) -> float:
+        if not self.started:
+            return NAN if true_range_prenan() else abs(bar["High"] - bar["Low"])
+        high, low, prev = bar["High"], bar["Low"], self.prev_close
+        ranges = [r for r in (abs(high - low), abs(high - prev), abs(low - prev)) if r == r]
+        return max(ranges) if ranges else NAN
+
+    def update(self, bar) -> float:
+        value = self.ewm.update(self._true_range(bar))
+        self.started = True
+        self.prev_close = bar["Close"]
+        return value
+
+    def peek(self, bar) -> float:
+        return self.ewm.peek(self._true_range(bar))
+
+    def residual(self, bars: int) -> float:
+        return _residual(self.ewm.factor, self.length, bars)
+
+
+class Rsi:
+    """pandas_ta rsi: Wilder-smoothed gains over gains plus losses."""
+    recursive = True
+    warmup = 0
+
+    def __init__(self, length: int = 14, column: str = "Close"):
+        self.length = length
+        self.column = column
+        self.inputs = (column,)
+        self.started = False
+        self.prev = NAN
+        self.gains = _wilder(length)
+        self.losses = _wilder(length)
+
+    def _moves(self, x: float):
+        diff = x - self.prev if self.started else NAN
+        return (0.0 if diff < 0 else diff), (0.0 if diff > 0 else diff)
+
+    @staticmethod
+    def _rsi(gain: float, loss: float) -> float:
+        denom = gain + abs(loss)
+        if denom != denom:
+            return NAN
+        if denom == 0:
+            return NAN if gain == 0 else math.copysign(math.inf, gain)
+        return 100.0 * gain / denom
+
+    def update(self, bar) -> float:
+        x = bar[self.column]
+        gain, loss = self._moves(x)
+        value = self._rsi(self.gains.update(gain), self.losses.update(loss))
+        self.started = True
+        self.prev = x
+        return value
+
+    def peek(self, bar) -> float:
+        gain, loss = self._moves(bar[self.column])
+        return self._rsi(self.gains.peek(gain), self.losses.peek(loss))
+
+    def residual(self, bars: int) -> float:
+        return _residual(self.gains.factor, self.length, bars)
+
+
+def make_indicator(name: str, params: tuple):
+    """Incremental counterpart of TickerFeatures.feature(name, params), or None if not streamable."""
+    params = tuple(params)
+    if name == "sma":
+        return RollingMean(*params)
+    if name == "rolling_max":
+        return RollingExtreme(*params, highest=True)
+    if name == "rolling_min":
+        return RollingExtreme(*params, highest=False)
+    if name == "donchian_high":
+        return Shifted(RollingExtreme("High", params[0], highest=True))
+    if name == "donchian_low":
+        return Shifted(RollingExtreme("Low", params[0], highest=False))
+    if name == "ema":
+        return Ema(*params)
+    if name == "atr":
+        return Atr(*params)
+    if name == "rsi":
+        return Rsi(*params)
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Per-ticker state
+# ---------------------------------------------------------------------------
+
+def _bar_values(df: pd.DataFrame, pos: int) -> tuple:
+    return tuple(float(df[f].iat[pos]) if f in df.columns else None for f in _BAR_FIELDS)
+
+
+def _same_bar(a: tuple, b: tuple) -> bool:
+    return a is not None and b is not None and all(
+        x == y or (x is not None and y is not None and x != x and y != y) for x, y in zip(a, b)
+    )
+
+
+class TickerStream:
+    """
+    Indicator states and committed output history for one ticker.
+
+    Every bar but the frame's last is committed; the last one is only peeked, so a partial
+    session bar that is revised on the next refresh costs nothing to correct. A frame that
+    no longer extends the committed history (revised bars, adjusted prices) rebuilds it.
+    When the frame drops leading bars (rolling period trim), window indicators keep
+    streaming and recursive ones (EMA, Wilder) are rebuilt, since their values depend on
+    where the history starts.
+
+    Checkpoints are a snapshot followed by deltas (delta() / apply_delta()): per feature,
+    the outputs dropped from the front and appended since the last save, plus the small
+    indicator states, so a rescan does not rewrite the whole history.
+    """
+
+    def __init__(self):
+        self.indicators = {}
+        self.origins = {}
+        self.outputs = {}
+        self.first_index = None
+        self.first_bar = None
+        self.last_index = None
+        self.last_bar = None
+        self.dirty = False
+        # Outputs dropped from the front of each feature's history since it was built
+        self.dropped = {}
+        # (dropped, end) of each feature at the last save; None: the next save is a snapshot
+        self.saved = None
+
+    def __setstate__(self, state):
+        state.setdefault("dropped", {spec: 0 for spec in state.get("outputs", {})})
+        state.setdefault("saved", None)
+        self.__dict__.update(state)
+
+    def _bookmarks(self) -> tuple:
+        return self.first_index, self.first_bar, self.last_index, self.last_bar
+
+    def mark_saved(self):
+        self.dirty = False
+        self.saved = {spec: (self.dropped[spec], self.dropped[spec] + len(out)) for spec, out in self.outputs.items()}
+
+    def delta(self) -> Optional[dict]:
+        """Changes since the last save, or None if only a snapshot can record them."""
+        if self.saved is None or set(self.saved) != set(self.outputs):
+            return None
+        features = {}
+        for spec, out in self.outputs.items():
+            saved_dropped, saved_end = self.saved[spec]
+            start = saved_end - self.dropped[spec]
+            if start < 0:
+                return None
+            features[spec] = (self.dropped[spec] - saved_dropped, out[start:], self.indicators[spec])
+        return {"bookmarks": self._bookmarks(), "features": features}
+
+    def apply_delta(self, delta: dict):
+        """Replays a delta() onto the state it was taken after."""
+        for spec, (dropped, appended, indicator) in delta["features"].items():
+            out = self.outputs[spec]
+            del out[:dropped]
+            out.extend(appended)
+            self.dropped[spec] += dropped
+            self.indicators[spec] = indicator
+        self.first_index, self.first_bar, self.last_index, self.last_bar = delta["bookmarks"]
+
+    def _position(self, df: pd.DataFrame) -> int:
+        """Row of the last committed bar in df, -1 if df does not extend the committed history."""
+        if self.last_index is None:
+            return -1
+        if df.index[0] == self.first_index and not _same_bar(_bar_values(df, 0), self.first_bar):
+            return -1  # history rewritten (e.g. dividend adjustment)
+        try:
+            pos = df.index.get_loc(self.last_index)
+        except KeyError:
+            return -1
+        if not isinstance(pos, (int, np.integer)) or not _same_bar(_bar_values(df, pos), self.last_bar):
+            return -1
+        return int(pos)
+
+    def _catch_up(self, df: pd.DataFrame, specs: List[FeatureSpec]) -> Optional[dict]:
+        """Commits every bar of df but the last; returns that last bar (to peek), None if df is too short."""
+        n = len(df)
+        if n < 2:
+            return None
+        end = n - 1
+        pos = self._position(df)
+        if pos >= end:
+            pos = -1  # the frame lost bars since the last run
+        first = df.index[0]
+
+        columns = sorted({c for spec in specs for c in make_indicator(*spec).inputs})
+
+        def bars(start: int, stop: int) -> List[dict]:
+            data = {c: df[c].iloc[start:stop].to_numpy(dtype=np.float64, na_value=np.nan).tolist() for c in columns}
+            return [dict(zip(columns, row)) for row in zip(*(data[c] for c in columns))]
+
+        new_bars = None
+        all_bars = None
+        for spec in specs:
+            indicator = self.indicators.get(spec)
+            out = self.outputs.get(spec)
+            origin = self.origins.get(spec)
+            stale = (pos < 0 or indicator is None or origin is None or origin > first
+                     or (indicator.recursive and origin != first) or len(out) < pos + 1)
+            if stale:
+                indicator = make_indicator(*spec)
+                out = array("d")
+                self.origins[spec] = first
+                self.dropped[spec] = 0
+                self.saved = None
+                if all_bars is None:
+                    all_bars = bars(0, end)
+                feed = all_bars
+            else:
+                self.dropped[spec] += len(out) - (pos + 1)
+                del out[:len(out) - (pos + 1)]
+                if new_bars is None:
+                    new_bars = bars(pos + 1, end)
+                feed = new_bars
+            for bar in feed:
+                out.append(indicator.update(bar))
+            self.dirty = self.dirty or bool(feed)
+            self.indicators[spec] = indicator
+            self.outputs[spec] = out
+
+        for spec in [s for s in self.indicators if s not in specs]:
+            # Not requested this run: it would fall behind the committed bars
+            del self.indicators[spec], self.outputs[spec], self.origins[spec], self.dropped[spec]
+            self.saved = None
+            self.dirty = True
+        self.first_index = first
+        self.first_bar = _bar_values(df, 0)
+        self.last_index = df.index[end - 1]
+        self.last_bar = _bar_values(df, end - 1)
+        return bars(end, n)[0]
+
+    def advance(self, df: pd.DataFrame, specs: Iterable[FeatureSpec]) -> Optional[Dict[FeatureSpec, np.ndarray]]:
+        """Brings the states up to df and returns each feature's values aligned to df."""
+        specs = list(specs)
+        last_bar = self._catch_up(df, specs)
+        if last_bar is None:
+            return None
+        n = len(df)
+        results = {}
+        for spec in specs:
+            indicator = self.indicators[spec]
+            values = np.empty(n)
+            values[:n - 1] = np.frombuffer(self.outputs[spec], dtype=np.float64)
+            values[n - 1] = indicator.peek(last_bar)
+            values[:indicator.warmup] = np.nan
+            results[spec] = values
+        return results
+
+    def last_values(self, df: pd.DataFrame, specs: Iterable[FeatureSpec], bars: Optional[int] = None) -> Optional[Dict[FeatureSpec, float]]:
+        """
+        Brings the states up to df and returns each feature's value on the last bar of
+        df.iloc[-bars:] (default: all of df). Window features read the same bars either way;
+        recursive ones are only within their residual(bars) of it.
+        """
+        specs = list(specs)
+        last_bar = self._catch_up(df, specs)
+        if last_bar is None:
+            return None
+        seen = len(df) if bars is None else min(len(df), bars)
+        results = {}
+        for spec in specs:
+            indicator = self.indicators[spec]
+            results[spec] = NAN if seen - 1 < indicator.warmup else indicator.peek(last_bar)
+        return results
+
+
+class IndicatorStreams:
+    """
+    TickerStreams for a process, publishing each feature's latest value into the feature
+    store, where TickerFeatures.last reads it. A rescan where one new bar arrived costs O(1)
+    per indicator instead of a pass over the full history; features strategies need as whole
+    series are left to the batch indicator engine.
+
+    Each feature is checked once against the per-ticker computation (pandas / pandas_ta)
+    before it is published; a mismatch leaves it to the other paths.
+
+    Tickers are advanced under their own locks, so concurrent scans only wait for each other
+    on the tickers both are streaming at that moment.
+    """
+
+    def __init__(self, state_dir: Optional[str] = None, enabled: bool = False):
+        self.state_dir = state_dir
+        self.enabled = enabled
+        self._streams: Dict[str, TickerStream] = {}
+        self._verified: Dict[FeatureSpec, bool] = {}
+        self._journal: Dict[str, int] = {}
+        self._ticker_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def enable(self, state_dir: Optional[str] = None):
+        self.enabled = True
+        if state_dir:
+            self.state_dir = state_dir
+
+    def clear(self):
+        with self._lock:
+            self._streams.clear()
+            self._verified.clear()
+            self._journal.clear()
+
+    def _ticker_lock(self, ticker: str) -> threading.Lock:
+        with self._lock:
+            lock = self._ticker_locks.get(ticker)
+            if lock is None:
+                lock = self._ticker_locks[ticker] = threading.Lock()
+            return lock
+
+    def _path(self, ticker: str) -> str:
+        safe_ticker = "".join(c if c.isalnum() or c in "-_." else "_" for c in ticker)
+        return os.path.join(self.state_dir, f"{safe_ticker}.pkl")
+
+    def _load(self, ticker: str) -> TickerStream:
+        """The ticker's stream, from its checkpoint (snapshot, then the deltas after it) on first use."""
+        stream = self._streams.get(ticker)
+        if stream is None and self.state_dir:
+            deltas = 0
+            try:
+                with open(self._path(ticker), "rb") as f:
+                    stream = pickle.load(f)
+                    while isinstance(stream, TickerStream):
+                        try:
+                            delta = pickle.load(f)
+                        except EOFError:
+                            break
+                        stream.apply_delta(delta)
+                        deltas += 1
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                # A torn last delta leaves the state as of the previous one: rewrite a snapshot
+                logger.debug(f"Indicator state for {ticker} cut short after {deltas} deltas: {e}")
+                deltas = STREAMING_JOURNAL_MAX
+            if isinstance(stream, TickerStream):
+                stream.mark_saved()
+                self._journal[ticker] = deltas
+        if not isinstance(stream, TickerStream):
+            stream = TickerStream()
+        self._streams[ticker] = stream
+        return stream
+
+    def _save(self, ticker: str, stream: TickerStream):
+        """Best effort checkpoint of a ticker's state: a delta appended to its file, or a new snapshot."""
+        delta = stream.delta()
+        stream.mark_saved()
+        if not self.state_dir:
+            return
+        path = self._path(ticker)
+        try:
+            os.makedirs(self.state_dir, exist_ok=True)
+            if delta is not None and self._journal.get(ticker, STREAMING_JOURNAL_MAX) < STREAMING_JOURNAL_MAX:
+                with open(path, "ab") as f:
+                    pickle.dump(delta, f, protocol=pickle.HIGHEST_PROTOCOL)
+                self._journal[ticker] += 1
+                return
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(stream, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+            self._journal[ticker] = 0
+        except OSError as e:
+            stream.saved = None
+            logger.debug(f"Indicator state write failed for {ticker}: {e}")
+
+    def publish(self, panel, features: Iterable[FeatureSpec], tickers: Optional[List[str]] = None, store=None,
+                lookback: Optional[int] = None) -> List[FeatureSpec]:
+        """
+        Advances the streams of the panel's tickers (default: all) and puts the requested
+        features' latest values into the feature store, for the frames strategies see (the
+        last `lookback` bars, if set). The panel is the untrimmed one, so a new bar does not
+        move the streams' origin. Returns the features it could not serve.
+        """
+        from option_auditor.common.feature_store import bar_version, feature_store
+
+        store = store or feature_store
+        specs = list(dict.fromkeys((name, tuple(params)) for name, params in features))
+        streamable = [s for s in specs if self._verified.get(s) is not False and _serves(s, lookback)]
+        if not streamable:
+            return specs
+        inputs = {s: make_indicator(*s).inputs for s in streamable}
+
+        for ticker in (panel.tickers if tickers is None else dict.fromkeys(tickers)):
+            if ticker not in panel:
+                continue
+            rows = panel.listed_rows(ticker)
+            if not isinstance(rows, slice) or rows.stop <= rows.start:
+                continue
+            df = panel.frame(ticker)
+            wanted = [s for s in streamable
+                      if self._verified.get(s) is not False and all(c in df.columns for c in inputs[s])]
+            if not wanted:
+                continue
+
+            with self._ticker_lock(ticker):
+                stream = self._load(ticker)
+                try:
+                    if any(s not in self._verified for s in wanted):
+                        self._verify(stream, df, wanted)
+                    values = stream.last_values(df, wanted, lookback)
+                except Exception as e:
+                    logger.debug(f"Indicator stream failed for {ticker}: {e}")
+                    self._streams.pop(ticker, None)
+                    continue
+                if values is None:
+                    continue
+
+                version = bar_version(df.iloc[-lookback:] if lookback else df)
+                for spec, value in values.items():
+                    if self._verified.get(spec):
+                        store.put_last(ticker, version, spec[0], spec[1], value)
+
+                if stream.dirty:
+                    self._save(ticker, stream)
+
+        return [s for s in specs if not (self._verified.get(s) and _serves(s, lookback))]
+
+    def _verify(self, stream: TickerStream, df: pd.DataFrame, specs: List[FeatureSpec]):
+        """Checks unverified features' full streamed series once against the per-ticker computation."""
+        from option_auditor.common.feature_store import TickerFeatures
+        from option_auditor.common.indicator_engine import _matches
+
+        values = stream.advance(df, specs)
+        if values is None:
+            return
+        for spec in specs:
+            if spec in self._verified:
+                continue
+            window = max([p for p in spec[1] if isinstance(p, int)], default=1)
+            if len(df) <= 2 * window:
+                continue  # too short to tell; check on a longer history
+            expected = TickerFeatures(None, df).feature(*spec)
+            self._verified[spec] = _matches(values[spec], expected)
+            if not self._verified[spec]:
+                logger.debug(f"Streaming {spec} differs from per-ticker result; not published")
+
+
+def _serves(spec: FeatureSpec, lookback: Optional[int]) -> bool:
+    """Whether a stream over the full history can serve the feature for frames cut to `lookback` bars."""
+    indicator = make_indicator(*spec)
+    if indicator is None:
+        return False
+    return not lookback or not indicator.recursive or indicator.residual(lookback) <= STREAMING_TRIM_RESIDUAL
+
+
+indicator_streams = IndicatorStreams(STREAMING_STATE_DIR, enabled=STREAMING_ENABLED)
@@ -0,0 +1,315 @@
+import os
+import json
+import time
+import random
+import logging
+import threading
+from collections import namedtuple
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
+import yfinance as yf
+
+from option_auditor.common.market_store import _partition_file_name
+
+logger = logging.getLogger(__name__)
+
+# "yfinance" (default) or "replay" (serve recorded fixtures from MARKET_DATA_REPLAY_DIR, no network).
+MARKET_DATA_PROVIDER = os.environ.get("MARKET_DATA_PROVIDER", "yfinance").lower()
+MARKET_DATA_REPLAY_DIR = os.environ.get("MARKET_DATA_REPLAY_DIR", "replay_data")
+MARKET_DATA_REPLAY_LATENCY_MS = float(os.environ.get("MARKET_DATA_REPLAY_LATENCY_MS", 0))
+
+# Same shape as yfinance's Ticker.option_chain() result
+OptionChain = namedtuple("OptionChain", ["calls", "puts", "underlying"])
+
+
+class MarketDataProvider:
+    """
+    Source of prices, quotes and option chains.
+
+    download() mirrors yf.download (same arguments, same column layouts) and ticker() returns
+    an object with the yf.Ticker surface the app uses: history(), info, fast_info, calendar,
+    options, option_chain() and financials.
+    """
+    name = "base"
+
+    def download(self, tickers: Union[str, List[str]], **kwargs) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def ticker(self, symbol: str):
+        raise NotImplementedError
+
+
+class YFinanceProvider(MarketDataProvider):
+    """Live Yahoo Finance data via the yfinance package."""
+    name = "yfinance"
+
+    def download(self, tickers, **kwargs) -> pd.DataFrame:
+        return yf.download(tickers, **kwargs)
+
+    def ticker(self, symbol: str):
+        return yf.Ticker(symbol)
+
+
+class ReplayProvider(MarketDataProvider):
+    """
+    Serves recorded fixtures from disk with optional simulated latency, for offline runs,
+    load tests and benchmarks.
+
+    Layout under `root` (see record_fixtures):
+      - history/<interval>/<TICKER>.parquet   flat OHLCV bars
+      - quotes/<TICKER>.json                  {"info": {...}, "fast_info": {...}, "calendar": {...}}
+      - options/<TICKER>/<expiry>.calls.parquet and <expiry>.puts.parquet
+
+    The clock is frozen at each fixture's last bar: period windows are measured back from it.
+    Tickers without fixtures behave like unknown symbols in yfinance (absent or empty).
+    """
+    name = "replay"
+
+    def __init__(self, root: str, latency_ms: float = 0.0, jitter_ms: float = 0.0):
+        self.root = root
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._frames: Dict[tuple, pd.DataFrame] = {}
+        self._lock = threading.Lock()
+
+    def _simulate_latency(self):
+        delay = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+    def _path(self, *parts) -> str:
+        return os.path.join(self.root, *parts)
+
+    def _bars(self, symbol: str, interval: str = "1d") -> pd.DataFrame:
+        key = (symbol, interval)
+        with self._lock:
+            cached = self._frames.get(key)
+        if cached is not None:
+            return cached
+
+        path = self._path("history", interval, _partition_file_name(symbol))
+        try:
+            df = pd.read_parquet(path)
+        except (OSError, ValueError):
+            df = pd.DataFrame()
+
+        with self._lock:
+            self._frames[key] = df
+        return df
+
+    def history(self, symbol: str, period: Optional[str] = "1mo", interval: str = "1d", start=None, end=None) -> pd.DataFrame:
+        df = self._bars(symbol, interval)
+        if df.empty:
+            return pd.DataFrame()
+        return _slice_window(df, period, start, end).copy()
+
+    def quote(self, symbol: str) -> dict:
+        try:
+            with open(self._path("quotes", _partition_file_name(symbol).replace(".parquet", ".json")), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def expirations(self, symbol: str) -> tuple:
+        folder = self._path("options", _partition_file_name(symbol)[:-len(".parquet")])
+        try:
+            names = os.listdir(folder)
+        except OSError:
+            return ()
+        return tuple(sorted({n.split(".")[0] for n in names if n.endswith(".calls.parquet")}))
+
+    def option_chain(self, symbol: str, expiry: Optional[str] = None) -> OptionChain:
+        expirations = self.expirations(symbol)
+        if expiry is None and expirations:
+            expiry = expirations[0]
+        if expiry not in expirations:
+            raise ValueError(f"Expiration `{expiry}` cannot be found for {symbol}. Available expirations are: {expirations}")
+
+        folder = self._path("options", _partition_file_name(symbol)[:-len(".parquet")])
+        calls = pd.read_parquet(os.path.join(folder, f"{expiry}.calls.parquet"))
+        puts_path = os.path.join(folder, f"{expiry}.puts.parquet")
+        puts = pd.read_parquet(puts_path) if os.path.exists(puts_path) else pd.DataFrame(columns=calls.columns)
+        return OptionChain(calls, puts, self.quote(symbol).get("info", {}))
+
+    def download(self, tickers, period=None, interval="1d", start=None, end=None, group_by="column", **kwargs) -> pd.DataFrame:
+        """yf.download over fixtures. Extra yfinance arguments (progress, threads, auto_adjust...) are ignored."""
+        self._simulate_latency()
+
+        single = isinstance(tickers, str) and len(tickers.split()) == 1
+        symbols = tickers.split() if isinstance(tickers, str) else list(tickers)
+        if period is None and start is None:
+            period = "1mo"
+
+        frames = {}
+        for symbol in dict.fromkeys(symbols):
+            df = self.history(symbol, period=period, interval=interval, start=start, end=end)
+            if not df.empty:
+                frames[symbol] = df
+
+        if not frames:
+            return pd.DataFrame()
+        if single and group_by != "ticker":
+            return frames[symbols[0]]
+
+        combined = pd.concat(frames, axis=1, sort=True)
+        if group_by != "ticker":
+            combined = combined.swaplevel(0, 1, axis=1).sort_index(axis=1)
+        return combined
+
+    def ticker(self, symbol: str):
+        return ReplayTicker(self, symbol)
+
+
+class ReplayTicker:
+    """yf.Ticker look-alike backed by a ReplayProvider."""
+
+    def __init__(self, provider: ReplayProvider, symbol: str):
+        self.provider = provider
+        self.ticker = symbol
+
+    def history(self, period="1mo", interval="1d", start=None, end=None, **kwargs) -> pd.DataFrame:
+        self.provider._simulate_latency()
+        return self.provider.history(self.ticker, period=period, interval=interval, start=start, end=end)
+
+    @property
+    def info(self) -> dict:
+        self.provider._simulate_latency()
+        return dict(self.provider.quote(self.ticker).get("info", {}))
+
+    @property
+    def fast_info(self) -> dict:
+        quote = self.provider.quote(self.ticker)
+        fast = dict(quote.get("fast_info", {}))
+        if "last_price" not in fast:
+            bars = self.provider._bars(self.ticker)
+            if not bars.empty and "Close" in bars.columns:
+                fast["last_price"] = float(bars["Close"].dropna().iloc[-1])
+        return fast
+
+    @property
+    def calendar(self) -> dict:
+        return dict(self.provider.quote(self.ticker).get("calendar", {}))
+
+    @property
+    def financials(self) -> pd.DataFrame:
+        return pd.DataFrame()
+
+    @property
+    def options(self) -> tuple:
+        self.provider._simulate_latency()
+        return self.provider.expirations(self.ticker)
+
+    def option_chain(self, date: Optional[str] = None) -> OptionChain:
+        self.provider._simulate_latency()
+        return self.provider.option_chain(self.ticker, date)
+
+
+def _slice_window(df: pd.DataFrame, period: Optional[str], start=None, end=None) -> pd.DataFrame:
+    """Applies yfinance-style start/end or period selection relative to the frame's last bar."""
+    if start is not None or end is not None:
+        index = df.index
+        if start is not None:
+            df = df[index >= _as_index_timestamp(start, index)]
+        if end is not None:
+            df = df[df.index < _as_index_timestamp(end, df.index)]
+        return df
+
+    if not period or period in ("max", "ytd"):
+        if period == "ytd" and len(df):
+            return df[df.index.year == df.index[-1].year]
+        return df
+
+    # Day periods count trading sessions, like Yahoo
+    if period.endswith("d") and period[:-1].isdigit():
+        return df.tail(int(period[:-1]))
+
+    from option_auditor.common.data_utils import _period_to_timedelta
+    delta = _period_to_timedelta(period)
+    if delta is None or not len(df):
+        return df
+    return df[df.index > df.index[-1] - delta]
+
+
+def _as_index_timestamp(value, index: pd.DatetimeIndex) -> pd.Timestamp:
+    ts = pd.Timestamp(value)
+    tz = getattr(index, "tz", None)
+    if tz is not None and ts.tzinfo is None:
+        return ts.tz_localize(tz)
+    if tz is None and ts.tzinfo is not None:
+        return ts.tz_convert(None)
+    return ts
+
+
+def record_fixtures(
+    tickers: List[str],
+    root: str,
+    period: str = "2y",
+    interval: str = "1d",
+    quotes: bool = True,
+    options: bool = False,
+    source: Optional[MarketDataProvider] = None,
+) -> List[str]:
+    """
+    Records fixtures for ReplayProvider from `source` (default: live yfinance).
+    Returns the tickers for which history was written.
+    """
+    source = source or YFinanceProvider()
+    history_dir = os.path.join(root, "history", interval)
+    os.makedirs(history_dir, exist_ok=True)
+
+    data = source.download(list(tickers), period=period, interval=interval, group_by="ticker", auto_adjust=True, progress=False)
+    recorded = []
+    for ticker in tickers:
+        if not isinstance(data.columns, pd.MultiIndex) or ticker not in data.columns.get_level_values(0):
+            continue
+        df = data[ticker].dropna(how="all")
+        if df.empty:
+            continue
+        df.to_parquet(os.path.join(history_dir, _partition_file_name(ticker)))
+        recorded.append(ticker)
+
+    for ticker in recorded if (quotes or options) else []:
+        try:
+            tk = source.ticker(ticker)
+            if quotes:
+                os.makedirs(os.path.join(root, "quotes"), exist_ok=True)
+                quote = {"info": tk.info, "fast_info": {"last_price": tk.fast_info.get("last_price")}}
+                with open(os.path.join(root, "quotes", _partition_file_name(ticker).replace(".parquet", ".json")), "w") as f:
+                    json.dump(quote, f, default=str)
+            if options:
+                folder = os.path.join(root, "options", _partition_file_name(ticker)[:-len(".parquet")])
+                os.makedirs(folder, exist_ok=True)
+                for expiry in tk.options:
+                    chain = tk.option_chain(expiry)
+                    chain.calls.to_parquet(os.path.join(folder, f"{expiry}.calls.parquet"))
+                    chain.puts.to_parquet(os.path.join(folder, f"{expiry}.puts.parquet"))
+        except Exception as e:
+            logger.warning(f"Failed to record quote/options for {ticker}: {e}")
+
+    logger.info(f"Recorded replay fixtures for {len(recorded)}/{len(tickers)} tickers in {root}")
+    return recorded
+
+
+_provider: Optional[MarketDataProvider] = None
+_provider_lock = threading.Lock()
+
+
+def get_provider() -> MarketDataProvider:
+    """The process-wide provider, built from MARKET_DATA_PROVIDER on first use."""
+    global _provider
+    with _provider_lock:
+        if _provider is None:
+            if MARKET_DATA_PROVIDER == "replay":
+                logger.info(f"Using replay market data from {MARKET_DATA_REPLAY_DIR} ({MARKET_DATA_REPLAY_LATENCY_MS}ms latency)")
+                _provider = ReplayProvider(MARKET_DATA_REPLAY_DIR, latency_ms=MARKET_DATA_REPLAY_LATENCY_MS)
+            else:
+                _provider = YFinanceProvider()
+        return _provider
+
+
+def set_provider(provider: Optional[MarketDataProvider]):
+    """Installs a provider for the process (None restores the environment default)."""
+    global _provider
+    with _provider_lock:
+        _provider = provider
@@ -0,0 +1,176 @@
+import logging
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from option_auditor.common.frame_cache import shared_copy
+
+logger = logging.getLogger(__name__)
+
+PANEL_FIELDS = ("Open", "High", "Low", "Close", "Volume")
+_KNOWN_FIELDS = set(PANEL_FIELDS) | {"Adj Close", "Dividends", "Stock Splits", "Capital Gains"}
+
+
+class MarketPanel:
+    """
+    Read-only ticker x date x field block built once from a cached batch frame
+    (float32 for the on-disk caches, which save_atomic already downcasts).
+
+    Screeners take per-ticker frames from `frame()` instead of slicing the MultiIndex
+    frame with `data[ticker]` / `xs(...).copy()` + `dropna`. Those frames are views
+    onto the shared block (trimmed to the ticker's listed range), so building one
+    costs no copy of the price data.
+    """
+
+    def __init__(self, values: np.ndarray, tickers: List[str], dates, fields: List[str], version=None):
+        values = np.ascontiguousarray(values)
+        if values.dtype not in (np.float32, np.float64):
+            values = values.astype(np.float64)
+        values.setflags(write=False)
+
+        self.values = values
+        self.tickers = list(tickers)
+        self.dates = pd.Index(dates)
+        self.fields = list(fields)
+        self.version = version
+        self.ticker_index = {t: i for i, t in enumerate(self.tickers)}
+        self.field_index = {f: i for i, f in enumerate(self.fields)}
+
+        self._rows = []
+        self._cols = []
+        self._frames = {}
+        if values.size:
+            nan = np.isnan(values)
+            valid_rows = ~nan.all(axis=2)    # (ticker, date)
+            has_field = ~nan.all(axis=1)     # (ticker, field)
+        else:
+            valid_rows = np.zeros(values.shape[:2], dtype=bool)
+            has_field = np.zeros((values.shape[0], values.shape[2]), dtype=bool)
+
+        for i in range(len(self.tickers)):
+            positions = np.flatnonzero(valid_rows[i])
+            if positions.size == 0:
+                rows = slice(0, 0)
+            elif positions[-1] - positions[0] + 1 == positions.size:
+                # Contiguous listed range -> basic slice keeps the frame a view
+                rows = slice(int(positions[0]), int(positions[-1]) + 1)
+            else:
+                # Gaps inside the range (mixed exchange calendars) need a gather
+                rows = positions
+            self._rows.append(rows)
+            self._cols.append(None if has_field[i].all() else np.flatnonzero(has_field[i]))
+
+    @classmethod
+    def empty_panel(cls, version=None) -> "MarketPanel":
+        return cls(np.empty((0, 0, len(PANEL_FIELDS)), dtype=np.float32), [], [], list(PANEL_FIELDS), version)
+
+    @classmethod
+    def from_frame(cls, data: Optional[pd.DataFrame], default_ticker: Optional[str] = None, version=None) -> "MarketPanel":
+        """
+        Builds a panel from a yfinance-style batch frame.
+
+        Accepts (Ticker, Field) or (Field, Ticker) MultiIndex columns. A flat OHLCV
+        frame is treated as a single ticker named `default_ticker` (empty panel if None).
+        The block is float32 only if every float source column is, so live downloads keep
+        float64 and results stay JSON-serialisable floats.
+        """
+        if data is None or data.empty:
+            return cls.empty_panel(version)
+
+        if not isinstance(data.columns, pd.MultiIndex):
+            if not default_ticker:
+                return cls.empty_panel(version)
+            data = pd.concat({default_ticker: data}, axis=1)
+
+        if data.columns.nlevels > 2:
+            data = data.droplevel(list(range(2, data.columns.nlevels)), axis=1)
+
+        level0 = data.columns.unique(level=0)
+        level1 = data.columns.unique(level=1)
+        if set(level0) <= _KNOWN_FIELDS and not set(level1) <= _KNOWN_FIELDS:
+            data = data.swaplevel(0, 1, axis=1)
+            level0, level1 = level1, level0
+
+        if data.columns.has_duplicates:
+            data = data.loc[:, ~data.columns.duplicated()]
+
+        tickers = list(level0)
+        present = set(level1)
+        fields = [f for f in PANEL_FIELDS if f in present] + [f for f in level1 if f not in PANEL_FIELDS]
+
+        float_dtypes = [dt for dt in data.dtypes if pd.api.types.is_float_dtype(dt)]
+        dtype = np.float32 if float_dtypes and all(dt == np.float32 for dt in float_dtypes) else np.float64
+        full_columns = pd.MultiIndex.from_product([tickers, fields])
+        block = data.reindex(columns=full_columns).to_numpy(dtype=dtype, na_value=np.nan)
+        values = block.reshape(len(data.index), len(tickers), len(fields)).transpose(1, 0, 2)
+
+        return cls(values, tickers, data.index, fields, version)
+
+    def __contains__(self, ticker) -> bool:
+        return ticker in self.ticker_index
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tickers)
+
+    @property
+    def empty(self) -> bool:
+        return not self.tickers
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.values.nbytes)
+
+    def tail(self, n: int) -> "MarketPanel":
+        """
+        Panel of the last n dates. For a ticker listed through the last date, frame(ticker)
+        of the tail equals frame(ticker).iloc[-n:] of this panel. The block is copied.
+        """
+        if n >= len(self.dates):
+            return self
+        version = None if self.version is None else (self.version, "tail", n)
+        return MarketPanel(self.values[:, -n:], self.tickers, self.dates[-n:], self.fields, version)
+
+    def listed_rows(self, ticker: str):
+        """Rows of a ticker's listed range: a slice when contiguous, else an array of positions."""
+        return self._rows[self.ticker_index[ticker]]
+
+    def array(self, ticker: str) -> np.ndarray:
+        """(date x field) array for a ticker over its listed range. A view when the range is contiguous."""
+        i = self.ticker_index[ticker]
+        return self.values[i, self._rows[i]]
+
+    def field(self, name: str) -> np.ndarray:
+        """(ticker x date) view of one field across the whole panel, e.g. all closes."""
+        return self.values[:, :, self.field_index[name]]
+
+    def frame(self, ticker: str) -> pd.DataFrame:
+        """
+        OHLCV DataFrame for a ticker, equivalent to `data[ticker].dropna(how='all')`.
+        Fields the ticker never reported are omitted, as they would be after a per-ticker download.
+
+        The returned frame is a shared_copy() of a base frame held by the panel: shallow under
+        copy-on-write, so any in-place edit by a strategy copies instead of touching the
+        read-only block (a writable deep copy if copy-on-write is off).
+        """
+        base = self._frames.get(ticker)
+        if base is None:
+            i = self.ticker_index[ticker]
+            rows, cols = self._rows[i], self._cols[i]
+            block = self.values[i, rows]
+            fields = self.fields
+            if cols is not None:
+                block = block[:, cols]
+                fields = [fields[c] for c in cols]
+            base = pd.DataFrame(block, index=self.dates[rows], columns=fields, copy=False)
+            self._frames[ticker] = base
+        return shared_copy(base)
+
+    def items(self, tickers: Optional[List[str]] = None) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """Yields (ticker, frame) for the given tickers (panel order if None), skipping unknown ones."""
+        for ticker in (self.tickers if tickers is None else dict.fromkeys(tickers)):
+            if ticker in self.ticker_index:
+                yield ticker, self.frame(ticker)
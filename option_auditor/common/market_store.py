@@ -0,0 +1,127 @@
+import os
+import re
+import json
+import hashlib
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Small lookups (watchlists, single-ticker checks) read partitions; larger ones read the full file.
+PARTITION_READ_MAX_TICKERS = 100
+
+
+def _partition_file_name(ticker: str) -> str:
+    """
+    Maps a ticker to a filesystem-safe partition file name.
+    Tickers like '^VIX' or 'BRK/B' get a short hash suffix so sanitised names cannot collide.
+    """
+    safe = re.sub(r'[^A-Za-z0-9._-]', '_', ticker)
+    if safe != ticker:
+        safe = f"{safe}_{hashlib.md5(ticker.encode()).hexdigest()[:8]}"
+    return f"{safe}.parquet"
+
+
+class PartitionedMarketStore:
+    """
+    Per-ticker partitioned companion to a region cache (e.g. market_scan_v1.parquet).
+
+    Layout under `<base_dir>/<cache_name>_parts/`:
+      - one parquet file per ticker with flat OHLCV columns
+      - manifest.json with per-ticker coverage (first/last bar, rows) and the mtime of
+        the monolithic file it was built from, so stale partitions are never served.
+    """
+    MANIFEST = "manifest.json"
+
+    def __init__(self, cache_name: str, base_dir: str):
+        self.cache_name = cache_name
+        self.root = os.path.join(base_dir, f"{cache_name}_parts")
+        self.manifest_path = os.path.join(self.root, self.MANIFEST)
+
+    def load_manifest(self) -> Optional[dict]:
+        """Returns the manifest dict, or None if missing/unreadable."""
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+            if isinstance(manifest, dict) and isinstance(manifest.get("tickers"), dict):
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def is_in_sync(self, manifest: Optional[dict], source_mtime_ns: Optional[int]) -> bool:
+        """True if the manifest was built from the monolithic file with the given mtime."""
+        if not manifest or source_mtime_ns is None:
+            return False
+        return manifest.get("source_mtime_ns") == source_mtime_ns
+
+    def write(self, df: pd.DataFrame, source_mtime_ns: Optional[int] = None) -> int:
+        """
+        Splits a (Ticker, Field) MultiIndex frame into per-ticker partitions and rewrites the manifest.
+        Each partition and the manifest are written via tmp file + atomic rename.
+        Returns the number of partitions written.
+        """
+        if df is None or df.empty or not isinstance(df.columns, pd.MultiIndex):
+            return 0
+
+        os.makedirs(self.root, exist_ok=True)
+        entries: Dict[str, dict] = {}
+
+        for ticker in df.columns.unique(level=0):
+            try:
+                part = df[ticker].dropna(how='all')
+                if part.empty:
+                    continue
+                file_name = _partition_file_name(str(ticker))
+                path = os.path.join(self.root, file_name)
+                tmp_path = f"{path}.tmp"
+                part.to_parquet(tmp_path)
+                os.replace(tmp_path, path)
+                entries[str(ticker)] = {
+                    "file": file_name,
+                    "first_bar": part.index[0].isoformat(),
+                    "last_bar": part.index[-1].isoformat(),
+                    "rows": int(len(part)),
+                }
+            except Exception as e:
+                logger.warning(f"Failed to write partition for {ticker} in {self.cache_name}: {e}")
+
+        manifest = {
+            "cache_name": self.cache_name,
+            "updated_at": datetime.now().isoformat(),
+            "source_mtime_ns": source_mtime_ns,
+            "tickers": entries,
+        }
+        tmp_manifest = f"{self.manifest_path}.tmp"
+        with open(tmp_manifest, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_manifest, self.manifest_path)
+
+        logger.info(f"🗂️  Partitioned {len(entries)} tickers for {self.cache_name}")
+        return len(entries)
+
+    def read(self, tickers: List[str], manifest: Optional[dict] = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Reads only the requested tickers (and fields, if columns is given) and returns a
+        (Ticker, Field) MultiIndex frame, the same shape the monolithic cache has.
+        Tickers not in the store are skipped.
+        """
+        manifest = manifest or self.load_manifest()
+        if not manifest:
+            return pd.DataFrame()
+
+        entries = manifest["tickers"]
+        frames = {}
+        for ticker in dict.fromkeys(tickers):
+            entry = entries.get(ticker)
+            if not entry:
+                continue
+            frames[ticker] = pd.read_parquet(os.path.join(self.root, entry["file"]), columns=columns)
+
+        if not frames:
+            return pd.DataFrame()
+
+        return pd.concat(frames, axis=1, sort=True)
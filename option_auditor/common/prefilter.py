@@ -0,0 +1,157 @@
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from option_auditor.common.market_panel import MarketPanel
+
+logger = logging.getLogger(__name__)
+
+# Gates drop a ticker only when it is clearly below the threshold: the window means here and
+# the strategies' rolling means can differ in the last bits
+PREFILTER_TOLERANCE = 1e-9
+
+GateSpec = Tuple[str, tuple]
+
+# Listing markets by ticker suffix, in the order by_market() takes thresholds
+MARKETS = ("us", "uk", "india")
+
+
+def by_market(us: Optional[float] = None, uk: Optional[float] = None, india: Optional[float] = None) -> tuple:
+    """Per-market thresholds of a gate in listing currency (UK in pence); None: no gate in that market."""
+    return (us, uk, india)
+
+
+def ticker_market(ticker: str) -> str:
+    if ticker.endswith(".L"):
+        return "uk"
+    if ticker.endswith(".NS"):
+        return "india"
+    return "us"
+
+
+class LastBars:
+    """
+    The last bars of each ticker's frame as a strategy sees it (panel.frame(ticker), cut to
+    `lookback`), gathered for all tickers at once. Windows a frame is too short for are NaN.
+    """
+
+    def __init__(self, panel: MarketPanel, tickers: List[str], lookback: Optional[int] = None):
+        self.panel = panel
+        self.tickers = tickers
+        self.index = np.array([panel.ticker_index[t] for t in tickers], dtype=np.intp)
+        self.markets = np.array([MARKETS.index(ticker_market(t)) for t in tickers], dtype=np.intp)
+
+        rows = [panel.listed_rows(t) for t in tickers]
+        self._contiguous = np.array([isinstance(r, slice) for r in rows], dtype=bool)
+        self._starts = np.array([r.start if isinstance(r, slice) else 0 for r in rows], dtype=np.intp)
+        self._stops = np.array([r.stop if isinstance(r, slice) else 0 for r in rows], dtype=np.intp)
+        # Tickers with gaps in the panel grid: their frames are a gather of these rows
+        self._gathered = {j: r for j, r in enumerate(rows) if not isinstance(r, slice)}
+
+        listed = np.array([r.stop - r.start if isinstance(r, slice) else len(r) for r in rows], dtype=np.intp)
+        self.count = np.minimum(listed, lookback) if lookback else listed
+        self._windows: Dict[Tuple[str, int], np.ndarray] = {}
+
+    def window(self, field: str, n: int) -> np.ndarray:
+        """(ticker x n) values of the field over each frame's last n bars; all NaN if the frame is shorter."""
+        key = (field, n)
+        out = self._windows.get(key)
+        if out is not None:
+            return out
+        out = np.full((len(self.tickers), n), np.nan)
+        f = self.panel.field_index.get(field)
+        if f is not None and n > 0 and len(self.tickers):
+            positions = self._stops[:, None] - n + np.arange(n)
+            ok = self._contiguous & (self.count >= n)
+            if ok.any():
+                out[ok] = self.panel.values[self.index[ok, None], positions[ok], f]
+            for j, rows in self._gathered.items():
+                if self.count[j] >= n:
+                    out[j] = self.panel.values[self.index[j], rows[-n:], f]
+        self._windows[key] = out
+        return out
+
+    def last(self, field: str) -> np.ndarray:
+        return self.window(field, 1)[:, 0]
+
+    def mean(self, field: str, n: int) -> np.ndarray:
+        """rolling(n).mean() at the last bar: NaN unless all n values are present."""
+        with np.errstate(invalid="ignore"):
+            return self.window(field, n).mean(axis=1)
+
+    def threshold(self, thresholds: tuple) -> np.ndarray:
+        """Each ticker's threshold from by_market() values, NaN where its market has none."""
+        per_market = np.array([np.nan if t is None else float(t) for t in thresholds])
+        return per_market[self.markets]
+
+
+def _below(values: np.ndarray, threshold) -> np.ndarray:
+    """Clearly below the threshold; NaN on either side is not below (the gate cannot tell)."""
+    with np.errstate(invalid="ignore"):
+        return values < threshold * (1 - PREFILTER_TOLERANCE)
+
+
+def _min_bars(bars: LastBars, n: int) -> np.ndarray:
+    return bars.count >= n
+
+
+def _min_price(bars: LastBars, thresholds: tuple) -> np.ndarray:
+    return ~_below(bars.last("Close"), bars.threshold(thresholds))
+
+
+def _min_avg_volume(bars: LastBars, n: int, threshold: float) -> np.ndarray:
+    return ~_below(bars.mean("Volume", n), threshold)
+
+
+def _min_turnover(bars: LastBars, n: int, thresholds: tuple, uk_pence_above: Optional[float] = None) -> np.ndarray:
+    """Last close x average volume. UK quotes above uk_pence_above are taken as pence (0: always)."""
+    price = bars.last("Close")
+    if uk_pence_above is not None:
+        with np.errstate(invalid="ignore"):
+            pence = (bars.markets == MARKETS.index("uk")) & (price > uk_pence_above)
+        price = np.where(pence, price / 100.0, price)
+    return ~_below(price * bars.mean("Volume", n), bars.threshold(thresholds))
+
+
+def _above_sma(bars: LastBars, n: int, column: str = "Close") -> np.ndarray:
+    return ~_below(bars.last(column), bars.mean(column, n))
+
+
+# name -> gate(bars, *params): True for the tickers that pass
+GATES: Dict[str, Callable[..., np.ndarray]] = {
+    "min_bars": _min_bars,
+    "min_price": _min_price,
+    "min_avg_volume": _min_avg_volume,
+    "min_turnover": _min_turnover,
+    "above_sma": _above_sma,
+}
+
+
+def prefilter_tickers(panel: Optional[MarketPanel], gates: Optional[Iterable[GateSpec]], tickers: List[str],
+                      lookback: Optional[int] = None, exempt: Iterable[str] = ()) -> List[str]:
+    """
+    The tickers that pass every gate, in order. Gates are (name, params) specs (see GATES)
+    declaring checks a strategy makes on its frame's last bars before anything else, so a
+    ticker they drop would have returned no result anyway. They are evaluated for the whole
+    universe in one pass over the panel. A ticker is only dropped when a gate can tell:
+    tickers missing from the panel, exempt ones and values a gate cannot compute pass.
+    """
+    gates = list(gates or ())
+    if not gates or panel is None or panel.empty:
+        return list(tickers)
+    exempt = set(exempt)
+    candidates = [t for t in dict.fromkeys(tickers) if t in panel and t not in exempt]
+    if not candidates:
+        return list(tickers)
+
+    bars = LastBars(panel, candidates, lookback)
+    passed = np.ones(len(candidates), dtype=bool)
+    for name, params in gates:
+        gate = GATES.get(name)
+        if gate is None:
+            raise KeyError(f"Unknown prefilter gate {name!r}")
+        passed &= gate(bars, *params)
+
+    dropped = {t for t, ok in zip(candidates, passed) if not ok}
+    return [t for t in tickers if t not in dropped]
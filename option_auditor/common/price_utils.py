@@ -1,7 +1,7 @@
 import logging
 import pandas as pd
-import yfinance as yf
 from typing import List, Dict, Union
+from option_auditor.common.market_data_provider import get_provider
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +30,7 @@ def normalize_ticker(broker_symbol: str) -> str:
 
 def fetch_live_prices(symbols: List[str]) -> Dict[str, float]:
     """
-    Fetches live prices for a list of symbols using yfinance.
+    Fetches live prices for a list of symbols from the market data provider (yfinance by default).
     Returns a dictionary mapping symbol -> current_price.
     Optimized to use batch downloading to prevent timeouts.
     """
@@ -62,7 +62,7 @@ def fetch_live_prices(symbols: List[str]) -> Dict[str, float]:
 
         if len(unique_symbols) == 1:
             sym = unique_symbols[0]
-            df = yf.download(sym, period="1d", progress=False, auto_adjust=True)
+            df = get_provider().download(sym, period="1d", progress=False, auto_adjust=True)
             if not df.empty:
                 # Handle potential MultiIndex return from yfinance even for single ticker
                 close_val = df["Close"].iloc[-1]
@@ -74,7 +74,7 @@ def fetch_live_prices(symbols: List[str]) -> Dict[str, float]:
         else:
             # Batch
             tickers_str = " ".join(unique_symbols)
-            df = yf.download(tickers_str, period="1d", group_by='ticker', threads=True, progress=False, auto_adjust=True)
+            df = get_provider().download(tickers_str, period="1d", group_by='ticker', threads=True, progress=False, auto_adjust=True)
 
             for sym in unique_symbols:
                 try:
@@ -108,7 +108,7 @@ def fetch_live_prices(symbols: List[str]) -> Dict[str, float]:
     if missing:
         for sym in missing[:5]:
             try:
-                t = yf.Ticker(sym)
+                t = get_provider().ticker(sym)
                 # Try fast_info
                 if hasattr(t, "fast_info"):
                     val = t.fast_info.get("last_price")
@@ -0,0 +1,192 @@
+import os
+import time
+import pickle
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Per-ticker strategy results reused across rescans while the ticker's bars are unchanged.
+# Opt-in via INCREMENTAL_SCREENING=1 or per scan (the scheduler's master scan uses it).
+RESULT_CACHE_ENABLED = os.environ.get("INCREMENTAL_SCREENING", "0").lower() in ("1", "true")
+# Results survive restarts when set
+RESULT_CACHE_DIR = os.environ.get("SCREEN_RESULT_DIR") or None
+# Results older than this are recomputed even if the bars did not change (strategies that
+# also read fundamentals or option chains pick those up at least this often)
+RESULT_MAX_AGE = int(os.environ.get("SCREEN_RESULT_MAX_AGE", 86400))
+# Distinct (strategy, params) scans kept in memory
+RESULT_CACHE_SCANS = 64
+
+Fingerprint = Tuple[Any, str]
+
+
+def params_digest(params: Any) -> str:
+    """Stable digest of strategy parameters (dicts, sequences, pandas objects, arrays, scalars)."""
+    h = hashlib.blake2b(digest_size=16)
+
+    def feed(obj):
+        if isinstance(obj, dict):
+            h.update(b"{")
+            for key in sorted(obj, key=repr):
+                feed(key)
+                feed(obj[key])
+            h.update(b"}")
+        elif isinstance(obj, (list, tuple)):
+            h.update(b"[")
+            for item in obj:
+                feed(item)
+            h.update(b"]")
+        elif isinstance(obj, (pd.Series, pd.DataFrame)):
+            h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+        elif isinstance(obj, np.ndarray):
+            h.update(np.ascontiguousarray(obj).tobytes())
+        else:
+            h.update(repr(obj).encode())
+
+    feed(params)
+    return h.hexdigest()
+
+
+def ticker_fingerprints(panel, tickers: Iterable[str]) -> Dict[str, Fingerprint]:
+    """
+    (last bar timestamp, data hash) of each ticker's bars in the panel. The hash covers every
+    bar of the ticker's listed range (values and dates), so a revised or added bar changes it.
+    Tickers missing from the panel get no fingerprint.
+    """
+    fingerprints = {}
+    if panel.empty or not len(panel.dates):
+        return fingerprints
+    date_hashes = pd.util.hash_pandas_object(pd.Series(panel.dates), index=False).to_numpy()
+    fields = ",".join(panel.fields).encode()
+    for ticker in dict.fromkeys(tickers):
+        if ticker not in panel:
+            continue
+        rows = panel.listed_rows(ticker)
+        dates = date_hashes[rows]
+        if not len(dates):
+            continue
+        h = hashlib.blake2b(np.ascontiguousarray(panel.array(ticker)).tobytes(), digest_size=16)
+        h.update(dates.tobytes())
+        h.update(fields)
+        fingerprints[ticker] = (panel.dates[rows][-1], h.hexdigest())
+    return fingerprints
+
+
+class ResultCache:
+    """
+    Strategy results per (scan key, ticker), each stored with the fingerprint of the bars it was
+    computed from. A rescan looks up the current fingerprints, screens only the tickers whose
+    fingerprint changed (or that were never screened) and stores their results for next time.
+    "No signal" (None) is a result too, so unchanged tickers cost nothing either way.
+
+    Results are kept pickled, so callers are free to modify the dicts they get back.
+    """
+
+    def __init__(self, state_dir: Optional[str] = None, enabled: bool = False, max_age: int = RESULT_MAX_AGE,
+                 max_scans: int = RESULT_CACHE_SCANS):
+        self.state_dir = state_dir
+        self.enabled = enabled
+        self.max_age = max_age
+        self.max_scans = max_scans
+        self._scans: "OrderedDict[str, Dict[str, tuple]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def enable(self, state_dir: Optional[str] = None):
+        self.enabled = True
+        if state_dir:
+            self.state_dir = state_dir
+
+    def clear(self):
+        with self._lock:
+            self._scans.clear()
+
+    @staticmethod
+    def scan_id(key: Any) -> str:
+        return params_digest(key)
+
+    def _path(self, scan_id: str) -> str:
+        return os.path.join(self.state_dir, f"{scan_id}.pkl")
+
+    def _entries(self, scan_id: str) -> Dict[str, tuple]:
+        """ticker -> (fingerprint, computed at, pickled result) of a scan, loaded from disk on first use."""
+        entries = self._scans.get(scan_id)
+        if entries is None:
+            entries = {}
+            if self.state_dir:
+                try:
+                    with open(self._path(scan_id), "rb") as f:
+                        loaded = pickle.load(f)
+                    if isinstance(loaded, dict):
+                        entries = loaded
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.debug(f"Discarding screen results {scan_id}: {e}")
+            self._scans[scan_id] = entries
+        self._scans.move_to_end(scan_id)
+        while len(self._scans) > self.max_scans:
+            self._scans.popitem(last=False)
+        return entries
+
+    def lookup(self, key: Any, fingerprints: Dict[str, Fingerprint], now: Optional[float] = None) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Cached results of the tickers whose fingerprint is unchanged ({ticker: result or None})
+        and the fingerprinted tickers that have to be screened again.
+        """
+        now = time.time() if now is None else now
+        scan_id = self.scan_id(key)
+        cached, stale = {}, []
+        with self._lock:
+            entries = self._entries(scan_id)
+            for ticker, fingerprint in fingerprints.items():
+                entry = entries.get(ticker)
+                if entry is None or entry[0] != fingerprint or now - entry[1] > self.max_age:
+                    stale.append(ticker)
+                    continue
+                try:
+                    cached[ticker] = pickle.loads(entry[2])
+                except Exception:
+                    stale.append(ticker)
+        return cached, stale
+
+    def store(self, key: Any, fingerprints: Dict[str, Fingerprint], results: Dict[str, Any], now: Optional[float] = None):
+        """Records the results of freshly screened tickers (only those with a fingerprint)."""
+        now = time.time() if now is None else now
+        scan_id = self.scan_id(key)
+        with self._lock:
+            entries = self._entries(scan_id)
+            stored = 0
+            for ticker, result in results.items():
+                fingerprint = fingerprints.get(ticker)
+                if fingerprint is None:
+                    continue
+                try:
+                    entries[ticker] = (fingerprint, now, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+                    stored += 1
+                except Exception as e:
+                    logger.debug(f"Result for {ticker} cannot be cached: {e}")
+            if stored:
+                self._save(scan_id, entries)
+
+    def _save(self, scan_id: str, entries: Dict[str, tuple]):
+        """Best effort checkpoint of a scan's results."""
+        if not self.state_dir:
+            return
+        path = self._path(scan_id)
+        try:
+            os.makedirs(self.state_dir, exist_ok=True)
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug(f"Screen result write failed for {scan_id}: {e}")
+
+
+result_cache = ResultCache(RESULT_CACHE_DIR, enabled=RESULT_CACHE_ENABLED)
@@ -0,0 +1,50 @@
+import os
+import atexit
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Screening is CPU-bound pandas/numpy work, so the process pool defaults to one worker per core
+SCAN_PROCESS_WORKERS = int(os.environ.get("SCAN_PROCESS_WORKERS", 0)) or os.cpu_count() or 1
+
+
+class ScanProcessPool:
+    """
+    Persistent process pool for ScreeningRunner(executor="process"). Workers are started once
+    (spawned, so they never inherit the web server's threads or locks) and reused across scans;
+    each attaches to the scan's shared panel rather than receiving pickled frames.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "ScanProcessPool":
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def reset(cls):
+        """Shuts the pool down (e.g. after a worker died); the next instance() starts a new one."""
+        with cls._lock:
+            pool, cls._instance = cls._instance, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def __init__(self, workers: int = SCAN_PROCESS_WORKERS):
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        logger.info(f"ScanProcessPool initialized with {workers} processes.")
+
+    def submit(self, fn, *args):
+        return self.executor.submit(fn, *args)
+
+    def shutdown(self, wait: bool = True):
+        self.executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+atexit.register(ScanProcessPool.reset)
@@ -0,0 +1,107 @@
+import queue
+import logging
+import threading
+import contextvars
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Progress events are sent every this many screened tickers (rows are always sent at once)
+PROGRESS_EVERY = 25
+
+_current = contextvars.ContextVar("scan_stream", default=None)
+
+
+class ScanStream:
+    """
+    Rows and progress of a scan running on a background thread, for streaming to a client.
+    Scan loops report through scan_started() / ticker_screened() / batch_screened(), which do
+    nothing outside a streamed scan. events() yields (event, data) tuples:
+      ("progress", {"screened": n, "total": n}), ("row", result),
+      ("done", final results) once the scan function returns, or ("error", message).
+    Rows arrive in completion order; the done event carries the scan's final (sorted) list.
+    """
+
+    def __init__(self):
+        self._events = queue.Queue()
+        self._lock = threading.Lock()
+        self.total = 0
+        self.screened_count = 0
+
+    def started(self, total: int):
+        with self._lock:
+            self.total += total
+            progress = {"screened": self.screened_count, "total": self.total}
+        self._events.put(("progress", progress))
+
+    def screened(self, rows: List[Any], count: int = 1):
+        with self._lock:
+            before, self.screened_count = self.screened_count, self.screened_count + count
+            report = self.screened_count // PROGRESS_EVERY > before // PROGRESS_EVERY or self.screened_count >= self.total
+            progress = {"screened": self.screened_count, "total": self.total}
+        for row in rows:
+            self._events.put(("row", row))
+        if report:
+            self._events.put(("progress", progress))
+
+    def finished(self, results: Any):
+        self._events.put(("done", results))
+
+    def failed(self, error: str):
+        self._events.put(("error", error))
+
+    def events(self, keepalive: float = 15.0) -> Iterator[Tuple[str, Any]]:
+        """Yields events until done/error; ("ping", None) whenever nothing happened for `keepalive` seconds."""
+        while True:
+            try:
+                event = self._events.get(timeout=keepalive)
+            except queue.Empty:
+                yield "ping", None
+                continue
+            yield event
+            if event[0] in ("done", "error"):
+                return
+
+
+def scan_started(total: int):
+    """A scan loop is about to screen `total` more tickers."""
+    stream = _current.get()
+    if stream is not None:
+        stream.started(total)
+
+
+def ticker_screened(result: Optional[Any]):
+    """A scan loop finished one ticker (result None/empty if it produced no row)."""
+    stream = _current.get()
+    if stream is not None:
+        stream.screened([result] if result else [])
+
+
+def batch_screened(rows: List[Any], count: int):
+    """A scan loop finished `count` tickers that produced `rows`."""
+    stream = _current.get()
+    if stream is not None:
+        stream.screened(rows, count)
+
+
+def stream_scan(fn: Callable[..., Any], *args, on_done: Optional[Callable[[Any], None]] = None, **kwargs) -> ScanStream:
+    """
+    Runs fn(*args, **kwargs) on a daemon thread with a ScanStream attached and returns the stream.
+    on_done: Optional callback given the scan's final results (e.g. to cache them).
+    """
+    stream = ScanStream()
+
+    def _run():
+        _current.set(stream)
+        try:
+            results = fn(*args, **kwargs)
+            if on_done is not None:
+                on_done(results)
+        except Exception as e:
+            logger.error(f"Streamed scan failed: {e}")
+            stream.failed(str(e))
+            return
+        stream.finished(results)
+
+    threading.Thread(target=_run, name="scan-stream", daemon=True).start()
+    return stream
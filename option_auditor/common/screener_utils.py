@@ -3,21 +3,35 @@ import logging
 import math
 import numpy as np
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
 import time
-from typing import List, Callable, Dict, Any, Optional
-import yfinance as yf
+import pickle
+from typing import List, Callable, Dict, Any, Iterator, Optional
 
 from option_auditor.common.data_utils import (
     get_cached_market_data,
     fetch_batch_data_safe,
     prepare_data_for_ticker,
-    _calculate_trend_breakout_date
+    load_shared_panel,
+    _calculate_trend_breakout_date,
+    TREND_BREAKOUT_FEATURE
 )
+from option_auditor.common.market_panel import MarketPanel
+from option_auditor.common.frame_cache import loaded_frame_cache
+from option_auditor.common.timeframes import TIMEFRAMES, timeframe_spec, base_panel_key, derived_panel
+from option_auditor.common.shared_panel import scan_panel, attach_panel, detach_panel
+from option_auditor.common.scan_pool import ScanProcessPool
+from option_auditor.common.scan_stream import scan_started, ticker_screened, batch_screened
+from option_auditor.common.indicator_engine import prime_panel_features, ENGINE_MIN_TICKERS
+from option_auditor.common.indicator_stream import indicator_streams
+from option_auditor.common.result_cache import result_cache, ticker_fingerprints, params_digest
+from option_auditor.common.prefilter import prefilter_tickers
 from option_auditor.common.constants import SECTOR_COMPONENTS, TICKER_NAMES
 
 from option_auditor.uk_stock_data import get_uk_tickers, get_uk_euro_tickers
 from option_auditor.india_stock_data import get_indian_tickers
 from option_auditor.us_stock_data import get_united_states_stocks
+from option_auditor.common.market_data_provider import get_provider
 try:
     from option_auditor.sp500_data import get_sp500_tickers
 except ImportError:
@@ -33,6 +47,9 @@ DEFAULT_EMA_MED = 13
 DEFAULT_EMA_SLOW = 21
 DEFAULT_DONCHIAN_WINDOW = 20
 
+# ScreeningRunner execution mode unless a runner asks for one: "thread" or "process"
+SCREENER_EXECUTOR = os.environ.get("SCREENER_EXECUTOR", "thread").lower()
+
 logger = logging.getLogger(__name__)
 
 def _get_filtered_sp500(check_trend: bool = True) -> list:
@@ -43,13 +60,11 @@ def _get_filtered_sp500(check_trend: bool = True) -> list:
     if not base_tickers:
         return []
 
-    filtered_list = []
-
     # Use CACHED data to prevent timeouts and redundant downloads.
     # We use "market_scan_v1" which contains 2y data for S&P 500.
     # If the cache is missing, this will download it (heavy), but future calls will be instant.
     try:
-        data = get_cached_market_data(base_tickers, period="2y", cache_name="market_scan_v1")
+        data = get_cached_market_data(base_tickers, period="2y", cache_name="market_scan_v1", columns=["Close", "Volume"])
     except Exception as e:
         logger.error(f"Failed to get S&P 500 cache: {e}")
         data = pd.DataFrame()
@@ -59,43 +74,15 @@ def _get_filtered_sp500(check_trend: bool = True) -> list:
         logger.warning("S&P 500 filter data unavailable. Returning raw list.")
         return base_tickers
 
-    # Iterate through the downloaded data to check criteria
-    # OPTIMIZED ITERATION
-    if isinstance(data.columns, pd.MultiIndex):
-        iterator = [(ticker, data[ticker]) for ticker in data.columns.unique(level=0)]
-    else:
-        # Fallback for single ticker result (rare)
-        iterator = [(base_tickers[0], data)] if not data.empty and len(base_tickers)==1 else []
-
-    for ticker, df in iterator:
-        try:
-             # CLEANUP: Drop the top level index to make it a standard OHLVC df
-            if isinstance(df.columns, pd.MultiIndex):
-                df = df.droplevel(0, axis=1)
-
-            df = df.dropna(how='all')
-            if len(df) < 20: continue
-
-            # 1. Volume Filter (> 500k avg over last 20 days)
-            if 'Volume' in df.columns:
-                avg_vol = df['Volume'].rolling(20).mean().iloc[-1]
-                if avg_vol < 500000: continue
-            else:
-                 continue
-
-            # 2. Trend Filter (> SMA 200)
-            if check_trend:
-                if len(df) < 200: continue
-                sma_200 = df['Close'].rolling(200).mean().iloc[-1]
-                curr_price = df['Close'].iloc[-1]
-                if curr_price < sma_200: continue
-
-            filtered_list.append(ticker)
-        except Exception as e:
-            logger.warning(f"Error filtering S&P ticker {ticker}: {e}")
-            continue
-
-    return filtered_list
+    # One vectorized pass over the universe: Volume (> 500k avg over last 20 days), then Trend (> SMA 200)
+    default_ticker = base_tickers[0] if len(base_tickers) == 1 else None
+    panel = MarketPanel.from_frame(data, default_ticker=default_ticker)
+    if "Volume" not in panel.fields:
+        return []
+    gates = [("min_bars", (20,)), ("min_avg_volume", (20, 500000))]
+    if check_trend:
+        gates += [("min_bars", (200,)), ("above_sma", (200,))]
+    return prefilter_tickers(panel, gates, panel.tickers)
 
 def resolve_region_tickers(region: str, check_trend: bool = False, only_watch: bool = False) -> list:
     """
@@ -170,8 +157,11 @@ def sanitize(val):
         return None
 
 class ScreeningRunner:
-    def __init__(self, ticker_list: Optional[List[str]] = None, time_frame: str = "1d", region: str = "us", check_mode: bool = False, workers: int = 4, data_period: str = None):
+    def __init__(self, ticker_list: Optional[List[str]] = None, time_frame: str = "1d", region: str = "us", check_mode: bool = False, workers: int = 4, data_period: str = None,
+                 executor: Optional[str] = None):
         self.ticker_list = ticker_list
+        # "thread" (default) or "process": CPU-bound scans of large universes scale across cores on the process pool
+        self.executor = executor or SCREENER_EXECUTOR
         self.time_frame = time_frame
         self.region = region
         self.check_mode = check_mode
@@ -187,62 +177,46 @@ class ScreeningRunner:
         self._configure_timeframe()
 
     def _configure_timeframe(self):
-        if self.time_frame == "49m":
-            self.yf_interval = "5m"
-            self.resample_rule = "49min"
-            self.is_intraday = True
-            self.period = "1mo"
-        elif self.time_frame == "98m":
-            self.yf_interval = "5m"
-            self.resample_rule = "98min"
-            self.is_intraday = True
-            self.period = "1mo"
-        elif self.time_frame == "196m":
-            self.yf_interval = "5m"
-            self.resample_rule = "196min"
-            self.is_intraday = True
-            self.period = "1mo"
-        elif self.time_frame == "1wk":
-            self.yf_interval = "1wk"
-            self.period = "2y"
-            self.is_intraday = False
-        elif self.time_frame == "1mo":
-            self.yf_interval = "1mo"
-            self.period = "5y"
-            self.is_intraday = False
-        elif self.time_frame == "1h":
-            self.yf_interval = "1h"
-            self.period = "60d"
-            self.is_intraday = True
-        elif self.time_frame == "4h":
-            self.yf_interval = "1h"
-            self.resample_rule = "4h"
-            self.is_intraday = True
-            self.period = "60d"
-        elif self.time_frame == "15m":
-            self.yf_interval = "15m"
-            self.period = "1mo"
-            self.is_intraday = True
-        elif self.time_frame == "5m":
-             self.yf_interval = "5m"
-             self.period = "5d"
-             self.is_intraday = True
-        elif self.time_frame == "1d":
-            self.yf_interval = "1d"
-            self.period = "2y" # Safe default for most daily strategies (e.g. 200 SMA)
-            self.is_intraday = False
+        # Weekly bars are derived from daily data and 4h/49m/98m/196m from the 1h/5m base
+        # downloads; monthly bars are downloaded natively (see TIMEFRAMES)
+        if self.time_frame in TIMEFRAMES:
+            self.yf_interval, self.period, self.resample_rule, self.is_intraday = timeframe_spec(self.time_frame)
 
         if self.custom_period:
             self.period = self.custom_period
 
+    def _cache_name(self) -> str:
+        cache_name = "market_scan_v1"
+        if self.region == "uk": cache_name = "market_scan_uk"
+        elif self.region == "india": cache_name = "market_scan_india"
+        elif self.region == "uk_euro": cache_name = "market_scan_europe"
+        return cache_name
+
+    def _attach_shared_panel(self, tickers: List[str]) -> Optional[MarketPanel]:
+        """
+        Uses the cross-process shared panel (SHARED_MARKET_PANEL=1) when it covers the request,
+        under the same rules as the parquet cache path in _fetch_data: the freshness of a
+        lookup_only read, so past its windows the scan downloads instead.
+        """
+        if self.yf_interval != "1d" or self.check_mode or len(tickers) <= 50:
+            return None
+        try:
+            panel = load_shared_panel(self._cache_name(), lookup_only=True)
+        except Exception as e:
+            logger.warning(f"Shared panel attach failed: {e}")
+            return None
+        if panel is None:
+            return None
+        intersection = sum(1 for t in set(tickers) if t in panel)
+        if intersection / len(tickers) > 0.6:
+            return panel
+        return None
+
     def _fetch_data(self, tickers: List[str]) -> pd.DataFrame:
         data = None
-        # Try Cache first for Daily/Weekly
-        if not self.is_intraday and not self.check_mode:
-            cache_name = "market_scan_v1"
-            if self.region == "uk": cache_name = "market_scan_uk"
-            elif self.region == "india": cache_name = "market_scan_india"
-            elif self.region == "uk_euro": cache_name = "market_scan_europe"
+        # Try Cache first for Daily/Weekly (the region caches hold daily bars)
+        if self.yf_interval == "1d" and not self.check_mode:
+            cache_name = self._cache_name()
 
             try:
                 # Optimization: Check Master Cache coverage
@@ -253,7 +227,9 @@ class ScreeningRunner:
                              available = cached.columns.levels[0]
                              intersection = len(set(tickers).intersection(available))
                              if intersection / len(tickers) > 0.6: # 60% coverage enough to prefer cache
-                                 data = get_cached_market_data(tickers, period="2y", cache_name=cache_name)
+                                 # Reuse the frame we just loaded instead of reading the cache a second time
+                                 wanted = cached.columns.get_level_values(0).isin(tickers)
+                                 data = cached.loc[:, wanted]
             except Exception as e:
                 logger.error(f"Cache check failed: {e}")
 
@@ -267,7 +243,58 @@ class ScreeningRunner:
 
         return data
 
-    def run(self, strategy_func: Callable[[str, pd.DataFrame], Optional[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    def _load_panel(self, tickers: List[str]) -> MarketPanel:
+        """
+        Panel of the base bars for the scan. Large downloads other than daily (which come from
+        the region caches) are kept in the frame cache for INTRADAY_BASE_TTL seconds, so
+        timeframes derived from the same base (1h/4h, 5m/49m/98m/196m) reuse one download.
+        """
+        key = None
+        if self.yf_interval != "1d" and not self.check_mode and len(tickers) > 50:
+            key = base_panel_key(self.yf_interval, self.period, tickers)
+            panel = loaded_frame_cache.get(key)
+            if panel is not None:
+                return panel
+
+        data = self._fetch_data(tickers)
+        # Flat data is only unambiguous for a single-ticker request
+        default_ticker = tickers[0] if len(tickers) == 1 else None
+        panel = MarketPanel.from_frame(data, default_ticker=default_ticker, version=key)
+        if key is not None and not panel.empty:
+            loaded_frame_cache.put(key, panel)
+        return panel
+
+    def run(self, strategy_func: Callable[[str, pd.DataFrame], Optional[Dict[str, Any]]], panel: Optional[MarketPanel] = None,
+            features: Optional[List[tuple]] = None, lookback: Optional[int] = None, result_key: Optional[tuple] = None,
+            prefilter: Optional[List[tuple]] = None, incremental: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """
+        Runs strategy_func(ticker, df) for every ticker.
+        panel: Optional pre-built MarketPanel to screen instead of fetching data.
+        features: Optional (name, params) indicator specs the strategy reads through
+        TickerFeatures; on large universes they are batch-computed up front.
+        lookback: Optional bars the strategy's latest-bar result depends on (its LOOKBACK);
+        each ticker's frame is cut to that tail (a view) before the strategy sees it.
+        result_key: Optional (strategy, params digest) identifying what strategy_func computes.
+        With incremental screening enabled, tickers whose bars are unchanged since the last
+        scan with this key reuse that scan's result instead of being screened again. Only for
+        strategies whose result depends on nothing but the bars and the key.
+        prefilter: Optional (gate, params) specs (the strategy's PREFILTER, see prefilter.GATES) for
+        the liquidity/price/trend checks strategy_func makes first; they are evaluated for the
+        whole universe at once and only the tickers that pass are screened.
+        incremental: Turns incremental screening on/off for this scan (default: INCREMENTAL_SCREENING).
+        """
+        return list(self.iter_results(strategy_func, panel=panel, features=features, lookback=lookback, result_key=result_key,
+                                      prefilter=prefilter, incremental=incremental))
+
+    def iter_results(self, strategy_func: Callable[[str, pd.DataFrame], Optional[Dict[str, Any]]], panel: Optional[MarketPanel] = None,
+                     features: Optional[List[tuple]] = None, lookback: Optional[int] = None,
+                     result_key: Optional[tuple] = None, prefilter: Optional[List[tuple]] = None,
+                     incremental: Optional[bool] = None) -> Iterator[Dict[str, Any]]:
+        """
+        run() as a generator: yields each result as soon as its ticker (or process batch) is
+        screened, in completion order, and reports progress to the streamed scan, if any.
+        Closing the generator early cancels the tickers not yet started.
+        """
         if self.ticker_list is None:
             self.ticker_list = resolve_region_tickers(self.region)
 
@@ -276,83 +303,184 @@ class ScreeningRunner:
         # But if the user passed a list, we use it.
 
         if not self.ticker_list:
-            return []
-
-        data = self._fetch_data(self.ticker_list)
-
-        results = []
-
-        # Handle Flat vs MultiIndex
-        # We need a map of ticker -> DataFrame
-        ticker_data_map = {}
-
-        if isinstance(data.columns, pd.MultiIndex):
-            # Iterate Level 0
-            for t in data.columns.levels[0]:
-                if t in self.ticker_list:
-                     ticker_data_map[t] = data[t] # This is a slice, might need copy inside strategy
-        else:
-            # Flat
-            if len(self.ticker_list) == 1 and not data.empty:
-                ticker_data_map[self.ticker_list[0]] = data
-            elif not data.empty:
-                 # Ambiguous. If we asked for many and got flat, it's weird.
-                 # Maybe only 1 valid?
-                 pass
-
-        # If data fetch failed, we might still want to try one-by-one inside the thread (prepare_data_for_ticker handles fallback)
-        # So even if ticker_data_map is empty, we proceed with ticker_list
-
-        def _worker(ticker):
-            # If we have batch data, pass it. If not, pass None and prepare_data_for_ticker will fetch.
-            # But wait, prepare_data_for_ticker takes `data_source`.
-            # If we pass None, it fetches.
-
-            # The issue: If we pass the WHOLE batch data to every thread, it's slow/memory heavy if not sliced?
-            # Or prepare_data_for_ticker expects the FULL batch and slices it itself?
-            # Let's check prepare_data_for_ticker signature.
-            # prepare_data_for_ticker(ticker, data_source, time_frame, period, yf_interval, resample_rule, is_intraday)
-
-            # It expects `data_source` to be the batch DF.
-            # So we should pass `data` (the full DF) to it?
-            # `prepare_data_for_ticker` does:
-            # if isinstance(data_source.columns, pd.MultiIndex): ... slice ...
-
-            # So yes, we can pass `data` directly.
-
-            try:
-                # We use the shared helper to get the specific DF
-                df = prepare_data_for_ticker(
-                    ticker,
-                    data,
-                    self.time_frame,
-                    self.period,
-                    self.yf_interval,
-                    self.resample_rule,
-                    self.is_intraday
-                )
-
-                if df is None or df.empty:
-                    return None
-
-                # Run strategy
-                return strategy_func(ticker, df)
-
-            except Exception as e:
-                logger.error(f"Error processing {ticker}: {e}")
-                return None
-
-        with ThreadPoolExecutor(max_workers=self.workers) as executor:
-            future_to_symbol = {executor.submit(_worker, sym): sym for sym in self.ticker_list}
+            return
+
+        if panel is None:
+            panel = self._attach_shared_panel(self.ticker_list)
+
+        if panel is None:
+            panel = self._load_panel(self.ticker_list)
+
+        if self.resample_rule:
+            # Derived once for the whole universe (and cached per base panel), so strategies,
+            # lookback and feature priming all see the timeframe's own bars
+            panel = derived_panel(panel, self.resample_rule)
+
+        if features or len(panel) >= ENGINE_MIN_TICKERS:
+            # Nearly every strategy reports the trend breakout date, so that is always included.
+            features = list(features or ()) + [TREND_BREAKOUT_FEATURE]
+
+        scan_started(len(self.ticker_list))
+        tickers = self.ticker_list
+        if prefilter and not self.check_mode:
+            # Vectorized gates over the universe; tickers that fail them never reach the strategy
+            tickers = prefilter_tickers(panel, prefilter, tickers, lookback)
+            logger.info(f"🚧 Pre-filter: {len(tickers)} of {len(self.ticker_list)} tickers passed")
+            batch_screened([], len(self.ticker_list) - len(tickers))
+
+        if incremental is None:
+            incremental = result_cache.enabled
+        if result_key is None or not incremental or self.check_mode:
+            for _, res in self._iter_screened(strategy_func, panel, tickers, features, lookback):
+                if res:
+                    yield res
+            return
+
+        # Incremental rescan: only tickers whose bars changed are screened again
+        key = (result_key, self.time_frame, lookback)
+        fingerprints = ticker_fingerprints(panel, tickers)
+        cached, stale = result_cache.lookup(key, fingerprints)
+        tickers = stale + [t for t in dict.fromkeys(tickers) if t not in fingerprints]
+        hits = [res for res in cached.values() if res]
+        logger.info(f"♻️ Reusing {len(cached)} unchanged results; screening {len(tickers)} tickers")
+        batch_screened(hits, len(cached))
+        yield from hits
+
+        fresh = {}
+        try:
+            for ticker, res in self._iter_screened(strategy_func, panel, tickers, features, lookback):
+                fresh[ticker] = res
+                if res:
+                    yield res
+        finally:
+            # Also when the caller stops early: whatever was screened is valid
+            result_cache.store(key, fingerprints, fresh)
+
+    def _iter_screened(self, strategy_func, panel: MarketPanel, tickers: List[str], features: Optional[List[tuple]],
+                       lookback: Optional[int]) -> Iterator[tuple]:
+        """Screens the tickers against the panel, yielding (ticker, result or None) as each one finishes."""
+        if not tickers:
+            return
+        prepare_args = (self.time_frame, self.period, self.yf_interval, self.resample_rule, self.is_intraday)
+        if self.executor == "process" and not self.check_mode:
+            # Whatever the process pool could not screen continues on threads
+            tickers = yield from self._iter_in_processes(strategy_func, panel, tickers, prepare_args, lookback, features)
+            if not tickers:
+                return
+
+        if features:
+            if indicator_streams.enabled:
+                # Incremental state from previous scans, kept on the untrimmed panel so a new bar
+                # does not move its origin; whatever it can't serve goes to the batch engine
+                features = indicator_streams.publish(panel, features, tickers, lookback=lookback)
+            # Features are keyed by the frames strategies see, so prime the same tail.
+            feature_panel = panel.tail(lookback) if lookback else panel
+            prime_panel_features(feature_panel, features, tickers)
+
+        # Tickers missing from the panel are fetched one-by-one inside the thread (prepare_data_for_ticker handles fallback)
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            future_to_symbol = {executor.submit(_screen_ticker, sym, panel, strategy_func, prepare_args, lookback): sym
+                                for sym in tickers}
             for future in as_completed(future_to_symbol):
                 try:
                     res = future.result()
-                    if res:
-                        results.append(res)
                 except Exception as e:
                     logger.error(f"Thread error: {e}")
+                    res = None
+                ticker_screened(res)
+                yield future_to_symbol[future], res
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _iter_in_processes(self, strategy_func, panel: MarketPanel, tickers: List[str], prepare_args: tuple,
+                           lookback: Optional[int], features: Optional[List[tuple]]) -> Iterator[tuple]:
+        """
+        Screens the tickers in batches on the persistent process pool, yielding (ticker, result
+        or None) per batch. Workers attach to the panel through shared memory and prime the
+        features themselves. Returns the tickers left unscreened (all of them if the strategy or
+        panel cannot be shipped, the rest if the pool fails) for the caller to run on threads.
+        """
+        try:
+            pickle.dumps(strategy_func)
+        except Exception as e:
+            logger.warning(f"Strategy cannot be sent to worker processes ({e}); screening with threads")
+            return tickers
+
+        with scan_panel(panel) as shared:
+            if shared is None:
+                return tickers
+            pool = ScanProcessPool.instance()
+            # A few batches per worker balances uneven tickers without paying per-ticker round trips
+            size = max(1, math.ceil(len(tickers) / (pool.workers * 4)))
+            batches = [tickers[i:i + size] for i in range(0, len(tickers), size)]
+
+            pending = {}
+            screened = set()
+            try:
+                for batch in batches:
+                    pending[pool.submit(_screen_batch, shared, batch, strategy_func, prepare_args, lookback, features)] = batch
+                for future in as_completed(list(pending)):
+                    results = dict(future.result())
+                    batch = pending.pop(future)
+                    screened.update(batch)
+                    batch_screened(list(results.values()), len(batch))
+                    for ticker in batch:
+                        yield ticker, results.get(ticker)
+            except Exception as e:
+                logger.error(f"Process pool screening failed ({e}); screening the rest with threads")
+                ScanProcessPool.reset()
+                return [t for t in tickers if t not in screened]
+            finally:
+                for future in pending:
+                    future.cancel()
+        return []
 
-        return results
+
+def _screen_ticker(ticker: str, panel: MarketPanel, strategy_func, prepare_args: tuple, lookback: Optional[int]):
+    """One ticker of a scan: its frame (a view onto the panel, or a fallback download) through the strategy."""
+    try:
+        df = prepare_data_for_ticker(ticker, panel, *prepare_args, source_resampled=True)
+
+        if df is None or df.empty:
+            return None
+        if lookback:
+            df = df.iloc[-lookback:]
+
+        return strategy_func(ticker, df)
+
+    except Exception as e:
+        logger.error(f"Error processing {ticker}: {e}")
+        return None
+
+
+# Scan panel (base_dir, cache_name, version) this worker process is attached to, and the one it primed
+_worker_panel = {"shared": None, "primed": None}
+
+
+def _screen_batch(shared: tuple, tickers: List[str], strategy_func, prepare_args: tuple, lookback: Optional[int],
+                  features: Optional[List[tuple]]) -> List[tuple]:
+    """Process-pool task: screens a batch of tickers against the shared scan panel; (ticker, result) of the hits."""
+    base_dir, cache_name, version = shared
+    previous = _worker_panel["shared"]
+    if previous is not None and previous != shared:
+        detach_panel(previous[1], previous[0])
+    panel = attach_panel(cache_name, base_dir, expected_version=version)
+    if panel is None:
+        raise RuntimeError(f"Scan panel {cache_name} ({version}) is not available")
+    _worker_panel["shared"] = shared
+
+    if features and _worker_panel["primed"] != (shared, lookback):
+        # Once per scan and process: the batch engine works on the whole panel either way
+        prime_panel_features(panel.tail(lookback) if lookback else panel, features)
+        _worker_panel["primed"] = (shared, lookback)
+
+    results = []
+    for ticker in tickers:
+        res = _screen_ticker(ticker, panel, strategy_func, prepare_args, lookback)
+        if res:
+            results.append((ticker, res))
+    return results
 
 
 def _norm_cdf(x):
@@ -399,13 +527,92 @@ def _get_market_regime():
     """
     try:
         # 5 day history to get a smoothing or just last close
-        vix = yf.download("^VIX", period="5d", progress=False, auto_adjust=True)
+        vix = get_provider().download("^VIX", period="5d", progress=False, auto_adjust=True)
         if not vix.empty:
             return float(vix['Close'].iloc[-1])
     except Exception as e:
         logger.warning(f"Failed to fetch VIX: {e}")
     return 15.0 # Safe default
 
+class _StrategyCall:
+    """strategy_class(ticker, df, ...).analyze() as a picklable callable, so it can run on the process pool."""
+
+    def __init__(self, strategy_class: Callable, check_mode: bool, strategy_kwargs: Dict[str, Any]):
+        self.strategy_class = strategy_class
+        self.check_mode = check_mode
+        self.strategy_kwargs = strategy_kwargs
+
+    def __call__(self, ticker, df):
+        try:
+            # Try passing check_mode and kwargs
+            return self.strategy_class(ticker, df, check_mode=self.check_mode, **self.strategy_kwargs).analyze()
+        except TypeError:
+            try:
+                # Try passing just kwargs (some don't take check_mode)
+                return self.strategy_class(ticker, df, **self.strategy_kwargs).analyze()
+            except TypeError:
+                # Fallback: Try passing ONLY ticker and df (no kwargs support?)
+                return self.strategy_class(ticker, df).analyze()
+
+
+class StrategySuite:
+    """
+    Several strategies evaluated in one pass over a scan: each ticker's frame is prepared once and
+    handed to every strategy, so the indicators they share are computed once (the union of their
+    FEATURES is primed up front). strategies maps a result key to a strategy class, run as
+    run_screening_strategy runs it, or to a strategy_func(ticker, df).
+    Returns {"ticker": ..., <key>: <result or None>, ...}, or None if no strategy returned anything.
+    """
+
+    def __init__(self, strategies: Dict[str, Callable], check_mode: bool = False, **strategy_kwargs):
+        self.strategies = {name: _StrategyCall(s, check_mode, strategy_kwargs) if isinstance(s, type) else s
+                           for name, s in strategies.items()}
+        self.features = tuple(dict.fromkeys(f for s in strategies.values() for f in getattr(s, "FEATURES", None) or ()))
+        # Every strategy reads the same frame, so it is the longest tail any of them needs
+        lookbacks = [getattr(s, "LOOKBACK", None) for s in strategies.values()]
+        self.lookback = None if not lookbacks or None in lookbacks else max(lookbacks)
+        # Only gates every strategy makes: a ticker they drop has no result from any of them
+        prefilters = [tuple(getattr(s, "PREFILTER", None) or ()) for s in strategies.values()]
+        self.prefilter = tuple(g for g in prefilters[0] if all(g in p for p in prefilters[1:])) if prefilters else ()
+
+    def __call__(self, ticker, df):
+        merged = {}
+        for name, strategy in self.strategies.items():
+            try:
+                merged[name] = strategy(ticker, df)
+            except Exception as e:
+                logger.error(f"Error processing {ticker} with {name}: {e}")
+                merged[name] = None
+        if not any(merged.values()):
+            return None
+        return {"ticker": ticker, **merged}
+
+
+def run_strategy_suite(
+    strategies: Dict[str, Callable],
+    ticker_list: Optional[List[str]] = None,
+    time_frame: str = "1d",
+    region: str = "us",
+    check_mode: bool = False,
+    data_period: str = None,
+    panel: Optional[MarketPanel] = None,
+    features: Optional[List[tuple]] = None,
+    executor: Optional[str] = None,
+    prefilter: Optional[List[tuple]] = None,
+    **strategy_kwargs
+) -> List[Dict[str, Any]]:
+    """
+    Runs several strategies over one data load and one traversal of the tickers (see StrategySuite).
+    features: Optional extra indicator specs read by function strategies (classes declare FEATURES).
+    prefilter: Optional gates every strategy makes, for function strategies (classes declare PREFILTER).
+    """
+    suite = StrategySuite(strategies, check_mode=check_mode, **strategy_kwargs)
+    runner = ScreeningRunner(ticker_list=ticker_list, time_frame=time_frame, region=region, check_mode=check_mode, data_period=data_period,
+                             executor=executor)
+    return runner.run(suite, panel=panel, features=list(dict.fromkeys(suite.features + tuple(features or ()))),
+                      lookback=suite.lookback, prefilter=list(dict.fromkeys(suite.prefilter + tuple(prefilter or ()))))
+
+
 def run_screening_strategy(
     strategy_class: Callable,
     ticker_list: Optional[List[str]] = None,
@@ -415,27 +622,30 @@ def run_screening_strategy(
     sorting_key: Optional[Callable] = None,
     reverse_sort: bool = False,
     data_period: str = None,
+    panel: Optional[MarketPanel] = None,
+    executor: Optional[str] = None,
     **strategy_kwargs
 ) -> List[Dict[str, Any]]:
     """
     Generic runner for class-based strategies.
     Instantiates the strategy class for each ticker and runs .analyze().
+    panel: Optional MarketPanel to screen instead of fetching data.
+    executor: Optional "thread" / "process" override of SCREENER_EXECUTOR.
     """
-    runner = ScreeningRunner(ticker_list=ticker_list, time_frame=time_frame, region=region, check_mode=check_mode, data_period=data_period)
-
-    def strategy_wrapper(ticker, df):
-        try:
-             # Try passing check_mode and kwargs
-             return strategy_class(ticker, df, check_mode=check_mode, **strategy_kwargs).analyze()
-        except TypeError:
-             try:
-                 # Try passing just kwargs (some don't take check_mode)
-                 return strategy_class(ticker, df, **strategy_kwargs).analyze()
-             except TypeError:
-                  # Fallback: Try passing ONLY ticker and df (no kwargs support?)
-                  return strategy_class(ticker, df).analyze()
-
-    results = runner.run(strategy_wrapper)
+    runner = ScreeningRunner(ticker_list=ticker_list, time_frame=time_frame, region=region, check_mode=check_mode, data_period=data_period,
+                             executor=executor)
+
+    strategy_wrapper = _StrategyCall(strategy_class, check_mode, strategy_kwargs)
+    # A strategy class's result depends on the ticker's bars and its kwargs, so rescans can reuse unchanged
+    # tickers; classes that also read fundamentals or option chains opt out (RESULT_CACHEABLE = False)
+    result_key = None
+    if getattr(strategy_class, "RESULT_CACHEABLE", True):
+        result_key = (f"{getattr(strategy_class, '__module__', '')}.{getattr(strategy_class, '__qualname__', repr(strategy_class))}",
+                      params_digest(strategy_kwargs))
+
+    results = runner.run(strategy_wrapper, panel=panel, features=getattr(strategy_class, "FEATURES", None),
+                         lookback=getattr(strategy_class, "LOOKBACK", None), result_key=result_key,
+                         prefilter=getattr(strategy_class, "PREFILTER", None))
 
     if sorting_key:
         results.sort(key=sorting_key, reverse=reverse_sort)
@@ -0,0 +1,160 @@
+import os
+import json
+import uuid
+import shutil
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from option_auditor.common.market_panel import MarketPanel
+
+logger = logging.getLogger(__name__)
+
+# Opt-in: multi-worker deployments set SHARED_MARKET_PANEL=1 so every worker maps the same panel files.
+SHARED_PANEL_ENABLED = os.environ.get("SHARED_MARKET_PANEL", "0").lower() in ("1", "true")
+
+PANEL_DIR_NAME = "panels"
+CURRENT_POINTER = "CURRENT"
+
+# Scan panels handed to worker processes live in RAM-backed /dev/shm where available
+SCAN_PANEL_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+SCAN_PANEL_NAME = "scan"
+
+_attached = {}
+_attach_lock = threading.Lock()
+
+
+def cache_version(file_path: str) -> Optional[str]:
+    """Version stamp of a cache parquet: '<mtime_ns>_<size>'. None if the file is missing."""
+    try:
+        st = os.stat(file_path)
+        return f"{st.st_mtime_ns}_{st.st_size}"
+    except OSError:
+        return None
+
+
+def _panel_root(base_dir: str, cache_name: str) -> str:
+    return os.path.join(base_dir, PANEL_DIR_NAME, cache_name)
+
+
+def publish_panel(panel: MarketPanel, cache_name: str, base_dir: str, version: str) -> Optional[str]:
+    """
+    Writes the panel as memory-mappable .npy files under
+    `<base_dir>/panels/<cache_name>/<version>/` and atomically flips the CURRENT pointer.
+    Older versions are removed; processes that still map them keep their (unlinked) pages.
+    Returns the published directory, or None if the panel cannot be shared.
+    """
+    if panel.empty or not isinstance(panel.dates, pd.DatetimeIndex):
+        return None
+
+    root = _panel_root(base_dir, cache_name)
+    target = os.path.join(root, version)
+    staging = f"{target}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging, exist_ok=True)
+
+    dates = panel.dates
+    np.save(os.path.join(staging, "values.npy"), panel.values)
+    np.save(os.path.join(staging, "dates.npy"), dates.asi8)
+    meta = {
+        "version": version,
+        "tickers": panel.tickers,
+        "fields": panel.fields,
+        "tz": str(dates.tz) if dates.tz is not None else None,
+        "unit": dates.unit,
+    }
+    with open(os.path.join(staging, "meta.json"), "w") as f:
+        json.dump(meta, f)
+
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(staging, target)
+
+    pointer = os.path.join(root, CURRENT_POINTER)
+    with open(f"{pointer}.tmp", "w") as f:
+        f.write(version)
+    os.replace(f"{pointer}.tmp", pointer)
+
+    for entry in os.listdir(root):
+        if entry not in (version, CURRENT_POINTER):
+            path = os.path.join(root, entry)
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+
+    logger.info(f"📡 Published shared panel {cache_name} ({version}, {panel.nbytes / 1e6:.1f} MB)")
+    return target
+
+
+def current_panel_version(cache_name: str, base_dir: str) -> Optional[str]:
+    try:
+        with open(os.path.join(_panel_root(base_dir, cache_name), CURRENT_POINTER)) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def attach_panel(cache_name: str, base_dir: str, expected_version: Optional[str] = None) -> Optional[MarketPanel]:
+    """
+    Attaches read-only to the published panel for cache_name (memory-mapped, so pages are
+    shared by every process). Re-attaches only when the CURRENT pointer moves.
+    If expected_version is given, returns None unless the published panel has that version.
+    """
+    version = current_panel_version(cache_name, base_dir)
+    if version is None or (expected_version is not None and version != expected_version):
+        return None
+
+    key = (os.path.abspath(base_dir), cache_name)
+    with _attach_lock:
+        panel = _attached.get(key)
+        if panel is not None and panel.version == version:
+            return panel
+
+        path = os.path.join(_panel_root(base_dir, cache_name), version)
+        try:
+            with open(os.path.join(path, "meta.json")) as f:
+                meta = json.load(f)
+            values = np.load(os.path.join(path, "values.npy"), mmap_mode="r")
+            dates = pd.DatetimeIndex(np.load(os.path.join(path, "dates.npy")).astype(f"datetime64[{meta['unit']}]"))
+            if meta.get("tz"):
+                dates = dates.tz_localize("UTC").tz_convert(meta["tz"])
+            panel = MarketPanel(values, meta["tickers"], dates, meta["fields"], version=version)
+        except Exception as e:
+            logger.warning(f"Failed to attach shared panel {cache_name} ({version}): {e}")
+            return None
+
+        _attached[key] = panel
+        logger.info(f"📡 Attached shared panel {cache_name} ({version})")
+        return panel
+
+
+def detach_panel(cache_name: str, base_dir: str):
+    """Drops this process's attachment; its pages are released once no frame refers to them."""
+    with _attach_lock:
+        _attached.pop((os.path.abspath(base_dir), cache_name), None)
+
+
+@contextmanager
+def scan_panel(panel: MarketPanel) -> Iterator[Optional[Tuple[str, str, str]]]:
+    """
+    Makes `panel` attachable by worker processes for the duration of a scan and yields the
+    (base_dir, cache_name, version) to pass to attach_panel, or None if it cannot be shared.
+    A panel this process attached from a published cache is reused as is; any other panel is
+    published to a private directory that is removed on exit.
+    """
+    with _attach_lock:
+        published = next((key for key, attached in _attached.items() if attached is panel), None)
+    if published is not None:
+        yield published[0], published[1], panel.version
+        return
+
+    base_dir = tempfile.mkdtemp(prefix="scan_panel_", dir=SCAN_PANEL_DIR)
+    try:
+        version = uuid.uuid4().hex
+        target = publish_panel(panel, SCAN_PANEL_NAME, base_dir, version)
+        yield None if target is None else (base_dir, SCAN_PANEL_NAME, version)
+    finally:
+        shutil.rmtree(base_dir, ignore_errors=True)
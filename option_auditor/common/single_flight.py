@@ -0,0 +1,65 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key: the first caller runs the function,
+    callers arriving while it is in flight wait and share its result (or its exception).
+    Nothing is cached once the call completes.
+
+    share: Optional hook applied to the result handed to waiting callers, e.g. a shallow
+    DataFrame copy so one caller adding columns cannot affect another.
+    """
+
+    def __init__(self, name: str = "single_flight", share: Optional[Callable[[Any], Any]] = None):
+        self.name = name
+        self.share = share
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            logger.info(f"⏳ {self.name}: joining in-flight call for {key!r}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return self.share(call.result) if self.share else call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
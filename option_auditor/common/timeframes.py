@@ -0,0 +1,160 @@
+import os
+import time
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from option_auditor.common.frame_cache import loaded_frame_cache
+from option_auditor.common.market_panel import MarketPanel, PANEL_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# time_frame -> (base interval, base period, resample rule or None, intraday).
+# Only the base granularities are downloaded; the other timeframes are derived from them locally.
+# Monthly is the exception: 5y of the provider's monthly bars is ~60 rows per ticker where 5y of
+# daily bars is ~1260, and the 2y daily region cache would leave under half the history. So it
+# is downloaded natively (large universes too, memoized like intraday bases) instead of from the
+# daily store.
+TIMEFRAMES = {
+    "5m": ("5m", "5d", None, True),
+    "15m": ("15m", "1mo", None, True),
+    "49m": ("5m", "1mo", "49min", True),
+    "98m": ("5m", "1mo", "98min", True),
+    "196m": ("5m", "1mo", "196min", True),
+    "1h": ("1h", "60d", None, True),
+    "4h": ("1h", "60d", "4h", True),
+    "1d": ("1d", "2y", None, False),
+    "1wk": ("1d", "2y", "W-MON", False),
+    "1mo": ("1mo", "5y", None, False),
+}
+
+# Weekly bars are labelled by their Monday and monthly bars by the 1st, like the provider's own
+RESAMPLE_OPTIONS = {"W-MON": {"closed": "left", "label": "left"}}
+
+OHLCV_AGG = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+
+# Intraday base downloads of large universes are reused for this long, so switching between
+# timeframes derived from the same base (49m/98m/196m, 1h/4h) does not download again
+INTRADAY_BASE_TTL = int(os.environ.get("INTRADAY_BASE_TTL", 300))
+
+
+def timeframe_spec(time_frame: str) -> Tuple[str, str, Optional[str], bool]:
+    """(base interval, base period, resample rule, intraday) for a UI timeframe; daily if unknown."""
+    return TIMEFRAMES.get(time_frame, TIMEFRAMES["1d"])
+
+
+def resample_frame(df: pd.DataFrame, rule: str) -> pd.DataFrame:
+    """One ticker's OHLCV bars aggregated to `rule`; buckets with a missing field are dropped."""
+    agg_dict = {k: v for k, v in OHLCV_AGG.items() if k in df.columns}
+    return df.resample(rule, **RESAMPLE_OPTIONS.get(rule, {})).agg(agg_dict).dropna()
+
+
+def base_panel_key(interval: str, period: str, tickers: List[str], now: Optional[float] = None) -> tuple:
+    """Cache key (and panel version) of an intraday base download, valid for INTRADAY_BASE_TTL seconds."""
+    bucket = int((time.time() if now is None else now) // max(INTRADAY_BASE_TTL, 1))
+    return ("base", interval, period, tuple(sorted(set(tickers))), bucket)
+
+
+def _panel_key(panel: MarketPanel) -> tuple:
+    """The panel's version, or a fingerprint of its universe, date range and last bar when it has none."""
+    if panel.version is not None:
+        return panel.version
+    last = panel.values[:, -1].tobytes() if panel.values.size else b""
+    first_date = panel.dates[0] if len(panel.dates) else None
+    last_date = panel.dates[-1] if len(panel.dates) else None
+    return ("fingerprint", hash(tuple(panel.tickers)), first_date, last_date, len(panel.dates), hash(last))
+
+
+def _bins(dates: pd.DatetimeIndex, rule: str, origin) -> Tuple[pd.Index, np.ndarray]:
+    """Labels of the non-empty resample buckets over sorted `dates` and the row each one starts at."""
+    counts = pd.Series(1, index=dates).resample(rule, origin=origin, **RESAMPLE_OPTIONS.get(rule, {})).count()
+    counts = counts[counts > 0]
+    sizes = counts.to_numpy()
+    return counts.index, np.cumsum(sizes) - sizes
+
+
+def _aggregate(block: np.ndarray, fields: List[str], starts: np.ndarray) -> np.ndarray:
+    """(ticker x bucket x field) OHLCV aggregates of a (ticker x date x field) block, skipping NaNs."""
+    n = block.shape[1]
+    ends = np.append(starts[1:], n)
+    positions = np.arange(n)
+    out = np.full((block.shape[0], len(starts), len(fields)), np.nan)
+    for f, name in enumerate(fields):
+        x = block[:, :, f]
+        valid = ~np.isnan(x)
+        how = OHLCV_AGG[name]
+        if how == "max":
+            out[:, :, f] = np.fmax.reduceat(x, starts, axis=1)
+        elif how == "min":
+            out[:, :, f] = np.fmin.reduceat(x, starts, axis=1)
+        elif how == "sum":
+            out[:, :, f] = np.add.reduceat(np.where(valid, x, 0).astype(np.float64), starts, axis=1)
+        else:
+            if how == "first":
+                pick = np.minimum.reduceat(np.where(valid, positions, n), starts, axis=1)
+                found = pick < ends
+            else:
+                pick = np.maximum.reduceat(np.where(valid, positions, -1), starts, axis=1)
+                found = pick >= starts
+            values = np.take_along_axis(x, np.clip(pick, 0, n - 1), axis=1)
+            out[:, :, f] = np.where(found, values, np.nan)
+    return out
+
+
+def resample_panel(panel: MarketPanel, rule: str) -> MarketPanel:
+    """
+    The panel aggregated to `rule` for every ticker at once. frame(ticker) of the result equals
+    resample_frame(panel.frame(ticker), rule): buckets are binned as pandas bins that frame
+    (fixed-length rules such as 49min start counting at the midnight of the ticker's first bar),
+    fields the ticker never reported stay absent, and buckets with a missing field are dropped.
+    """
+    fields = [f for f in PANEL_FIELDS if f in panel.fields]
+    if panel.empty or not len(panel.dates):
+        return MarketPanel(np.empty((len(panel), 0, len(fields))), panel.tickers, [], fields, (_panel_key(panel), "resample", rule))
+
+    dates = pd.DatetimeIndex(panel.dates)
+    order = np.argsort(dates, kind="stable")
+    dates = dates[order]
+    block = panel.values[:, order][:, :, [panel.field_index[f] for f in fields]]
+
+    # Tickers whose frames resample onto the same buckets share one pass
+    fixed_length = isinstance(pd.tseries.frequencies.to_offset(rule), pd.offsets.Tick)
+    groups = {}
+    for i, ticker in enumerate(panel.tickers):
+        present = ~np.isnan(block[i]).all(axis=1)
+        if not present.any():
+            continue
+        origin = dates[np.argmax(present)].normalize() if fixed_length else "start_day"
+        groups.setdefault(origin, []).append(i)
+
+    results = []
+    for origin, rows in groups.items():
+        labels, starts = _bins(dates, rule, origin)
+        aggregated = _aggregate(block[rows], fields, starts)
+        for j, i in enumerate(rows):
+            reported = ~np.isnan(block[i]).all(axis=0)
+            aggregated[j][:, ~reported] = np.nan
+            # Like dropna() on the ticker's frame: a bucket missing any reported field is dropped
+            missing = np.isnan(aggregated[j][:, reported]).any(axis=1)
+            aggregated[j][missing] = np.nan
+        results.append((labels, rows, aggregated))
+
+    all_labels = results[0][0] if len(results) == 1 else pd.DatetimeIndex(sorted(set().union(*(r[0] for r in results))))
+    values = np.full((len(panel), len(all_labels), len(fields)), np.nan, dtype=panel.values.dtype)
+    for labels, rows, aggregated in results:
+        values[np.ix_(rows, all_labels.get_indexer(labels))] = aggregated
+    return MarketPanel(values, panel.tickers, all_labels, fields, (_panel_key(panel), "resample", rule))
+
+
+def derived_panel(panel: MarketPanel, rule: str) -> MarketPanel:
+    """resample_panel, cached per (base panel version, rule) in the process-level frame cache."""
+    key = ("timeframe", _panel_key(panel), rule)
+    derived = loaded_frame_cache.get(key)
+    if derived is None:
+        started = time.perf_counter()
+        derived = resample_panel(panel, rule)
+        loaded_frame_cache.put(key, derived)
+        logger.info(f"🕒 Derived {rule} bars for {len(panel)} tickers in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return derived
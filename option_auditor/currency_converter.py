@@ -1,12 +1,12 @@
 from __future__ import annotations
-import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Optional, Dict
+from option_auditor.common.market_data_provider import get_provider
 
 class CurrencyConverter:
     """
-    Converts currency amounts using historical FX rates from yfinance.
+    Converts currency amounts using historical FX rates from the market data provider.
     """
     def __init__(self, base_currency: str = 'USD'):
         self.base_currency = base_currency
@@ -25,7 +25,7 @@ class CurrencyConverter:
         if pair not in self.rate_cache:
             try:
                 # Fetch last 10 years to cover most history
-                ticker = yf.Ticker(pair)
+                ticker = get_provider().ticker(pair)
                 # period="10y" covers reasonable backtest history
                 hist = ticker.history(period="10y")
                 if hist.empty:
@@ -1,10 +1,10 @@
 import pandas as pd
 import numpy as np
-import yfinance as yf
 from datetime import datetime
 from option_auditor.common.data_utils import get_cached_market_data
 from option_auditor.common.constants import SECTOR_COMPONENTS, SECTOR_NAMES
 from option_auditor.strategies.math_utils import calculate_greeks, calculate_option_price
+from option_auditor.common.market_data_provider import get_provider
 import logging
 
 logger = logging.getLogger(__name__)
@@ -50,7 +50,7 @@ def analyze_portfolio_risk(positions: list) -> dict:
 
     # 2. Get Historical Data (1 Year) for Correlation
     # We use your existing Cached Loader to be fast and safe
-    price_data = get_cached_market_data(ticker_list, period="1y", cache_name="portfolio_risk")
+    price_data = get_cached_market_data(ticker_list, period="1y", cache_name="portfolio_risk", columns=["Close"])
 
     # Handle MultiIndex if necessary
     closes = pd.DataFrame()
@@ -122,7 +122,7 @@ def analyze_portfolio_risk(positions: list) -> dict:
     if unknowns:
         for t in unknowns[:5]: # Limit to 5 to avoid timeouts
             try:
-                info = yf.Ticker(t).info
+                info = get_provider().ticker(t).info
                 real_sector = info.get('sector', 'Other')
                 # Add to map
                 sector_map[t] = real_sector
@@ -238,7 +238,7 @@ def analyze_portfolio_greeks(positions: list) -> dict:
 
     # Fetch Data (Price + History for Vol)
     # Using 6mo to get enough history for 30d rolling vol
-    market_data = get_cached_market_data(tickers, period="6mo", cache_name="portfolio_greeks")
+    market_data = get_cached_market_data(tickers, period="6mo", cache_name="portfolio_greeks", columns=["Close"])
 
     current_prices = {}
     historical_vols = {}
@@ -401,7 +401,7 @@ def analyze_scenario(positions: list, scenario: dict) -> dict:
 
     # 1. Gather Tickers and fetch Prices
     tickers = list(set([p['ticker'].upper().strip() for p in positions]))
-    market_data = get_cached_market_data(tickers, period="6mo", cache_name="portfolio_scenario")
+    market_data = get_cached_market_data(tickers, period="6mo", cache_name="portfolio_scenario", columns=["Close"])
 
     current_prices = {}
     historical_vols = {}
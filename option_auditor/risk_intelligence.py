@@ -1,8 +1,8 @@
 import pandas as pd
 import numpy as np
 import logging
-import yfinance as yf
 from option_auditor.common.screener_utils import fetch_batch_data_safe, resolve_ticker
+from option_auditor.common.market_data_provider import get_provider
 
 logger = logging.getLogger(__name__)
 
@@ -140,7 +140,7 @@ def get_market_regime(sp500_data: pd.DataFrame) -> dict:
 
     # --- 1. Fetch VIX for Market Climate ---
     try:
-        vix_df = yf.download("^VIX", period="5d", progress=False, auto_adjust=True)
+        vix_df = get_provider().download("^VIX", period="5d", progress=False, auto_adjust=True)
         if not vix_df.empty:
              # Handle MultiIndex if present
             if isinstance(vix_df.columns, pd.MultiIndex):
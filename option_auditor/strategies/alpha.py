@@ -84,7 +84,7 @@ def screen_alpha_101(ticker_list: list = None, region: str = "us", time_frame: s
                 "target": round(target, 2),
                 "atr": round(atr, 2),
                 "score": round(abs(alpha_val) * 100, 1), # Sort by intensity
-                "breakout_date": _calculate_trend_breakout_date(df)
+                "breakout_date": _calculate_trend_breakout_date(df, ticker)
             }
 
         except Exception as e:
@@ -171,7 +171,7 @@ def screen_my_strategy(ticker_list: list = None, region: str = "us") -> list:
             risk = curr_close - stop_loss
             target = curr_close + (risk * 2) if risk > 0 else curr_close + (5 * atr)
 
-            breakout_date = _calculate_trend_breakout_date(df)
+            breakout_date = _calculate_trend_breakout_date(df, ticker)
             base_ticker = ticker.split('.')[0]
             company_name = TICKER_NAMES.get(ticker, TICKER_NAMES.get(base_ticker, ticker))
 
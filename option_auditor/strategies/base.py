@@ -5,6 +5,11 @@ import logging
 logger = logging.getLogger(__name__)
 
 class BaseStrategy(ABC):
+    # Bars of history the latest-bar result depends on (including indicator warm-up).
+    # When set, the screening runner hands the strategy only that tail of the frame.
+    # None: the strategy reads the whole history (e.g. trend start dates).
+    LOOKBACK = None
+
     @abstractmethod
     def analyze(self, df: pd.DataFrame) -> dict:
         """
@@ -5,7 +5,6 @@ from datetime import date
 import pandas as pd
 import numpy as np
 import pandas_ta as ta
-import yfinance as yf
 
 from option_auditor.common.screener_utils import (
     resolve_region_tickers,
@@ -13,6 +12,7 @@ from option_auditor.common.screener_utils import (
 )
 from option_auditor.common.data_utils import _calculate_trend_breakout_date
 from option_auditor.common.constants import RISK_FREE_RATE, TICKER_NAMES
+from option_auditor.common.market_data_provider import get_provider
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +41,7 @@ def screen_bull_put_spreads(ticker_list: list = None, min_roi: float = 0.15, reg
     def _process_spread(ticker):
         try:
             # 1. TECHNICAL & LIQUIDITY FILTER (Fast Fail)
-            tk = yf.Ticker(ticker)
+            tk = get_provider().ticker(ticker)
 
             # Fetch 1y to calculate HV (Historical Volatility) and Trend
             df = tk.history(period="1y", interval="1d", auto_adjust=True)
@@ -178,7 +178,7 @@ def screen_bull_put_spreads(ticker_list: list = None, min_roi: float = 0.15, reg
             # Technicals
             df['ATR'] = ta.atr(df['High'], df['Low'], df['Close'], length=14)
             atr = df['ATR'].iloc[-1]
-            breakout_date = _calculate_trend_breakout_date(df)
+            breakout_date = _calculate_trend_breakout_date(df, ticker)
 
             high_52 = df['High'].max()
             low_52 = df['Low'].min()
@@ -6,13 +6,24 @@ import logging
 from option_auditor.common.data_utils import _calculate_trend_breakout_date
 from option_auditor.common.constants import TICKER_NAMES
 from option_auditor.common.screener_utils import DEFAULT_ATR_LENGTH
+from option_auditor.common.feature_store import TickerFeatures
+from option_auditor.strategies.patterns import DARVAS_BREAKOUT, DARVAS_BREAKDOWN, DARVAS_MOMENTUM
 
 logger = logging.getLogger(__name__)
 
+BOX_SIGNALS = {
+    DARVAS_BREAKOUT: "📦 DARVAS BREAKOUT",
+    DARVAS_BREAKDOWN: "📉 BOX BREAKDOWN",
+    DARVAS_MOMENTUM: "🚀 MOMENTUM (Post-Breakout)",
+}
+
 class DarvasBoxStrategy(BaseStrategy):
     """
     Screens for Darvas Box Breakouts.
     """
+    # Batch-computed on large scans by the indicator engine
+    FEATURES = (("darvas_box", ()),)
+
     def __init__(self, ticker: str, df: pd.DataFrame, check_mode: bool = False):
         self.ticker = ticker
         self.df = df
@@ -41,49 +52,15 @@ class DarvasBoxStrategy(BaseStrategy):
             if curr_close < period_high * 0.90 and not self.check_mode:
                 pass # Just a filter, but we proceed to check boxes
 
-            # 2. Identify Box (Ceiling & Floor)
-            # We iterate back to find the most recent valid Box.
-            ceiling = None
-            floor = None
-
-            # Convert to numpy for speed
-            highs = df['High'].values
-            lows = df['Low'].values
-            closes = df['Close'].values
+            # 2. Identify Box (Ceiling & Floor): the most recent valid box (batch-computed on large scans)
             volumes = df['Volume'].values if 'Volume' in df.columns else np.zeros(len(df))
 
-            lookback = min(len(df), 60)
-            found_top_idx = -1
-
-            for i in range(len(df) - 4, len(df) - lookback, -1):
-                if i < 3: break
-                if i + 3 >= len(df): continue
-
-                curr_h = highs[i]
-                if (curr_h >= highs[i-1] and curr_h >= highs[i-2] and curr_h >= highs[i-3] and
-                    curr_h >= highs[i+1] and curr_h >= highs[i+2] and curr_h >= highs[i+3]):
-
-                    found_top_idx = i
-                    ceiling = curr_h
-                    break
-
-            if found_top_idx == -1: return None
+            box = TickerFeatures(self.ticker, df).darvas_box()
+            if box is None: return None
 
-            found_bot_idx = -1
-
-            for j in range(found_top_idx + 1, len(df) - 3):
-                if j < 3: continue
-                if j + 3 >= len(df): continue
-
-                curr_l = lows[j]
-                if curr_l >= ceiling: continue # Bottom must be below top
-
-                if (curr_l <= lows[j-1] and curr_l <= lows[j-2] and curr_l <= lows[j-3] and
-                    curr_l <= lows[j+1] and curr_l <= lows[j+2] and curr_l <= lows[j+3]):
-
-                    found_bot_idx = j
-                    floor = curr_l
-                    break
+            ceiling, floor, box_state = box
+            if np.isnan(floor):
+                floor = None
 
             # Calc ATR, 52wk
             current_atr = ta.atr(df['High'], df['Low'], df['Close'], length=DEFAULT_ATR_LENGTH).iloc[-1] if len(df) >= DEFAULT_ATR_LENGTH else 0.0
@@ -96,18 +73,7 @@ class DarvasBoxStrategy(BaseStrategy):
 
             # 3. Check for Breakout
             if ceiling and floor:
-                if closes[-1] > ceiling and closes[-2] <= ceiling:
-                     signal = "📦 DARVAS BREAKOUT"
-
-                elif closes[-1] < floor and closes[-2] >= floor:
-                     signal = "📉 BOX BREAKDOWN"
-
-                elif closes[-1] > ceiling:
-                     if (closes[-1] - ceiling) / ceiling < 0.05:
-                         signal = "🚀 MOMENTUM (Post-Breakout)"
-
-            elif ceiling and not floor:
-                pass
+                signal = BOX_SIGNALS.get(box_state, signal)
 
             if signal == "WAIT" and not self.check_mode:
                 return None
@@ -133,7 +99,7 @@ class DarvasBoxStrategy(BaseStrategy):
 
             base_ticker = self.ticker.split('.')[0]
             company_name = TICKER_NAMES.get(self.ticker, TICKER_NAMES.get(base_ticker, self.etf_names.get(self.ticker, self.ticker)))
-            breakout_date = _calculate_trend_breakout_date(df)
+            breakout_date = _calculate_trend_breakout_date(df, self.ticker)
 
             return {
                 "ticker": self.ticker,
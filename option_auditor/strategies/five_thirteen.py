@@ -131,7 +131,7 @@ class FiveThirteenStrategy(BaseStrategy):
                 stop_loss = curr_21 * 1.01
 
             # Calculate Trend Breakout Date
-            breakout_date = _calculate_trend_breakout_date(df)
+            breakout_date = _calculate_trend_breakout_date(df, self.ticker)
 
             # Calculate Target based on 2R relative to EMA stop or 4 ATR
             # If long, target = price + (price - stop) * 2
@@ -105,7 +105,7 @@ def screen_dynamic_volatility_fortress(ticker_list: list = None, time_frame: str
             score = atr_pct * 10
             if curr_close > sma_200: score += 15
 
-            breakout_date = _calculate_trend_breakout_date(df)
+            breakout_date = _calculate_trend_breakout_date(df, ticker)
 
             # Fortress Stop/Target (Underlying)
             stock_stop_loss = curr_close - (safety_k * atr)
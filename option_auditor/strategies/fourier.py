@@ -4,9 +4,13 @@ import numpy as np
 import pandas_ta as ta
 from option_auditor.common.constants import TICKER_NAMES
 from option_auditor.common.data_utils import _calculate_trend_breakout_date
+from option_auditor.common.feature_store import TickerFeatures
 from option_auditor.strategies.math_utils import calculate_hilbert_phase, calculate_dominant_cycle
 
 class FourierStrategy(BaseStrategy):
+    # Batch-computed on large scans by the indicator engine
+    FEATURES = (("hilbert_phase", ()), ("dominant_cycle", ()))
+
     def __init__(self, ticker: str, df: pd.DataFrame, check_mode: bool = False):
         self.ticker = ticker
         self.df = df
@@ -23,8 +27,9 @@ class FourierStrategy(BaseStrategy):
             # --- DSP PHYSICS CALCULATION ---
             # Use 'Close' series values
             closes = df['Close'].values
+            features = TickerFeatures(ticker, df)
 
-            phase, strength = calculate_hilbert_phase(closes)
+            phase, strength = features.cached("hilbert_phase", ()) or calculate_hilbert_phase(closes)
 
             if phase is None: return None
 
@@ -64,7 +69,7 @@ class FourierStrategy(BaseStrategy):
                 pct_change_1d = ((closes[-1] - closes[-2]) / closes[-2]) * 100
 
             # Calculate dominant period for context
-            period, rel_pos = calculate_dominant_cycle(closes) or (0, 0)
+            period, rel_pos = features.cached("dominant_cycle", ()) or calculate_dominant_cycle(closes) or (0, 0)
 
             # ATR for Stop/Target
             if 'ATR' not in df.columns:
@@ -86,7 +91,7 @@ class FourierStrategy(BaseStrategy):
                 stop_loss = curr_price - (2 * current_atr)
                 target = curr_price + (2 * current_atr)
 
-            breakout_date = _calculate_trend_breakout_date(df)
+            breakout_date = _calculate_trend_breakout_date(df, ticker)
 
             base_ticker = ticker.split('.')[0]
             company_name = TICKER_NAMES.get(ticker, TICKER_NAMES.get(base_ticker, ticker))
@@ -3,6 +3,7 @@ import pandas_ta as ta
 import numpy as np
 from option_auditor.strategies.base import BaseStrategy
 from option_auditor.common.signal_type import SignalType
+from option_auditor.common.feature_store import TickerFeatures
 
 class GrandmasterScreener(BaseStrategy):
     """
@@ -16,39 +17,52 @@ class GrandmasterScreener(BaseStrategy):
     3. Filter: Relative Volume (RVol) check to prevent fakeouts.
     """
 
+    # Indicators read through TickerFeatures in generate_signals (batch-computed on large scans)
+    FEATURES = (
+        ("sma", (50, "Close")), ("sma", (150, "Close")), ("sma", (200, "Close")),
+        ("atr", (14,)),
+        ("rolling_max", ("Close", 252)), ("rolling_min", ("Close", 252)),
+        ("donchian_high", (20,)), ("donchian_low", (20,)),
+        ("sma", (20, "Volume")),
+    )
+
+    # 252-bar highs/lows plus warm-up for the Wilder ATR (residual weight (13/14)**300 ~ 2e-10)
+    LOOKBACK = 300
+
     def __init__(self, config=None):
         super().__init__()
         self.config = config
         self.name = "GrandmasterScreener"
 
-    def generate_signals(self, ticker_data: pd.DataFrame) -> pd.DataFrame:
+    def generate_signals(self, ticker_data: pd.DataFrame, ticker: str = None) -> pd.DataFrame:
         """
         Generates buy/sell signals on historical data using vectorised logic.
+        ticker: When given, indicators come from the shared feature store, so other
+        strategies in the same scan reuse them.
         """
         df = ticker_data.copy()
 
-        # Standardise columns
-        if 'Close' in df.columns and 'close' not in df.columns:
-            df['close'] = df['Close']
-        if 'High' in df.columns and 'high' not in df.columns:
-            df['high'] = df['High']
-        if 'Low' in df.columns and 'low' not in df.columns:
-            df['low'] = df['Low']
-        if 'Volume' in df.columns and 'volume' not in df.columns:
-            df['volume'] = df['Volume']
+        # Standardise columns (both cases, the feature store reads the capitalised ones)
+        for upper, lower in (('Close', 'close'), ('High', 'high'), ('Low', 'low'), ('Volume', 'volume')):
+            if upper in df.columns and lower not in df.columns:
+                df[lower] = df[upper]
+            elif lower in df.columns and upper not in df.columns:
+                df[upper] = df[lower]
+
+        features = TickerFeatures(ticker, df)
 
         # ------------------------------------------------------------------
         # 1. INDICATORS
         # ------------------------------------------------------------------
         # Trend Moving Averages
-        df['SMA_50'] = df['close'].rolling(window=50).mean()
-        df['SMA_150'] = df['close'].rolling(window=150).mean()
-        df['SMA_200'] = df['close'].rolling(window=200).mean()
+        df['SMA_50'] = features.sma(50)
+        df['SMA_150'] = features.sma(150)
+        df['SMA_200'] = features.sma(200)
 
         # Volatility (ATR 14)
         # using pandas_ta if available, else manual
         try:
-            df['ATR'] = ta.atr(df['high'], df['low'], df['close'], length=14)
+            df['ATR'] = features.atr(14)
         except AttributeError:
              # Fallback manual ATR
             tr1 = df['high'] - df['low']
@@ -58,16 +72,16 @@ class GrandmasterScreener(BaseStrategy):
             df['ATR'] = tr.rolling(14).mean()
 
         # 52 Week High/Low (252 days)
-        df['High_52'] = df['close'].rolling(window=252).max()
-        df['Low_52'] = df['close'].rolling(window=252).min()
+        df['High_52'] = features.rolling_max('Close', 252)
+        df['Low_52'] = features.rolling_min('Close', 252)
 
         # Donchian Channels (20 Day) for Breakouts & Trailing Exits
         # Shift(1) is critical: We want to break the *previous* 20 day high
-        df['Donchian_High_20'] = df['high'].rolling(window=20).max().shift(1)
-        df['Donchian_Low_20'] = df['low'].rolling(window=20).min().shift(1)
+        df['Donchian_High_20'] = features.donchian_high(20)
+        df['Donchian_Low_20'] = features.donchian_low(20)
 
         # Volume Analytics
-        df['Vol_SMA_20'] = df['volume'].rolling(window=20).mean()
+        df['Vol_SMA_20'] = features.volume_avg(20)
         df['RVol'] = df['volume'] / df['Vol_SMA_20']
 
         # ------------------------------------------------------------------
@@ -108,7 +122,63 @@ class GrandmasterScreener(BaseStrategy):
 
         return df
 
-    def analyze(self, df: pd.DataFrame) -> dict:
+    def evaluate_last_bar(self, ticker_data: pd.DataFrame, ticker: str = None) -> dict:
+        """
+        The last row of generate_signals() without building the full-length signal frame:
+        every indicator is read for the final bar only (see TickerFeatures.last).
+        """
+        df = ticker_data
+        renames = {lower: upper for upper, lower in (('Close', 'close'), ('High', 'high'), ('Low', 'low'), ('Volume', 'volume'))
+                   if lower in df.columns and upper not in df.columns}
+        if renames:
+            df = df.rename(columns=renames)
+
+        features = TickerFeatures(ticker, df)
+        close = float(df['Close'].iloc[-1])
+        volume = float(df['Volume'].iloc[-1])
+
+        try:
+            atr = features.last("atr", (14,))
+        except AttributeError:
+            # Same fallback as generate_signals
+            tail = df.iloc[-15:]
+            tr1 = tail['High'] - tail['Low']
+            tr2 = abs(tail['High'] - tail['Close'].shift(1))
+            tr3 = abs(tail['Low'] - tail['Close'].shift(1))
+            atr = float(pd.concat([tr1, tr2, tr3], axis=1).max(axis=1).rolling(14).mean().iloc[-1])
+
+        row = {
+            'close': close,
+            'SMA_50': features.last("sma", (50, "Close")),
+            'SMA_150': features.last("sma", (150, "Close")),
+            'SMA_200': features.last("sma", (200, "Close")),
+            'ATR': atr,
+            'High_52': features.last("rolling_max", ("Close", 252)),
+            'Low_52': features.last("rolling_min", ("Close", 252)),
+            'Donchian_High_20': features.last("donchian_high", (20,)),
+            'Donchian_Low_20': features.last("donchian_low", (20,)),
+            'Vol_SMA_20': features.last("sma", (20, "Volume")),
+        }
+        with np.errstate(divide='ignore', invalid='ignore'):
+            row['RVol'] = float(np.float64(volume) / row['Vol_SMA_20'])
+
+        trend_ok = (
+            close > row['SMA_200'] and
+            row['SMA_50'] > row['SMA_200'] and
+            close > row['SMA_50'] and
+            close > row['Low_52'] * 1.25 and
+            close > row['High_52'] * 0.75
+        )
+        breakout_trigger = close > row['Donchian_High_20'] and row['RVol'] > 1.2
+
+        row['signal'] = SignalType.HOLD.value
+        if trend_ok and breakout_trigger:
+            row['signal'] = SignalType.BUY.value
+        if close < row['Donchian_Low_20']:
+            row['signal'] = SignalType.SELL.value
+        return row
+
+    def analyze(self, df: pd.DataFrame, ticker: str = None) -> dict:
         """
         Analyzes the latest state for the Live Screener Dashboard.
         Calculates exact Stop Loss levels based on ATR.
@@ -116,10 +186,8 @@ class GrandmasterScreener(BaseStrategy):
         if df is None or df.empty or len(df) < 200:
             return {'signal': 'WAIT'}
 
-        # Run vectorised logic to get the latest signal status
-        sig_df = self.generate_signals(df)
-
-        last_row = sig_df.iloc[-1]
+        # Only the latest row of the signal logic is needed
+        last_row = self.evaluate_last_bar(df, ticker=ticker)
         curr_price = last_row['close']
         atr = last_row['ATR']
         signal = last_row['signal']
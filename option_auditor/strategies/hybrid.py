@@ -13,16 +13,44 @@ from option_auditor.common.data_utils import (
     get_cached_market_data,
     _calculate_trend_breakout_date
 )
+from option_auditor.common.market_panel import MarketPanel
+from option_auditor.common.feature_store import TickerFeatures
+from option_auditor.common.indicator_engine import ENGINE_MIN_TICKERS, prime_panel_features
+from option_auditor.common.prefilter import prefilter_tickers
 from option_auditor.strategies.math_utils import calculate_dominant_cycle
 
 logger = logging.getLogger(__name__)
 
+# Indicators _process_hybrid_ticker reads through TickerFeatures
+HYBRID_FEATURES = (
+    ("sma", (200, "Close")),
+    ("donchian_high", (50,)),
+    ("rolling_max", ("High", 252)), ("rolling_min", ("Low", 252)),
+    ("sma", (20, "Volume")),
+    ("atr", (14,)),
+    ("dominant_cycle", ()),
+)
+
+# History and volume gates of the hybrid/confluence passes, evaluated for the whole universe up front
+MIN_HISTORY_GATE = (("min_bars", (200,)),)
+VOLUME_GATE = (("min_avg_volume", (20, 500000)),)
+
+# StrategyAnalyzer's reads, batch-computed for large confluence scans
+CONFLUENCE_FEATURES = (
+    ("sma", (200, "Close")),
+    ("dominant_cycle", ()),
+    ("rsi", (14, "Close")),
+    ("atr", (14,)),
+    ("sma", (20, "Volume")),
+)
+
 class StrategyAnalyzer:
     """
     Runs multiple strategies on a single dataframe to verify confluence.
     """
-    def __init__(self, df):
+    def __init__(self, df, ticker=None):
         self.df = df
+        self.features = TickerFeatures(ticker, df)
         try:
             self.close = df['Close'].iloc[-1]
             self.len = len(df)
@@ -32,7 +60,7 @@ class StrategyAnalyzer:
     def check_isa_trend(self):
         if self.len < 200: return "N/A"
         try:
-            sma_200 = self.df['Close'].rolling(200).mean().iloc[-1]
+            sma_200 = self.features.sma(200).iloc[-1]
             return "BULLISH" if self.close > sma_200 else "BEARISH"
         except Exception:
             return "N/A"
@@ -41,7 +69,7 @@ class StrategyAnalyzer:
         if self.len < 64: return "N/A", 0.0
         try:
             # Use the existing helper function
-            cycle_data = calculate_dominant_cycle(self.df['Close'].tolist())
+            cycle_data = self.features.cached("dominant_cycle", ()) or calculate_dominant_cycle(self.df['Close'].tolist())
             if not cycle_data: return "N/A", 0.0
             period, rel_pos = cycle_data
 
@@ -54,8 +82,6 @@ class StrategyAnalyzer:
     def check_momentum(self):
         if self.len < 14: return "NEUTRAL"
         # Simple RSI check
-        import pandas_ta as ta
-
         rsi_val = None
         if 'RSI_14' in self.df.columns:
              rsi_val = self.df['RSI_14'].iloc[-1]
@@ -63,7 +89,7 @@ class StrategyAnalyzer:
              rsi_val = self.df['RSI'].iloc[-1]
         else:
              try:
-                 rsi_s = ta.rsi(self.df['Close'], length=14)
+                 rsi_s = self.features.rsi(14)
                  if rsi_s is not None and not rsi_s.empty:
                     rsi_val = rsi_s.iloc[-1]
              except Exception as e:
@@ -78,12 +104,12 @@ class StrategyAnalyzer:
 def _process_hybrid_ticker(ticker, df, time_frame, check_mode):
     try:
         curr_close = float(df['Close'].iloc[-1])
-        closes = df['Close'].tolist()
+        features = TickerFeatures(ticker, df)
 
-        sma_200 = df['Close'].rolling(200).mean().iloc[-1]
-        high_50 = df['High'].rolling(50).max().shift(1).iloc[-1]
-        high_52wk = df['High'].rolling(252).max().iloc[-1] if len(df) >= 252 else df['High'].max()
-        low_52wk = df['Low'].rolling(252).min().iloc[-1] if len(df) >= 252 else df['Low'].min()
+        sma_200 = features.sma(200).iloc[-1]
+        high_50 = features.donchian_high(50).iloc[-1]
+        high_52wk = features.rolling_max('High', 252).iloc[-1] if len(df) >= 252 else df['High'].max()
+        low_52wk = features.rolling_min('Low', 252).iloc[-1] if len(df) >= 252 else df['Low'].min()
 
         trend_verdict = "NEUTRAL"
         if curr_close > sma_200:
@@ -93,7 +119,7 @@ def _process_hybrid_ticker(ticker, df, time_frame, check_mode):
 
         is_breakout = curr_close >= high_50
 
-        cycle_data = calculate_dominant_cycle(closes)
+        cycle_data = features.cached("dominant_cycle", ()) or calculate_dominant_cycle(df['Close'].tolist())
 
         cycle_state = "NEUTRAL"
         cycle_score = 0.0
@@ -114,7 +140,7 @@ def _process_hybrid_ticker(ticker, df, time_frame, check_mode):
             watch_list = SECTOR_COMPONENTS.get("WATCH", [])
             if ticker not in watch_list:
                 if 'Volume' in df.columns:
-                    avg_vol = df['Volume'].rolling(20).mean().iloc[-1]
+                    avg_vol = features.volume_avg(20).iloc[-1]
                     if avg_vol < 500000:
                         return None
 
@@ -124,7 +150,7 @@ def _process_hybrid_ticker(ticker, df, time_frame, check_mode):
         is_green_candle = curr_close > today_open
 
         if 'ATR' not in df.columns:
-            df['ATR'] = ta.atr(df['High'], df['Low'], df['Close'], length=14)
+            df['ATR'] = features.atr(14)
 
         current_atr = 0.0
         if 'ATR' in df.columns and not df['ATR'].empty:
@@ -202,7 +228,7 @@ def _process_hybrid_ticker(ticker, df, time_frame, check_mode):
         base_ticker = ticker.split('.')[0]
         company_name = TICKER_NAMES.get(ticker, TICKER_NAMES.get(base_ticker, ticker))
 
-        breakout_date = _calculate_trend_breakout_date(df)
+        breakout_date = _calculate_trend_breakout_date(df, ticker)
 
         return {
             "ticker": ticker,
@@ -229,10 +255,11 @@ def _process_hybrid_ticker(ticker, df, time_frame, check_mode):
         }
     except Exception: return None
 
-def screen_hybrid_strategy(ticker_list: list = None, time_frame: str = "1d", region: str = "us", check_mode: bool = False) -> list:
+def screen_hybrid_strategy(ticker_list: list = None, time_frame: str = "1d", region: str = "us", check_mode: bool = False, panel: MarketPanel = None) -> list:
     """
     Robust Hybrid Screener with CHUNKING to prevent API Timeouts.
     Combines ISA Trend Following with Fourier Cycle Analysis.
+    panel: Optional pre-built MarketPanel; skips the data fetch.
     """
     if ticker_list is None:
         ticker_list = resolve_region_tickers(region)
@@ -255,31 +282,30 @@ def screen_hybrid_strategy(ticker_list: list = None, time_frame: str = "1d", reg
     elif is_large_scan:
          cache_name = "market_scan_v1"
 
-    if check_mode:
-        all_data = fetch_batch_data_safe(ticker_list, period="2y", interval=time_frame)
-    elif time_frame == "1d":
-        all_data = get_cached_market_data(ticker_list, period="2y", cache_name=cache_name)
-    else:
-        all_data = fetch_batch_data_safe(ticker_list, period="5d", interval=time_frame)
-
-    # Optimized Iteration
-    if isinstance(all_data.columns, pd.MultiIndex):
-        iterator = [(ticker, all_data[ticker]) for ticker in all_data.columns.unique(level=0)]
-    else:
-        # Fallback for single or flat
-        if not all_data.empty and len(ticker_list) == 1:
-            iterator = [(ticker_list[0], all_data)]
+    if panel is None:
+        if check_mode:
+            all_data = fetch_batch_data_safe(ticker_list, period="2y", interval=time_frame)
+        elif time_frame == "1d":
+            all_data = get_cached_market_data(ticker_list, period="2y", cache_name=cache_name)
         else:
-            iterator = []
+            all_data = fetch_batch_data_safe(ticker_list, period="5d", interval=time_frame)
 
-    for ticker, df in iterator:
-        try:
-            if isinstance(df.columns, pd.MultiIndex):
-                df = df.droplevel(0, axis=1)
+        # Fallback for single or flat
+        default_ticker = ticker_list[0] if ticker_list and len(ticker_list) == 1 else None
+        panel = MarketPanel.from_frame(all_data, default_ticker=default_ticker)
 
-            if ticker not in ticker_list: continue
+    tickers = ticker_list
+    if not check_mode:
+        tickers = prefilter_tickers(panel, MIN_HISTORY_GATE, tickers)
+        if time_frame == "1d":
+            # The watch list is exempt from _process_hybrid_ticker's volume gate
+            tickers = prefilter_tickers(panel, VOLUME_GATE, tickers, exempt=SECTOR_COMPONENTS.get("WATCH", []))
 
-            df = df.dropna(how='all')
+    prime_panel_features(panel, HYBRID_FEATURES, tickers)
+
+    # Optimized Iteration: zero-copy per-ticker views
+    for ticker, df in panel.items(tickers):
+        try:
             min_length = 50 if check_mode else 200
             if len(df) < min_length: continue
 
@@ -332,32 +358,32 @@ def screen_confluence_scan(ticker_list: list = None, region: str = "us", check_m
     if all_data.empty:
         return []
 
-    if isinstance(all_data.columns, pd.MultiIndex):
-        valid_tickers = [t for t in ticker_list if t in all_data.columns.levels[0]]
-        iterator = [(ticker, all_data[ticker]) for ticker in all_data.columns.unique(level=0)]
-    else:
-        valid_tickers = ticker_list if not all_data.empty else []
-        iterator = [(ticker_list[0], all_data)] if len(ticker_list)==1 else []
-
+    # One panel serves the batch indicators and the per-ticker frames (zero-copy views)
+    default_ticker = ticker_list[0] if len(ticker_list) == 1 else None
+    panel = MarketPanel.from_frame(all_data, default_ticker=default_ticker)
     watch_list = SECTOR_COMPONENTS.get("WATCH", [])
+    tickers = prefilter_tickers(panel, MIN_HISTORY_GATE, ticker_list)
+    if region == "sp500":
+        tickers = prefilter_tickers(panel, VOLUME_GATE, tickers, exempt=watch_list)
 
-    for ticker, df in iterator:
-        try:
-            if isinstance(df.columns, pd.MultiIndex):
-                df = df.droplevel(0, axis=1)
+    if len(ticker_list) >= ENGINE_MIN_TICKERS:
+        prime_panel_features(panel, CONFLUENCE_FEATURES, tickers)
 
+    valid_tickers = set(tickers)
+
+    for ticker, df in panel.items():
+        try:
             if ticker not in valid_tickers: continue
 
-            df = df.dropna(how='all')
             if len(df) < 200: continue
 
             if region == "sp500" and ticker not in watch_list:
                 if 'Volume' in df.columns:
-                     avg_vol = df['Volume'].rolling(20).mean().iloc[-1]
+                     avg_vol = TickerFeatures(ticker, df).volume_avg(20).iloc[-1]
                      if avg_vol < 500000: continue
 
             # --- RUN ALL STRATEGIES ---
-            analyzer = StrategyAnalyzer(df)
+            analyzer = StrategyAnalyzer(df, ticker=ticker)
 
             isa_trend = analyzer.check_isa_trend()
             fourier, f_score = analyzer.check_fourier()
@@ -393,12 +419,11 @@ def screen_confluence_scan(ticker_list: list = None, region: str = "us", check_m
                 except Exception as e:
                     logger.debug(f"Pct change calc failed: {e}")
 
-            import pandas_ta as ta
-            df['ATR'] = ta.atr(df['High'], df['Low'], df['Close'], length=14)
+            df['ATR'] = analyzer.features.atr(14)
             current_atr = df['ATR'].iloc[-1] if 'ATR' in df.columns and not df['ATR'].empty else 0.0
             volatility_pct = (current_atr / curr_price * 100) if curr_price > 0 else 0.0
 
-            breakout_date = _calculate_trend_breakout_date(df)
+            breakout_date = _calculate_trend_breakout_date(df, ticker)
 
             # Standard Confluence Stop/Target (3 ATR Stop, 5 ATR Target)
             stop_loss = curr_price - (3 * current_atr) if isa_trend == "BULLISH" else curr_price + (3 * current_atr)
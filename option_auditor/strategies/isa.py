@@ -4,6 +4,7 @@ import pandas_ta as ta
 import logging
 from option_auditor.common.data_utils import _calculate_trend_breakout_date
 from option_auditor.common.constants import TICKER_NAMES
+from option_auditor.common.feature_store import TickerFeatures
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,14 @@ class IsaStrategy(BaseStrategy):
     - Breakout: Price crosses 50-day High (Donchian Channel)
     - Volatility: ATR logic for stops
     """
+    FEATURES = (
+        ("atr", (14,)), ("atr", (20,)),
+        ("rolling_max", ("High", 252)), ("rolling_min", ("Low", 252)),
+        ("sma", (20, "Volume")), ("sma", (200, "Close")),
+        ("donchian_high", (50,)), ("donchian_low", (20,)),
+        ("ema", (50, "Close")), ("ema", (150, "Close")), ("ema", (200, "Close")),
+    )
+
     def __init__(self, ticker: str, df: pd.DataFrame, check_mode: bool = False, account_size: float = None, risk_per_trade_pct: float = 0.01, benchmark_df: pd.DataFrame = None):
         self.ticker = ticker
         self.df = df
@@ -55,9 +64,10 @@ class IsaStrategy(BaseStrategy):
         """
         if len(self.df) < 200: return False
         try:
-            ema_50 = ta.ema(self.df['Close'], length=50)
-            ema_150 = ta.ema(self.df['Close'], length=150)
-            ema_200 = ta.ema(self.df['Close'], length=200)
+            features = TickerFeatures(self.ticker, self.df)
+            ema_50 = features.ema(50)
+            ema_150 = features.ema(150)
+            ema_200 = features.ema(200)
 
             if ema_50 is None or ema_150 is None or ema_200 is None:
                 return False
@@ -113,21 +123,22 @@ class IsaStrategy(BaseStrategy):
             if len(df) < min_length: return None
 
             curr_close = float(df['Close'].iloc[-1])
+            features = TickerFeatures(self.ticker, df)
 
-            current_atr = ta.atr(df['High'], df['Low'], df['Close'], length=14).iloc[-1] if len(df) >= 14 else 0.0
-            high_52wk = df['High'].rolling(252).max().iloc[-1] if len(df) >= 252 else df['High'].max()
-            low_52wk = df['Low'].rolling(252).min().iloc[-1] if len(df) >= 252 else df['Low'].min()
+            current_atr = features.atr(14).iloc[-1] if len(df) >= 14 else 0.0
+            high_52wk = features.rolling_max('High', 252).iloc[-1] if len(df) >= 252 else df['High'].max()
+            low_52wk = features.rolling_min('Low', 252).iloc[-1] if len(df) >= 252 else df['Low'].min()
             pct_change_1d = ((curr_close - df['Close'].iloc[-2]) / df['Close'].iloc[-2] * 100) if len(df) >= 2 else 0.0
 
-            avg_vol = df['Volume'].rolling(20).mean().iloc[-1]
+            avg_vol = features.volume_avg(20).iloc[-1]
             if not self.check_mode and (avg_vol * curr_close) < 5_000_000:
                 return None
 
-            sma_200 = df['Close'].rolling(200).mean().iloc[-1]
+            sma_200 = features.sma(200).iloc[-1]
 
-            df['High_50'] = df['High'].rolling(50).max().shift(1)
-            df['Low_20'] = df['Low'].rolling(20).min().shift(1)
-            df['ATR'] = ta.atr(df['High'], df['Low'], df['Close'], length=20)
+            df['High_50'] = features.donchian_high(50)
+            df['Low_20'] = features.donchian_low(20)
+            df['ATR'] = features.atr(20)
 
             # Fix for Data Gaps (e.g. Missing High/Low): Forward Fill indicators
             df['High_50'] = df['High_50'].ffill()
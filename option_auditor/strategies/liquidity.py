@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import logging
 from option_auditor.common.screener_utils import (
@@ -6,6 +7,7 @@ from option_auditor.common.screener_utils import (
     DEFAULT_ATR_LENGTH
 )
 from option_auditor.common.constants import TICKER_NAMES
+from option_auditor.strategies.patterns import swing_highs, swing_lows, fair_value_gaps
 
 logger = logging.getLogger(__name__)
 
@@ -15,25 +17,15 @@ def _identify_swings(df: pd.DataFrame, lookback: int = 2) -> pd.DataFrame:
     A swing high is a high surrounded by lower highs on both sides.
     """
     df = df.copy()
-    # Swing High
-    df['Swing_High'] = df['High'][
-        (df['High'] > df['High'].shift(1)) &
-        (df['High'] > df['High'].shift(-1))
-    ]
-    # Swing Low
-    df['Swing_Low'] = df['Low'][
-        (df['Low'] < df['Low'].shift(1)) &
-        (df['Low'] < df['Low'].shift(-1))
-    ]
+    df['Swing_High'] = df['High'].where(swing_highs(df['High'].values))
+    df['Swing_Low'] = df['Low'].where(swing_lows(df['Low'].values))
     return df
 
 def _detect_fvgs(df: pd.DataFrame) -> list:
     """
-    Detects unmitigated Fair Value Gaps (FVGs) in the last 20 candles.
-    Returns a list of dicts: {'type': 'bull/bear', 'top': float, 'bottom': float, 'index': datetime}
+    Detects unmitigated Fair Value Gaps (FVGs) in the last 30 candles.
+    Returns a list of dicts: {'type': 'BULLISH/BEARISH', 'top': float, 'bottom': float, 'ts': datetime}
     """
-    fvgs = []
-
     if len(df) < 3:
         return []
 
@@ -41,29 +33,27 @@ def _detect_fvgs(df: pd.DataFrame) -> list:
     lows = df['Low'].values
     times = df.index
 
-    # Check last 30 candles
-    start_idx = max(2, len(df) - 30)
-
-    for i in range(start_idx, len(df)):
-        if lows[i-2] > highs[i]:
-            gap_size = lows[i-2] - highs[i]
-            if gap_size > (highs[i] * 0.0002):
-                fvgs.append({
-                    "type": "BEARISH",
-                    "top": lows[i-2],
-                    "bottom": highs[i],
-                    "ts": times[i-1]
-                })
-
-        if highs[i-2] < lows[i]:
-            gap_size = lows[i] - highs[i-2]
-            if gap_size > (lows[i] * 0.0002):
-                fvgs.append({
-                    "type": "BULLISH",
-                    "top": lows[i],
-                    "bottom": highs[i-2],
-                    "ts": times[i-1]
-                })
+    # Check last 30 candles (plus the two candles before the first one)
+    offset = max(0, len(df) - 32)
+    bearish, bullish = fair_value_gaps(highs[offset:], lows[offset:])
+
+    fvgs = []
+    for j in np.flatnonzero(bearish | bullish):
+        i = offset + j
+        if bearish[j]:
+            fvgs.append({
+                "type": "BEARISH",
+                "top": lows[i-2],
+                "bottom": highs[i],
+                "ts": times[i-1]
+            })
+        if bullish[j]:
+            fvgs.append({
+                "type": "BULLISH",
+                "top": lows[i],
+                "bottom": highs[i-2],
+                "ts": times[i-1]
+            })
     return fvgs
 
 def screen_liquidity_grabs(ticker_list: list = None, time_frame: str = "1h", region: str = "us") -> list:
@@ -83,7 +73,10 @@ def screen_liquidity_grabs(ticker_list: list = None, time_frame: str = "1h", reg
             if len(df) < 50: return None
 
             # Identify Swings
-            df_swings = _identify_swings(df, lookback=3)
+            highs = df['High'].to_numpy(dtype=float)
+            lows = df['Low'].to_numpy(dtype=float)
+            is_swing_high = swing_highs(highs)
+            is_swing_low = swing_lows(lows)
 
             # Current Candle
             curr = df.iloc[-1]
@@ -92,10 +85,10 @@ def screen_liquidity_grabs(ticker_list: list = None, time_frame: str = "1h", reg
             curr_l = float(curr['Low'])
 
             # Previous Swings (excluding current candle)
-            history = df_swings.iloc[:-1].tail(50)
+            history = slice(max(0, len(df) - 51), len(df) - 1)
 
-            swing_highs = history[history['Swing_High'].notna()]['Swing_High']
-            swing_lows = history[history['Swing_Low'].notna()]['Swing_Low']
+            recent_highs = highs[history][is_swing_high[history]]
+            recent_lows = lows[history][is_swing_low[history]]
 
             signal = "WAIT"
             verdict_color = "gray"
@@ -103,28 +96,28 @@ def screen_liquidity_grabs(ticker_list: list = None, time_frame: str = "1h", reg
             displacement_pct = 0.0
 
             # BULLISH SWEEP CHECK
-            if not swing_lows.empty:
-                breached_lows = swing_lows[swing_lows > curr_l] # Lows that are higher than current low (so we dipped below them)
+            if recent_lows.size:
+                breached_lows = recent_lows[recent_lows > curr_l] # Lows that are higher than current low (so we dipped below them)
 
-                if not breached_lows.empty:
+                if breached_lows.size:
                     # Check if we closed ABOVE them (Rejection)
                     valid_sweeps = breached_lows[breached_lows < curr_c]
 
-                    if not valid_sweeps.empty:
+                    if valid_sweeps.size:
                         sweep_level = valid_sweeps.min()
                         signal = "🐂 BULLISH SWEEP"
                         verdict_color = "green"
                         displacement_pct = ((curr_c - sweep_level) / sweep_level) * 100
 
             # BEARISH SWEEP CHECK
-            if signal == "WAIT" and not swing_highs.empty:
-                breached_highs = swing_highs[swing_highs < curr_h] # Highs lower than current high (so we spiked above)
+            if signal == "WAIT" and recent_highs.size:
+                breached_highs = recent_highs[recent_highs < curr_h] # Highs lower than current high (so we spiked above)
 
-                if not breached_highs.empty:
+                if breached_highs.size:
                     # Check if we closed BELOW them (Rejection)
                     valid_sweeps = breached_highs[breached_highs > curr_c]
 
-                    if not valid_sweeps.empty:
+                    if valid_sweeps.size:
                         sweep_level = valid_sweeps.max()
                         signal = "🐻 BEARISH SWEEP"
                         verdict_color = "red"
@@ -168,7 +161,7 @@ def screen_liquidity_grabs(ticker_list: list = None, time_frame: str = "1h", reg
                 "atr": round(atr, 2),
                 "breakout_level": round(sweep_level, 2),
                 "score": abs(displacement_pct) * 100,
-                "breakout_date": _calculate_trend_breakout_date(df)
+                "breakout_date": _calculate_trend_breakout_date(df, ticker)
             }
 
         except Exception as e:
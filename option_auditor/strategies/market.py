@@ -1,6 +1,5 @@
 import logging
 import pandas_ta as ta
-import yfinance as yf
 from option_auditor.common.screener_utils import (
     ScreeningRunner,
     resolve_region_tickers,
@@ -14,6 +13,7 @@ from option_auditor.common.constants import (
     TICKER_NAMES
 )
 from option_auditor.common.data_utils import _calculate_trend_breakout_date
+from option_auditor.common.market_data_provider import get_provider
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +41,7 @@ def enrich_with_fundamentals(results_list: list) -> list:
         try:
             ticker = item['ticker']
             # Fast fetch
-            info = yf.Ticker(ticker).info
+            info = get_provider().ticker(ticker).info
 
             pe = info.get('trailingPE', None)
             f_pe = info.get('forwardPE', None)
@@ -112,10 +112,10 @@ def screen_tickers_helper(tickers: list, iv_rank_threshold: float, rsi_threshold
                         pct_change_1d = ((curr_close - prev_close) / prev_close) * 100
 
                     # 1 Week change approximation based on interval
-                    if runner.yf_interval == "1d" and len(df) >= 6:
+                    if runner.time_frame == "1d" and len(df) >= 6:
                         week_close = float(df['Close'].iloc[-6])
                         pct_change_1w = ((curr_close - week_close) / week_close) * 100
-                    elif runner.yf_interval == "1wk" and len(df) >= 5:
+                    elif runner.time_frame == "1wk" and len(df) >= 5:
                          month_close = float(df['Close'].iloc[-5])
                          pct_change_1w = ((curr_close - month_close) / month_close) * 100
 
@@ -146,7 +146,7 @@ def screen_tickers_helper(tickers: list, iv_rank_threshold: float, rsi_threshold
             # This is slow inside a thread pool of 4, but let's keep it for parity
             pe_ratio = "N/A"
             try:
-                t = yf.Ticker(symbol)
+                t = get_provider().ticker(symbol)
                 info = t.info
                 if info and 'trailingPE' in info and info['trailingPE'] is not None:
                     pe_ratio = f"{info['trailingPE']:.2f}"
@@ -173,7 +173,7 @@ def screen_tickers_helper(tickers: list, iv_rank_threshold: float, rsi_threshold
                     signal = "🔴 OVERBOUGHT (Bearish)"
 
             company_name = TICKER_NAMES.get(symbol, symbol)
-            breakout_date = _calculate_trend_breakout_date(df)
+            breakout_date = _calculate_trend_breakout_date(df, symbol)
 
             stop_loss = current_price - (2 * current_atr) if trend == "BULLISH" else current_price + (2 * current_atr)
             target_price = current_price + (4 * current_atr) if trend == "BULLISH" else current_price - (4 * current_atr)
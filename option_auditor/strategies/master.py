@@ -1,7 +1,6 @@
 import logging
 import pandas as pd
 import numpy as np
-import yfinance as yf
 import pandas_ta as ta
 from typing import List, Optional, Dict, Any
 
@@ -16,6 +15,11 @@ from option_auditor.common.constants import (
     ISA_ACCOUNT_GBP, RISK_PER_TRADE_PCT, MIN_PRICE_USD, MIN_PRICE_GBP, MIN_PRICE_INR,
     MIN_TURNOVER_USD, MIN_TURNOVER_GBP, MIN_TURNOVER_INR
 )
+from option_auditor.common.market_data_provider import get_provider
+from option_auditor.common.feature_store import TickerFeatures
+from option_auditor.common.result_cache import params_digest
+from option_auditor.common.data_utils import last_closed_session
+from option_auditor.common.prefilter import by_market
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +34,7 @@ def get_detailed_market_regime() -> dict:
     curr_vix = 20.0
 
     try:
-        data = yf.download(["SPY", "^VIX"], period="1y", progress=False, auto_adjust=True)
+        data = get_provider().download(["SPY", "^VIX"], period="1y", progress=False, auto_adjust=True)
         if data.empty:
             return {"regime": "🟡 NEUTRAL (Data Empty)", "spy_history": None, "vix": 20.0}
 
@@ -71,11 +75,34 @@ def get_detailed_market_regime() -> dict:
         "vix": curr_vix
     }
 
+def _regime_key(regime_data: dict) -> str:
+    """
+    Digest of what analyze() reads from the regime: its label and the SPY closes of settled
+    sessions (the RS score). The live VIX and today's SPY bar are left out, so an intraday
+    rescan with unchanged bars reuses its results.
+    """
+    spy = regime_data.get("spy_history")
+    if spy is not None and not spy.empty and isinstance(spy.index, pd.DatetimeIndex):
+        settled = last_closed_session("NYSE").tz_localize(None).normalize()
+        dates = spy.index.tz_localize(None) if spy.index.tz is not None else spy.index
+        spy = spy[dates.normalize() <= settled]
+    return params_digest({"regime": regime_data.get("regime", "NEUTRAL"), "spy_history": spy})
+
 class FortressMasterScreener:
     """
     Orchestrates the Grandmaster (Growth) and Lite Bull Put (Options) strategies
     based on Market Regime.
     """
+    FEATURES = GrandmasterScreener.FEATURES + (("rsi", (14, "Close")),)
+    # Grandmaster's lookback also covers the RS score (63 bars) and RSI warm-up
+    LOOKBACK = GrandmasterScreener.LOOKBACK
+    # analyze()'s history and liquidity gates (UK prices are pence), checked for the whole universe first
+    PREFILTER = (
+        ("min_bars", (200,)),
+        ("min_turnover", (20, by_market(us=MIN_TURNOVER_USD, uk=MIN_TURNOVER_GBP, india=MIN_TURNOVER_INR), 0)),
+        ("min_price", (by_market(us=MIN_PRICE_USD, india=MIN_PRICE_INR),)),
+    )
+
     def __init__(self, regime_data: dict, check_mode: bool = False):
         self.regime = regime_data.get("regime", "NEUTRAL")
         self.spy_history = regime_data.get("spy_history")
@@ -106,8 +133,9 @@ class FortressMasterScreener:
             if df is None or df.empty or len(df) < 200: return None
 
             curr_price = float(df['Close'].iloc[-1])
-            volume = df['Volume'] if 'Volume' in df.columns else pd.Series([0]*len(df))
-            try: avg_vol = float(volume.rolling(20).mean().iloc[-1])
+            # Indicators shared with Grandmaster below and with other strategies in the scan
+            features = TickerFeatures(ticker, df)
+            try: avg_vol = features.last("sma", (20, "Volume")) if 'Volume' in df.columns else 0.0
             except: avg_vol = 0
 
             # --- REGION IDENTIFICATION ---
@@ -131,7 +159,7 @@ class FortressMasterScreener:
                     if curr_price < MIN_PRICE_USD: return None
 
             # --- RUN GRANDMASTER (GROWTH) ---
-            gm_result = self.grandmaster.analyze(df)
+            gm_result = self.grandmaster.analyze(df, ticker=ticker)
 
             setup = "NONE"
             score = 0
@@ -182,10 +210,10 @@ class FortressMasterScreener:
             # 2. OPTIONS INCOME (US Only) - LITE CHECK
             # Logic: If NOT Bearish (so Bullish or Neutral/Volatile ok) and US
             if is_us and "BEARISH" not in self.regime and setup == "NONE":
-                sma_50 = df['Close'].rolling(50).mean().iloc[-1]
-                sma_200 = df['Close'].rolling(200).mean().iloc[-1]
+                sma_50 = features.last("sma", (50, "Close"))
+                sma_200 = features.last("sma", (200, "Close"))
 
-                try: rsi = float(ta.rsi(df['Close'], length=14).iloc[-1])
+                try: rsi = features.last("rsi", (14, "Close"))
                 except: rsi = 50.0
 
                 if curr_price > sma_200 and rsi < 45 and rsi > 30:
@@ -209,7 +237,7 @@ class FortressMasterScreener:
             if len(df) >= 2:
                 pct_change = ((curr_price - df['Close'].iloc[-2]) / df['Close'].iloc[-2]) * 100
 
-            try: rsi = float(ta.rsi(df['Close'], length=14).iloc[-1])
+            try: rsi = features.last("rsi", (14, "Close"))
             except: rsi = 50.0
 
             # VCP Check (re-implemented lite version or just pass NO)
@@ -242,10 +270,13 @@ class FortressMasterScreener:
             # logger.error(f"Error analyzing {ticker}: {e}")
             return None
 
-def screen_master_convergence(ticker_list: list = None, region: str = "us", check_mode: bool = False, time_frame: str = "1d") -> list:
+def screen_master_convergence(ticker_list: list = None, region: str = "us", check_mode: bool = False, time_frame: str = "1d",
+                              incremental: bool = None) -> list:
     """
     Runs the Master Fortress Screener.
     Orchestrates Grandmaster (Growth) and Bull Put (Options) strategies.
+    incremental: Reuse the previous scan's results for tickers whose bars are unchanged
+    (default: INCREMENTAL_SCREENING).
     """
     if ticker_list is None:
         ticker_list = resolve_region_tickers(region)
@@ -260,7 +291,10 @@ def screen_master_convergence(ticker_list: list = None, region: str = "us", chec
     # We pass the method `screener_instance.analyze`
     runner = ScreeningRunner(ticker_list=ticker_list, time_frame=time_frame, region=region, check_mode=check_mode)
 
-    results = runner.run(screener_instance.analyze)
+    # Results also depend on the regime (incl. SPY history for the RS score), so it is part of the key
+    results = runner.run(screener_instance.analyze, features=FortressMasterScreener.FEATURES,
+                         lookback=FortressMasterScreener.LOOKBACK, result_key=("master", _regime_key(regime_data)),
+                         prefilter=FortressMasterScreener.PREFILTER, incremental=incremental)
 
     # Sort by Score
     results.sort(key=lambda x: x['Score'], reverse=True)
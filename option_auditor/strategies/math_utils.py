@@ -132,6 +132,128 @@ def kalman_filter(series: pd.Series, optimization_window: int = 30) -> pd.Series
     except Exception:
         return series
 
+# --- Batch versions: one column per ticker ---
+# Columns must be gap-free and the same length (the statistics are anchored at the
+# first bar), so callers group tickers by history length. NaN stands for None.
+
+def batch_hurst(returns: np.ndarray, max_lag=20) -> np.ndarray:
+    """
+    calculate_hurst for many tickers. `returns` is a (bars - 1, tickers) matrix of
+    log returns; chunk statistics for each lag come from one reshape.
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    n, k = returns.shape
+    hurst = np.full(k, np.nan)
+
+    # Same gates as calculate_hurst (100 prices -> 99 returns)
+    if n < 99: return hurst
+    actual_max_lag = min(max_lag, n // 4)
+    if actual_max_lag < 5: return hurst
+
+    lags = np.arange(2, actual_max_lag)
+    rs = np.full((len(lags), k), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for j, lag in enumerate(lags):
+            chunks = returns[:(n // lag) * lag].reshape(n // lag, lag, k)
+            cumsum_dev = (chunks - chunks.mean(axis=1, keepdims=True)).cumsum(axis=1)
+            R = cumsum_dev.max(axis=1) - cumsum_dev.min(axis=1)
+            S = chunks.std(axis=1, ddof=1)
+
+            valid = S > 1e-9
+            count = valid.sum(axis=0)
+            total = np.where(valid, R / S, 0.0).sum(axis=0)
+            rs[j] = np.where(count > 0, total / count, np.nan)
+
+        # calculate_hurst pairs the lags that produced a value with the first lags
+        # in order, so a skipped lag shifts the x values of the ones after it
+        present = ~np.isnan(rs)
+        x = np.log(lags)[np.maximum(np.cumsum(present, axis=0) - 1, 0)]
+
+        # Log-Log Regression (least-squares slope over the usable points)
+        use = present & (rs > 0)
+        y = np.log(np.where(use, rs, 1.0))
+        w = use.astype(np.float64)
+        n_use = w.sum(axis=0)
+        x_mean = (w * x).sum(axis=0) / n_use
+        y_mean = (w * y).sum(axis=0) / n_use
+        dx = x - x_mean
+        slope = (w * dx * (y - y_mean)).sum(axis=0) / (w * dx * dx).sum(axis=0)
+
+    ok = (present.sum(axis=0) >= 3) & (n_use >= 3)
+    hurst[ok] = slope[ok]
+    hurst[returns.std(axis=0, ddof=1) == 0] = 0.5
+    return hurst
+
+def batch_shannon_entropy(returns: np.ndarray, base=2) -> np.ndarray:
+    """
+    shannon_entropy for many tickers. `returns` is a (bars - 1, tickers) matrix of
+    simple returns; binned with np.histogram's equal-width rules, all columns at once.
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    n, k = returns.shape
+    if n < 100: return np.full(k, np.nan)
+
+    num_bins = int(n ** 0.5)
+    first_edge = returns.min(axis=0)
+    last_edge = returns.max(axis=0)
+    flat = first_edge == last_edge
+    first_edge = np.where(flat, first_edge - 0.5, first_edge)
+    last_edge = np.where(flat, last_edge + 0.5, last_edge)
+    edges = np.linspace(first_edge, last_edge, num_bins + 1)
+
+    # Bin index estimate, then np.histogram's corrections against the actual edges
+    indices = ((returns - first_edge) / (last_edge - first_edge) * num_bins).astype(np.intp)
+    indices[indices == num_bins] -= 1
+    indices[returns < np.take_along_axis(edges, indices, axis=0)] -= 1
+    indices[(returns >= np.take_along_axis(edges, indices + 1, axis=0)) & (indices != num_bins - 1)] += 1
+
+    counts = np.bincount((indices + np.arange(k) * num_bins).ravel(), minlength=k * num_bins)
+    probs = counts.reshape(num_bins, k, order='F') / n
+    terms = np.where(probs > 0, probs * np.log(np.where(probs > 0, probs, 1.0)) / np.log(base), 0.0)
+
+    S = -terms.sum(axis=0)
+    max_S = np.log(num_bins) / np.log(base)
+    return S / max_S
+
+def batch_kalman_filter(prices: np.ndarray, optimization_window: int = 30) -> np.ndarray:
+    """
+    kalman_filter for many tickers: one recursion step per bar across all columns.
+    Columns with non-positive prices are returned unfiltered, as kalman_filter does.
+    """
+    out = np.array(prices, dtype=np.float64)
+    n_iter = len(out)
+    ok = (out > 0).all(axis=0)
+    if n_iter == 0 or not ok.any(): return out
+
+    x = np.log(out[:, ok])
+    xhat = np.empty_like(x)  # Posteriori estimate
+    xhat[0] = x[0]
+    P = np.ones(x.shape[1])  # Posteriori error covariance
+
+    # Estimate initial Measurement Noise (R) from history
+    if n_iter > optimization_window:
+        R_val = np.maximum(1e-5, np.var(np.diff(x[:optimization_window], axis=0), axis=0))
+    else:
+        R_val = np.full(x.shape[1], 1e-4)
+
+    # Initial Process Noise (Q)
+    Q_val = np.full(x.shape[1], 1e-5)
+    alpha = 0.1 # Smoothing factor
+
+    for k in range(1, n_iter):
+        xhatminus = xhat[k-1]
+        Pminus = P + Q_val
+
+        K = Pminus / (Pminus + R_val)
+        innovation = x[k] - xhatminus
+        xhat[k] = xhatminus + K * innovation
+        P = (1 - K) * Pminus
+
+        Q_val = (1 - alpha) * Q_val + alpha * (innovation**2)
+
+    out[:, ok] = np.exp(xhat)
+    return out
+
 def calculate_momentum_decay(price_series: np.ndarray) -> float:
     """
     Atomic Physics: Half-life of a trend.
@@ -280,6 +402,65 @@ def calculate_dominant_cycle(prices):
 
     return round(period, 1), rel_pos
 
+def batch_hilbert_phase(prices: np.ndarray):
+    """
+    calculate_hilbert_phase for many tickers: one detrend and one FFT-based Hilbert
+    transform down axis 0 of a (bars, tickers) price matrix.
+    Returns (phase, amplitude) arrays; NaN for columns with non-finite log prices and for
+    constant columns (their detrended residue is rounding noise, so results are arbitrary).
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    n, k = prices.shape
+    phase, amplitude = np.full(k, np.nan), np.full(k, np.nan)
+    if n < 30: return phase, amplitude
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_prices = np.log(prices)
+    ok = np.isfinite(log_prices).all(axis=0) & (np.ptp(log_prices, axis=0) > 0)
+    if not ok.any(): return phase, amplitude
+
+    detrended = detrend(log_prices[:, ok], axis=0, type='linear')
+    analytic_signal = hilbert(detrended, axis=0)[-1]
+
+    phase[ok] = np.angle(analytic_signal)
+    amplitude[ok] = np.abs(analytic_signal)
+    return phase, amplitude
+
+def batch_dominant_cycle(prices: np.ndarray):
+    """
+    calculate_dominant_cycle for many tickers: the last 64 bars of every column are
+    detrended, windowed and transformed with one rfft down axis 0.
+    Returns (period_days, rel_pos) arrays; NaN for non-finite or constant columns,
+    as in batch_hilbert_phase.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    n, k = prices.shape
+    period, rel_pos = np.full(k, np.nan), np.full(k, np.nan)
+    window_size = 64
+    if n < window_size: return period, rel_pos
+
+    y = prices[-window_size:]
+    ok = np.isfinite(y).all(axis=0) & (np.ptp(y, axis=0) > 0)
+    if not ok.any(): return period, rel_pos
+    y = y[:, ok]
+    x = np.arange(window_size)
+
+    p = np.polyfit(x, y, 1)
+    detrended = y - (p[0] * x[:, None] + p[1])
+    windowed = detrended * np.hanning(window_size)[:, None]
+
+    amplitudes = np.abs(np.fft.rfft(windowed, axis=0))
+    frequencies = np.fft.rfftfreq(window_size)
+
+    # Skip DC component at index 0
+    dominant_freq = frequencies[np.argmax(amplitudes[1:], axis=0) + 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        period[ok] = np.round(np.where(dominant_freq > 0, 1.0 / dominant_freq, 0), 1)
+
+        cycle_range = detrended.max(axis=0) - detrended.min(axis=0)
+        rel_pos[ok] = np.where(cycle_range > 0, detrended[-1] / (cycle_range / 2.0), 0)
+    return period, rel_pos
+
 def calculate_greeks(S: float, K: float, T: float, r: float, sigma: float, option_type: str = "call") -> dict:
     """
     Calculates Black-Scholes Greeks for European options.
@@ -105,7 +105,7 @@ def screen_mms_ote_setups(ticker_list: list = None, time_frame: str = "1h", regi
                                      "target": peak_up_high + range_up
                                  }
 
-            breakout_date = _calculate_trend_breakout_date(df)
+            breakout_date = _calculate_trend_breakout_date(df, ticker)
 
             high_52wk = df['High'].rolling(252).max().iloc[-1] if len(df) >= 252 else df['High'].max()
             low_52wk = df['Low'].rolling(252).min().iloc[-1] if len(df) >= 252 else df['Low'].min()
@@ -1,6 +1,6 @@
 import numpy as np
 import pandas as pd
-import yfinance as yf
+from option_auditor.common.market_data_provider import get_provider
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,7 +12,7 @@ def screen_monte_carlo_forecast(ticker: str, days: int = 30, sims: int = 1000):
     """
     try:
         # Fetch sufficient history to capture tail events (2 years minimum)
-        df = yf.download(ticker, period="2y", progress=False)
+        df = get_provider().download(ticker, period="2y", progress=False)
         if df.empty or len(df) < 100: return None
 
         if isinstance(df.columns, pd.MultiIndex):
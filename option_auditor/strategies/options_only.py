@@ -1,6 +1,5 @@
 import pandas as pd
 import numpy as np
-import yfinance as yf
 import os
 from datetime import date, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -9,6 +8,8 @@ import logging
 # Local Imports
 from option_auditor.common.screener_utils import _calculate_put_delta
 from option_auditor.common.constants import RISK_FREE_RATE
+from option_auditor.common.market_data_provider import get_provider
+from option_auditor.common.scan_stream import scan_started, ticker_screened
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +66,7 @@ def screen_options_only_strategy(region: str = "us", limit: int = 75) -> list:
 
     def process_ticker(ticker):
         try:
-            tk = yf.Ticker(ticker)
+            tk = get_provider().ticker(ticker)
 
             # --- PHASE 1: FAST LIQUIDITY CHECK ---
             # Only fetch 5 days. If it fails, abort immediately.
@@ -234,15 +235,18 @@ def screen_options_only_strategy(region: str = "us", limit: int = 75) -> list:
     # --- EXECUTION ---
     results = []
     # Increase workers for IO bound tasks, but not too high to hit API limits
+    scan_started(len(ticker_list))
     with ThreadPoolExecutor(max_workers=20) as executor:
         future_to_ticker = {executor.submit(process_ticker, t): t for t in ticker_list}
         for future in as_completed(future_to_ticker):
+            data = None
             try:
                 data = future.result()
                 if data:
                     results.append(data)
             except Exception as e:
                 logger.debug(f"Future failed: {e}")
+            ticker_screened(data)
 
     results.sort(key=lambda x: (1 if "GREEN" in x['verdict'] else 0, x['roc']), reverse=True)
     return results
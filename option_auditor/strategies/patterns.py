@@ -0,0 +1,119 @@
+import numpy as np
+
+# Price-pattern masks shared by the liquidity/MMS screeners, RSI divergence and the backtester.
+# Every function takes a series (bars,) or a panel block (bars x tickers) and works down axis 0,
+# so a whole universe is marked in one pass. Bars involving a NaN are never marked.
+
+
+def swing_highs(high: np.ndarray) -> np.ndarray:
+    """Fractal swing highs: a high above the highs of the bars on either side."""
+    high = np.asarray(high, dtype=np.float64)
+    out = np.zeros(high.shape, dtype=bool)
+    if len(high) >= 3:
+        out[1:-1] = (high[1:-1] > high[:-2]) & (high[1:-1] > high[2:])
+    return out
+
+
+def swing_lows(low: np.ndarray) -> np.ndarray:
+    """Fractal swing lows: a low below the lows of the bars on either side."""
+    low = np.asarray(low, dtype=np.float64)
+    out = np.zeros(low.shape, dtype=bool)
+    if len(low) >= 3:
+        out[1:-1] = (low[1:-1] < low[:-2]) & (low[1:-1] < low[2:])
+    return out
+
+
+def fair_value_gaps(high: np.ndarray, low: np.ndarray, min_gap_pct: float = 0.0002) -> tuple:
+    """
+    (bearish, bullish) masks of three-candle Fair Value Gaps, marked on the third candle i.
+    Bearish: low[i-2] > high[i], the gap being low[i-2] - high[i]. Bullish: high[i-2] < low[i],
+    the gap being low[i] - high[i-2]. The gap must exceed min_gap_pct of the third candle's price.
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    bearish = np.zeros(high.shape, dtype=bool)
+    bullish = np.zeros(high.shape, dtype=bool)
+    if len(high) >= 3:
+        first_low, first_high = low[:-2], high[:-2]
+        third_low, third_high = low[2:], high[2:]
+        bearish[2:] = (first_low > third_high) & ((first_low - third_high) > third_high * min_gap_pct)
+        bullish[2:] = (first_high < third_low) & ((third_low - first_high) > third_low * min_gap_pct)
+    return bearish, bullish
+
+
+def pivots(values: np.ndarray, order: int = 3) -> tuple:
+    """
+    (highs, lows) masks of strict local extrema over `order` bars on each side, as
+    scipy.signal.argrelextrema(values, np.greater / np.less, order=order): the window is
+    clipped at the ends, so the first and last bars are never pivots.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    highs = np.ones(values.shape, dtype=bool)
+    lows = np.ones(values.shape, dtype=bool)
+    if n == 0:
+        return highs, lows
+
+    pad = [(order, order)] + [(0, 0)] * (values.ndim - 1)
+    padded = np.pad(values, pad, mode="edge")
+    for shift in range(1, order + 1):
+        for neighbour in (padded[order + shift:order + shift + n], padded[order - shift:order - shift + n]):
+            highs &= values > neighbour
+            lows &= values < neighbour
+    return highs, lows
+
+
+# Darvas box states (the third output of darvas_boxes)
+DARVAS_NONE, DARVAS_BREAKOUT, DARVAS_BREAKDOWN, DARVAS_MOMENTUM = 0, 1, -1, 2
+
+DARVAS_LOOKBACK = 60
+
+
+def darvas_boxes(high: np.ndarray, low: np.ndarray, close: np.ndarray, lookback: int = DARVAS_LOOKBACK) -> tuple:
+    """
+    (ceiling, floor, state) of the latest Darvas box per column.
+
+    The ceiling is the most recent high within the last `lookback` bars that is the highest of
+    the 3 bars on either side; the floor is the first later low below the ceiling that is the
+    lowest of the 3 bars on either side. Either is NaN if not found. The state compares the
+    last two closes with the box: DARVAS_BREAKOUT (close crossed above the ceiling),
+    DARVAS_BREAKDOWN (crossed below the floor), DARVAS_MOMENTUM (above the ceiling by less
+    than 5%) or DARVAS_NONE; it needs both box edges. Only the last lookback + 2 bars are read.
+    A series gives floats, a (bars x tickers) block one array per output.
+    """
+    single = np.ndim(high) == 1
+    high, low, close = (np.asarray(x, dtype=np.float64).reshape(len(x), -1)[-(lookback + 2):] for x in (high, low, close))
+    n, k = high.shape
+    ceiling, floor, state = np.full(k, np.nan), np.full(k, np.nan), np.zeros(k)
+
+    if n >= 7:
+        rows = np.arange(n)[:, None]
+        # Centre bars 3..n-4; window extremes are NaN if any bar in the window is
+        is_top = np.zeros((n, k), dtype=bool)
+        is_bottom = np.zeros((n, k), dtype=bool)
+        is_top[3:-3] = high[3:-3] >= np.lib.stride_tricks.sliding_window_view(high, 7, axis=0).max(axis=-1)
+        is_bottom[3:-3] = low[3:-3] <= np.lib.stride_tricks.sliding_window_view(low, 7, axis=0).min(axis=-1)
+
+        is_top &= rows > n - min(n, lookback)
+        has_top = is_top.any(axis=0)
+        top_idx = n - 1 - np.argmax(is_top[::-1], axis=0)
+        ceiling[has_top] = high[top_idx, np.arange(k)][has_top]
+
+        is_bottom &= (rows > top_idx) & (low < ceiling)
+        has_bottom = is_bottom.any(axis=0)
+        floor[has_bottom] = low[np.argmax(is_bottom, axis=0), np.arange(k)][has_bottom]
+
+    if n >= 2:
+        last, prev = close[-1], close[-2]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            breakout = (last > ceiling) & (prev <= ceiling)
+            breakdown = ~breakout & (last < floor) & (prev >= floor)
+            momentum = ~breakout & ~breakdown & (last > ceiling) & ((last - ceiling) / ceiling < 0.05)
+        boxed = ~np.isnan(ceiling) & ~np.isnan(floor)
+        state[boxed & breakout] = DARVAS_BREAKOUT
+        state[boxed & breakdown] = DARVAS_BREAKDOWN
+        state[boxed & momentum] = DARVAS_MOMENTUM
+
+    if single:
+        return float(ceiling[0]), float(floor[0]), int(state[0])
+    return ceiling, floor, state
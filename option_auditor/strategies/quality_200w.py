@@ -2,11 +2,30 @@ from .base import BaseStrategy
 import pandas as pd
 import pandas_ta as ta
 import logging
-import yfinance as yf
 from option_auditor.common.constants import TICKER_NAMES
+from option_auditor.common.market_data_provider import get_provider
+from option_auditor.common.feature_store import TickerFeatures
 
 logger = logging.getLogger(__name__)
 
+
+def _last_weekly_sma(close: pd.Series, length: int) -> float:
+    """
+    Latest `length`-week SMA of weekly ('W') closes. Only the trailing weeks are
+    resampled; NaN when there are fewer than `length` weeks or the window has gaps.
+    """
+    # One spare week: the oldest resampled bin may be cut by the slice
+    cutoff = close.index[-1] - pd.Timedelta(weeks=length + 1)
+    trailing = close.loc[cutoff:] if cutoff > close.index[0] else close
+    weekly = trailing.resample('W').last()
+    if len(weekly) < length:
+        return float("nan")
+    sma = ta.sma(weekly.iloc[-length:], length=length)
+    if sma is None or sma.empty:
+        return float("nan")
+    return float(sma.iloc[-1])
+
+
 class Quality200wStrategy(BaseStrategy):
     """
     Quality 200-Week MA Strategy:
@@ -15,6 +34,10 @@ class Quality200wStrategy(BaseStrategy):
     - Quality Filter: Price > 50-Day SMA.
     - Fundamental: Positive 3-Year Revenue Growth.
     """
+    FEATURES = (("sma", (50, "Close")),)
+    # Revenue growth comes from the ticker's fundamentals, not its bars
+    RESULT_CACHEABLE = False
+
     def __init__(self, ticker: str, df: pd.DataFrame, check_mode: bool = False):
         self.ticker = ticker
         self.df = df
@@ -24,22 +47,16 @@ class Quality200wStrategy(BaseStrategy):
         if self.df is None or self.df.empty:
             return None
 
-        df = self.df.copy()
+        df = self.df
 
         # 1. Calculate 50-Day SMA (Daily)
         # Ensure we have enough data
         if len(df) < 50:
             return None
 
-        # pandas_ta might return None if insufficient data
-        sma_50_series = ta.sma(df['Close'], length=50)
-        if sma_50_series is None or sma_50_series.empty:
-            return None
-
-        df['SMA_50'] = sma_50_series
-
+        # Only today's values are needed; shared with the other strategies screening this ticker
         current_price = df['Close'].iloc[-1]
-        current_sma_50 = df['SMA_50'].iloc[-1]
+        current_sma_50 = TickerFeatures(self.ticker, df).last("sma", (50, "Close"))
 
         if pd.isna(current_sma_50):
             return None
@@ -49,26 +66,7 @@ class Quality200wStrategy(BaseStrategy):
             return None
 
         # 2. Resample to Weekly for 200-Week SMA
-        # 'W' frequency corresponds to weekly
-        df_weekly = df.resample('W').agg({
-            'Open': 'first',
-            'High': 'max',
-            'Low': 'min',
-            'Close': 'last',
-            'Volume': 'sum'
-        })
-
-        # We need at least 200 weeks
-        if len(df_weekly) < 200:
-            return None
-
-        sma_200_weekly_series = ta.sma(df_weekly['Close'], length=200)
-        if sma_200_weekly_series is None or sma_200_weekly_series.empty:
-            return None
-
-        df_weekly['SMA_200'] = sma_200_weekly_series
-
-        current_sma_200 = df_weekly['SMA_200'].iloc[-1]
+        current_sma_200 = _last_weekly_sma(df['Close'], 200)
 
         if pd.isna(current_sma_200):
             return None
@@ -89,7 +87,7 @@ class Quality200wStrategy(BaseStrategy):
 
         is_quality = False
         try:
-            ticker_obj = yf.Ticker(self.ticker)
+            ticker_obj = get_provider().ticker(self.ticker)
             info = ticker_obj.info
 
             # Check 1: Info 'revenueGrowth'
@@ -1,20 +1,57 @@
 import pandas as pd
 import numpy as np
-import pandas_ta as ta
 import logging
 from option_auditor.common.screener_utils import ScreeningRunner
 from option_auditor.strategies.math_utils import (
     calculate_hurst,
     shannon_entropy,
     kalman_filter,
-    generate_human_verdict
+    generate_human_verdict,
+    batch_hurst,
+    batch_shannon_entropy,
+    batch_kalman_filter
 )
 from option_auditor.common.data_utils import get_cached_market_data, fetch_batch_data_safe
+from option_auditor.common.market_panel import MarketPanel
+from option_auditor.common.feature_store import TickerFeatures
+from option_auditor.common.indicator_engine import ENGINE_MIN_TICKERS, prime_panel_features
 from option_auditor.common.constants import TICKER_NAMES
 
 logger = logging.getLogger(__name__)
 
-def screen_quantum_setups(ticker_list: list = None, time_frame: str = "1d", region: str = "us") -> list:
+QUANTUM_FEATURES = (("atr", (14,)),)
+
+
+def _batch_physics(closes: dict) -> dict:
+    """
+    (hurst, entropy, kalman slope) per ticker from the batch math_utils functions.
+    Tickers are grouped by history length; those with gaps or non-positive closes
+    are left out and go through the scalar functions.
+    """
+    groups = {}
+    for ticker, close in closes.items():
+        values = close.to_numpy(dtype=np.float64, na_value=np.nan)
+        if np.isfinite(values).all() and (values > 0).all():
+            groups.setdefault(len(values), []).append((ticker, values))
+
+    physics = {}
+    for members in groups.values():
+        prices = np.column_stack([values for _, values in members])
+        hurst = batch_hurst(np.log(prices[1:] / prices[:-1]))
+        entropy = batch_shannon_entropy(prices[1:] / prices[:-1] - 1)
+        kalman = batch_kalman_filter(prices)
+        # Slope of Kalman (last 5 days)
+        k_slope = (kalman[-1] - kalman[-5]) / kalman[-5]
+
+        for i, (ticker, _) in enumerate(members):
+            physics[ticker] = (
+                None if np.isnan(hurst[i]) else float(hurst[i]),
+                None if np.isnan(entropy[i]) else float(entropy[i]),
+                float(k_slope[i]),
+            )
+    return physics
+
+def screen_quantum_setups(ticker_list: list = None, time_frame: str = "1d", region: str = "us", panel: MarketPanel = None) -> list:
     """
     Screens for Quantum Setups using math_utils.
     Logic:
@@ -22,6 +59,8 @@ def screen_quantum_setups(ticker_list: list = None, time_frame: str = "1d", regi
     2. Calculate Entropy (Chaos)
     3. Calculate Kalman Filter Slope (True Trend)
     4. Generate Human Verdict
+
+    panel: Optional pre-built MarketPanel; skips the data fetch.
     """
     if not ticker_list:
         return []
@@ -30,58 +69,56 @@ def screen_quantum_setups(ticker_list: list = None, time_frame: str = "1d", regi
 
     # Fetch data
     try:
-        # Retrieve Data
-        cache_name = "market_scan_us_liquid"
-        if region == "india": cache_name = "market_scan_india"
-        elif region == "uk": cache_name = "market_scan_uk"
-        elif region == "uk_euro": cache_name = "market_scan_europe"
-        elif region == "sp500": cache_name = "market_scan_v1"
-
-        try:
-            all_data = get_cached_market_data(ticker_list, period="2y", cache_name=cache_name)
-        except Exception:
-            all_data = None
-
-        if all_data is None or all_data.empty:
-             all_data = fetch_batch_data_safe(ticker_list, period="2y", interval=time_frame)
-
-        # Handle Flat vs MultiIndex
-        ticker_data_map = {}
-        if isinstance(all_data.columns, pd.MultiIndex):
-            for t in ticker_list:
-                try:
-                    # Select ticker from Level 0
-                    if t in all_data.columns.get_level_values(0):
-                         df = all_data[t]
-                         if not df.empty:
-                             ticker_data_map[t] = df
-                except KeyError:
-                    pass
-        else:
-            if len(ticker_list) == 1:
-                ticker_data_map[ticker_list[0]] = all_data
-
-        for ticker, df in ticker_data_map.items():
-            if len(df) < 200: continue
-
+        if panel is None:
+            # Retrieve Data
+            cache_name = "market_scan_us_liquid"
+            if region == "india": cache_name = "market_scan_india"
+            elif region == "uk": cache_name = "market_scan_uk"
+            elif region == "uk_euro": cache_name = "market_scan_europe"
+            elif region == "sp500": cache_name = "market_scan_v1"
+
+            try:
+                all_data = get_cached_market_data(ticker_list, period="2y", cache_name=cache_name)
+            except Exception:
+                all_data = None
+
+            if all_data is None or all_data.empty:
+                 all_data = fetch_batch_data_safe(ticker_list, period="2y", interval=time_frame)
+
+            # Handle Flat vs MultiIndex
+            default_ticker = ticker_list[0] if len(ticker_list) == 1 else None
+            panel = MarketPanel.from_frame(all_data, default_ticker=default_ticker)
+
+        frames = [(ticker, df) for ticker, df in panel.items(ticker_list) if len(df) >= 200]
+
+        # Large universes: physics for all tickers at once, ATR from the indicator engine
+        physics = {}
+        if len(frames) >= ENGINE_MIN_TICKERS:
+            physics = _batch_physics({ticker: df['Close'] for ticker, df in frames})
+            prime_panel_features(panel, QUANTUM_FEATURES, ticker_list)
+
+        for ticker, df in frames:
             close = df['Close']
             curr_price = close.iloc[-1]
 
             # Physics
-            hurst = calculate_hurst(close)
-            entropy = shannon_entropy(close)
-            kalman = kalman_filter(close)
-
-            # Slope of Kalman (last 5 days)
-            k_slope = 0.0
-            if len(kalman) > 5:
-                k_slope = (kalman.iloc[-1] - kalman.iloc[-5]) / kalman.iloc[-5]
+            if ticker in physics:
+                hurst, entropy, k_slope = physics[ticker]
+            else:
+                hurst = calculate_hurst(close)
+                entropy = shannon_entropy(close)
+                kalman = kalman_filter(close)
+
+                # Slope of Kalman (last 5 days)
+                k_slope = 0.0
+                if len(kalman) > 5:
+                    k_slope = (kalman.iloc[-1] - kalman.iloc[-5]) / kalman.iloc[-5]
 
             ai_verdict, ai_rationale = generate_human_verdict(hurst, entropy, k_slope, curr_price)
 
             # Calculate ATR for Risk Management
             # Default length 14
-            atr_series = ta.atr(df['High'], df['Low'], close, length=14)
+            atr_series = TickerFeatures(ticker, df).atr(14)
             current_atr = atr_series.iloc[-1] if atr_series is not None and not atr_series.empty else 0.0
 
             # Risk Management Defaults
@@ -2,10 +2,10 @@ from .base import BaseStrategy
 import pandas_ta as ta
 import numpy as np
 import pandas as pd
-from scipy.signal import argrelextrema
 from option_auditor.common.constants import TICKER_NAMES
 from option_auditor.common.screener_utils import DEFAULT_RSI_LENGTH, DEFAULT_ATR_LENGTH
 from option_auditor.common.data_utils import _calculate_trend_breakout_date
+from option_auditor.strategies.patterns import pivots
 
 class RsiDivergenceStrategy(BaseStrategy):
     def __init__(self, ticker: str, df: pd.DataFrame, check_mode: bool = False):
@@ -15,13 +15,14 @@ class RsiDivergenceStrategy(BaseStrategy):
 
     def _find_divergence(self, price, rsi, lookback=30, order=3):
         # Find peaks (Highs)
-        # argrelextrema returns indices of local maxima/minima
+        # pivots marks the local maxima/minima
         # order=3 means it must be the max of 3 neighbors on each side
 
         if len(price) < lookback: return None, None
 
-        high_idx = argrelextrema(price.values, np.greater, order=order)[0]
-        low_idx = argrelextrema(price.values, np.less, order=order)[0]
+        is_high, is_low = pivots(price.values, order=order)
+        high_idx = np.flatnonzero(is_high)
+        low_idx = np.flatnonzero(is_low)
 
         current_idx = len(price) - 1
         relevant_highs = [i for i in high_idx if (current_idx - i) < lookback]
@@ -120,7 +121,7 @@ class RsiDivergenceStrategy(BaseStrategy):
                     "atr_value": round(atr, 2),
                     "stop_loss": round(stop_loss, 2),
                     "target": round(target, 2),
-                    "breakout_date": _calculate_trend_breakout_date(df),
+                    "breakout_date": _calculate_trend_breakout_date(df, ticker),
                     "score": 90
                 }
         except Exception as e:
@@ -1,7 +1,14 @@
-import pandas_ta as ta
 from option_auditor.common.screener_utils import ScreeningRunner, DEFAULT_ATR_LENGTH
 from option_auditor.common.constants import TICKER_NAMES
 from option_auditor.common.data_utils import _calculate_trend_breakout_date
+from option_auditor.common.feature_store import TickerFeatures
+
+SQUEEZE_FEATURES = (
+    ("bollinger_bands", (20, 2.0)),
+    ("keltner_channels", (20, 1.5)),
+    ("sma", (20, "Close")),
+    ("atr", (DEFAULT_ATR_LENGTH,)),
+)
 
 def screen_bollinger_squeeze(ticker_list: list = None, time_frame: str = "1d", region: str = "us") -> list:
     """
@@ -16,23 +23,22 @@ def screen_bollinger_squeeze(ticker_list: list = None, time_frame: str = "1d", r
             if len(df) < 50: return None
 
             curr_close = float(df['Close'].iloc[-1])
+            features = TickerFeatures(ticker, df)
 
             # --- CALCULATIONS ---
             # 1. Bollinger Bands (20, 2)
-            bb = ta.bbands(df['Close'], length=20, std=2.0)
+            bb = features.bollinger_bands(20, 2.0)
             if bb is None: return None
 
-            # Columns: BBL, BBM, BBU, Bandwidth, Percent
-            bb_lower = bb.iloc[:, 0]
-            bb_upper = bb.iloc[:, 2]
+            bb_lower = bb['lower']
+            bb_upper = bb['upper']
 
             # 2. Keltner Channels (20, 1.5)
-            kc = ta.kc(df['High'], df['Low'], df['Close'], length=20, scalar=1.5)
+            kc = features.keltner_channels(20, 1.5)
             if kc is None: return None
 
-            # Columns: Lower, Basis, Upper
-            kc_lower = kc.iloc[:, 0]
-            kc_upper = kc.iloc[:, 2]
+            kc_lower = kc['lower']
+            kc_upper = kc['upper']
 
             if bb_upper is None or kc_upper is None: return None
 
@@ -43,15 +49,15 @@ def screen_bollinger_squeeze(ticker_list: list = None, time_frame: str = "1d", r
             if not sq_on: return None
 
             # 4. Momentum (Close - SMA(20))
-            sma_20 = df['Close'].rolling(20).mean().iloc[-1]
+            sma_20 = features.sma(20).iloc[-1]
             mom = curr_close - sma_20
             mom_color = "green" if mom > 0 else "red"
             signal_desc = "BULLISH SQUEEZE" if mom > 0 else "BEARISH SQUEEZE"
 
-            breakout_date = _calculate_trend_breakout_date(df)
+            breakout_date = _calculate_trend_breakout_date(df, ticker)
 
             # Calculate ATR for UI
-            df['ATR'] = ta.atr(df['High'], df['Low'], df['Close'], length=DEFAULT_ATR_LENGTH)
+            df['ATR'] = features.atr(DEFAULT_ATR_LENGTH)
             atr = df['ATR'].iloc[-1] if 'ATR' in df.columns else (curr_close * 0.01)
 
             base_ticker = ticker.split('.')[0]
@@ -86,4 +92,4 @@ def screen_bollinger_squeeze(ticker_list: list = None, time_frame: str = "1d", r
         except Exception as e:
             return None
 
-    return runner.run(strategy)
+    return runner.run(strategy, features=SQUEEZE_FEATURES)
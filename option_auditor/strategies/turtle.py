@@ -98,7 +98,7 @@ class TurtleStrategy(BaseStrategy):
                 target = prev_high + (4 * atr)
 
             # Calculate Trend Breakout Date
-            breakout_date = _calculate_trend_breakout_date(df)
+            breakout_date = _calculate_trend_breakout_date(df, self.ticker)
 
             # Additional Calcs for Consistency
             current_atr = ta.atr(df['High'], df['Low'], df['Close'], length=DEFAULT_ATR_LENGTH).iloc[-1] if len(df) >= DEFAULT_ATR_LENGTH else 0.0
@@ -1,13 +1,14 @@
 import logging
 import pandas as pd
 import numpy as np
-import yfinance as yf
 from datetime import date, datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from option_auditor.common.data_utils import fetch_batch_data_safe
 from option_auditor.common.screener_utils import resolve_region_tickers, _calculate_put_delta
 from option_auditor.common.constants import TICKER_NAMES, RISK_FREE_RATE
+from option_auditor.common.market_data_provider import get_provider
+from option_auditor.common.scan_stream import scan_started, ticker_screened
 
 logger = logging.getLogger(__name__)
 
@@ -105,7 +106,7 @@ def screen_vertical_put_spreads(ticker_list: list = None, region: str = "us", ch
         hv_20 = candidate['hv_20']
 
         try:
-            tk = yf.Ticker(ticker)
+            tk = get_provider().ticker(ticker)
 
             # --- FILTER 3: EARNINGS AVOIDANCE ---
             # Exclude if earnings in next 21 days
@@ -261,11 +262,13 @@ def screen_vertical_put_spreads(ticker_list: list = None, region: str = "us", ch
             return None
 
     # Threaded Execution for Option Chains
+    scan_started(len(trend_candidates))
     with ThreadPoolExecutor(max_workers=8) as executor:
         futures = {executor.submit(process_options, c): c for c in trend_candidates}
         for future in as_completed(futures):
             res = future.result()
             if res: results.append(res)
+            ticker_screened(res)
 
     # Sort by ROC
     results.sort(key=lambda x: x['roc'], reverse=True)
@@ -1,8 +1,7 @@
 import pandas as pd
 import pandas_ta as ta
-import yfinance as yf
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
+from functools import partial
 from datetime import datetime, timedelta
 
 # Import Strategy Logic
@@ -11,7 +10,11 @@ from option_auditor.strategies.rsi_reversal import RsiReversalStrategy
 # from option_auditor.strategies.bull_put import screen_bull_put_spreads # Use simplified logic for speed if needed
 from option_auditor.common.constants import TICKER_NAMES, SECTOR_COMPONENTS
 from option_auditor.common.data_utils import _calculate_trend_breakout_date, fetch_batch_data_safe
-from option_auditor.common.screener_utils import _get_market_regime
+from option_auditor.common.screener_utils import _get_market_regime, run_strategy_suite
+from option_auditor.common.market_panel import MarketPanel
+from option_auditor.common.market_data_provider import get_provider
+from option_auditor.common.feature_store import TickerFeatures
+from option_auditor.common.prefilter import by_market
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,20 @@ ISA_CONFIG = {
     "min_vol_usd": 20000000
 }
 
+# analyze_ticker_hardened's history and liquidity gates (UK quotes above 500 are pence), shared by all modes
+DASHBOARD_PREFILTER = (
+    ("min_bars", (200,)),
+    ("min_turnover", (20, by_market(us=ISA_CONFIG["min_vol_usd"], uk=ISA_CONFIG["min_vol_gbp"], india=ISA_CONFIG["min_vol_usd"]), 500)),
+)
+
+# analyze_ticker_hardened modes in order of preference
+DASHBOARD_MODES = ("ISA", "OPTIONS", "MEAN_REVERSION")
+
+# Indicators the modes read through TickerFeatures, batch-computed for large universes
+DASHBOARD_FEATURES = IsaStrategy.FEATURES + (
+    ("rsi", (14, "Close")), ("sma", (50, "Close")), ("rolling_min", ("Low", 10)),
+)
+
 def get_market_regime_verdict():
     """
     Returns 'GREEN', 'YELLOW', 'RED' based on SPY/VIX.
@@ -33,7 +50,7 @@ def get_market_regime_verdict():
 
         # We need SPY for the 200 SMA check
         # Let's fetch SPY efficiently
-        spy = yf.download("SPY", period="2y", progress=False, auto_adjust=True)
+        spy = get_provider().download("SPY", period="2y", progress=False, auto_adjust=True)
         if spy.empty:
              return "YELLOW", f"VIX {vix_price:.1f} (SPY Fail)"
 
@@ -86,8 +103,15 @@ def analyze_ticker_hardened(ticker, df, regime, mode="ISA"):
              high = df['High']
              low = df['Low']
 
+        # All modes (and IsaStrategy) over the same ticker share these through the feature store
+        if isinstance(df.columns, pd.MultiIndex):
+            df_features = pd.DataFrame({'High': high, 'Low': low, 'Close': close, 'Volume': volume})
+        else:
+            df_features = df
+        features = TickerFeatures(ticker, df_features)
+
         curr_price = float(close.iloc[-1])
-        avg_vol_20 = float(volume.rolling(20).mean().iloc[-1])
+        avg_vol_20 = float(features.volume_avg(20).iloc[-1])
         turnover = curr_price * avg_vol_20
 
         is_uk = ticker.endswith(".L")
@@ -107,10 +131,10 @@ def analyze_ticker_hardened(ticker, df, regime, mode="ISA"):
 
         # Helper: Calculate Common Metrics (RSI, Score)
         try:
-            rsi_series = ta.rsi(close, length=14)
+            rsi_series = features.rsi(14)
             rsi = float(rsi_series.iloc[-1]) if rsi_series is not None else 0.0
 
-            atr_series = ta.atr(high, low, close, length=14)
+            atr_series = features.atr(14)
             atr = float(atr_series.iloc[-1]) if atr_series is not None else 1.0
 
             # Score: Slope of 90d reg / ATR
@@ -151,14 +175,14 @@ def analyze_ticker_hardened(ticker, df, regime, mode="ISA"):
         elif mode == "OPTIONS" and not is_uk:
             # Re-implement lightweight Bull Put check or use technicals
             # Original code: Trend > 50SMA, RSI < 55 (Pullback), ATR > 2%
-            sma50 = close.rolling(50).mean().iloc[-1]
+            sma50 = features.sma(50).iloc[-1]
             atr_pct = (atr / curr_price) * 100
 
             is_uptrend = curr_price > sma50
             pullback = 40 < rsi < 55
 
             if is_uptrend and pullback and atr_pct > 2.0:
-                 short_strike = round(low.rolling(10).min().iloc[-1], 1)
+                 short_strike = round(features.rolling_min('Low', 10).iloc[-1], 1)
                  long_strike = round(short_strike - 5, 1)
                  result = {
                     "ticker": ticker,
@@ -171,7 +195,7 @@ def analyze_ticker_hardened(ticker, df, regime, mode="ISA"):
                     "rsi": round(rsi, 0),
                     "quality_score": round(quality_score, 2),
                     "master_color": "blue",
-                    "breakout_date": _calculate_trend_breakout_date(df)
+                    "breakout_date": _calculate_trend_breakout_date(df, ticker)
                  }
 
         elif mode == "MEAN_REVERSION":
@@ -196,7 +220,7 @@ def analyze_ticker_hardened(ticker, df, regime, mode="ISA"):
                     "rsi": round(res_mr['rsi'], 0),
                     "quality_score": round(quality_score, 2),
                     "master_color": "purple",
-                    "breakout_date": _calculate_trend_breakout_date(df)
+                    "breakout_date": _calculate_trend_breakout_date(df, ticker)
                 }
 
         return result
@@ -228,52 +252,15 @@ def screen_universal_dashboard(ticker_list: list = None, time_frame: str = "1d")
     if data.empty:
         return {"regime": regime_note, "results": []}
 
-    results = []
-
-    def process(ticker):
-        try:
-            # Extract DF
-            df = pd.DataFrame()
-            if isinstance(data.columns, pd.MultiIndex):
-                # Try both level orders (Price, Ticker) vs (Ticker, Price)
-                # fetch_batch_data_safe usually returns (Price, Ticker) or (Ticker, Price) depending on yfinance version/params
-                # But we can try to extract ticker column
-                try:
-                    df = data.xs(ticker, axis=1, level=1).copy()
-                except KeyError:
-                    try:
-                        df = data.xs(ticker, axis=1, level=0).copy()
-                    except KeyError:
-                         pass
-            else:
-                df = data.copy() # Only if single ticker?
-
-            df = df.dropna(how='all')
-
-            # Check ISA Fit
-            res_isa = analyze_ticker_hardened(ticker, df, regime_status, mode="ISA")
-            if res_isa: return res_isa
-
-            # Check Options Fit (If US)
-            if not ticker.endswith(".L"):
-                res_opt = analyze_ticker_hardened(ticker, df, regime_status, mode="OPTIONS")
-                if res_opt: return res_opt
-
-            # Check Mean Reversion
-            res_mr = analyze_ticker_hardened(ticker, df, regime_status, mode="MEAN_REVERSION")
-            if res_mr: return res_mr
-
-            return None
-
-        except:
-            return None
+    # 4. ONE PASS: every mode sees the same frame and shares its indicators through the feature store
+    default_ticker = ticker_list[0] if len(ticker_list) == 1 else None
+    panel = MarketPanel.from_frame(data, default_ticker=default_ticker)
+    modes = {mode: partial(analyze_ticker_hardened, regime=regime_status, mode=mode) for mode in DASHBOARD_MODES}
+    scans = run_strategy_suite(modes, ticker_list=ticker_list, panel=panel, features=DASHBOARD_FEATURES,
+                               prefilter=DASHBOARD_PREFILTER)
 
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        futures = {executor.submit(process, t): t for t in ticker_list}
-        for future in as_completed(futures):
-            res = future.result()
-            if res:
-                results.append(res)
+    # First fit wins: ISA, then Options (US only), then Mean Reversion
+    results = [next(scan[mode] for mode in DASHBOARD_MODES if scan[mode]) for scan in scans]
 
     results.sort(key=lambda x: x.get('quality_score', 0), reverse=True)
 
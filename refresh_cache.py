@@ -34,7 +34,7 @@ def refresh_all():
         logger.info("Refreshing S&P 500 cache (market_scan_v1)...")
         sp500 = get_sp500_tickers()
         if sp500:
-             get_cached_market_data(sp500, period="2y", cache_name="market_scan_v1", force_refresh=True)
+             get_cached_market_data(sp500, period="2y", cache_name="market_scan_v1", force_refresh=True, incremental=True)
         else:
             logger.warning("No S&P 500 tickers found.")
     except Exception as e:
@@ -45,7 +45,7 @@ def refresh_all():
         logger.info("Refreshing US Liquid cache (market_scan_us_liquid)...")
         us_stocks = get_united_states_stocks()
         if us_stocks:
-            get_cached_market_data(us_stocks, period="1y", cache_name="market_scan_us_liquid", force_refresh=True)
+            get_cached_market_data(us_stocks, period="1y", cache_name="market_scan_us_liquid", force_refresh=True, incremental=True)
         else:
             logger.warning("No US stocks found.")
     except Exception as e:
@@ -56,7 +56,7 @@ def refresh_all():
         logger.info("Refreshing India cache (market_scan_india)...")
         india = get_indian_tickers()
         if india:
-            get_cached_market_data(india, period="2y", cache_name="market_scan_india", force_refresh=True)
+            get_cached_market_data(india, period="2y", cache_name="market_scan_india", force_refresh=True, incremental=True)
         else:
             logger.warning("No India tickers found.")
     except Exception as e:
@@ -67,7 +67,7 @@ def refresh_all():
         logger.info("Refreshing UK cache (market_scan_uk)...")
         uk = get_uk_tickers()
         if uk:
-             get_cached_market_data(uk, period="2y", cache_name="market_scan_uk", force_refresh=True)
+             get_cached_market_data(uk, period="2y", cache_name="market_scan_uk", force_refresh=True, incremental=True)
         else:
             logger.warning("No UK tickers found.")
     except Exception as e:
@@ -78,7 +78,7 @@ def refresh_all():
         logger.info("Refreshing Europe cache (market_scan_europe)...")
         euro = get_uk_euro_tickers()
         if euro:
-             get_cached_market_data(euro, period="2y", cache_name="market_scan_europe", force_refresh=True)
+             get_cached_market_data(euro, period="2y", cache_name="market_scan_europe", force_refresh=True, incremental=True)
         else:
             logger.warning("No Europe tickers found.")
     except Exception as e:
@@ -38,6 +38,48 @@ def prevent_background_scheduler():
     with patch('webapp.services.scheduler_service.start_scheduler') as mock:
         yield mock
 
+@pytest.fixture(autouse=True)
+def clear_loaded_frame_cache():
+    """Keep decoded cache files from leaking between tests through the process-level frame cache."""
+    from option_auditor.common.frame_cache import loaded_frame_cache
+    loaded_frame_cache.clear()
+    yield
+    loaded_frame_cache.clear()
+
+@pytest.fixture(autouse=True)
+def clear_feature_store():
+    """Indicator series are cached per (ticker, data version); keep mocked indicators from leaking between tests."""
+    from option_auditor.common.feature_store import feature_store
+    feature_store.clear()
+    yield
+    feature_store.clear()
+
+@pytest.fixture(autouse=True)
+def reset_indicator_streams():
+    """start_scheduler turns streaming on for the process; don't carry it (or its state) into other tests."""
+    from option_auditor.common.indicator_stream import indicator_streams
+    enabled = indicator_streams.enabled
+    yield
+    indicator_streams.enabled = enabled
+    indicator_streams.clear()
+
+@pytest.fixture(autouse=True)
+def reset_result_cache():
+    """Incremental screening can be turned on for the process; don't reuse results across tests."""
+    from option_auditor.common.result_cache import result_cache
+    enabled = result_cache.enabled
+    yield
+    result_cache.enabled = enabled
+    result_cache.clear()
+
+@pytest.fixture(autouse=True)
+def reset_adaptive_downloader():
+    """Adaptive chunk sizes and rate-limiter debt persist per process; start each test fresh."""
+    from option_auditor.common.downloader import reset_download_state
+    reset_download_state()
+    yield
+    reset_download_state()
+
 @pytest.fixture
 def app():
     """Create and configure a new app instance for each test."""
@@ -187,7 +187,7 @@ def test_screen_sectors_coverage(mock_screen):
          assert len(results) == 1
          assert results[0]["ticker"] == "TEST"
 
-@patch('option_auditor.strategies.bull_put.yf.Ticker')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
 def test_screen_bull_put_spreads_logic(mock_ticker_cls):
     mock_ticker = MagicMock()
     mock_ticker_cls.return_value = mock_ticker
@@ -220,7 +220,7 @@ def test_screen_bull_put_spreads_logic(mock_ticker_cls):
         assert len(results) == 1
         assert results[0]['ticker'] == "TEST"
 
-@patch('option_auditor.common.screener_utils.yf.Ticker')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
 def test_screen_mms_ote_bearish(mock_ticker_cls):
     mock_ticker = MagicMock()
     mock_ticker_cls.return_value = mock_ticker
@@ -285,9 +285,10 @@ class TestScreenerCoverageExtended:
         # "49m" maps to "5m" interval in screener_utils
         assert call_args['interval'] == '5m'
         # assert call_args['period'] == '1mo' # Period might also differ
+        # Weekly bars are derived from daily downloads, monthly ones are downloaded natively
         _screen_tickers(tickers, 30, 50, "1wk")
         call_args = mock_download.call_args[1]
-        assert call_args['interval'] == '1wk'
+        assert call_args['interval'] == '1d'
         assert call_args['period'] == '2y'
         _screen_tickers(tickers, 30, 50, "1mo")
         call_args = mock_download.call_args[1]
@@ -316,7 +317,7 @@ class TestScreenerCoverageExtended:
         assert results[0]['ticker'] == 'AAPL'
 
     @patch('yfinance.download')
-    @patch('option_auditor.strategies.market.yf.Ticker')
+    @patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
     def test_screen_tickers_pe_ratio(self, mock_ticker, mock_download):
         mock_df = create_mock_data(rows=60)
         columns = pd.MultiIndex.from_product([['AAPL'], mock_df.columns])
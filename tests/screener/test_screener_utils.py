@@ -1,6 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
+import pandas_ta as ta
 from unittest.mock import MagicMock, patch
 from option_auditor.common.screener_utils import (
     ScreeningRunner,
@@ -10,9 +11,14 @@ from option_auditor.common.screener_utils import (
     _norm_cdf,
     _calculate_put_delta,
     _get_filtered_sp500,
-    run_screening_strategy
+    run_screening_strategy,
+    run_strategy_suite,
+    StrategySuite
 )
 from option_auditor.common.constants import TICKER_NAMES
+from option_auditor.common.feature_store import TickerFeatures
+from option_auditor.common.market_panel import MarketPanel
+from option_auditor.common.scan_stream import stream_scan
 
 def test_constants_availability():
     assert DEFAULT_RSI_LENGTH == 14
@@ -217,8 +223,8 @@ def test_screening_runner_fetch_data_logic(mock_cache, mock_fetch):
 @patch("option_auditor.common.screener_utils.ScreeningRunner.run")
 def test_run_screening_strategy_wrappers(mock_run):
     # Mock the internal run call to execute the passed wrapper function
-    def side_effect(wrapper_func):
-        # Simulate processing one ticker
+    def side_effect(wrapper_func, **kwargs):
+        # Simulate processing one ticker (panel, features, lookback etc. are not used here)
         return [wrapper_func("AAPL", pd.DataFrame())]
 
     mock_run.side_effect = side_effect
@@ -241,3 +247,80 @@ def test_run_screening_strategy_wrappers(mock_run):
         sorting_key=lambda x: x['ticker']
     )
     assert len(results_sorted) == 1
+
+# --- Tests for run_strategy_suite ---
+class TrendStrategy:
+    FEATURES = (("atr", (14,)), ("sma", (50, "Close")))
+    LOOKBACK = 120
+
+    def __init__(self, ticker, df, check_mode=False):
+        self.ticker, self.df = ticker, df
+
+    def analyze(self):
+        features = TickerFeatures(self.ticker, self.df)
+        if self.df["Close"].iloc[-1] > features.sma(50).iloc[-1]:
+            return {"bars": len(self.df), "atr": features.atr(14).iloc[-1]}
+
+
+class VolatilityStrategy(TrendStrategy):
+    FEATURES = (("atr", (14,)),)
+    LOOKBACK = 60
+
+    def analyze(self):
+        return {"atr": TickerFeatures(self.ticker, self.df).atr(14).iloc[-1]}
+
+
+def test_run_strategy_suite_merges_one_pass_per_ticker():
+    dates = pd.date_range("2023-01-02", periods=300, freq="B")
+    close = {"UP": np.linspace(50, 150, 300), "DOWN": np.linspace(150, 50, 300)}
+    panel = MarketPanel.from_frame(pd.concat({t: pd.DataFrame({
+        "Open": c, "High": c * 1.01, "Low": c * 0.99, "Close": c, "Volume": 1e6,
+    }, index=dates) for t, c in close.items()}, axis=1))
+
+    suite = StrategySuite({"trend": TrendStrategy, "vol": VolatilityStrategy})
+    assert suite.features == (("atr", (14,)), ("sma", (50, "Close")))
+    assert suite.lookback == 120
+
+    with patch("option_auditor.common.feature_store.ta.atr", wraps=ta.atr) as mock_atr:
+        results = run_strategy_suite({"trend": TrendStrategy, "vol": VolatilityStrategy}, ticker_list=["UP", "DOWN"], panel=panel)
+    # The strategies share one frame per ticker, so ATR is computed once per ticker
+    assert mock_atr.call_count == 2
+
+    by_ticker = {r["ticker"]: r for r in results}
+    assert by_ticker["UP"]["trend"]["bars"] == 120
+    assert by_ticker["UP"]["trend"]["atr"] == by_ticker["UP"]["vol"]["atr"]
+    assert by_ticker["DOWN"]["trend"] is None and by_ticker["DOWN"]["vol"] is not None
+
+
+# --- Tests for streamed scans ---
+def test_streamed_runner_scan_sends_rows_progress_and_results():
+    dates = pd.date_range("2023-01-02", periods=60, freq="B")
+    tickers = [f"T{i}" for i in range(30)]
+    panel = MarketPanel.from_frame(pd.concat({t: pd.DataFrame({
+        "Close": np.linspace(10, 20 + i, 60), "Volume": 1e6,
+    }, index=dates) for i, t in enumerate(tickers)}, axis=1))
+
+    def strategy(ticker, df):
+        if int(ticker[1:]) % 2 == 0:
+            return {"ticker": ticker, "close": df["Close"].iloc[-1]}
+
+    def scan():
+        results = ScreeningRunner(ticker_list=tickers).run(strategy, panel=panel)
+        return sorted(results, key=lambda r: r["close"], reverse=True)
+
+    cached = []
+    events = list(stream_scan(scan, on_done=cached.append).events(keepalive=5))
+
+    rows = [data["ticker"] for event, data in events if event == "row"]
+    progress = [data for event, data in events if event == "progress"]
+    assert sorted(rows) == sorted(t for t in tickers if int(t[1:]) % 2 == 0)
+    assert progress == [{"screened": 0, "total": 30}, {"screened": 25, "total": 30}, {"screened": 30, "total": 30}]
+    assert events[-1] == ("done", cached[0])
+    assert [r["ticker"] for r in cached[0]][:2] == ["T28", "T26"]
+
+
+def test_streamed_scan_reports_errors():
+    def scan():
+        raise ValueError("provider down")
+
+    assert list(stream_scan(scan).events(keepalive=5)) == [("error", "provider down")]
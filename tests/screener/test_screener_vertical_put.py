@@ -14,7 +14,7 @@ def create_trend_df():
     return df
 
 @patch('option_auditor.strategies.vertical_spreads.fetch_batch_data_safe')
-@patch('option_auditor.strategies.vertical_spreads.yf.Ticker')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
 @patch('option_auditor.strategies.vertical_spreads.resolve_region_tickers')
 def test_screen_vertical_put_spreads_refactor(mock_resolve, mock_ticker_cls, mock_fetch):
     # Setup Ticker List
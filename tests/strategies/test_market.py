@@ -74,7 +74,7 @@ def test_screen_market_with_sector(mock_resolve, mock_runner_cls, sample_df):
     assert len(results["Technology (TECH)"]) == 1
     assert results["Technology (TECH)"][0]['ticker'] == 'AAPL'
 
-@patch('option_auditor.strategies.market.yf.Ticker')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
 def test_enrich_with_fundamentals(mock_ticker):
     mock_info = {'trailingPE': 20.0, 'forwardPE': 25.0, 'sector': 'Tech'}
     mock_ticker.return_value.info = mock_info
@@ -4,7 +4,7 @@ import pandas as pd
 import numpy as np
 from option_auditor.strategies.monte_carlo import screen_monte_carlo_forecast
 
-@patch('option_auditor.strategies.monte_carlo.yf.download')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.download')
 def test_screen_monte_carlo_forecast(mock_download):
     # Setup mock data
     dates = pd.date_range(start='2023-01-01', periods=100, freq='D')
@@ -5,7 +5,7 @@ import numpy as np
 from datetime import date
 from option_auditor.strategies.options_only import screen_options_only_strategy
 
-@patch('option_auditor.strategies.options_only.yf.Ticker')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
 @patch('option_auditor.strategies.options_only.os.path.exists')
 def test_screen_options_only_green_light(mock_exists, mock_ticker):
     # Mock CSV existence (False to trigger fallback list)
@@ -72,7 +72,7 @@ def test_screen_options_only_green_light(mock_exists, mock_ticker):
     # Credit 1.0, Width 5.0, Risk 4.0. ROC = 25%
     assert res['roc'] == 25.0
 
-@patch('option_auditor.strategies.options_only.yf.Ticker')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
 @patch('option_auditor.strategies.options_only.os.path.exists')
 def test_screen_options_only_low_roc(mock_exists, mock_ticker):
     mock_exists.return_value = False
@@ -4,7 +4,7 @@ import pandas as pd
 from option_auditor.screener import screen_bull_put_spreads
 from datetime import date, timedelta
 
-@patch('option_auditor.strategies.bull_put.yf.Ticker')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
 def test_screen_bull_put_valid(mock_ticker, mock_market_data):
     # Valid Bull Put:
     # 1. Price > SMA 50
@@ -64,7 +64,7 @@ def test_screen_bull_put_valid(mock_ticker, mock_market_data):
         assert res['long_strike'] == 90.0
         assert res['roi_pct'] > 15.0
 
-@patch('option_auditor.strategies.bull_put.yf.Ticker')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
 def test_screen_bull_put_bearish_trend(mock_ticker, mock_market_data):
     df = mock_market_data(days=250, price=100.0)
     # Price < SMA 50
@@ -78,7 +78,7 @@ def test_screen_bull_put_bearish_trend(mock_ticker, mock_market_data):
     results = screen_bull_put_spreads(ticker_list=["BEAR"], check_mode=False) # check_mode False enforces filters
     assert len(results) == 0
 
-@patch('option_auditor.strategies.bull_put.yf.Ticker')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
 def test_screen_bull_put_no_options(mock_ticker, mock_market_data):
     df = mock_market_data(days=250, price=100.0)
     mock_instance = MagicMock()
@@ -13,7 +13,7 @@ class TestFortressMasterScreener(unittest.TestCase):
         }
         self.screener = FortressMasterScreener(self.mock_regime, check_mode=True)
 
-    @patch("option_auditor.strategies.master.yf.download")
+    @patch("option_auditor.common.market_data_provider.YFinanceProvider.download")
     def test_get_detailed_market_regime_bullish(self, mock_download):
         # Mock SPY and VIX data for Bullish Regime
         dates = pd.date_range(end=pd.Timestamp.now(), periods=300)
@@ -32,7 +32,7 @@ class TestFortressMasterScreener(unittest.TestCase):
         self.assertIn("BULLISH", regime_data["regime"])
         self.assertIsNotNone(regime_data["spy_history"])
 
-    @patch("option_auditor.strategies.master.yf.download")
+    @patch("option_auditor.common.market_data_provider.YFinanceProvider.download")
     def test_get_detailed_market_regime_bearish(self, mock_download):
         dates = pd.date_range(end=pd.Timestamp.now(), periods=300)
         spy_prices = np.linspace(500, 300, 300) # Downtrend
@@ -142,6 +142,46 @@ class TestFortressMasterScreener(unittest.TestCase):
         self.assertEqual(results[0]['Ticker'], "AAPL")
         mock_regime.assert_called_once()
 
+    def test_rescan_with_moved_vix_reuses_results(self):
+        from option_auditor.common.market_panel import MarketPanel
+        from option_auditor.common.result_cache import result_cache
+        from option_auditor.common.screener_utils import ScreeningRunner
+
+        dates = pd.date_range(end="2024-06-14", periods=260, freq="B")
+        frames = {t: pd.DataFrame({
+            "Open": 100.0, "High": 101.0, "Low": 99.0, "Close": np.linspace(90, 110 + i, 260), "Volume": 5e6,
+        }, index=dates) for i, t in enumerate(["AAPL", "MSFT"])}
+        panel = MarketPanel.from_frame(pd.concat(frames, axis=1))
+        spy = pd.Series(np.linspace(400, 500, 260), index=dates)
+        moved_spy = spy.copy()
+        moved_spy.iloc[-1] += 3.0  # today's bar, still trading
+
+        class PanelRunner(ScreeningRunner):
+            def run(self, *args, **kwargs):
+                return super().run(*args, panel=panel, **kwargs)
+
+        screened = []
+
+        def analyze(self, ticker, df):
+            screened.append(ticker)
+            return {"Ticker": ticker, "Score": 50}
+
+        regimes = [{"regime": "🟢 BULLISH (Aggressive)", "spy_history": spy, "vix": 15.0},
+                   {"regime": "🟢 BULLISH (Aggressive)", "spy_history": moved_spy, "vix": 17.5}]
+        with patch("option_auditor.strategies.master.get_detailed_market_regime", side_effect=regimes), \
+             patch("option_auditor.strategies.master.last_closed_session",
+                   return_value=pd.Timestamp("2024-06-13 16:00", tz="America/New_York")), \
+             patch("option_auditor.strategies.master.ScreeningRunner", PanelRunner), \
+             patch.object(FortressMasterScreener, "analyze", analyze), \
+             patch.object(result_cache, "enabled", True):
+            first = screen_master_convergence(ticker_list=["AAPL", "MSFT"], time_frame="1d")
+            self.assertEqual(sorted(screened), ["AAPL", "MSFT"])
+
+            screened.clear()
+            second = screen_master_convergence(ticker_list=["AAPL", "MSFT"], time_frame="1d")
+            self.assertEqual(screened, [])
+        self.assertEqual(sorted(r["Ticker"] for r in first), sorted(r["Ticker"] for r in second))
+
 
 # --- Migrated from test_strategy_master_coverage.py ---
 
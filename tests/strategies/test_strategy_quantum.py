@@ -122,3 +122,26 @@ def test_quantum_fallback_and_nan(mock_hurst, mock_entropy, mock_kalman, mock_ve
         json.dumps(res)
     except ValueError as e:
         pytest.fail(f"JSON Serialization Failed: {e}")
+
+def test_large_universe_uses_batch_physics():
+    from option_auditor.common.indicator_engine import ENGINE_MIN_TICKERS
+    from option_auditor.common.market_panel import MarketPanel
+    from option_auditor.strategies.math_utils import calculate_hurst, shannon_entropy
+
+    rng = np.random.default_rng(3)
+    dates = pd.date_range("2023-01-02", periods=250, freq="B")
+    frames = {}
+    for i in range(ENGINE_MIN_TICKERS):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 250)))
+        frames[f"T{i}"] = pd.DataFrame({"Open": close, "High": close * 1.01, "Low": close * 0.99,
+                                        "Close": close, "Volume": 1e6}, index=dates)
+    panel = MarketPanel.from_frame(pd.concat(frames, axis=1))
+
+    with patch('option_auditor.strategies.quantum.calculate_hurst') as mock_hurst:
+        results = screen_quantum_setups(ticker_list=list(frames), panel=panel)
+    mock_hurst.assert_not_called()
+    assert len(results) == ENGINE_MIN_TICKERS
+
+    res = next(r for r in results if r['ticker'] == "T5")
+    assert res['hurst'] == round(calculate_hurst(frames["T5"]['Close']), 2)
+    assert res['entropy'] == round(shannon_entropy(frames["T5"]['Close']), 2)
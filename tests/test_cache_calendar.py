@@ -0,0 +1,171 @@
+import logging
+import os
+import sys
+from datetime import datetime, date
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from option_auditor.common.data_utils import (
+    get_cached_market_data, last_closed_session, cache_exchanges, _calendar_cache_freshness,
+    is_trading_day, _exchange_holidays, _warn_no_nse_calendar,
+)
+from option_auditor.common.frame_cache import loaded_frame_cache
+
+
+def _make_frame(tickers, end, periods=5):
+    dates = pd.bdate_range(end=end, periods=periods)
+    frames = {t: pd.DataFrame({
+        "Open": 1.0, "High": 2.0, "Low": 0.5,
+        "Close": np.arange(periods, dtype=float) + i,
+        "Volume": 100.0,
+    }, index=dates) for i, t in enumerate(tickers)}
+    return pd.concat(frames, axis=1)
+
+
+def _set_written(path, when):
+    ns = pd.Timestamp(when).value
+    os.utime(path, ns=(ns, ns))
+
+
+@pytest.fixture
+def mock_cache_dir(tmp_path):
+    d = tmp_path / "cache_test"
+    d.mkdir()
+    loaded_frame_cache.clear()
+    with patch("option_auditor.common.data_utils.CACHE_DIR", str(d)):
+        yield str(d)
+    loaded_frame_cache.clear()
+
+
+def test_last_closed_session_skips_weekends_and_holidays():
+    # Saturday after Good Friday 2025 -> Thursday's close
+    close = last_closed_session("NYSE", pd.Timestamp("2025-04-19 12:00", tz="UTC"))
+    assert close == pd.Timestamp("2025-04-17 16:00", tz="America/New_York")
+
+    # Before the session has settled the previous day is the latest close
+    close = last_closed_session("NYSE", pd.Timestamp("2025-04-22 20:10", tz="UTC"))
+    assert close.date() == date(2025, 4, 21)
+    close = last_closed_session("NYSE", pd.Timestamp("2025-04-22 20:31", tz="UTC"))
+    assert close.date() == date(2025, 4, 22)
+
+    # Easter Monday is an LSE holiday
+    close = last_closed_session("LSE", datetime(2025, 4, 21, 18, 0))
+    assert close.date() == date(2025, 4, 17)
+
+
+def test_cache_exchanges_from_tickers_and_name():
+    assert cache_exchanges("market_scan_v1", ["AAPL", "VOD.L", "RELIANCE.NS"]) == {"NYSE", "LSE", "NSE"}
+    assert cache_exchanges("market_scan_india") == {"NSE"}
+    assert cache_exchanges("market_scan_uk") == {"LSE"}
+    assert cache_exchanges("sp500") == {"NYSE"}
+
+
+def test_calendar_freshness_over_weekend(mock_cache_dir):
+    path = os.path.join(mock_cache_dir, "sp500.parquet")
+    _make_frame(["AAPL"], end="2025-04-11").to_parquet(path)
+    _set_written(path, "2025-04-11 21:00Z")  # Friday after the close
+
+    # Still current on Sunday night and Monday before the close
+    assert _calendar_cache_freshness(path, "sp500", ["AAPL"], now=pd.Timestamp("2025-04-13 23:00Z")) is True
+    assert _calendar_cache_freshness(path, "sp500", ["AAPL"], now=pd.Timestamp("2025-04-14 19:00Z")) is True
+    # Monday's session has settled
+    assert _calendar_cache_freshness(path, "sp500", ["AAPL"], now=pd.Timestamp("2025-04-14 21:00Z")) is False
+
+
+def test_calendar_freshness_partial_bar(mock_cache_dir):
+    path = os.path.join(mock_cache_dir, "sp500.parquet")
+    _make_frame(["AAPL"], end="2025-04-14").to_parquet(path)
+    _set_written(path, "2025-04-14 15:00Z")  # Monday, mid-session
+
+    assert _calendar_cache_freshness(path, "sp500", ["AAPL"], now=pd.Timestamp("2025-04-14 18:00Z")) is True
+    assert _calendar_cache_freshness(path, "sp500", ["AAPL"], now=pd.Timestamp("2025-04-14 21:00Z")) is False
+
+
+def test_stale_calendar_cache_refreshes_and_falls_back(mock_cache_dir):
+    tickers = ["AAPL", "MSFT"]
+    path = os.path.join(mock_cache_dir, "market_scan_v1.parquet")
+    _make_frame(tickers, end="2025-04-11").to_parquet(path)
+    _set_written(path, "2025-04-11 21:00Z")
+
+    fresh = _make_frame(tickers, end=pd.Timestamp.now().normalize())
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", return_value=fresh) as mock_fetch:
+        result = get_cached_market_data(tickers, cache_name="market_scan_v1")
+        assert mock_fetch.call_count == 1
+        pd.testing.assert_frame_equal(result, fresh, check_freq=False)
+
+        # Written just now: current until the next session settles
+        get_cached_market_data(tickers, cache_name="market_scan_v1")
+        assert mock_fetch.call_count == 1
+
+    # A failed refresh serves the previous session's bars instead of nothing
+    _set_written(path, "2025-04-11 21:00Z")
+    loaded_frame_cache.clear()
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", return_value=pd.DataFrame()):
+        result = get_cached_market_data(tickers, cache_name="market_scan_v1")
+    assert not result.empty
+
+
+def test_lookup_only_serves_cache_behind_the_calendar(mock_cache_dir):
+    tickers = ["AAPL", "MSFT"]
+    path = os.path.join(mock_cache_dir, "market_scan_v1.parquet")
+    _make_frame(tickers, end="2025-04-11").to_parquet(path)
+    # Written a few hours ago, before a session that has since closed
+    _set_written(path, pd.Timestamp.now(tz="UTC") - pd.Timedelta(hours=5))
+
+    with patch("option_auditor.common.data_utils._calendar_cache_freshness", return_value=False), \
+         patch("option_auditor.common.data_utils.fetch_batch_data_safe") as mock_fetch:
+        result = get_cached_market_data(tickers, cache_name="market_scan_v1", lookup_only=True)
+        assert not result.empty and mock_fetch.call_count == 0
+
+        # Past the stale window a lookup finds nothing
+        _set_written(path, pd.Timestamp.now(tz="UTC") - pd.Timedelta(hours=50))
+        loaded_frame_cache.clear()
+        assert get_cached_market_data(tickers, cache_name="market_scan_v1", lookup_only=True).empty
+        assert mock_fetch.call_count == 0
+
+
+def test_holidays_beyond_the_listed_years():
+    # Good Friday 2026 (NYSE, LSE) and the Boxing Day substitute Monday 2026 (LSE)
+    close = last_closed_session("NYSE", pd.Timestamp("2026-04-04 12:00", tz="UTC"))
+    assert close.date() == date(2026, 4, 2)
+    close = last_closed_session("LSE", pd.Timestamp("2026-04-06 18:00", tz="UTC"))
+    assert close.date() == date(2026, 4, 2)
+    close = last_closed_session("LSE", pd.Timestamp("2026-12-28 18:00", tz="UTC"))
+    assert close.date() == date(2026, 12, 24)
+    # Thanksgiving 2027 falls on the 25th
+    close = last_closed_session("NYSE", pd.Timestamp("2027-11-25 23:00", tz="UTC"))
+    assert close.date() == date(2027, 11, 24)
+
+
+@pytest.fixture
+def fresh_holidays():
+    _exchange_holidays.cache_clear()
+    _warn_no_nse_calendar.cache_clear()
+    yield
+    _exchange_holidays.cache_clear()
+    _warn_no_nse_calendar.cache_clear()
+
+
+def test_nse_holidays_2026_without_holidays_package(fresh_holidays, caplog):
+    with patch.dict(sys.modules, {"holidays": None}), caplog.at_level(logging.WARNING):
+        # Republic Day 2026 is a Monday: Friday's session is the last closed one
+        assert not is_trading_day("NSE", date(2026, 1, 26))
+        close = last_closed_session("NSE", pd.Timestamp("2026-01-26 12:00", tz="UTC"))
+        assert close.date() == date(2026, 1, 23)
+        assert not is_trading_day("NSE", date(2026, 10, 2))
+        assert is_trading_day("NSE", date(2025, 3, 13))
+    warnings = [r for r in caplog.records if "holidays package" in r.getMessage()]
+    assert len(warnings) == 1
+
+
+def test_nse_lunar_holidays_2026_from_holidays_package(fresh_holidays):
+    holidays_lib = MagicMock()
+    holidays_lib.financial_holidays.return_value = {date(2026, 3, 3): "Holi"}
+    with patch.dict(sys.modules, {"holidays": holidays_lib}):
+        assert not is_trading_day("NSE", date(2026, 3, 3))
+        close = last_closed_session("NSE", pd.Timestamp("2026-03-03 12:00", tz="UTC"))
+    assert close.date() == date(2026, 3, 2)
+    holidays_lib.financial_holidays.assert_any_call("XNSE", years=2026)
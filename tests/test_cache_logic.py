@@ -89,3 +89,130 @@ def test_screener_uses_cache():
         # For short lists, logic skips cache and goes straight to live fetch
         # So we verify fetch_batch_data_safe was called
         assert mock_fetch.call_count > 0, "Expected fetch_batch_data_safe to be called for short list"
+
+def _make_batch(tickers, dates, start_price=100.0):
+    cols = pd.MultiIndex.from_product([tickers, ["Open", "High", "Low", "Close", "Volume"]])
+    data = {}
+    for i, t in enumerate(tickers):
+        base = start_price + i * 10 + pd.Series(range(len(dates)), dtype=float).values
+        for field in ["Open", "High", "Low", "Close"]:
+            data[(t, field)] = base
+        data[(t, "Volume")] = [1_000_000.0] * len(dates)
+    return pd.DataFrame(data, index=dates, columns=cols)
+
+def test_incremental_refresh_fetches_only_missing_bars(mock_cache_dir):
+    from option_auditor.common.data_utils import save_atomic
+
+    cache_path = os.path.join(mock_cache_dir, "market_scan_inc.parquet")
+    old_dates = pd.date_range("2024-01-01", periods=10, freq="B")
+    save_atomic(_make_batch(["AAPL", "MSFT"], old_dates), cache_path)
+
+    new_dates = pd.date_range(old_dates[-1], periods=3, freq="B")
+    delta = _make_batch(["AAPL", "MSFT"], new_dates, start_price=500.0)
+    fresh = _make_batch(["NVDA"], old_dates.append(new_dates[1:]))
+
+    def fake_fetch(tickers, period="1y", interval="1d", chunk_size=30, threads=True, raise_on_error=False, start=None):
+        return delta if start is not None else fresh
+
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", side_effect=fake_fetch) as mock_fetch:
+        result = get_cached_market_data(["AAPL", "MSFT", "NVDA"], period="2y", cache_name="market_scan_inc",
+                                        force_refresh=True, incremental=True)
+
+    starts = [c.kwargs.get("start") for c in mock_fetch.call_args_list]
+    assert pd.Timestamp(old_dates[-2]) in starts  # Delta fetch from the last settled cached bar
+    assert None in starts                          # Full fetch only for the uncached ticker
+    full_call = [c for c in mock_fetch.call_args_list if c.kwargs.get("start") is None][0]
+    assert full_call.args[0] == ["NVDA"]
+
+    assert set(result.columns.get_level_values(0)) == {"AAPL", "MSFT", "NVDA"}
+    assert len(result) == 12
+    # Re-fetched last bar overrides the cached (possibly partial) one
+    assert result[("AAPL", "Close")].loc[old_dates[-1]] == 500.0
+    assert result[("AAPL", "Close")].loc[old_dates[0]] == 100.0
+
+    on_disk = pd.read_parquet(cache_path)
+    assert len(on_disk) == 12
+
+def test_incremental_refresh_redownloads_readjusted_tickers(mock_cache_dir):
+    from option_auditor.common.data_utils import save_atomic
+
+    cache_path = os.path.join(mock_cache_dir, "market_scan_adj.parquet")
+    old_dates = pd.date_range("2024-01-01", periods=10, freq="B")
+    save_atomic(_make_batch(["AAPL", "MSFT"], old_dates), cache_path)
+
+    # Overlap from the settled bar: MSFT unchanged, AAPL halved (2:1 split re-adjusted its history)
+    new_dates = pd.date_range(old_dates[-2], periods=4, freq="B")
+    delta = _make_batch(["AAPL", "MSFT"], new_dates, start_price=108.0)
+    for field in ["Open", "High", "Low", "Close"]:
+        delta[("AAPL", field)] = delta[("AAPL", field)] / 2
+    full_aapl = _make_batch(["AAPL"], old_dates.append(new_dates[2:]), start_price=50.0)
+
+    def fake_fetch(tickers, period="1y", interval="1d", chunk_size=30, threads=True, raise_on_error=False, start=None):
+        return delta[tickers] if start is not None else full_aapl
+
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", side_effect=fake_fetch) as mock_fetch:
+        result = get_cached_market_data(["AAPL", "MSFT"], period="2y", cache_name="market_scan_adj",
+                                        force_refresh=True, incremental=True)
+
+    full_call = [c for c in mock_fetch.call_args_list if c.kwargs.get("start") is None]
+    assert len(full_call) == 1 and full_call[0].args[0] == ["AAPL"]
+    # AAPL is entirely on the new basis, MSFT keeps its cached history plus the new bars
+    assert result[("AAPL", "Close")].loc[old_dates[0]] == 50.0
+    assert result[("MSFT", "Close")].loc[old_dates[0]] == 110.0
+    assert result[("MSFT", "Close")].loc[new_dates[-1]] == 121.0
+    assert len(result) == 12
+
+def test_incremental_refresh_drops_tickers_left_out_of_the_universe(mock_cache_dir):
+    from option_auditor.common.data_utils import save_atomic
+
+    cache_path = os.path.join(mock_cache_dir, "market_scan_drop.parquet")
+    old_dates = pd.date_range("2024-01-01", periods=10, freq="B")
+    save_atomic(_make_batch(["AAPL", "MSFT", "DELISTED"], old_dates), cache_path)
+
+    delta = _make_batch(["AAPL", "MSFT"], pd.date_range(old_dates[-2], periods=3, freq="B"), start_price=108.0)
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", return_value=delta):
+        result = get_cached_market_data(["AAPL", "MSFT"], period="2y", cache_name="market_scan_drop",
+                                        force_refresh=True, incremental=True)
+
+    assert set(result.columns.get_level_values(0)) == {"AAPL", "MSFT"}
+    assert set(pd.read_parquet(cache_path).columns.get_level_values(0)) == {"AAPL", "MSFT"}
+
+def test_incremental_refresh_without_cache_downloads_full(mock_cache_dir):
+    dates = pd.date_range("2024-01-01", periods=5, freq="B")
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", return_value=_make_batch(["AAPL"], dates)) as mock_fetch:
+        result = get_cached_market_data(["AAPL"], period="2y", cache_name="market_scan_new", incremental=True)
+
+    mock_fetch.assert_called_once()
+    assert "start" not in mock_fetch.call_args.kwargs
+    assert len(result) == 5
+
+def test_projection_reads_only_requested_columns(mock_cache_dir):
+    tickers = [f"T{i}" for i in range(120)]
+    dates = pd.date_range("2024-01-01", periods=5, freq="B")
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", return_value=_make_batch(tickers, dates)):
+        get_cached_market_data(tickers, cache_name="market_scan_v1")
+
+    from option_auditor.common.frame_cache import loaded_frame_cache
+    loaded_frame_cache.clear()
+
+    real_read = pd.read_parquet
+    with patch("option_auditor.common.data_utils.pd.read_parquet", side_effect=real_read) as mock_read:
+        closes = get_cached_market_data(tickers, cache_name="market_scan_v1", columns=["Close", "Volume"])
+        subset = get_cached_market_data(tickers, cache_name="market_scan_v1", tickers=["T3", "T7"], columns=["Close"])
+
+    assert set(closes.columns.get_level_values(1)) == {"Close", "Volume"}
+    assert len(closes.columns) == 240
+    assert list(subset.columns) == [("T3", "Close"), ("T7", "Close")]
+    # Projection pushed into the reader, not applied after a full decode
+    assert len(mock_read.call_args_list[0].kwargs["columns"]) == 240
+
+
+def test_projection_on_fresh_download(mock_cache_dir):
+    dates = pd.date_range("2024-01-01", periods=5, freq="B")
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", return_value=_make_batch(["AAPL", "MSFT"], dates)):
+        result = get_cached_market_data(["AAPL", "MSFT"], cache_name="portfolio_risk", columns=["Close"])
+
+    assert list(result.columns) == [("AAPL", "Close"), ("MSFT", "Close")]
+    # The cache itself keeps every field
+    full = get_cached_market_data(["AAPL", "MSFT"], cache_name="portfolio_risk")
+    assert len(full.columns) == 10
@@ -130,7 +130,7 @@ def test_calculate_trend_breakout_date_valid_trend():
     res = _calculate_trend_breakout_date(df)
     assert res == breakout_date.strftime("%Y-%m-%d")
 
-@patch("option_auditor.common.data_utils.yf.download")
+@patch("option_auditor.common.market_data_provider.YFinanceProvider.download")
 def test_fetch_batch_data_safe(mock_download):
     """Test batch fetching with chunking."""
     tickers = [f"T{i}" for i in range(35)] # More than chunk_size 30
@@ -154,7 +154,7 @@ def test_fetch_batch_data_empty():
     """Test empty ticker list returns empty DataFrame."""
     assert fetch_batch_data_safe([]).empty
 
-@patch("option_auditor.common.data_utils.yf.download")
+@patch("option_auditor.common.market_data_provider.YFinanceProvider.download")
 def test_fetch_batch_data_exception(mock_download):
     """Test exception handling during download."""
     mock_download.side_effect = Exception("Network Error")
@@ -210,7 +210,7 @@ def test_normalize_ticker():
     assert normalize_ticker(None) == "None"
     assert normalize_ticker(123) == "123"
 
-@patch("option_auditor.common.price_utils.yf.download")
+@patch("option_auditor.common.market_data_provider.YFinanceProvider.download")
 def test_fetch_live_prices_batch(mock_download):
     """Test fetching live prices for multiple symbols."""
     # Mock return DataFrame for multiple tickers
@@ -225,7 +225,7 @@ def test_fetch_live_prices_batch(mock_download):
     assert prices["AAPL"] == 150.0
     assert prices["GOOG"] == 2800.0
 
-@patch("option_auditor.common.price_utils.yf.download")
+@patch("option_auditor.common.market_data_provider.YFinanceProvider.download")
 def test_fetch_live_prices_single(mock_download):
     """Test fetching live price for a single symbol."""
     # yfinance returns simple DataFrame for single ticker
@@ -237,8 +237,8 @@ def test_fetch_live_prices_single(mock_download):
 
     assert prices["AAPL"] == 150.0
 
-@patch("option_auditor.common.price_utils.yf.Ticker")
-@patch("option_auditor.common.price_utils.yf.download")
+@patch("option_auditor.common.market_data_provider.YFinanceProvider.ticker")
+@patch("option_auditor.common.market_data_provider.YFinanceProvider.download")
 def test_fetch_live_prices_fallback(mock_download, mock_ticker):
     """Test fallback to individual fetch if batch misses."""
     # Batch returns empty or missing specific symbol
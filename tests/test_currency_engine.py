@@ -42,7 +42,7 @@ class TestCurrencyEngine(unittest.TestCase):
     # 2. fetch_exchange_rate Tests
     # -------------------------------------------------------------------------
 
-    @patch('option_auditor.common.data_utils.yf.Ticker')
+    @patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
     def test_fetch_exchange_rate_success_usdinr(self, mock_ticker_cls):
         """Test successful live fetch for USD->INR uses correct ticker and returns rate."""
         # Mock Ticker instance
@@ -60,7 +60,7 @@ class TestCurrencyEngine(unittest.TestCase):
         mock_ticker_cls.assert_called_with("USDINR=X")
         self.assertEqual(rate, 83.50)
 
-    @patch('option_auditor.common.data_utils.yf.Ticker')
+    @patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
     def test_fetch_exchange_rate_success_gbpusd(self, mock_ticker_cls):
         """Test successful live fetch for GBP->USD."""
         mock_ticker = MagicMock()
@@ -74,7 +74,7 @@ class TestCurrencyEngine(unittest.TestCase):
         mock_ticker_cls.assert_called_with("GBPUSD=X")
         self.assertEqual(rate, 1.27)
 
-    @patch('option_auditor.common.data_utils.yf.Ticker')
+    @patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
     def test_fetch_exchange_rate_empty_history(self, mock_ticker_cls):
         """Test empty history triggers fallback to FALLBACK_RATES."""
         mock_ticker = MagicMock()
@@ -85,7 +85,7 @@ class TestCurrencyEngine(unittest.TestCase):
         rate = fetch_exchange_rate('USD', 'INR')
         self.assertEqual(rate, 83.50)
 
-    @patch('option_auditor.common.data_utils.yf.Ticker')
+    @patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
     def test_fetch_exchange_rate_exception(self, mock_ticker_cls):
         """Test exception triggers fallback."""
         mock_ticker_cls.side_effect = Exception("Connection Error")
@@ -94,7 +94,7 @@ class TestCurrencyEngine(unittest.TestCase):
         # GBP -> USD fallback is 1.27
         self.assertEqual(rate, 1.27)
 
-    @patch('option_auditor.common.data_utils.yf.Ticker')
+    @patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
     def test_fetch_exchange_rate_inverse_fallback(self, mock_ticker_cls):
         """Test inverse fallback logic specifically (A->B not found, but B->A found)."""
         mock_ticker = MagicMock()
@@ -114,7 +114,7 @@ class TestCurrencyEngine(unittest.TestCase):
         self.assertEqual(fetch_exchange_rate('USD', 'USD'), 1.0)
         self.assertEqual(fetch_exchange_rate('GBP', 'GBP'), 1.0)
 
-    @patch('option_auditor.common.data_utils.yf.Ticker')
+    @patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
     def test_fetch_exchange_rate_total_failure(self, mock_ticker_cls):
         """Test total failure (no live data, no fallback) returns 1.0."""
         mock_ticker_cls.side_effect = Exception("Fail")
@@ -36,7 +36,7 @@ class TestCurrencyUtils(unittest.TestCase):
         self.assertEqual(get_currency_symbol(""), "USD")
         self.assertEqual(get_currency_symbol(None), "USD")
 
-    @patch("option_auditor.common.data_utils.yf.Ticker")
+    @patch("option_auditor.common.market_data_provider.YFinanceProvider.ticker")
     def test_fetch_exchange_rate_live_success(self, mock_ticker):
         """Test fetching live exchange rate successfully."""
         mock_instance = MagicMock()
@@ -52,7 +52,7 @@ class TestCurrencyUtils(unittest.TestCase):
         # Verify ticker construction for GBP/USD
         mock_ticker.assert_called_with("GBPUSD=X")
 
-    @patch("option_auditor.common.data_utils.yf.Ticker")
+    @patch("option_auditor.common.market_data_provider.YFinanceProvider.ticker")
     def test_fetch_exchange_rate_fallback(self, mock_ticker):
         """Test fallback to FALLBACK_RATES when live fetch fails."""
         mock_instance = MagicMock()
@@ -66,7 +66,7 @@ class TestCurrencyUtils(unittest.TestCase):
         rate = fetch_exchange_rate("GBP", "USD")
         self.assertEqual(rate, expected_rate)
 
-    @patch("option_auditor.common.data_utils.yf.Ticker")
+    @patch("option_auditor.common.market_data_provider.YFinanceProvider.ticker")
     def test_fetch_exchange_rate_fallback_inverse(self, mock_ticker):
         """Test inverse fallback calculation."""
         mock_instance = MagicMock()
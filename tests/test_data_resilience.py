@@ -5,7 +5,7 @@ import requests
 
 class TestDataResilience:
     @patch('time.sleep')  # Mock sleep to speed up test
-    @patch('option_auditor.backtest_data_loader.yf.download')
+    @patch('option_auditor.common.market_data_provider.YFinanceProvider.download')
     def test_fetch_data_retry_logic(self, mock_download, mock_sleep):
         """
         Simulate 'Connection Timeout' and 'Rate Limit Reached' errors.
@@ -0,0 +1,109 @@
+import threading
+import time
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from option_auditor.common.downloader import (
+    AdaptiveDownloader,
+    ChunkTuner,
+    TokenBucket,
+    exchange_group,
+)
+
+
+def _frame(chunk):
+    cols = pd.MultiIndex.from_product([chunk, ["Close"]])
+    return pd.DataFrame(1.0, index=pd.date_range("2024-01-01", periods=2), columns=cols)
+
+
+def test_exchange_groups():
+    assert exchange_group("AAPL") == "us"
+    assert exchange_group("VOD.L") == "uk"
+    assert exchange_group("RELIANCE.NS") == "india"
+    assert exchange_group("SAP.DE") == "eu"
+
+
+def test_token_bucket_paces_after_burst():
+    bucket = TokenBucket(rate=10.0, capacity=1.0)
+    with patch("option_auditor.common.downloader.time.sleep") as mock_sleep:
+        waits = [bucket.acquire() for _ in range(3)]
+
+    assert waits[0] == 0.0
+    assert waits[1] == pytest.approx(0.1, abs=0.01)
+    assert waits[2] == pytest.approx(0.2, abs=0.01)
+    assert mock_sleep.call_count == 2
+
+
+def test_chunk_tuner_aimd():
+    tuner = ChunkTuner(slow_seconds=5.0)
+    assert tuner.chunk_size(30) == 30
+    tuner.record(1.0, ok=False)
+    assert tuner.chunk_size(30) == 15
+    tuner.record(10.0, ok=True)  # slow
+    assert tuner.chunk_size(30) == 8
+    for _ in range(20):
+        tuner.record(1.0, ok=True)
+    assert tuner.chunk_size(30) == 30
+
+
+def test_download_runs_chunks_concurrently_and_keeps_order():
+    downloader = AdaptiveDownloader(rate_per_sec=0, max_in_flight=4)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def fetch(chunk):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return _frame(chunk)
+
+    tickers = [f"T{i:02d}" for i in range(40)]
+    frames = downloader.download(tickers, fetch, chunk_size=10)
+
+    assert peak[0] > 1
+    assert [f.columns[0][0] for f in frames] == ["T00", "T10", "T20", "T30"]
+
+
+def test_download_shrinks_chunks_after_errors():
+    downloader = AdaptiveDownloader(rate_per_sec=0, max_in_flight=1)
+    sizes = []
+
+    def fetch(chunk):
+        sizes.append(len(chunk))
+        if len(sizes) == 1:
+            raise Exception("429 Too Many Requests")
+        return _frame(chunk)
+
+    frames = downloader.download([f"T{i}" for i in range(40)], fetch, chunk_size=20)
+
+    assert sizes[0] == 20
+    assert sizes[1] == 10
+    assert sum(len(f.columns) for f in frames) == 20
+
+
+def test_download_stops_dispatching_when_aborted():
+    downloader = AdaptiveDownloader(rate_per_sec=0, max_in_flight=1)
+    calls = []
+
+    def fetch(chunk):
+        calls.append(chunk)
+        raise Exception("down")
+
+    frames = downloader.download([f"T{i}" for i in range(10)], fetch, chunk_size=2, should_abort=lambda: True)
+
+    assert frames == []
+    assert len(calls) == 1
+
+
+def test_download_raise_on_error():
+    downloader = AdaptiveDownloader(rate_per_sec=0, max_in_flight=2)
+
+    def fetch(chunk):
+        raise ValueError("bad auth")
+
+    with pytest.raises(ValueError):
+        downloader.download(["A", "B"], fetch, chunk_size=1, raise_on_error=True)
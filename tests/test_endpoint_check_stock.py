@@ -144,7 +144,7 @@ class TestUnifiedStockCheck(unittest.TestCase):
         self.assertEqual(data['user_entry_price'], 100.0)
 
     @patch('webapp.services.check_service.screener.screen_trend_followers_isa')
-    @patch('webapp.blueprints.screener_routes.yf.download')
+    @patch('option_auditor.common.market_data_provider.YFinanceProvider.download')
     def test_check_stock_historical_entry(self, mock_download, mock_screen):
         """Test fetching historical price when entry_date is provided."""
         # Setup Screener Result
@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+from unittest.mock import patch
+
+from option_auditor.common.feature_store import FeatureStore, TickerFeatures, data_version
+from option_auditor.strategies.grandmaster_screener import GrandmasterScreener
+from option_auditor.strategies.master import FortressMasterScreener
+
+
+def _make_df(periods=300, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0.2, 1.0, periods))
+    dates = pd.date_range("2023-01-02", periods=periods, freq="B")
+    return pd.DataFrame({
+        "Open": close - 0.5,
+        "High": close + 1.0,
+        "Low": close - 1.0,
+        "Close": close,
+        "Volume": rng.integers(1_000_000, 2_000_000, periods).astype(float),
+    }, index=dates)
+
+
+def test_indicators_match_inline_calculations():
+    df = _make_df()
+    features = TickerFeatures("AAPL", df, store=FeatureStore(10 * 1024 * 1024))
+
+    pd.testing.assert_series_equal(features.sma(200), df["Close"].rolling(200).mean())
+    pd.testing.assert_series_equal(features.volume_avg(20), df["Volume"].rolling(20).mean())
+    pd.testing.assert_series_equal(features.donchian_high(50), df["High"].rolling(50).max().shift(1))
+    pd.testing.assert_series_equal(features.donchian_low(20), df["Low"].rolling(20).min().shift(1))
+    pd.testing.assert_series_equal(features.atr(14), ta.atr(df["High"], df["Low"], df["Close"], length=14))
+    pd.testing.assert_series_equal(features.rsi(14), ta.rsi(df["Close"], length=14))
+
+
+def test_each_indicator_computed_once_per_data_version():
+    store = FeatureStore(10 * 1024 * 1024)
+    df = _make_df()
+
+    with patch("option_auditor.common.feature_store.ta.rsi", wraps=ta.rsi) as mock_rsi:
+        first = TickerFeatures("AAPL", df, store=store).rsi(14)
+        # A copy of the same data (as strategies make) is the same version
+        second = TickerFeatures("AAPL", df.copy(), store=store).rsi(14)
+        assert mock_rsi.call_count == 1
+        assert first is second
+
+        # A different ticker, params or an updated last bar are separate entries
+        TickerFeatures("MSFT", df, store=store).rsi(14)
+        TickerFeatures("AAPL", df, store=store).rsi(7)
+        updated = df.copy()
+        updated.iloc[-1, updated.columns.get_loc("Close")] += 1.0
+        TickerFeatures("AAPL", updated, store=store).rsi(14)
+        assert mock_rsi.call_count == 4
+
+        # Without a ticker nothing is cached
+        TickerFeatures(None, df, store=store).rsi(14)
+        TickerFeatures(None, df, store=store).rsi(14)
+        assert mock_rsi.call_count == 6
+
+
+def test_data_version_tracks_last_bar():
+    df = _make_df(periods=10)
+    assert data_version(df) == data_version(df.copy())
+    assert data_version(df) != data_version(df.iloc[:-1])
+    assert data_version(pd.DataFrame()) is None
+
+    # A revised interior bar (same dates, count and last bar) is a new version
+    revised = df.copy()
+    revised.iloc[4, revised.columns.get_loc("Close")] *= 1.01
+    assert data_version(revised) != data_version(df)
+
+
+def test_disk_tier_survives_memory_clear(tmp_path):
+    df = _make_df()
+    store = FeatureStore(10 * 1024 * 1024, disk_dir=str(tmp_path))
+    expected = TickerFeatures("VOD.L", df, store=store).atr(14)
+
+    store.clear()
+    with patch("option_auditor.common.feature_store.ta.atr") as mock_atr:
+        loaded = TickerFeatures("VOD.L", df, store=store).atr(14)
+    mock_atr.assert_not_called()
+    np.testing.assert_allclose(loaded.to_numpy(), expected.to_numpy(dtype=float), equal_nan=True)
+    assert loaded.index.equals(df.index)
+
+    # A new data version replaces the old file for that indicator
+    TickerFeatures("VOD.L", df.iloc[:-1], store=store).atr(14)
+    assert len(list((tmp_path / "VOD.L").glob("atr-14-*.npy"))) == 1
+
+
+def test_master_scan_shares_indicators_with_grandmaster():
+    df = _make_df()
+    regime = {"regime": "🟢 BULLISH", "spy_history": None, "vix": 15.0}
+    screener = FortressMasterScreener(regime, check_mode=True)
+
+    with patch("option_auditor.common.feature_store.ta.atr", wraps=ta.atr) as mock_atr, \
+         patch("option_auditor.common.feature_store.ta.rsi", wraps=ta.rsi) as mock_rsi:
+        screener.analyze("AAPL", df)
+        screener.analyze("AAPL", df)
+        GrandmasterScreener().analyze(df, ticker="AAPL")
+
+    assert mock_atr.call_count == 1
+    assert mock_rsi.call_count <= 1
+
+
+def test_last_matches_full_series():
+    df = _make_df()
+    df.iloc[-30, df.columns.get_loc("Volume")] = np.nan  # gap inside the volume window
+    store = FeatureStore(10 * 1024 * 1024)
+    specs = [("sma", (50, "Close")), ("sma", (20, "Volume")), ("sma", (50, "Volume")), ("rolling_max", ("Close", 252)),
+             ("rolling_min", ("Close", 400)), ("donchian_high", (20,)), ("donchian_low", (20,)), ("atr", (14,)), ("rsi", (14, "Close"))]
+
+    for spec in specs:
+        expected = TickerFeatures(None, df).feature(*spec).iloc[-1]
+        np.testing.assert_allclose(TickerFeatures("AAPL", df, store=store).last(*spec), expected, rtol=1e-12, equal_nan=True,
+                                   err_msg=str(spec))
+
+    # A cached series is served as is
+    series = TickerFeatures("AAPL", df, store=store).sma(200)
+    assert TickerFeatures("AAPL", df, store=store).last("sma", (200, "Close")) == series.iloc[-1]
+
+
+def test_grandmaster_last_bar_matches_signal_frame():
+    screener = GrandmasterScreener()
+    for seed in range(3):
+        df = _make_df(periods=400, seed=seed)
+        expected = screener.generate_signals(df).iloc[-1]
+
+        for frame in (df, df.iloc[-GrandmasterScreener.LOOKBACK:]):
+            row = screener.evaluate_last_bar(frame)
+            assert row["signal"] == expected["signal"]
+            for key in ("SMA_50", "SMA_200", "High_52", "Low_52", "Donchian_High_20", "Donchian_Low_20", "RVol", "ATR"):
+                np.testing.assert_allclose(row[key], expected[key], rtol=1e-9, equal_nan=True, err_msg=key)
@@ -0,0 +1,95 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from option_auditor.common.frame_cache import FrameCache, loaded_frame_cache
+from option_auditor.common.data_utils import get_cached_market_data
+from option_auditor.common.screener_utils import ScreeningRunner
+
+
+def _make_frame(tickers, periods=5):
+    dates = pd.date_range("2024-01-01", periods=periods, freq="B")
+    frames = {t: pd.DataFrame({
+        "Open": 1.0, "High": 2.0, "Low": 0.5,
+        "Close": np.arange(periods, dtype=float) + i,
+        "Volume": 100.0,
+    }, index=dates) for i, t in enumerate(tickers)}
+    return pd.concat(frames, axis=1)
+
+
+@pytest.fixture
+def mock_cache_dir(tmp_path):
+    d = tmp_path / "cache_test"
+    d.mkdir()
+    with patch("option_auditor.common.data_utils.CACHE_DIR", str(d)):
+        yield str(d)
+
+
+def test_lru_eviction_respects_budget():
+    cache = FrameCache(max_bytes=100)
+    cache.put("a", object(), nbytes=40)
+    cache.put("b", object(), nbytes=40)
+    assert cache.get("a") is not None  # "a" becomes most recent
+    cache.put("c", object(), nbytes=40)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.nbytes == 80
+
+    cache.put("huge", object(), nbytes=500)
+    assert cache.get("huge") is None
+    assert len(cache) == 2
+
+
+def test_repeated_reads_do_not_touch_disk(mock_cache_dir):
+    tickers = [f"T{i}" for i in range(120)]
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", return_value=_make_frame(tickers)):
+        get_cached_market_data(tickers, cache_name="market_scan_v1")
+
+    real_read = pd.read_parquet
+    with patch("option_auditor.common.data_utils.pd.read_parquet", side_effect=real_read) as mock_read:
+        first = get_cached_market_data(tickers, cache_name="market_scan_v1")
+        first["EXTRA"] = 1.0
+        second = get_cached_market_data(tickers, cache_name="market_scan_v1")
+
+    assert mock_read.call_count == 1
+    assert "EXTRA" not in second.columns
+    assert loaded_frame_cache.hits >= 1
+
+    # Rewriting the file changes (mtime, size) and forces a fresh read
+    path = os.path.join(mock_cache_dir, "market_scan_v1.parquet")
+    _make_frame(tickers[:10]).to_parquet(path)
+    third = get_cached_market_data(tickers, cache_name="market_scan_v1")
+    assert len(third.columns.unique(level=0)) == 10
+
+
+@pytest.mark.parametrize("copy_on_write", [True, False])
+def test_in_place_edits_do_not_reach_the_cached_frame(mock_cache_dir, copy_on_write):
+    tickers = [f"T{i}" for i in range(120)]
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", return_value=_make_frame(tickers)):
+        get_cached_market_data(tickers, cache_name="market_scan_v1")
+
+    with pd.option_context("mode.copy_on_write", copy_on_write):
+        first = get_cached_market_data(tickers, cache_name="market_scan_v1")
+        first.iloc[0, 3] = -1.0
+        first.loc[first.index[1], ("T0", "Close")] = -1.0
+        first.replace(100.0, np.nan, inplace=True)
+        second = get_cached_market_data(tickers, cache_name="market_scan_v1")
+
+    assert second[("T0", "Close")].iloc[:2].tolist() == [0.0, 1.0]
+    assert (second.xs("Volume", axis=1, level=1) == 100.0).all().all()
+
+
+def test_runner_reads_cache_once(mock_cache_dir):
+    tickers = [f"T{i}" for i in range(60)]
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", return_value=_make_frame(tickers)):
+        get_cached_market_data(tickers, cache_name="market_scan_v1")
+
+    runner = ScreeningRunner(ticker_list=tickers[:55])
+    with patch("option_auditor.common.screener_utils.get_cached_market_data", wraps=get_cached_market_data) as mock_cache:
+        data = runner._fetch_data(tickers[:55])
+
+    assert mock_cache.call_count == 1
+    assert len(data.columns.unique(level=0)) == 55
@@ -37,7 +37,7 @@ class TestIndiaTickerList:
 class TestDataFetchingRobustness:
     """Tests for safe data fetching logic (chunking, sleep, retries)."""
 
-    @patch("option_auditor.common.data_utils.yf.download")
+    @patch("option_auditor.common.market_data_provider.YFinanceProvider.download")
     def test_fetch_batch_data_safe_chunking(self, mock_download):
         """Verify functionality splits requests into chunks of 30."""
         tickers = [f"T{i}" for i in range(100)]
@@ -54,7 +54,7 @@ class TestDataFetchingRobustness:
         assert kwargs['threads'] is True
         assert kwargs['group_by'] == 'ticker'
 
-    @patch("option_auditor.common.data_utils.yf.download")
+    @patch("option_auditor.common.market_data_provider.YFinanceProvider.download")
     @patch("option_auditor.common.data_utils.time.sleep")
     def test_fetch_batch_data_safe_sleeps(self, mock_sleep, mock_download):
         """Verify sleep is inserted for rate limiting between chunks."""
@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+from unittest.mock import patch
+
+from option_auditor.common import indicator_engine as ie
+from option_auditor.common.feature_store import FeatureStore, TickerFeatures
+from option_auditor.common.market_panel import MarketPanel
+
+
+def _make_frames(count, periods=300, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2023-01-02", periods=periods, freq="B")
+    frames = {}
+    for i in range(count):
+        # Staggered listing dates so tickers start at different rows of the panel
+        n = periods - (i * 7) % 100
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+        frames[f"T{i}"] = pd.DataFrame({
+            "Open": close,
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(100_000, 10_000_000, n).astype(float),
+        }, index=dates[-n:])
+    return frames
+
+
+def _column_block(frames, column):
+    return pd.DataFrame({t: df[column] for t, df in frames.items()}).sort_index()
+
+
+def test_rolling_kernels_match_pandas():
+    block = _column_block(_make_frames(5), "Close")
+    block.iloc[40:45, 1] = 5.0  # flat stretch: pandas returns the exact value
+    x = block.to_numpy()
+
+    for n in (1, 20, 252):
+        np.testing.assert_allclose(ie.rolling_max(x, n), block.rolling(n).max().to_numpy(), equal_nan=True)
+        np.testing.assert_allclose(ie.rolling_min(x, n), block.rolling(n).min().to_numpy(), equal_nan=True)
+        np.testing.assert_allclose(ie.rolling_mean(x, n), block.rolling(n).mean().to_numpy(), rtol=1e-12, equal_nan=True)
+    np.testing.assert_allclose(ie.rolling_std(x, 20), block.rolling(20).std(ddof=0).to_numpy(), rtol=1e-9, atol=1e-12, equal_nan=True)
+    assert (ie.rolling_mean(x, 5)[44, 1]) == 5.0
+
+
+def test_ewm_mean_matches_pandas():
+    block = _column_block(_make_frames(5), "Close")
+    block.iloc[50:53, 2] = np.nan  # gaps inside a column
+    x = block.to_numpy()
+
+    for adjust, min_periods in ((True, 14), (False, 0)):
+        expected = block.ewm(alpha=1 / 14, adjust=adjust, min_periods=min_periods).mean().to_numpy()
+        np.testing.assert_allclose(ie.ewm_mean(x, 1 / 14, adjust=adjust, min_periods=min_periods), expected,
+                                   rtol=1e-12, equal_nan=True)
+
+
+def test_engine_values_match_ticker_features():
+    frames = _make_frames(6)
+    panel = MarketPanel.from_frame(pd.concat(frames, axis=1))
+    engine = ie.IndicatorEngine(panel)
+
+    for ticker in ("T0", "T3"):
+        df = panel.frame(ticker)
+        features = TickerFeatures(None, df)
+        pd.testing.assert_series_equal(engine.value(ticker, "sma", (50, "Close")), features.sma(50), check_names=False, check_freq=False)
+        pd.testing.assert_series_equal(engine.value(ticker, "donchian_high", (20,)), features.donchian_high(20), check_names=False, check_freq=False)
+        np.testing.assert_allclose(engine.value(ticker, "atr", (14,)), ta.atr(df["High"], df["Low"], df["Close"], length=14), rtol=1e-6, equal_nan=True)
+        np.testing.assert_allclose(engine.value(ticker, "rsi", (14, "Close")), ta.rsi(df["Close"], length=14), rtol=1e-6, equal_nan=True)
+        np.testing.assert_allclose(engine.value(ticker, "ema", (50, "Close")), ta.ema(df["Close"], length=50), rtol=1e-6, equal_nan=True)
+
+
+def test_prime_fills_store_for_large_panels():
+    frames = _make_frames(ie.ENGINE_MIN_TICKERS)
+    panel = MarketPanel.from_frame(pd.concat(frames, axis=1))
+    store = FeatureStore(50 * 1024 * 1024)
+    features = [("sma", (200, "Close")), ("atr", (14,))]
+
+    stored = ie.prime_panel_features(panel, features, store=store)
+    assert stored == 2 * ie.ENGINE_MIN_TICKERS
+
+    # Strategies now read the batch results instead of computing
+    with patch("option_auditor.common.feature_store.ta.atr") as mock_atr:
+        atr = TickerFeatures("T7", panel.frame("T7"), store=store).atr(14)
+        mock_atr.assert_not_called()
+    assert atr is not None and not atr.isna().all()
+
+
+def test_prime_skips_small_panels_gapped_and_incomplete_tickers():
+    frames = _make_frames(ie.ENGINE_MIN_TICKERS)
+    store = FeatureStore(50 * 1024 * 1024)
+    small = MarketPanel.from_frame(pd.concat(dict(list(frames.items())[:5]), axis=1))
+    assert ie.prime_panel_features(small, [("sma", (20, "Close"))], store=store) == 0
+
+    frames["T1"] = frames["T1"].drop(frames["T1"].index[100:103])  # rows missing inside the range
+    frames["T2"] = frames["T2"].drop(columns="Volume")
+    panel = MarketPanel.from_frame(pd.concat(frames, axis=1))
+
+    stored = ie.prime_panel_features(panel, [("sma", (20, "Close")), ("sma", (20, "Volume"))], store=store)
+    assert stored == 2 * ie.ENGINE_MIN_TICKERS - 3
+
+
+def test_cycle_features_published_per_ticker():
+    frames = _make_frames(ie.ENGINE_MIN_TICKERS)
+    panel = MarketPanel.from_frame(pd.concat(frames, axis=1))
+    store = FeatureStore(50 * 1024 * 1024)
+
+    stored = ie.prime_panel_features(panel, [("hilbert_phase", ()), ("dominant_cycle", ())], store=store)
+    assert stored == 2 * ie.ENGINE_MIN_TICKERS
+
+    for ticker in ("T0", "T9"):
+        df = panel.frame(ticker)
+        features = TickerFeatures(ticker, df, store=store)
+        expected = TickerFeatures(None, df)
+        np.testing.assert_allclose(features.cached("hilbert_phase", ()), expected.hilbert_phase(), rtol=1e-9)
+        np.testing.assert_allclose(features.cached("dominant_cycle", ()), expected.dominant_cycle(), rtol=1e-9)
+
+
+def test_darvas_boxes_published_from_high_low_close():
+    frames = _make_frames(ie.ENGINE_MIN_TICKERS)
+    panel = MarketPanel.from_frame(pd.concat(frames, axis=1))
+    store = FeatureStore(50 * 1024 * 1024)
+
+    assert ie.prime_panel_features(panel, [("darvas_box", ())], store=store) > 0
+    for ticker in ("T0", "T9"):
+        df = panel.frame(ticker)
+        cached = TickerFeatures(ticker, df, store=store).cached("darvas_box", ())
+        np.testing.assert_allclose(cached, TickerFeatures(None, df).darvas_box())
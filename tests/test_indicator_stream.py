@@ -0,0 +1,176 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+import pytest
+from unittest.mock import patch
+
+from option_auditor.common.feature_store import FeatureStore, TickerFeatures, data_version
+from option_auditor.common.indicator_stream import IndicatorStreams, TickerStream, make_indicator
+from option_auditor.common.market_panel import MarketPanel
+
+SPECS = [
+    ("sma", (20, "Close")), ("sma", (50, "Volume")), ("ema", (50, "Close")),
+    ("rolling_max", ("High", 252)), ("rolling_min", ("Low", 252)),
+    ("donchian_high", (20,)), ("donchian_low", (20,)),
+    ("atr", (14,)), ("rsi", (14, "Close")),
+]
+
+
+def _make_df(periods=500, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, periods)))
+    df = pd.DataFrame({
+        "Open": close,
+        "High": close * 1.01,
+        "Low": close * 0.99,
+        "Close": close,
+        "Volume": rng.integers(100_000, 10_000_000, periods).astype(float),
+    }, index=pd.date_range("2022-01-03", periods=periods, freq="B"))
+    df.iloc[100:105] = 7.0       # flat stretch
+    df.iloc[200, 4] = np.nan     # missing volume
+    return df
+
+
+def _assert_matches_recompute(values, df, rtol=1e-12):
+    for spec in SPECS:
+        expected = np.asarray(TickerFeatures(None, df).feature(*spec), dtype=float)
+        np.testing.assert_allclose(values[spec], expected, rtol=rtol, equal_nan=True, err_msg=str(spec))
+
+
+def test_incremental_indicators_match_full_recompute():
+    df = _make_df()
+    stream = TickerStream()
+    _assert_matches_recompute(stream.advance(df.iloc[:300], SPECS), df.iloc[:300])
+
+    # One new bar, then a few, then a revised partial last bar
+    _assert_matches_recompute(stream.advance(df.iloc[:301], SPECS), df.iloc[:301])
+    _assert_matches_recompute(stream.advance(df.iloc[:310], SPECS), df.iloc[:310])
+    revised = df.iloc[:311].copy()
+    revised.iloc[-1, 3] *= 1.05
+    _assert_matches_recompute(stream.advance(revised, SPECS), revised)
+    _assert_matches_recompute(stream.advance(df.iloc[:312], SPECS), df.iloc[:312])
+
+
+def test_new_bar_is_not_a_full_pass():
+    df = _make_df()
+    stream = TickerStream()
+    stream.advance(df.iloc[:400], SPECS)
+
+    sma = stream.indicators[("sma", (20, "Close"))]
+    with patch.object(sma, "update", wraps=sma.update) as mock_update:
+        stream.advance(df.iloc[:402], SPECS)
+    # Bar 399 (previously only peeked) and bar 400 are committed; bar 401 is peeked
+    assert mock_update.call_count == 2
+
+
+def test_trimmed_history_and_rewritten_history():
+    df = _make_df()
+    stream = TickerStream()
+    stream.advance(df.iloc[:400], SPECS)
+
+    # Rolling period trim: window features keep streaming, recursive ones rebuild
+    trimmed = df.iloc[30:420]
+    _assert_matches_recompute(stream.advance(trimmed, SPECS), trimmed, rtol=1e-9)
+
+    # Adjusted prices: everything rebuilds
+    adjusted = df.iloc[30:421].copy()
+    adjusted[["Open", "High", "Low", "Close"]] *= 0.98
+    _assert_matches_recompute(stream.advance(adjusted, SPECS), adjusted)
+
+
+def test_state_survives_pickling():
+    df = _make_df()
+    stream = TickerStream()
+    stream.advance(df.iloc[:350], SPECS)
+    restored = pickle.loads(pickle.dumps(stream))
+    _assert_matches_recompute(restored.advance(df.iloc[:355], SPECS), df.iloc[:355])
+
+
+def test_unsupported_features_are_left_to_other_paths():
+    assert make_indicator("bollinger_bands", (20, 2.0)) is None
+
+
+def test_publish_checkpoints_and_fills_store(tmp_path):
+    frames = {t: _make_df(seed=i) for i, t in enumerate(["AAPL", "MSFT", "NVDA"])}
+    panel = MarketPanel.from_frame(pd.concat(frames, axis=1))
+    store = FeatureStore(50 * 1024 * 1024)
+    streams = IndicatorStreams(state_dir=str(tmp_path), enabled=True)
+
+    features = [("atr", (14,)), ("bollinger_bands", (20, 2.0))]
+    left = streams.publish(panel, features, store=store)
+    assert left == [("bollinger_bands", (20, 2.0))]
+    assert (tmp_path / "AAPL.pkl").exists()
+
+    df = panel.frame("MSFT")
+    with patch("option_auditor.common.feature_store.ta.atr") as mock_atr:
+        atr = TickerFeatures("MSFT", df, store=store).last("atr", (14,))
+        mock_atr.assert_not_called()
+    assert atr == pytest.approx(ta.atr(df["High"], df["Low"], df["Close"], length=14).iloc[-1], rel=1e-6)
+    # Only latest values are published, not full-length series
+    assert store.lookup("MSFT", data_version(df), "atr", (14,)) is None
+
+    # A new process picks up the checkpoint
+    reloaded = IndicatorStreams(state_dir=str(tmp_path), enabled=True)
+    assert reloaded._load("AAPL").last_index == panel.frame("AAPL").index[-2]
+
+
+def test_publish_serves_trimmed_frames_from_untrimmed_streams():
+    frames = {t: _make_df(periods=700, seed=i) for i, t in enumerate(["AAPL", "MSFT"])}
+    full = pd.concat(frames, axis=1)
+    store = FeatureStore(50 * 1024 * 1024)
+    streams = IndicatorStreams(enabled=True)
+    features = SPECS + [("ema", (200, "Close"))]
+
+    left = streams.publish(MarketPanel.from_frame(full.iloc[:600]), features, store=store, lookback=300)
+    # Too much of a 200-bar EMA's weight lies before a 300-bar frame; the batch engine takes it
+    assert left == [("ema", (50, "Close")), ("ema", (200, "Close"))]
+
+    stream = streams._streams["MSFT"]
+    atr = stream.indicators[("atr", (14,))]
+    streams.publish(MarketPanel.from_frame(full.iloc[:601]), features, store=store, lookback=300)
+    # A new bar moves the 300-bar frame's start, not the stream's origin: nothing is rebuilt
+    assert stream.indicators[("atr", (14,))] is atr
+
+    seen = frames["MSFT"].iloc[:601].iloc[-300:]
+    served = TickerFeatures("MSFT", seen, store=store)
+    for spec in SPECS:
+        if spec[0] == "ema":
+            continue
+        expected = TickerFeatures(None, seen).feature(*spec).iloc[-1]
+        assert served.store.lookup_last("MSFT", served.bar_version, *spec) == pytest.approx(expected, rel=1e-6, nan_ok=True), spec
+
+
+def test_checkpoints_append_deltas_and_replay(tmp_path):
+    df = _make_df()
+    store = FeatureStore(50 * 1024 * 1024)
+    streams = IndicatorStreams(state_dir=str(tmp_path), enabled=True)
+    path = tmp_path / "AAPL.pkl"
+    specs = [("sma", (20, "Close")), ("rolling_max", ("High", 50))]
+
+    def panel(stop, start=0):
+        return MarketPanel.from_frame(pd.concat({"AAPL": df.iloc[start:stop]}, axis=1))
+
+    streams.publish(panel(400), specs, store=store)
+    snapshot = path.stat().st_size
+    streams.publish(panel(401), specs, store=store)
+    # One new bar appends a delta, not another copy of the history
+    assert path.stat().st_size - snapshot < snapshot / 4
+    streams.publish(panel(405, start=3), specs, store=store)  # trimmed front: still a delta
+    assert streams._journal["AAPL"] == 2
+
+    live = streams._load("AAPL")
+    reloaded = IndicatorStreams(state_dir=str(tmp_path), enabled=True)._load("AAPL")
+    assert reloaded.last_index == live.last_index == df.index[403]
+    for spec in specs:
+        np.testing.assert_array_equal(np.asarray(reloaded.outputs[spec]), np.asarray(live.outputs[spec]))
+    values = reloaded.advance(df.iloc[3:410], specs)
+    for spec in specs:
+        expected = np.asarray(TickerFeatures(None, df.iloc[3:410]).feature(*spec), dtype=float)
+        np.testing.assert_allclose(values[spec], expected, rtol=1e-9, equal_nan=True)
+
+    # A torn last delta keeps the state of the ones before it
+    with open(path, "ab") as f:
+        f.write(b"\x80\x05garbage")
+    assert IndicatorStreams(state_dir=str(tmp_path), enabled=True)._load("AAPL").last_index == df.index[403]
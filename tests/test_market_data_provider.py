@@ -0,0 +1,136 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from option_auditor.common import market_data_provider as mdp
+from option_auditor.common.market_data_provider import (
+    ReplayProvider,
+    YFinanceProvider,
+    get_provider,
+    record_fixtures,
+    set_provider,
+)
+from option_auditor.common.market_store import _partition_file_name
+
+
+def _bars(n=300, start=100.0):
+    idx = pd.bdate_range("2023-01-02", periods=n)
+    close = start + np.arange(n, dtype=float)
+    return pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close, "Volume": 1000.0}, index=idx)
+
+
+@pytest.fixture
+def replay_root(tmp_path):
+    hist = tmp_path / "history" / "1d"
+    hist.mkdir(parents=True)
+    _bars().to_parquet(hist / _partition_file_name("AAPL"))
+    _bars(start=20.0).to_parquet(hist / _partition_file_name("^VIX"))
+
+    (tmp_path / "quotes").mkdir()
+    with open(tmp_path / "quotes" / "AAPL.json", "w") as f:
+        json.dump({"info": {"sector": "Technology"}, "calendar": {"Earnings Date": ["2024-05-02"]}}, f)
+
+    chain_dir = tmp_path / "options" / "AAPL"
+    chain_dir.mkdir(parents=True)
+    calls = pd.DataFrame({"strike": [390.0, 400.0], "bid": [5.0, 2.0], "ask": [5.2, 2.2]})
+    calls.to_parquet(chain_dir / "2024-03-15.calls.parquet")
+    calls.to_parquet(chain_dir / "2024-03-15.puts.parquet")
+    return str(tmp_path)
+
+
+@pytest.fixture
+def replay(replay_root):
+    provider = ReplayProvider(replay_root)
+    set_provider(provider)
+    yield provider
+    set_provider(None)
+
+
+def test_default_provider_is_yfinance():
+    set_provider(None)
+    assert isinstance(get_provider(), YFinanceProvider)
+
+
+def test_yfinance_provider_passes_arguments_through():
+    with patch("yfinance.download") as mock_download:
+        YFinanceProvider().download(["AAPL"], period="1y", group_by="ticker")
+    mock_download.assert_called_once_with(["AAPL"], period="1y", group_by="ticker")
+
+
+def test_replay_download_layouts(replay):
+    flat = replay.download("AAPL", period="5d")
+    assert list(flat.columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert len(flat) == 5
+    assert flat["Close"].iloc[-1] == 399.0
+
+    by_ticker = replay.download(["AAPL", "^VIX", "MISSING"], period="1y", group_by="ticker")
+    assert set(by_ticker.columns.get_level_values(0)) == {"AAPL", "^VIX"}
+
+    by_field = replay.download(["AAPL", "^VIX"], period="1mo")
+    assert by_field.columns.nlevels == 2
+    assert by_field["Close"].columns.tolist() == ["AAPL", "^VIX"]
+
+
+def test_replay_start_window(replay):
+    df = replay.download("AAPL", start="2024-01-01")
+    assert df.index.min() >= pd.Timestamp("2024-01-01")
+
+
+def test_replay_ticker_quotes_and_options(replay):
+    tk = replay.ticker("AAPL")
+    assert tk.info["sector"] == "Technology"
+    assert tk.fast_info["last_price"] == 399.0
+    assert tk.calendar["Earnings Date"] == ["2024-05-02"]
+    assert tk.options == ("2024-03-15",)
+
+    chain = tk.option_chain("2024-03-15")
+    assert chain.calls["strike"].tolist() == [390.0, 400.0]
+    assert not chain.puts.empty
+
+    with pytest.raises(ValueError):
+        tk.option_chain("2030-01-01")
+
+    assert replay.ticker("MISSING").history(period="1y").empty
+
+
+def test_replay_simulated_latency(replay_root):
+    provider = ReplayProvider(replay_root, latency_ms=50)
+    with patch("option_auditor.common.market_data_provider.time.sleep") as mock_sleep:
+        provider.download(["AAPL"], period="1y")
+        provider.ticker("AAPL").options
+    assert mock_sleep.call_count == 2
+    mock_sleep.assert_called_with(0.05)
+
+
+def test_app_code_runs_offline_on_replay(replay):
+    from option_auditor.common.price_utils import fetch_live_prices
+    from option_auditor.common.data_utils import fetch_batch_data_safe
+
+    with patch("yfinance.download", side_effect=AssertionError("network")):
+        prices = fetch_live_prices(["AAPL", "^VIX"])
+        batch = fetch_batch_data_safe(["AAPL", "^VIX"], period="1y")
+
+    assert prices == {"AAPL": 399.0, "^VIX": 319.0}
+    assert set(batch.columns.get_level_values(0)) == {"AAPL", "^VIX"}
+
+
+def test_record_fixtures_roundtrip(replay, tmp_path):
+    out = str(tmp_path / "recorded")
+    recorded = record_fixtures(["AAPL", "MISSING"], out, period="1y", options=True, source=replay)
+
+    assert recorded == ["AAPL"]
+    replayed = ReplayProvider(out)
+    assert len(replayed.download("AAPL", period="1y")) == len(replay.download("AAPL", period="1y"))
+    assert replayed.ticker("AAPL").options == ("2024-03-15",)
+    assert replayed.ticker("AAPL").info["sector"] == "Technology"
+
+
+def test_env_selects_replay_provider(replay_root):
+    set_provider(None)
+    with patch.object(mdp, "MARKET_DATA_PROVIDER", "replay"), patch.object(mdp, "MARKET_DATA_REPLAY_DIR", replay_root):
+        provider = get_provider()
+    set_provider(None)
+    assert isinstance(provider, ReplayProvider)
+    assert provider.root == replay_root
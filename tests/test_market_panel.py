@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from option_auditor.common.market_panel import MarketPanel
+from option_auditor.common.screener_utils import ScreeningRunner
+
+
+@pytest.fixture
+def batch_frame():
+    dates = pd.date_range("2024-01-01", periods=6, freq="B")
+    frames = {}
+    for i, t in enumerate(["AAPL", "NEWCO"]):
+        frames[t] = pd.DataFrame({
+            "Open": 10.0 + i, "High": 11.0 + i, "Low": 9.0 + i,
+            "Close": np.arange(6, dtype=float) + i * 100,
+            "Volume": 1000.0,
+        }, index=dates)
+    df = pd.concat(frames, axis=1)
+    # NEWCO listed two days later
+    df.loc[dates[:2], "NEWCO"] = np.nan
+    return df
+
+
+def test_from_frame_shapes_and_indexes(batch_frame):
+    panel = MarketPanel.from_frame(batch_frame)
+
+    assert panel.tickers == ["AAPL", "NEWCO"]
+    assert panel.fields == ["Open", "High", "Low", "Close", "Volume"]
+    assert panel.values.shape == (2, 6, 5)
+    assert panel.values.dtype == np.float64
+    assert MarketPanel.from_frame(batch_frame.astype(np.float32)).values.dtype == np.float32
+    assert panel.field("Close").shape == (2, 6)
+    assert "AAPL" in panel and "MSFT" not in panel
+
+
+def test_frame_matches_slice_and_dropna(batch_frame):
+    panel = MarketPanel.from_frame(batch_frame)
+
+    for ticker in ["AAPL", "NEWCO"]:
+        expected = batch_frame[ticker].dropna(how="all")
+        pd.testing.assert_frame_equal(panel.frame(ticker), expected, check_freq=False)
+
+
+def test_frame_is_view_and_writes_do_not_leak(batch_frame):
+    panel = MarketPanel.from_frame(batch_frame)
+
+    with pd.option_context("mode.copy_on_write", True):
+        df = panel.frame("NEWCO")
+        assert np.shares_memory(df["Close"].to_numpy(), panel.values)
+
+        df.loc[df.index[0], "Close"] = 999.0
+        df["SMA"] = df["Close"].rolling(2).mean()
+    assert panel.frame("NEWCO")["Close"].iloc[0] == 100 + 2
+    assert "SMA" not in panel.frame("NEWCO").columns
+
+
+def test_in_place_writes_without_copy_on_write(batch_frame):
+    panel = MarketPanel.from_frame(batch_frame)
+
+    with pd.option_context("mode.copy_on_write", False):
+        df = panel.frame("AAPL")
+        df.iloc[0, 3] = 999.0
+        df.fillna(0.0, inplace=True)
+    assert panel.frame("AAPL")["Close"].iloc[0] == 0.0
+
+
+def test_field_first_layout_and_flat_frame(batch_frame):
+    swapped = batch_frame.swaplevel(0, 1, axis=1)
+    assert MarketPanel.from_frame(swapped).tickers == ["AAPL", "NEWCO"]
+
+    flat = batch_frame["AAPL"]
+    assert MarketPanel.from_frame(flat).empty
+    assert MarketPanel.from_frame(flat, default_ticker="AAPL").tickers == ["AAPL"]
+
+
+def test_screening_runner_accepts_panel(batch_frame):
+    panel = MarketPanel.from_frame(batch_frame)
+    seen = {}
+
+    def strategy(ticker, df):
+        seen[ticker] = len(df)
+        return {"ticker": ticker}
+
+    runner = ScreeningRunner(ticker_list=["AAPL", "NEWCO"])
+    with patch.object(ScreeningRunner, "_fetch_data") as mock_fetch:
+        results = runner.run(strategy, panel=panel)
+
+    mock_fetch.assert_not_called()
+    assert len(results) == 2
+    assert seen == {"AAPL": 6, "NEWCO": 4}
+
+
+def test_runner_hands_strategies_the_lookback_tail(batch_frame):
+    panel = MarketPanel.from_frame(batch_frame)
+    tail = panel.tail(3)
+    assert tail.frame("AAPL").equals(panel.frame("AAPL").iloc[-3:])
+    assert panel.tail(10) is panel
+
+    seen = {}
+
+    def strategy(ticker, df):
+        seen[ticker] = df.index[0]
+        return {"ticker": ticker}
+
+    ScreeningRunner(ticker_list=["AAPL", "NEWCO"]).run(strategy, panel=panel, lookback=3)
+    assert seen == {"AAPL": batch_frame.index[3], "NEWCO": batch_frame.index[3]}
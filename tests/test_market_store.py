@@ -0,0 +1,101 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from option_auditor.common.market_store import PartitionedMarketStore, _partition_file_name
+from option_auditor.common.data_utils import get_cached_market_data
+
+
+def _make_frame(tickers, periods=5):
+    dates = pd.date_range("2024-01-01", periods=periods, freq="B")
+    frames = {}
+    for i, t in enumerate(tickers):
+        base = 100.0 * (i + 1)
+        frames[t] = pd.DataFrame({
+            "Open": base, "High": base + 1, "Low": base - 1,
+            "Close": np.linspace(base, base + periods - 1, periods),
+            "Volume": 1000.0,
+        }, index=dates)
+    return pd.concat(frames, axis=1)
+
+
+@pytest.fixture
+def mock_cache_dir(tmp_path):
+    d = tmp_path / "cache_test"
+    d.mkdir()
+    with patch("option_auditor.common.data_utils.CACHE_DIR", str(d)):
+        yield str(d)
+
+
+def test_partition_file_name_is_safe_and_unique():
+    assert _partition_file_name("AAPL") == "AAPL.parquet"
+    assert _partition_file_name("RELIANCE.NS") == "RELIANCE.NS.parquet"
+    caret = _partition_file_name("^VIX")
+    assert "/" not in _partition_file_name("BRK/B")
+    assert caret != _partition_file_name("_VIX")
+
+
+def test_write_and_read_subset(tmp_path):
+    df = _make_frame(["AAPL", "MSFT", "^VIX"])
+    df.loc[df.index[:2], ("MSFT", slice(None))] = np.nan
+
+    store = PartitionedMarketStore("market_scan_v1", str(tmp_path))
+    assert store.write(df, source_mtime_ns=123) == 3
+
+    manifest = store.load_manifest()
+    assert manifest["source_mtime_ns"] == 123
+    assert manifest["tickers"]["MSFT"]["rows"] == 3
+    assert manifest["tickers"]["MSFT"]["first_bar"].startswith(str(df.index[2].date()))
+    assert manifest["tickers"]["AAPL"]["last_bar"].startswith(str(df.index[-1].date()))
+
+    subset = store.read(["^VIX", "AAPL", "UNKNOWN"])
+    assert isinstance(subset.columns, pd.MultiIndex)
+    assert set(subset.columns.get_level_values(0)) == {"^VIX", "AAPL"}
+    pd.testing.assert_series_equal(subset[("AAPL", "Close")], df[("AAPL", "Close")], check_freq=False)
+
+
+def test_is_in_sync(tmp_path):
+    store = PartitionedMarketStore("x", str(tmp_path))
+    assert not store.is_in_sync(None, 1)
+    store.write(_make_frame(["AAPL"]), source_mtime_ns=5)
+    manifest = store.load_manifest()
+    assert store.is_in_sync(manifest, 5)
+    assert not store.is_in_sync(manifest, 6)
+
+
+def test_get_cached_market_data_reads_partitions_for_small_lookups(mock_cache_dir):
+    tickers = ["AAPL", "MSFT", "NVDA"]
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", return_value=_make_frame(tickers)):
+        get_cached_market_data(tickers, cache_name="market_scan_v1")
+
+    parts_dir = os.path.join(mock_cache_dir, "market_scan_v1_parts")
+    assert os.path.exists(os.path.join(parts_dir, "manifest.json"))
+
+    full_path = os.path.join(mock_cache_dir, "market_scan_v1.parquet")
+    real_read = pd.read_parquet
+    with patch("option_auditor.common.data_utils.pd.read_parquet", side_effect=real_read) as mock_read:
+        result = get_cached_market_data(["MSFT"], cache_name="market_scan_v1")
+
+    assert list(result.columns.get_level_values(0).unique()) == ["MSFT"]
+    read_paths = [c.args[0] for c in mock_read.call_args_list]
+    assert full_path not in read_paths
+
+
+def test_get_cached_market_data_ignores_stale_partitions(mock_cache_dir):
+    tickers = ["AAPL", "MSFT"]
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", return_value=_make_frame(tickers)):
+        get_cached_market_data(tickers, cache_name="market_scan_v1")
+
+    manifest_path = os.path.join(mock_cache_dir, "market_scan_v1_parts", "manifest.json")
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    manifest["source_mtime_ns"] = 1
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f)
+
+    result = get_cached_market_data(["MSFT"], cache_name="market_scan_v1")
+    # Falls back to the full region file
+    assert set(result.columns.get_level_values(0)) == {"AAPL", "MSFT"}
@@ -10,7 +10,12 @@ from option_auditor.strategies.math_utils import (
     calculate_hilbert_phase,
     calculate_dominant_cycle,
     calculate_option_price,
-    calculate_greeks
+    calculate_greeks,
+    batch_hurst,
+    batch_shannon_entropy,
+    batch_kalman_filter,
+    batch_hilbert_phase,
+    batch_dominant_cycle
 )
 
 # Test calculate_hurst
@@ -153,6 +158,35 @@ def test_kalman_filter_negative_input():
     result = kalman_filter(series)
     pd.testing.assert_series_equal(result, series)
 
+# Test batch versions against the scalar functions
+def _batch_prices(n=300):
+    np.random.seed(7)
+    prices = 100 * np.exp(np.cumsum(np.random.randn(n, 6) * 0.02, axis=0))
+    prices[:, 1] = 50.0                                  # constant
+    prices[:, 2] = np.round(prices[:, 2])                # tick-sized moves, repeated values
+    prices[:, 3] = np.where(np.arange(n) % 2, 100.0, 101.0)
+    return prices
+
+def test_batch_hurst_and_entropy_match_scalar():
+    for n in (60, 120, 300):
+        prices = _batch_prices(n)
+        hurst = batch_hurst(np.log(prices[1:] / prices[:-1]))
+        entropy = batch_shannon_entropy(prices[1:] / prices[:-1] - 1)
+        for j in range(prices.shape[1]):
+            series = pd.Series(prices[:, j])
+            for batch_value, scalar in ((hurst[j], calculate_hurst(series)), (entropy[j], shannon_entropy(series))):
+                if scalar is None:
+                    assert np.isnan(batch_value)
+                else:
+                    assert batch_value == pytest.approx(scalar, rel=1e-9, abs=1e-12)
+
+def test_batch_kalman_matches_scalar():
+    prices = _batch_prices()
+    prices[5, 4] = -1.0  # returned unfiltered
+    filtered = batch_kalman_filter(prices)
+    for j in range(prices.shape[1]):
+        np.testing.assert_allclose(filtered[:, j], kalman_filter(pd.Series(prices[:, j])).to_numpy(), rtol=1e-12)
+
 # Test calculate_momentum_decay
 def test_calculate_momentum_decay():
     # Exponential decay
@@ -306,3 +340,22 @@ def test_calculate_greeks_comprehensive():
     g_put = calculate_greeks(S=100, K=100, T=1, r=0.05, sigma=0.2, option_type="put")
     # Delta(Put) approx -0.36, so check it is between -0.3 and -0.5
     assert -0.3 > g_put['delta'] > -0.5
+
+def test_batch_cycles_match_scalar():
+    prices = _batch_prices()
+    prices[10, 4] = np.nan
+    phase, amplitude = batch_hilbert_phase(prices)
+    period, rel_pos = batch_dominant_cycle(prices)
+
+    for j in (0, 2, 3, 5):
+        expected_phase, expected_amplitude = calculate_hilbert_phase(prices[:, j])
+        assert phase[j] == pytest.approx(expected_phase, rel=1e-9)
+        assert amplitude[j] == pytest.approx(expected_amplitude, rel=1e-9)
+        expected_period, expected_rel_pos = calculate_dominant_cycle(list(prices[:, j]))
+        assert period[j] == expected_period
+        assert rel_pos[j] == pytest.approx(expected_rel_pos, rel=1e-9, abs=1e-12)
+
+    # Constant and gapped columns are left to the scalar functions
+    assert np.isnan([phase[1], phase[4], rel_pos[1]]).all()
+    assert np.isnan(batch_dominant_cycle(prices[:50])[0]).all()
+
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+from scipy.signal import argrelextrema
+
+from option_auditor.strategies.patterns import swing_highs, swing_lows, fair_value_gaps, pivots, darvas_boxes
+from option_auditor.strategies.liquidity import _detect_fvgs
+
+
+def _bars(periods=400, tickers=6, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (periods, tickers)), axis=0))
+    gap = rng.normal(0, 0.01, (periods, tickers))
+    high = close * (1.002 + np.abs(gap))
+    low = close * (0.998 - np.abs(gap))
+    if tickers > 2:
+        close[50:55, 1] = close[50, 1]  # flat stretch: no strict extrema inside it
+        high[50:55, 1] = high[50, 1]
+        low[50:55, 1] = low[50, 1]
+        high[120, 2] = np.nan
+    return high, low, close
+
+
+def test_swings_match_pandas_fractals():
+    high, low, _ = _bars()
+    block_high, block_low = swing_highs(high), swing_lows(low)
+
+    for t in range(high.shape[1]):
+        h, l = pd.Series(high[:, t]), pd.Series(low[:, t])
+        expected_high = ((h > h.shift(1)) & (h > h.shift(-1))).to_numpy()
+        expected_low = ((l < l.shift(1)) & (l < l.shift(-1))).to_numpy()
+        np.testing.assert_array_equal(swing_highs(high[:, t]), expected_high)
+        np.testing.assert_array_equal(block_high[:, t], expected_high)
+        np.testing.assert_array_equal(block_low[:, t], expected_low)
+
+
+def test_pivots_match_argrelextrema():
+    _, _, close = _bars()
+    for order in (1, 3, 5):
+        block_high, block_low = pivots(close, order=order)
+        for t in range(close.shape[1]):
+            expected_high = argrelextrema(close[:, t], np.greater, order=order)[0]
+            expected_low = argrelextrema(close[:, t], np.less, order=order)[0]
+            np.testing.assert_array_equal(np.flatnonzero(block_high[:, t]), expected_high)
+            np.testing.assert_array_equal(np.flatnonzero(block_low[:, t]), expected_low)
+            np.testing.assert_array_equal(np.flatnonzero(pivots(close[:, t], order=order)[0]), expected_high)
+
+
+def test_detect_fvgs_matches_candle_loop():
+    high, low, close = _bars(periods=60, tickers=1, seed=3)
+    # Force one gap of each kind into the last 30 candles
+    low[40, 0], high[42, 0] = close[42, 0] * 1.05, close[42, 0] * 1.01
+    high[47, 0], low[49, 0] = close[49, 0] * 0.95, close[49, 0] * 0.99
+    df = pd.DataFrame({"High": high[:, 0], "Low": low[:, 0], "Close": close[:, 0]},
+                      index=pd.date_range("2024-01-01", periods=60, freq="h"))
+
+    expected = []
+    for i in range(30, 60):
+        if low[i - 2, 0] > high[i, 0] and low[i - 2, 0] - high[i, 0] > high[i, 0] * 0.0002:
+            expected.append(("BEARISH", low[i - 2, 0], high[i, 0], df.index[i - 1]))
+        if high[i - 2, 0] < low[i, 0] and low[i, 0] - high[i - 2, 0] > low[i, 0] * 0.0002:
+            expected.append(("BULLISH", low[i, 0], high[i - 2, 0], df.index[i - 1]))
+
+    fvgs = _detect_fvgs(df)
+    assert [(f["type"], f["top"], f["bottom"], f["ts"]) for f in fvgs] == expected
+    assert {"BEARISH", "BULLISH"} <= {f["type"] for f in fvgs}
+
+    bearish, bullish = fair_value_gaps(high, low)
+    assert bearish[42, 0] and bullish[49, 0]
+    assert not (bearish[:2].any() or bullish[:2].any())
+
+
+def _darvas_scan(highs, lows, closes, lookback=60):
+    """The backwards/forwards candle scan DarvasBoxStrategy used before darvas_boxes."""
+    n = len(highs)
+    ceiling = floor = np.nan
+    top = -1
+    for i in range(n - 4, n - min(n, lookback), -1):
+        if i < 3: break
+        if all(highs[i] >= highs[i + d] for d in (-3, -2, -1, 1, 2, 3)):
+            top, ceiling = i, highs[i]
+            break
+    if top == -1:
+        return ceiling, floor, 0
+    for j in range(top + 1, n - 3):
+        if lows[j] >= ceiling: continue
+        if all(lows[j] <= lows[j + d] for d in (-3, -2, -1, 1, 2, 3)):
+            floor = lows[j]
+            break
+    state = 0
+    if not np.isnan(floor):
+        if closes[-1] > ceiling and closes[-2] <= ceiling: state = 1
+        elif closes[-1] < floor and closes[-2] >= floor: state = -1
+        elif closes[-1] > ceiling and (closes[-1] - ceiling) / ceiling < 0.05: state = 2
+    return ceiling, floor, state
+
+
+def test_darvas_boxes_match_candle_scan():
+    high, low, close = _bars(periods=150, tickers=200, seed=7)
+    # Rounded prices give equal highs/lows (ties count as box edges)
+    high, low, close = np.round(high), np.round(low), np.round(close)
+    ceilings, floors, states = darvas_boxes(high, low, close)
+
+    for t in range(high.shape[1]):
+        expected = _darvas_scan(high[:, t], low[:, t], close[:, t])
+        np.testing.assert_array_equal((ceilings[t], floors[t], states[t]), expected)
+        np.testing.assert_array_equal(darvas_boxes(high[:, t], low[:, t], close[:, t]), expected)
+        for n in (8, 30, 61, 63):
+            np.testing.assert_array_equal(darvas_boxes(high[-n:, t], low[-n:, t], close[-n:, t]),
+                                          _darvas_scan(high[-n:, t], low[-n:, t], close[-n:, t]))
+    assert set(states) == {-1, 0, 1, 2}
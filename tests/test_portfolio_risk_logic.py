@@ -10,7 +10,7 @@ def mock_market_data(mocker):
 
 @pytest.fixture
 def mock_yf_ticker(mocker):
-    return mocker.patch('option_auditor.portfolio_risk.yf.Ticker')
+    return mocker.patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
 
 def test_analyze_portfolio_risk_input_validation():
     # Test empty list
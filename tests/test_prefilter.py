@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from option_auditor.common.market_panel import MarketPanel
+from option_auditor.common.prefilter import LastBars, by_market, prefilter_tickers
+from option_auditor.common.screener_utils import ScreeningRunner, StrategySuite
+from option_auditor.strategies.master import FortressMasterScreener
+
+
+def _make_frames(count, periods=300, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2023-01-02", periods=periods)
+    suffixes = ("", ".L", ".NS")
+    frames = {}
+    for i in range(count):
+        n = periods - (i * 23) % 150  # staggered listings, some shorter than 200 bars
+        close = rng.uniform(5, 800) * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+        frames[f"T{i}{suffixes[i % 3]}"] = pd.DataFrame({
+            "Close": close,
+            "Volume": rng.uniform(1e3, 2e6) * rng.uniform(0.5, 1.5, n),
+        }, index=dates[-n:])
+    return frames
+
+
+def _fortress_gates(ticker, df):
+    """FortressMasterScreener.analyze's checks, per ticker."""
+    if len(df) < 200:
+        return False
+    price = df["Close"].iloc[-1]
+    turnover = price * df["Volume"].rolling(20).mean().iloc[-1]
+    if ticker.endswith(".L"):
+        return not (turnover / 100 < 2_000_000)
+    if ticker.endswith(".NS"):
+        return not (turnover < 50_000_000 or price < 100)
+    return not (turnover < 20_000_000 or price < 10)
+
+
+def test_gates_match_per_ticker_checks():
+    frames = _make_frames(60)
+    frames["T1.L"].iloc[-5, 1] = np.nan                           # gap in the volume window: cannot tell
+    frames["T3"] = frames["T3"].drop(frames["T3"].index[-30:-25])  # gapped listing (frame is a gather)
+    panel = MarketPanel.from_frame(pd.concat(frames, axis=1))
+
+    expected = [t for t in frames if _fortress_gates(t, panel.frame(t)) or pd.isna(panel.frame(t)["Volume"].iloc[-20:]).any()]
+    assert prefilter_tickers(panel, FortressMasterScreener.PREFILTER, list(frames), lookback=300) == expected
+    assert "T1.L" in expected and 0 < len(expected) < len(frames)
+
+
+def test_trend_and_volume_gates():
+    frames = _make_frames(12)
+    panel = MarketPanel.from_frame(pd.concat(frames, axis=1))
+    gates = [("min_avg_volume", (20, 500000)), ("above_sma", (200,))]
+
+    expected = []
+    for ticker, df in frames.items():
+        sma_200 = df["Close"].rolling(200).mean().iloc[-1]
+        if df["Volume"].rolling(20).mean().iloc[-1] < 500000 or df["Close"].iloc[-1] < sma_200:
+            continue
+        expected.append(ticker)
+    assert prefilter_tickers(panel, gates, list(frames)) == expected
+
+
+def test_undecidable_gates_keep_tickers():
+    frames = _make_frames(3)
+    panel = MarketPanel.from_frame(pd.concat(frames, axis=1))
+    tickers = ["MISSING"] + list(frames)
+    gate = [("min_avg_volume", (60, 1e12))]
+
+    assert prefilter_tickers(panel, gate, tickers) == ["MISSING"]
+    # The strategy only sees 40 bars: a 60-bar average is NaN there, so the gate cannot drop anything
+    assert prefilter_tickers(panel, gate, tickers, lookback=40) == tickers
+    assert prefilter_tickers(panel, gate, tickers, exempt=["T0"]) == ["MISSING", "T0"]
+    assert np.isnan(LastBars(panel, ["T0"]).mean("Open", 5)).all()
+    with pytest.raises(KeyError):
+        prefilter_tickers(panel, [("max_beta", (1,))], tickers)
+
+
+def test_runner_skips_filtered_tickers():
+    frames = _make_frames(8)
+    panel = MarketPanel.from_frame(pd.concat(frames, axis=1))
+    seen = []
+
+    def strategy(ticker, df):
+        seen.append(ticker)
+        if df["Volume"].rolling(20).mean().iloc[-1] >= 500000:
+            return {"ticker": ticker}
+
+    gates = [("min_avg_volume", (20, 500000))]
+    unfiltered = ScreeningRunner(ticker_list=list(frames)).run(strategy, panel=panel)
+    seen.clear()
+    filtered = ScreeningRunner(ticker_list=list(frames)).run(strategy, panel=panel, prefilter=gates)
+
+    assert sorted(seen) == sorted(r["ticker"] for r in unfiltered) and len(seen) < len(frames)
+    assert sorted(r["ticker"] for r in filtered) == sorted(seen)
+    # check_mode verifies single tickers, so every ticker reaches the strategy
+    seen.clear()
+    ScreeningRunner(ticker_list=list(frames), check_mode=True).run(strategy, panel=panel, prefilter=gates)
+    assert len(seen) == len(frames)
+
+
+def test_suite_keeps_only_gates_shared_by_all_strategies():
+    class Liquid:
+        PREFILTER = (("min_bars", (200,)), ("min_price", (by_market(us=10),)))
+
+    class Long:
+        PREFILTER = (("min_bars", (200,)),)
+
+    assert StrategySuite({"a": Liquid, "b": Long}).prefilter == (("min_bars", (200,)),)
+    assert StrategySuite({"a": Liquid, "b": lambda t, df: None}).prefilter == ()
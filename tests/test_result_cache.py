@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+from unittest.mock import patch
+
+from option_auditor.common.market_panel import MarketPanel
+from option_auditor.common.result_cache import ResultCache, ticker_fingerprints, params_digest, result_cache
+from option_auditor.common.screener_utils import ScreeningRunner, run_screening_strategy
+
+
+def _make_frames(tickers, periods=60):
+    dates = pd.date_range("2024-01-02", periods=periods, freq="B")
+    return {t: pd.DataFrame({
+        "Close": np.linspace(10, 20 + i, periods),
+        "Volume": 1e6,
+    }, index=dates) for i, t in enumerate(tickers)}
+
+
+def _panel(frames):
+    return MarketPanel.from_frame(pd.concat(frames, axis=1))
+
+
+def test_fingerprint_changes_only_for_changed_tickers():
+    frames = _make_frames(["A", "B", "C"])
+    before = ticker_fingerprints(_panel(frames), ["A", "B", "C", "MISSING"])
+    assert set(before) == {"A", "B", "C"}
+    assert before["A"][0] == frames["A"].index[-1]
+
+    frames["B"].iloc[10, 0] = 99.0  # revised history, same last bar
+    after = ticker_fingerprints(_panel(frames), ["A", "B", "C"])
+    assert after["A"] == before["A"] and after["C"] == before["C"]
+    assert after["B"][0] == before["B"][0] and after["B"] != before["B"]
+
+
+def test_params_digest_is_stable_and_covers_series():
+    spy = pd.Series([1.0, 2.0], index=pd.date_range("2024-01-02", periods=2))
+    assert params_digest({"regime": "BULL", "spy": spy}) == params_digest({"spy": spy.copy(), "regime": "BULL"})
+    assert params_digest({"regime": "BULL", "spy": spy}) != params_digest({"regime": "BULL", "spy": spy * 2})
+
+
+def test_lookup_store_and_persistence(tmp_path):
+    cache = ResultCache(str(tmp_path), enabled=True, max_age=100)
+    fingerprints = {"A": ("t1", "h1"), "B": ("t1", "h2")}
+    cache.store("scan", fingerprints, {"A": {"ticker": "A"}, "B": None}, now=0)
+
+    # A fresh process reads the results back from disk
+    restored = ResultCache(str(tmp_path), enabled=True, max_age=100)
+    cached, stale = restored.lookup("scan", {"A": ("t1", "h1"), "B": ("t2", "h3"), "C": ("t1", "h4")}, now=50)
+    assert cached == {"A": {"ticker": "A"}}
+    assert stale == ["B", "C"]
+
+    cached["A"]["mutated"] = True
+    assert restored.lookup("scan", fingerprints, now=50)[0] == {"A": {"ticker": "A"}, "B": None}
+    # Old results are recomputed even if the bars are unchanged
+    assert restored.lookup("scan", fingerprints, now=200) == ({}, ["A", "B"])
+
+
+def test_runner_rescans_only_changed_tickers():
+    tickers = ["A", "B", "C", "D"]
+    frames = _make_frames(tickers)
+    screened = []
+
+    def strategy(ticker, df):
+        screened.append(ticker)
+        if ticker != "D":
+            return {"ticker": ticker, "close": df["Close"].iloc[-1]}
+
+    with patch.object(result_cache, "enabled", True):
+        first = ScreeningRunner(ticker_list=tickers).run(strategy, panel=_panel(frames), result_key=("test", "v1"))
+        assert sorted(screened) == tickers
+
+        screened.clear()
+        frames["B"].iloc[-1, 0] = 42.0
+        second = ScreeningRunner(ticker_list=tickers).run(strategy, panel=_panel(frames), result_key=("test", "v1"))
+        assert screened == ["B"]
+
+        # Another strategy (or other parameters) does not see these results
+        screened.clear()
+        ScreeningRunner(ticker_list=tickers).run(strategy, panel=_panel(frames), result_key=("test", "v2"))
+        assert sorted(screened) == tickers
+
+    by_ticker = {r["ticker"]: r["close"] for r in second}
+    assert len(first) == len(second) == 3
+    assert by_ticker["B"] == 42.0 and by_ticker["A"] == 20.0
+
+
+def test_runner_ignores_results_when_disabled():
+    tickers = ["A", "B"]
+    panel = _panel(_make_frames(tickers))
+    screened = []
+    strategy = lambda ticker, df: screened.append(ticker)
+
+    for _ in range(2):
+        ScreeningRunner(ticker_list=tickers).run(strategy, panel=panel, result_key=("test", "v1"))
+    assert len(screened) == 4
+
+
+def test_incremental_per_scan_and_strategy_opt_out():
+    tickers = ["A", "B"]
+    panel = _panel(_make_frames(tickers))
+    screened = []
+    strategy = lambda ticker, df: screened.append(ticker)
+
+    # Disabled process-wide, on for this scan only
+    for _ in range(2):
+        ScreeningRunner(ticker_list=tickers).run(strategy, panel=panel, result_key=("test", "scan"), incremental=True)
+    assert len(screened) == 2
+
+    class ReadsFundamentals:
+        RESULT_CACHEABLE = False
+
+        def __init__(self, ticker, df, check_mode=False):
+            self.ticker = ticker
+
+        def analyze(self):
+            screened.append(self.ticker)
+
+    screened.clear()
+    with patch.object(result_cache, "enabled", True):
+        for _ in range(2):
+            run_screening_strategy(ReadsFundamentals, ticker_list=tickers, panel=panel)
+    assert len(screened) == 4
@@ -117,7 +117,7 @@ def _create_base_df(length=250):
         'Low': [99.0] * length
     }, index=dates)
 
-@patch('option_auditor.risk_intelligence.yf.download')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.download')
 @patch('option_auditor.risk_intelligence._calculate_atr')
 @patch('option_auditor.risk_intelligence._calculate_rsi')
 def test_market_regime_stormy(mock_rsi, mock_atr, mock_yf):
@@ -139,7 +139,7 @@ def test_market_regime_stormy(mock_rsi, mock_atr, mock_yf):
     assert result["market_climate"] == "Quiet" # VIX 14
     assert result["vix"] == 14.0
 
-@patch('option_auditor.risk_intelligence.yf.download')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.download')
 @patch('option_auditor.risk_intelligence._calculate_atr')
 @patch('option_auditor.risk_intelligence._calculate_rsi')
 def test_market_regime_bearish(mock_rsi, mock_atr, mock_yf):
@@ -163,7 +163,7 @@ def test_market_regime_bearish(mock_rsi, mock_atr, mock_yf):
     assert result["market_climate"] == "Turbulent"
     assert result["vix"] == 20.0
 
-@patch('option_auditor.risk_intelligence.yf.download')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.download')
 @patch('option_auditor.risk_intelligence._calculate_atr')
 @patch('option_auditor.risk_intelligence._calculate_rsi')
 def test_market_regime_bullish(mock_rsi, mock_atr, mock_yf):
@@ -187,7 +187,7 @@ def test_market_regime_bullish(mock_rsi, mock_atr, mock_yf):
     assert result["market_climate"] == "Panic"
     assert result["vix"] == 30.0
 
-@patch('option_auditor.risk_intelligence.yf.download')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.download')
 @patch('option_auditor.risk_intelligence._calculate_atr')
 @patch('option_auditor.risk_intelligence._calculate_rsi')
 def test_market_regime_neutral(mock_rsi, mock_atr, mock_yf):
@@ -210,21 +210,21 @@ def test_market_regime_neutral(mock_rsi, mock_atr, mock_yf):
     assert result["market_climate"] == "Unknown"
     assert result["vix"] is None
 
-@patch('option_auditor.risk_intelligence.yf.download')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.download')
 def test_market_regime_insufficient_data(mock_yf):
     mock_yf.return_value = pd.DataFrame({'Close': [15.0]})
     df = _create_base_df(length=50) # Too short
     result = get_market_regime(df)
     assert "Insufficient History" in result["regime"]
 
-@patch('option_auditor.risk_intelligence.yf.download')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.download')
 def test_market_regime_missing_columns(mock_yf):
     mock_yf.return_value = pd.DataFrame({'Close': [15.0]})
     df = pd.DataFrame({'Close': [100]*250})
     result = get_market_regime(df)
     assert "Missing Columns" in result["regime"]
 
-@patch('option_auditor.risk_intelligence.yf.download')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.download')
 def test_market_regime_empty(mock_yf):
     mock_yf.return_value = pd.DataFrame({'Close': [15.0]})
     result = get_market_regime(pd.DataFrame())
@@ -17,7 +17,7 @@ def test_run_master_scan_success(mock_cache, mock_scan):
 
     run_master_scan()
 
-    mock_scan.assert_called_with(region="us", time_frame="1d")
+    mock_scan.assert_called_with(region="us", time_frame="1d", incremental=True)
     mock_cache.assert_called_with(("master", "us", "1d"), [{"ticker": "AAPL"}])
 
 @patch('webapp.services.scheduler_service.screen_master_convergence')
@@ -108,3 +108,10 @@ def test_schedule_registration(mock_run_scan, mock_schedule, mock_thread, app):
     # Run the job
     registered_job()
     mock_run_scan.assert_called()
+
+@patch('webapp.services.scheduler_service.threading.Thread')
+@patch('webapp.services.scheduler_service.schedule')
+@patch('webapp.services.scheduler_service.indicator_streams')
+def test_start_scheduler_enables_indicator_streams(mock_streams, mock_schedule, mock_thread, app):
+    start_scheduler(app)
+    mock_streams.enable.assert_called_once()
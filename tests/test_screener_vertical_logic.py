@@ -54,7 +54,7 @@ def test_vertical_spread_trend_filter(mock_fetch):
 
     # We need to mock yf.Ticker to prevent it from crashing or doing real calls
     # If we don't mock it, it might try to fetch earnings and fail.
-    with patch('option_auditor.strategies.vertical_spreads.yf.Ticker') as mock_ticker:
+    with patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker') as mock_ticker:
         # Mock Ticker to return nothing useful so it stops at earnings/options check
         # But we want to confirm it PASSED the trend check.
         # If it returns empty list at end, that's fine, as long as it TRIED to fetch ticker.
@@ -69,7 +69,7 @@ def test_vertical_spread_trend_filter(mock_fetch):
 
 
 @patch('option_auditor.strategies.vertical_spreads.fetch_batch_data_safe')
-@patch('option_auditor.strategies.vertical_spreads.yf.Ticker')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
 def test_vertical_spread_earnings_check(mock_ticker_cls, mock_fetch):
     """
     Test Step 3: Earnings Avoidance (Next 21 days).
@@ -114,7 +114,7 @@ def test_vertical_spread_earnings_check(mock_ticker_cls, mock_fetch):
 
 
 @patch('option_auditor.strategies.vertical_spreads.fetch_batch_data_safe')
-@patch('option_auditor.strategies.vertical_spreads.yf.Ticker')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
 def test_vertical_spread_liquidity_check(mock_ticker_cls, mock_fetch):
     """
     Test Step 4 & 5: Option Liquidity (Vol/OI).
@@ -180,7 +180,7 @@ def test_vertical_spread_liquidity_check(mock_ticker_cls, mock_fetch):
 
 
 @patch('option_auditor.strategies.vertical_spreads.fetch_batch_data_safe')
-@patch('option_auditor.strategies.vertical_spreads.yf.Ticker')
+@patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker')
 @patch('option_auditor.strategies.vertical_spreads._calculate_put_delta')
 def test_vertical_spread_selection_logic(mock_delta, mock_ticker_cls, mock_fetch):
     """
@@ -0,0 +1,138 @@
+import os
+import time
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from option_auditor.common import data_utils, shared_panel
+from option_auditor.common.market_panel import MarketPanel
+from option_auditor.common.data_utils import get_cached_market_data, load_shared_panel
+from option_auditor.common.screener_utils import ScreeningRunner, _screen_batch
+
+
+def _make_frame(tickers, periods=5):
+    dates = pd.date_range("2024-01-01", periods=periods, freq="B")
+    frames = {t: pd.DataFrame({
+        "Open": 1.0, "High": 2.0, "Low": 0.5,
+        "Close": np.arange(periods, dtype=float) + i,
+        "Volume": 100.0,
+    }, index=dates) for i, t in enumerate(tickers)}
+    return pd.concat(frames, axis=1)
+
+
+def _rows(ticker, df):
+    if ticker in ("T1", "T2"):
+        return {"ticker": ticker, "rows": len(df), "last": float(df["Close"].iloc[-1])}
+
+
+@pytest.fixture
+def mock_cache_dir(tmp_path):
+    d = tmp_path / "cache_test"
+    d.mkdir()
+    with patch("option_auditor.common.data_utils.CACHE_DIR", str(d)), \
+         patch.object(shared_panel, "SHARED_PANEL_ENABLED", True), \
+         patch.dict(shared_panel._attached, clear=True):
+        yield str(d)
+
+
+def test_publish_and_attach_roundtrip(tmp_path):
+    panel = MarketPanel.from_frame(_make_frame(["AAPL", "MSFT"]).astype(np.float32))
+
+    with patch.dict(shared_panel._attached, clear=True):
+        shared_panel.publish_panel(panel, "market_scan_v1", str(tmp_path), "v1")
+        attached = shared_panel.attach_panel("market_scan_v1", str(tmp_path))
+
+        assert attached.version == "v1"
+        assert attached.tickers == ["AAPL", "MSFT"]
+        assert isinstance(attached.values.base, np.memmap) or isinstance(attached.values, np.memmap)
+        assert not attached.values.flags.writeable
+        pd.testing.assert_frame_equal(attached.frame("MSFT"), panel.frame("MSFT"), check_freq=False)
+
+        # Same version -> same object, no reload
+        assert shared_panel.attach_panel("market_scan_v1", str(tmp_path)) is attached
+        assert shared_panel.attach_panel("market_scan_v1", str(tmp_path), expected_version="v0") is None
+
+        # New version replaces the old one on disk and is picked up on next attach
+        shared_panel.publish_panel(panel, "market_scan_v1", str(tmp_path), "v2")
+        assert shared_panel.attach_panel("market_scan_v1", str(tmp_path)).version == "v2"
+        assert not os.path.exists(os.path.join(str(tmp_path), "panels", "market_scan_v1", "v1"))
+
+
+def test_cache_refresh_publishes_panel_visible_to_readers(mock_cache_dir):
+    tickers = ["AAPL", "MSFT"]
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", return_value=_make_frame(tickers)):
+        get_cached_market_data(tickers, cache_name="market_scan_v1", force_refresh=True)
+
+    panel = load_shared_panel("market_scan_v1")
+    assert panel is not None
+    assert panel.version == shared_panel.cache_version(os.path.join(mock_cache_dir, "market_scan_v1.parquet"))
+
+    # A newer cache file without a matching published panel is not served
+    os.utime(os.path.join(mock_cache_dir, "market_scan_v1.parquet"), ns=(1, 1))
+    assert load_shared_panel("market_scan_v1") is None
+
+
+def test_screening_runner_attaches_shared_panel(mock_cache_dir):
+    tickers = [f"T{i}" for i in range(60)]
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", return_value=_make_frame(tickers)):
+        get_cached_market_data(tickers, cache_name="market_scan_v1", force_refresh=True)
+
+    runner = ScreeningRunner(ticker_list=tickers)
+    with patch.object(ScreeningRunner, "_fetch_data") as mock_fetch:
+        results = runner.run(lambda t, df: {"ticker": t, "rows": len(df)})
+
+    mock_fetch.assert_not_called()
+    assert len(results) == 60
+
+
+def test_stale_shared_panel_is_not_served(mock_cache_dir):
+    tickers = [f"T{i}" for i in range(60)]
+    with patch("option_auditor.common.data_utils.fetch_batch_data_safe", return_value=_make_frame(tickers)):
+        get_cached_market_data(tickers, cache_name="market_scan_v1", force_refresh=True)
+    assert load_shared_panel("market_scan_v1", lookup_only=True) is not None
+
+    # Written ten days ago: sessions have closed since and it is past the 48h window
+    file_path = os.path.join(mock_cache_dir, "market_scan_v1.parquet")
+    written = time.time_ns() - 10 * 24 * 3600 * 10**9
+    os.utime(file_path, ns=(written, written))
+    data_utils._publish_shared_panel("market_scan_v1", _make_frame(tickers), file_path)
+    assert shared_panel.attach_panel("market_scan_v1", mock_cache_dir, expected_version=shared_panel.cache_version(file_path)) is not None
+
+    assert load_shared_panel("market_scan_v1", lookup_only=True) is None
+    assert load_shared_panel("market_scan_v1", ticker_list=tickers) is None
+    runner = ScreeningRunner(ticker_list=tickers)
+    with patch.object(ScreeningRunner, "_fetch_data", return_value=_make_frame(tickers)) as mock_fetch:
+        runner.run(lambda t, df: {"ticker": t})
+    mock_fetch.assert_called_once()
+
+
+def test_load_shared_panel_disabled(mock_cache_dir):
+    with patch.object(shared_panel, "SHARED_PANEL_ENABLED", False):
+        assert load_shared_panel("market_scan_v1") is None
+
+
+def test_scan_panel_shared_with_workers_and_removed():
+    tickers = [f"T{i}" for i in range(3)]
+    panel = MarketPanel.from_frame(_make_frame(tickers, periods=30))
+
+    with patch.dict(shared_panel._attached, clear=True):
+        with shared_panel.scan_panel(panel) as shared:
+            base_dir, cache_name, version = shared
+            # What a worker process runs for its batch of tickers
+            results = _screen_batch(shared, ["T0", "T1", "T2"], _rows, ("1d", "2y", "1d", None, False), 10, None)
+            assert shared_panel.attach_panel(cache_name, base_dir, expected_version=version).tickers == tickers
+        assert not os.path.exists(base_dir)
+
+    assert results == [("T1", {"ticker": "T1", "rows": 10, "last": 30.0}), ("T2", {"ticker": "T2", "rows": 10, "last": 31.0})]
+
+
+def test_process_runner_falls_back_to_threads_for_local_strategies():
+    tickers = [f"T{i}" for i in range(3)]
+    panel = MarketPanel.from_frame(_make_frame(tickers))
+    runner = ScreeningRunner(ticker_list=tickers, executor="process")
+
+    with patch("option_auditor.common.screener_utils.ScanProcessPool") as mock_pool:
+        results = runner.run(lambda t, df: {"ticker": t}, panel=panel)
+    mock_pool.instance.assert_not_called()
+    assert len(results) == 3
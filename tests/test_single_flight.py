@@ -0,0 +1,109 @@
+import threading
+import time
+import pandas as pd
+from unittest.mock import patch
+
+from option_auditor.common.single_flight import SingleFlight
+from option_auditor.common import data_utils
+from webapp.cache import run_screener_once
+
+
+def _run_concurrently(n, target):
+    barrier = threading.Barrier(n)
+    results, errors = [None] * n, [None] * n
+
+    def worker(i):
+        barrier.wait()
+        try:
+            results[i] = target()
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, errors
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test")
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"value": 42}
+
+    results, errors = _run_concurrently(5, lambda: flight.do("k", slow))
+
+    assert len(calls) == 1
+    assert errors == [None] * 5
+    assert all(r == {"value": 42} for r in results)
+    assert flight.in_flight() == 0
+
+
+def test_errors_propagate_to_waiters_and_are_not_cached():
+    flight = SingleFlight("test")
+    calls = []
+
+    def failing():
+        calls.append(1)
+        time.sleep(0.2)
+        raise ValueError("boom")
+
+    _, errors = _run_concurrently(3, lambda: flight.do("k", failing))
+
+    assert len(calls) == 1
+    assert all(isinstance(e, ValueError) for e in errors)
+    # Nothing is remembered once the call completes
+    assert flight.do("k", lambda: "ok") == "ok"
+
+
+def test_share_hook_applies_to_waiters():
+    flight = SingleFlight("test", share=lambda df: df.copy(deep=False))
+    df = pd.DataFrame({"Close": [1.0, 2.0]})
+
+    def slow():
+        time.sleep(0.2)
+        return df
+
+    results, _ = _run_concurrently(3, lambda: flight.do("k", slow))
+
+    assert sum(r is df for r in results) == 1
+    for r in results:
+        pd.testing.assert_frame_equal(r, df)
+
+
+def test_concurrent_fetch_batch_downloads_once():
+    cols = pd.MultiIndex.from_product([["AAPL", "MSFT"], ["Close"]])
+    frame = pd.DataFrame(1.0, index=pd.date_range("2024-01-01", periods=3), columns=cols)
+
+    def slow_download(*args, **kwargs):
+        time.sleep(0.3)
+        return frame
+
+    with patch("option_auditor.common.market_data_provider.YFinanceProvider.download", side_effect=slow_download) as mock_dl:
+        results, errors = _run_concurrently(
+            4, lambda: data_utils.fetch_batch_data_safe(["MSFT", "AAPL"], period="1y", interval="1d")
+        )
+
+    assert mock_dl.call_count == 1
+    assert errors == [None] * 4
+    for r in results:
+        assert list(r.columns) == list(cols)
+
+
+def test_run_screener_once_coalesces_same_key():
+    calls = []
+
+    def screen(region="us"):
+        calls.append(region)
+        time.sleep(0.2)
+        return [{"ticker": "AAPL"}]
+
+    results, _ = _run_concurrently(4, lambda: run_screener_once(("test_screen", "us"), screen, region="us"))
+
+    assert calls == ["us"]
+    assert all(r == [{"ticker": "AAPL"}] for r in results)
@@ -12,7 +12,7 @@ except ImportError:
 
 @pytest.fixture
 def mock_yf_ticker():
-    with patch('option_auditor.strategies.quality_200w.yf.Ticker') as mock:
+    with patch('option_auditor.common.market_data_provider.YFinanceProvider.ticker') as mock:
         yield mock
 
 def create_mock_df(days=2000, start_price=100, trend=1):
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+from unittest.mock import patch
+
+from option_auditor.common.market_panel import MarketPanel
+from option_auditor.common.screener_utils import ScreeningRunner
+from option_auditor.common.timeframes import resample_frame, resample_panel, derived_panel
+
+
+def _make_frames(count, index, seed=0):
+    rng = np.random.default_rng(seed)
+    frames = {}
+    for i in range(count):
+        # Staggered listing dates so tickers start on different days of the panel
+        n = len(index) - (i * 37) % (len(index) // 2)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+        frames[f"T{i}"] = pd.DataFrame({
+            "Open": close * (1 + rng.normal(0, 0.002, n)),
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(1_000, 1_000_000, n).astype(float),
+        }, index=index[-n:])
+    return frames
+
+
+def _assert_matches_per_ticker(panel, rule):
+    derived = resample_panel(panel, rule)
+    for ticker in panel.tickers:
+        expected = resample_frame(panel.frame(ticker), rule)
+        pd.testing.assert_frame_equal(derived.frame(ticker), expected, check_freq=False, rtol=1e-9)
+
+
+def test_daily_panel_resamples_like_each_ticker():
+    frames = _make_frames(8, pd.bdate_range("2022-01-03", periods=520))
+    frames["T3"] = frames["T3"].drop(columns="Volume")
+    frames["T4"].iloc[100:110] = np.nan  # suspended: the week has no bars
+    frames["T5"].iloc[200, frames["T5"].columns.get_loc("Open")] = np.nan
+    panel = MarketPanel.from_frame(pd.concat(frames, axis=1))
+
+    for rule in ("W-MON", "MS"):
+        _assert_matches_per_ticker(panel, rule)
+    # Weekly bars carry their Monday, like the provider's weekly download
+    assert (resample_panel(panel, "W-MON").dates.dayofweek == 0).all()
+
+
+def test_intraday_panel_resamples_like_each_ticker():
+    sessions = pd.bdate_range("2024-03-04", periods=20)
+    index = pd.DatetimeIndex([day + pd.Timedelta(hours=9, minutes=30) + pd.Timedelta(minutes=5 * k)
+                              for day in sessions for k in range(78)])
+    panel = MarketPanel.from_frame(pd.concat(_make_frames(6, index, seed=1), axis=1))
+
+    # Fixed-length bins start at the midnight of each ticker's first bar
+    for rule in ("49min", "98min", "4h"):
+        _assert_matches_per_ticker(panel, rule)
+
+
+def test_derived_panel_is_cached_per_base_version():
+    frames = _make_frames(3, pd.bdate_range("2023-01-02", periods=120))
+    panel = MarketPanel.from_frame(pd.concat(frames, axis=1), version=("test", "daily", 1))
+
+    weekly = derived_panel(panel, "W-MON")
+    with patch("option_auditor.common.timeframes.resample_panel") as mock_resample:
+        assert derived_panel(panel, "W-MON") is weekly
+        mock_resample.assert_not_called()
+    assert derived_panel(panel, "MS") is not weekly
+
+
+def test_runner_screens_weekly_bars_from_daily_data():
+    frames = _make_frames(2, pd.bdate_range("2023-01-02", periods=300))
+    runner = ScreeningRunner(ticker_list=["T0", "T1"], time_frame="1wk")
+    assert (runner.yf_interval, runner.resample_rule) == ("1d", "W-MON")
+
+    seen = {}
+    with patch.object(ScreeningRunner, "_fetch_data", return_value=pd.concat(frames, axis=1)) as mock_fetch:
+        runner.run(lambda ticker, df: seen.setdefault(ticker, df) is None)
+    mock_fetch.assert_called_once()
+    for ticker, df in seen.items():
+        pd.testing.assert_frame_equal(df, resample_frame(frames[ticker], "W-MON"), check_freq=False)
+
+
+def test_runner_downloads_monthly_bars_natively():
+    tickers = [f"T{i}" for i in range(60)]
+    monthly = pd.concat(_make_frames(60, pd.date_range("2021-01-01", periods=60, freq="MS")), axis=1)
+    runner = ScreeningRunner(ticker_list=tickers, time_frame="1mo")
+    assert (runner.yf_interval, runner.period, runner.resample_rule) == ("1mo", "5y", None)
+
+    seen = {}
+    with patch("option_auditor.common.screener_utils.get_cached_market_data") as mock_cache, \
+         patch("option_auditor.common.screener_utils.fetch_batch_data_safe", return_value=monthly) as mock_fetch:
+        runner.run(lambda ticker, df: seen.setdefault(ticker, len(df)) is None)
+        # The daily region cache is not monthly history; the native download is memoized instead
+        ScreeningRunner(ticker_list=tickers, time_frame="1mo").run(lambda ticker, df: None)
+    mock_cache.assert_not_called()
+    mock_fetch.assert_called_once()
+    assert mock_fetch.call_args.kwargs["interval"] == "1mo"
+    assert max(seen.values()) == 60
@@ -1,7 +1,12 @@
 import pytest
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from option_auditor.common.data_utils import _calculate_trend_breakout_date
+from unittest.mock import patch
+from option_auditor.common.data_utils import _calculate_trend_breakout_date, TREND_BREAKOUT_FEATURE
+from option_auditor.common.feature_store import FeatureStore
+from option_auditor.common.indicator_engine import prime_panel_features, ENGINE_MIN_TICKERS
+from option_auditor.common.market_panel import MarketPanel
 
 def create_ohlc_df(days=100, start_price=100.0):
     """
@@ -152,3 +157,67 @@ def test_backwards_search_logic():
     # Assert return is NOT the first breakout, but the second one.
     assert result == breakout2_date.strftime("%Y-%m-%d")
     assert result != df.index[breakout1_idx].strftime("%Y-%m-%d")
+
+
+def _reference_breakout_date(df):
+    """The pandas implementation _calculate_trend_breakout_date replaced."""
+    if df.empty or len(df) < 50: return "N/A"
+    subset = df.copy()
+    if 'High_50' not in subset.columns:
+        subset['High_50'] = subset['High'].rolling(50).max().shift(1)
+    if 'Low_20' not in subset.columns:
+        subset['Low_20'] = subset['Low'].rolling(20).min().shift(1)
+    curr_close = subset['Close'].iloc[-1]
+    low_20 = subset['Low_20'].iloc[-1]
+    if pd.isna(curr_close) or pd.isna(low_20) or curr_close <= low_20:
+        return "N/A"
+    subset = subset.iloc[-min(len(subset), 400):]
+    break_indices = subset.index[subset['Close'] <= subset['Low_20']]
+    breakouts = subset.index[subset['Close'] >= subset['High_50']]
+    if not break_indices.empty:
+        breakouts = breakouts[breakouts > break_indices[-1]]
+    return breakouts[0].strftime("%Y-%m-%d") if not breakouts.empty else "N/A"
+
+
+def _random_frames(count, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2021-01-04", periods=700, freq="B")
+    frames = {}
+    for i in range(count):
+        n = 700 - (i * 37) % 660
+        close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, n)))
+        frames[f"T{i}"] = pd.DataFrame({
+            "Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+            "Volume": np.full(n, 1e6),
+        }, index=dates[-n:])
+    return frames
+
+
+def test_vectorized_breakout_date_matches_pandas():
+    frames = _random_frames(60)
+    results = set()
+    for ticker, df in frames.items():
+        expected = _reference_breakout_date(df)
+        assert _calculate_trend_breakout_date(df) == expected
+        assert _calculate_trend_breakout_date(df, ticker) == expected
+        results.add(expected == "N/A")
+
+        # Channels the caller already computed are used as they are
+        with_columns = df.assign(High_50=df['High'].rolling(50).max().shift(1).ffill(),
+                                 Low_20=df['Low'].rolling(20).min().shift(1).ffill())
+        assert _calculate_trend_breakout_date(with_columns) == _reference_breakout_date(with_columns)
+    assert results == {True, False}
+
+
+def test_breakout_dates_batch_computed_for_the_panel():
+    frames = _random_frames(ENGINE_MIN_TICKERS, seed=1)
+    panel = MarketPanel.from_frame(pd.concat(frames, axis=1))
+    store = FeatureStore(50 * 1024 * 1024)
+
+    assert prime_panel_features(panel, [TREND_BREAKOUT_FEATURE], store=store) == ENGINE_MIN_TICKERS
+    with patch("option_auditor.common.data_utils.batch_trend_breakout") as mock_batch, \
+            patch("option_auditor.common.feature_store.feature_store", store):
+        for ticker in ("T0", "T5", "T11"):
+            df = panel.frame(ticker)
+            assert _calculate_trend_breakout_date(df, ticker) == _reference_breakout_date(df)
+        mock_batch.assert_not_called()
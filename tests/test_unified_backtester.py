@@ -7,7 +7,7 @@ from option_auditor.unified_backtester import UnifiedBacktester
 @pytest.fixture
 def mock_yf_download():
     # Patch yf.download in the new BacktestDataLoader location
-    with patch("option_auditor.backtest_data_loader.yf.download") as mock:
+    with patch("option_auditor.common.market_data_provider.YFinanceProvider.download") as mock:
         yield mock
 
 def create_mock_df():
@@ -5,7 +5,7 @@ from option_auditor.unified_screener import screen_universal_dashboard, get_mark
 
 @pytest.fixture
 def mock_yf_download():
-    with patch('option_auditor.unified_screener.yf.download') as mock:
+    with patch('option_auditor.common.market_data_provider.YFinanceProvider.download') as mock:
         yield mock
 
 def create_mock_df(closes):
@@ -161,6 +161,26 @@ def test_screen_isa(client):
         assert len(data["results"]) == 1
         assert data["results"][0]["ticker"] == "AAPL"
 
+def test_screen_isa_falls_back_when_shared_panel_lacks_tickers(client):
+    """A shared panel missing requested tickers is not used; the cache path serves them all"""
+    import pandas as pd
+    from option_auditor.common.market_panel import MarketPanel
+
+    dates = pd.date_range("2024-01-01", periods=2)
+    frame = pd.concat({t: pd.DataFrame({"Close": [100.0, 101.0]}, index=dates) for t in ("AAPL", "MSFT")}, axis=1)
+    with patch("webapp.blueprints.screener_routes.resolve_region_tickers", return_value=["AAPL", "MSFT"]), \
+         patch("webapp.blueprints.screener_routes.load_shared_panel", return_value=MarketPanel.from_frame(frame[["AAPL"]])), \
+         patch("webapp.blueprints.screener_routes.get_cached_market_data", return_value=frame) as mock_data, \
+         patch("webapp.blueprints.screener_routes.IsaStrategy") as MockStrategy, \
+         patch("webapp.blueprints.screener_routes.get_cached_screener_result", return_value=None):
+
+        MockStrategy.return_value.analyze.return_value = {"Signal": "ENTER"}
+
+        resp = client.get("/screen/isa?region=us")
+        assert resp.status_code == 200
+        mock_data.assert_called_once()
+        assert sorted(call.args[0] for call in MockStrategy.call_args_list) == ["AAPL", "MSFT"]
+
 def test_screen_bull_put(client):
     """Test /screen/bull_put"""
     with patch("webapp.blueprints.screener_routes.screener") as mock_screener, \
@@ -282,6 +302,37 @@ def test_screen_master(client):
         data = resp.get_json()
         assert data[0]["ticker"] == "MASTER"
 
+def test_stream_screen_master(client):
+    """Test /screen/stream/master (Server-Sent Events)"""
+    from option_auditor.common.scan_stream import scan_started, ticker_screened
+
+    def fake_scan(region, time_frame):
+        scan_started(2)
+        ticker_screened({"ticker": "MASTER"})
+        ticker_screened(None)
+        return [{"ticker": "MASTER"}]
+
+    with patch("webapp.blueprints.screener_routes.screen_master_convergence", side_effect=fake_scan), \
+         patch("webapp.blueprints.screener_routes.get_cached_screener_result", return_value=None), \
+         patch("webapp.blueprints.screener_routes.cache_screener_result") as mock_cache:
+
+        resp = client.get("/screen/stream/master?region=us")
+        assert resp.status_code == 200
+        assert resp.mimetype == "text/event-stream"
+        body = resp.get_data(as_text=True)
+
+    assert 'event: row\ndata: {"ticker": "MASTER"}' in body
+    assert 'event: progress\ndata: {"screened": 2, "total": 2}' in body
+    assert body.rstrip().endswith('event: done\ndata: [{"ticker": "MASTER"}]')
+    mock_cache.assert_called_once_with(("master", "us", "1d"), [{"ticker": "MASTER"}])
+
+    # Cached results are sent as a single done event
+    with patch("webapp.blueprints.screener_routes.get_cached_screener_result", return_value=[{"ticker": "CACHED"}]):
+        body = client.get("/screen/stream/master").get_data(as_text=True)
+    assert body == 'event: done\ndata: [{"ticker": "CACHED"}]\n\n'
+
+    assert client.get("/screen/stream/unknown").status_code == 404
+
 def test_screen_fourier(client):
     """Test /screen/fourier"""
     with patch("webapp.blueprints.screener_routes.screener") as mock_screener, \
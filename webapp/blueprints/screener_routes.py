@@ -1,21 +1,23 @@
-from flask import Blueprint, request, jsonify, current_app, g
+from flask import Blueprint, request, jsonify, current_app, g, Response, stream_with_context
 import logging
 from datetime import datetime, timedelta
 import pandas as pd
-import yfinance as yf
 
 from option_auditor import screener
 from option_auditor.strategies.master import screen_master_convergence
 from option_auditor.unified_backtester import UnifiedBacktester
 from option_auditor.strategies.isa import IsaStrategy
 from option_auditor.common.resilience import data_api_breaker
-from option_auditor.common.data_utils import get_cached_market_data
+from option_auditor.common.data_utils import get_cached_market_data, load_shared_panel
+from option_auditor.common.market_panel import MarketPanel
 from option_auditor.common.screener_utils import resolve_region_tickers, resolve_ticker
 from option_auditor.uk_stock_data import get_uk_tickers
 from option_auditor.us_stock_data import get_united_states_stocks
 from option_auditor.common.constants import SECTOR_COMPONENTS, DEFAULT_ACCOUNT_SIZE
+from option_auditor.common.market_data_provider import get_provider
+from option_auditor.common.scan_stream import stream_scan
 
-from webapp.cache import screener_cache, get_cached_screener_result, cache_screener_result
+from webapp.cache import screener_cache, get_cached_screener_result, cache_screener_result, run_screener_once
 from webapp.utils import handle_screener_errors
 from webapp.services.check_service import handle_check_stock
 from webapp.validation import validate_schema
@@ -62,8 +64,13 @@ def screen():
         current_app.logger.info("Serving cached screen result")
         return jsonify(cached)
 
-    results = screener.screen_market(data.iv_rank, data.rsi_threshold, data.time_frame, region=data.region)
-    sector_results = screener.screen_sectors(data.iv_rank, data.rsi_threshold, data.time_frame)
+    def _compute():
+        return (
+            screener.screen_market(data.iv_rank, data.rsi_threshold, data.time_frame, region=data.region),
+            screener.screen_sectors(data.iv_rank, data.rsi_threshold, data.time_frame),
+        )
+
+    results, sector_results = run_screener_once(cache_key, _compute)
     data_resp = {
         "results": results,
         "sector_results": sector_results,
@@ -151,7 +158,7 @@ def screen_alpha101():
         return jsonify(cached)
 
     # Use the new function
-    results = screener.screen_alpha_101(region=data.region, time_frame=data.time_frame)
+    results = run_screener_once(cache_key, screener.screen_alpha_101, region=data.region, time_frame=data.time_frame)
 
     current_app.logger.info(f"Alpha 101 Screen completed. Results: {len(results)}")
     cache_screener_result(cache_key, results)
@@ -169,7 +176,7 @@ def screen_my_strategy_route():
     cached = get_cached_screener_result(cache_key)
     if cached: return jsonify(cached)
 
-    results = screener.screen_my_strategy(region=data.region)
+    results = run_screener_once(cache_key, screener.screen_my_strategy, region=data.region)
 
     cache_screener_result(cache_key, results)
     return jsonify(results)
@@ -184,7 +191,7 @@ def screen_fortress():
     cached = get_cached_screener_result(cache_key)
     if cached: return jsonify(cached)
 
-    results = screener.screen_dynamic_volatility_fortress(time_frame=data.time_frame)
+    results = run_screener_once(cache_key, screener.screen_dynamic_volatility_fortress, time_frame=data.time_frame)
 
     current_app.logger.info(f"Fortress Screen completed. Results: {len(results)}")
     cache_screener_result(cache_key, results)
@@ -203,7 +210,7 @@ def screen_options_only():
         return jsonify(cached)
 
     # Run with limit=75 to be safe
-    results = screener.screen_options_only_strategy(limit=75)
+    results = run_screener_once(cache_key, screener.screen_options_only_strategy, limit=75)
 
     # Cache results
     cache_screener_result(cache_key, results)
@@ -225,68 +232,61 @@ def screen_isa():
         current_app.logger.info("Serving cached ISA screen result")
         return jsonify({"results": cached})
 
-    # For ISA, if region is 'us', we prefer the broader S&P 500 list
-    if data.region == 'us':
-        tickers = resolve_region_tickers('sp500')
-    else:
-        tickers = resolve_region_tickers(data.region)
-
-    # Correct Cache Name logic to use Shared Cache for US/SP500
-    cache_name = f"market_scan_{data.region}"
-    if data.region in ['us', 'united_states', 'sp500']:
-        cache_name = "market_scan_v1"
-    elif data.region == 'uk':
-        cache_name = "market_scan_uk"
-    elif data.region == 'india':
-        cache_name = "market_scan_india"
-    elif data.region == 'uk_euro':
-            cache_name = "market_scan_europe"
-
-    results = []
+    def _compute():
+        # For ISA, if region is 'us', we prefer the broader S&P 500 list
+        if data.region == 'us':
+            tickers = resolve_region_tickers('sp500')
+        else:
+            tickers = resolve_region_tickers(data.region)
+
+        # Correct Cache Name logic to use Shared Cache for US/SP500
+        cache_name = f"market_scan_{data.region}"
+        if data.region in ['us', 'united_states', 'sp500']:
+            cache_name = "market_scan_v1"
+        elif data.region == 'uk':
+            cache_name = "market_scan_uk"
+        elif data.region == 'india':
+            cache_name = "market_scan_india"
+        elif data.region == 'uk_euro':
+                cache_name = "market_scan_europe"
+
+        results = []
+
+        # Cross-process panel published by the cache refresh (SHARED_MARKET_PANEL=1) while the cache
+        # is current and holds every ticker, else the parquet / download path
+        panel = load_shared_panel(cache_name, ticker_list=tickers)
+        if panel is not None and not all(t in panel for t in tickers):
+            panel = None
+
+        if panel is None:
+            market_data = get_cached_market_data(tickers, period="2y", cache_name=cache_name)
+
+            if market_data.empty:
+                current_app.logger.warning("ISA Screen: Data empty")
+                return None
+
+            # Shared panel: per-ticker frames are views, no slicing/copying per ticker
+            # (a flat result is only unambiguous if we asked for 1 ticker)
+            panel = MarketPanel.from_frame(market_data, default_ticker=tickers[0] if len(tickers) == 1 else None)
+
+        for ticker, df in panel.items(tickers):
+            try:
+                if not df.empty:
+                    strategy = IsaStrategy(ticker, df, account_size=account_size)
+                    res = strategy.analyze()
+                    if res and res['Signal'] != 'WAIT':
+                        results.append(res)
+            except Exception as e:
+                # Log but continue - prevent one bad ticker from killing the loop
+                # current_app.logger.warning(f"ISA Screen failed for {ticker}: {e}")
+                continue
 
-    data = get_cached_market_data(tickers, period="2y", cache_name=cache_name)
+        return results
 
-    if data.empty:
-        current_app.logger.warning("ISA Screen: Data empty")
+    results = run_screener_once(cache_key, _compute)
+    if results is None:
         return jsonify([])
 
-    # Robust Iteration Logic (Handles both MultiIndex and Flat DataFrames)
-    iterator = []
-    if isinstance(data.columns, pd.MultiIndex):
-        # Standard Batch Result: Iterate over Level 0 (Tickers)
-        iterator = [(ticker, data[ticker]) for ticker in data.columns.unique(level=0)]
-    else:
-        # Flat Result (Single Ticker or Flattened)
-        # If we asked for 1 ticker, this is expected.
-        # If we asked for 500, this is bad unless only 1 returned.
-        if len(tickers) == 1:
-                iterator = [(tickers[0], data)]
-        elif not data.empty:
-                # Attempt to use as is if ambiguous, or skip
-                # Usually shouldn't happen with fetch_batch_data_safe unless strict single mode
-                pass
-
-    for ticker, df_raw in iterator:
-        try:
-            if ticker not in tickers: continue
-
-            # Ensure df is clean
-            df = df_raw.dropna(how='all')
-
-            if df is not None and not df.empty:
-                # Handle potential MultiIndex columns remaining (rare)
-                if isinstance(df.columns, pd.MultiIndex):
-                    df = df.droplevel(0, axis=1)
-
-                strategy = IsaStrategy(ticker, df, account_size=account_size)
-                res = strategy.analyze()
-                if res and res['Signal'] != 'WAIT':
-                    results.append(res)
-        except Exception as e:
-            # Log but continue - prevent one bad ticker from killing the loop
-            # current_app.logger.warning(f"ISA Screen failed for {ticker}: {e}")
-            continue
-
     current_app.logger.info(f"ISA Screen completed. Results: {len(results)}")
 
     # Cache the successful result
@@ -308,7 +308,7 @@ def screen_bull_put():
 
     ticker_list = resolve_region_tickers(data.region, check_trend=True)
 
-    results = screener.screen_bull_put_spreads(ticker_list=ticker_list, time_frame=data.time_frame)
+    results = run_screener_once(cache_key, screener.screen_bull_put_spreads, ticker_list=ticker_list, time_frame=data.time_frame)
     current_app.logger.info(f"Bull Put Screen completed. Results: {len(results)}")
     cache_screener_result(cache_key, results)
     return jsonify(results)
@@ -327,7 +327,7 @@ def screen_vertical_put():
         return jsonify(cached)
 
     # Call the new logic
-    results = screener.screen_vertical_put_spreads(region=data.region)
+    results = run_screener_once(cache_key, screener.screen_vertical_put_spreads, region=data.region)
 
     current_app.logger.info(f"Vertical Put Screen completed. Results: {len(results)}")
     cache_screener_result(cache_key, results)
@@ -347,7 +347,7 @@ def screen_darvas():
 
     ticker_list = resolve_region_tickers(data.region, check_trend=True)
 
-    results = screener.screen_darvas_box(ticker_list=ticker_list, time_frame=data.time_frame)
+    results = run_screener_once(cache_key, screener.screen_darvas_box, ticker_list=ticker_list, time_frame=data.time_frame)
     current_app.logger.info(f"Darvas Screen completed. Results: {len(results)}")
     cache_screener_result(cache_key, results)
     return jsonify(results)
@@ -366,7 +366,7 @@ def screen_ema():
 
     ticker_list = resolve_region_tickers(data.region, check_trend=True)
 
-    results = screener.screen_5_13_setups(ticker_list=ticker_list, time_frame=data.time_frame)
+    results = run_screener_once(cache_key, screener.screen_5_13_setups, ticker_list=ticker_list, time_frame=data.time_frame)
     current_app.logger.info(f"EMA Screen completed. Results: {len(results)}")
     cache_screener_result(cache_key, results)
     return jsonify(results)
@@ -386,7 +386,7 @@ def screen_mms():
     # Use only_watch=True for SP500 to avoid heavy load on intraday screens
     ticker_list = resolve_region_tickers(data.region, check_trend=False, only_watch=True)
 
-    results = screener.screen_mms_ote_setups(ticker_list=ticker_list, time_frame=data.time_frame)
+    results = run_screener_once(cache_key, screener.screen_mms_ote_setups, ticker_list=ticker_list, time_frame=data.time_frame)
     current_app.logger.info(f"MMS Screen completed. Results: {len(results)}")
     cache_screener_result(cache_key, results)
     return jsonify(results)
@@ -406,7 +406,7 @@ def screen_liquidity_grabs():
     # Use only_watch=True for SP500 to avoid heavy load on intraday screens
     ticker_list = resolve_region_tickers(data.region, check_trend=False, only_watch=True)
 
-    results = screener.screen_liquidity_grabs(ticker_list=ticker_list, time_frame=data.time_frame, region=data.region)
+    results = run_screener_once(cache_key, screener.screen_liquidity_grabs, ticker_list=ticker_list, time_frame=data.time_frame, region=data.region)
     current_app.logger.info(f"Liquidity Grab Screen completed. Results: {len(results)}")
     cache_screener_result(cache_key, results)
     return jsonify(results)
@@ -425,7 +425,7 @@ def screen_squeeze():
 
     ticker_list = resolve_region_tickers(data.region, check_trend=False)
 
-    results = screener.screen_bollinger_squeeze(ticker_list=ticker_list, time_frame=data.time_frame, region=data.region)
+    results = run_screener_once(cache_key, screener.screen_bollinger_squeeze, ticker_list=ticker_list, time_frame=data.time_frame, region=data.region)
     current_app.logger.info(f"Squeeze Screen completed. Results: {len(results)}")
     cache_screener_result(cache_key, results)
     return jsonify(results)
@@ -444,7 +444,7 @@ def screen_hybrid():
 
     ticker_list = resolve_region_tickers(data.region, check_trend=False)
 
-    results = screener.screen_hybrid_strategy(ticker_list=ticker_list, time_frame=data.time_frame, region=data.region)
+    results = run_screener_once(cache_key, screener.screen_hybrid_strategy, ticker_list=ticker_list, time_frame=data.time_frame, region=data.region)
     current_app.logger.info(f"Hybrid Screen completed. Results: {len(results)}")
     cache_screener_result(cache_key, results)
     return jsonify(results)
@@ -464,7 +464,7 @@ def screen_master():
         return jsonify(cached)
 
     # The adapter handles the list logic internally based on region
-    results = screen_master_convergence(region=data.region, time_frame=data.time_frame)
+    results = run_screener_once(cache_key, screen_master_convergence, region=data.region, time_frame=data.time_frame)
 
     # Cache result
     cache_screener_result(cache_key, results)
@@ -478,6 +478,50 @@ def screen_master():
     # Let's standardise on the list for this specific route if the frontend grid handles it
     return jsonify(results)
 
+def _streamable_scan(scan: str, data: ScreenerBaseRequest):
+    """(cache key, scan function, kwargs) of a scan /screen/stream can serve, matching its regular route."""
+    if scan == "master":
+        return ("master", data.region, data.time_frame), screen_master_convergence, {"region": data.region, "time_frame": data.time_frame}
+    if scan == "options_only":
+        return ("options_only_scanner", "us"), screener.screen_options_only_strategy, {"limit": 75}
+    if scan == "vertical_put":
+        return ("vertical_put_v2", data.region), screener.screen_vertical_put_spreads, {"region": data.region}
+    return None
+
+@screener_bp.route('/screen/stream/<scan>', methods=['GET'])
+@handle_screener_errors
+@validate_schema(ScreenerBaseRequest, source='args')
+def stream_screen(scan):
+    """
+    Server-Sent Events version of /screen/master, /screen/options_only and /screen/vertical_put.
+    Sends 'row' events as tickers pass, 'progress' counters ({screened, total}) and a final
+    'done' event with the complete sorted results, which are cached like the regular route's.
+    """
+    data: ScreenerBaseRequest = g.validated_data
+    spec = _streamable_scan(scan, data)
+    if spec is None:
+        return jsonify({"error": f"Unknown scan: {scan}"}), 404
+    cache_key, scan_fn, kwargs = spec
+    current_app.logger.info(f"Streaming {scan} screen: region={data.region}, time_frame={data.time_frame}")
+
+    cached = get_cached_screener_result(cache_key)
+    if cached:
+        events = iter([("done", cached)])
+    else:
+        events = stream_scan(scan_fn, on_done=lambda results: cache_screener_result(cache_key, results), **kwargs).events()
+
+    dumps = current_app.json.dumps
+
+    def generate():
+        for event, payload in events:
+            if event == "ping":
+                yield ": ping\n\n"  # keeps proxies from timing out an idle connection
+            else:
+                yield f"event: {event}\ndata: {dumps(payload)}\n\n"
+
+    return Response(stream_with_context(generate()), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
 @screener_bp.route('/screen/quant', methods=['GET'])
 def screen_quant():
     # Redirect Quant requests to the Fortress as well, since QuantMasterScreener (OpenBB) is broken
@@ -509,7 +553,7 @@ def screen_fourier():
 
     ticker_list = resolve_region_tickers(data.region, check_trend=False)
 
-    results = screener.screen_fourier_cycles(ticker_list=ticker_list, time_frame=data.time_frame)
+    results = run_screener_once(cache_key, screener.screen_fourier_cycles, ticker_list=ticker_list, time_frame=data.time_frame)
     current_app.logger.info(f"Fourier Screen completed. Results: {len(results)}")
     cache_screener_result(cache_key, results)
     return jsonify(results)
@@ -528,7 +572,7 @@ def screen_rsi_divergence():
 
     ticker_list = resolve_region_tickers(data.region, check_trend=False)
 
-    results = screener.screen_rsi_divergence(ticker_list=ticker_list, time_frame=data.time_frame, region=data.region)
+    results = run_screener_once(cache_key, screener.screen_rsi_divergence, ticker_list=ticker_list, time_frame=data.time_frame, region=data.region)
     current_app.logger.info(f"RSI Divergence Screen completed. Results: {len(results)}")
     cache_screener_result(cache_key, results)
     return jsonify(results)
@@ -548,7 +592,7 @@ def screen_medallion_isa():
     # Resolve tickers
     ticker_list = resolve_region_tickers(data.region, check_trend=False)
 
-    results = screener.screen_medallion_isa(ticker_list=ticker_list, time_frame=data.time_frame, region=data.region)
+    results = run_screener_once(cache_key, screener.screen_medallion_isa, ticker_list=ticker_list, time_frame=data.time_frame, region=data.region)
     current_app.logger.info(f"Medallion ISA Screen completed. Results: {len(results)}")
     cache_screener_result(cache_key, results)
     return jsonify(results)
@@ -565,7 +609,7 @@ def screen_quality200():
     if cached:
         return jsonify(cached)
 
-    results = screener.screen_quality_200w(region=data.region, time_frame=data.time_frame)
+    results = run_screener_once(cache_key, screener.screen_quality_200w, region=data.region, time_frame=data.time_frame)
 
     current_app.logger.info(f"Quality 200W Screen completed. Results: {len(results)}")
     cache_screener_result(cache_key, results)
@@ -585,7 +629,7 @@ def screen_universal():
 
     ticker_list = resolve_region_tickers(data.region, check_trend=False)
 
-    results = screener.screen_universal_dashboard(ticker_list=ticker_list)
+    results = run_screener_once(cache_key, screener.screen_universal_dashboard, ticker_list=ticker_list)
     current_app.logger.info(f"Universal Screen completed.")
     cache_screener_result(cache_key, results)
     return jsonify(results)
@@ -601,7 +645,7 @@ def screen_quantum():
     if cached:
         return jsonify(cached)
 
-    results = screener.screen_quantum_setups(region=data.region, time_frame=data.time_frame)
+    results = run_screener_once(cache_key, screener.screen_quantum_setups, region=data.region, time_frame=data.time_frame)
 
     api_results = [
         {
@@ -648,7 +692,7 @@ def check_unified_stock():
     if entry_price is None and data.entry_date:
             try:
                 dt = datetime.strptime(data.entry_date, "%Y-%m-%d")
-                hist = yf.download(ticker, start=dt, end=dt + timedelta(days=5), progress=False, auto_adjust=True)
+                hist = get_provider().download(ticker, start=dt, end=dt + timedelta(days=5), progress=False, auto_adjust=True)
                 if not hist.empty:
                     try:
                         close_series = hist['Close']
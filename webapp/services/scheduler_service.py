@@ -4,6 +4,7 @@ import logging
 import schedule
 from flask import current_app
 from option_auditor.strategies.master import screen_master_convergence
+from option_auditor.common.indicator_stream import indicator_streams
 from webapp.cache import cache_screener_result
 
 logger = logging.getLogger(__name__)
@@ -16,7 +17,8 @@ def run_master_scan():
     logger.info("🔄 [HEADLESS] Starting Master Convergence Scan (US)...")
     try:
         # Run US Scan (Standard 1d)
-        results = screen_master_convergence(region="us", time_frame="1d")
+        # Its results depend only on the bars and the regime, so rescans reuse unchanged tickers
+        results = screen_master_convergence(region="us", time_frame="1d", incremental=True)
 
         # Cache with key matching the route
         cache_key = ("master", "us", "1d")
@@ -31,7 +33,10 @@ def run_master_scan():
 def start_scheduler(app):
     """
     Starts the background scheduler in a daemon thread.
+    Rescans of the same universe update indicator state incrementally (new bars only).
     """
+    indicator_streams.enable()
+
     # Run once immediately on startup (in a separate thread to not block boot)
     def initial_run():
         time.sleep(10) # Wait for app to fully settle